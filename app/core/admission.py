@@ -0,0 +1,275 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Optional, Tuple, Type
+
+from app.core.config import get_settings
+from app.core.metrics import record_admission
+from app.core.resilience import LatencyTracker
+
+# 추론 요청 admission control (워커 프로세스 단위)
+# 동시 실행 수를 관찰한 처리 지연 시간으로 조정되는 한도(AIMD) 안으로 제한하고,
+# 한도를 넘는 요청은 길이가 제한된 대기열(FIFO)에서 기다립니다.
+# 대기열이 가득 찼거나 대기 시간, 클라이언트 기한을 넘긴 요청은 LLM 호출 전에 바로 거부합니다.
+
+logger = logging.getLogger(__name__)
+
+# 클라이언트가 기다릴 수 있는 남은 시간(초), 대기열 대기와 LLM 호출 기한에 반영
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout"
+
+# 거부 사유 (admission_requests_total 의 result 레이블)
+ADMISSION_ADMITTED = "admitted"
+REJECT_QUEUE_FULL = "queue_full"
+REJECT_QUEUE_TIMEOUT = "queue_timeout"
+REJECT_DEADLINE = "deadline"
+
+# 처리 시간 샘플이 없을 때 Retry-After 추정에 사용할 처리 시간(초)
+DEFAULT_SERVICE_TIME = 1.0
+
+# 현재 요청의 기한 (time.monotonic 기준 절대 시각), admit 블록 안에서만 설정
+_request_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class AdmissionRejectedError(Exception):
+	"""admission control 이 요청을 거부한 경우 (reason: queue_full, queue_timeout, deadline)"""
+
+	def __init__(self, message: str, reason: str, retry_after: float):
+		super().__init__(message)
+		self.reason = reason
+		self.retry_after = retry_after
+
+
+def parse_request_timeout(value: Optional[str]) -> Optional[float]:
+	"""X-Request-Timeout 헤더 값(초), 없거나 잘못된 값이면 None"""
+	if value is None:
+		return None
+	try:
+		timeout = float(value)
+	except ValueError:
+		return None
+	if not math.isfinite(timeout):
+		return None
+	return max(0.0, timeout)
+
+
+def remaining_request_time() -> Optional[float]:
+	"""현재 요청 기한까지 남은 시간(초), 기한이 없으면 None"""
+	deadline = _request_deadline.get()
+	if deadline is None:
+		return None
+	return max(0.0, deadline - time.monotonic())
+
+
+def bounded_deadline(deadline: float) -> float:
+	"""호출 기한을 현재 요청의 남은 시간 이하로 제한"""
+	remaining = remaining_request_time()
+	return deadline if remaining is None else min(deadline, remaining)
+
+
+class AdaptiveConcurrencyLimit:
+	"""
+	AIMD 동시 실행 한도
+	처리 시간이 latency_target 이하이면 한도를 조금씩(1 / 한도) 늘리고,
+	초과하거나 과부하 오류(LLM 기한 초과, 호출 한도, 서킷 브레이커)가 발생하면 backoff_ratio 배로 줄입니다.
+	"""
+
+	def __init__(self, initial: int, min_limit: int, max_limit: int, latency_target: float, backoff_ratio: float = 0.9):
+		self.min_limit = max(1, min_limit)
+		self.max_limit = max(self.min_limit, max_limit)
+		self.latency_target = latency_target
+		self.backoff_ratio = backoff_ratio
+		self._limit = float(min(self.max_limit, max(self.min_limit, initial)))
+
+	@property
+	def limit(self) -> int:
+		return int(self._limit)
+
+	def on_sample(self, latency: float, in_flight: int, dropped: bool = False) -> None:
+		if dropped or latency > self.latency_target:
+			self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+		# 한도의 절반도 쓰지 않는 동안에는 늘리지 않음 (한도가 실제 부하와 무관하게 커지는 것 방지)
+		elif in_flight * 2 >= self._limit:
+			self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+
+class AdmissionController:
+	"""
+	동시 실행 한도 + 제한된 FIFO 대기열
+	요청이 끝나면 대기 중인 다음 요청에 바로 실행 슬롯을 넘겨줍니다.
+	"""
+
+	def __init__(
+		self,
+		limit: AdaptiveConcurrencyLimit,
+		max_queue: int,
+		max_queue_wait: float,
+		overload_errors: Tuple[Type[BaseException], ...] = (),
+		clock: Callable[[], float] = time.monotonic,
+		):
+		self.limit = limit
+		self.max_queue = max_queue
+		self.max_queue_wait = max_queue_wait
+		self.overload_errors = overload_errors
+		self._clock = clock
+		self._waiters: Deque[asyncio.Future] = deque()
+		self.in_flight = 0
+
+		# 지표
+		self.admitted = 0
+		self.rejected: Dict[str, int] = {REJECT_QUEUE_FULL: 0, REJECT_QUEUE_TIMEOUT: 0, REJECT_DEADLINE: 0}
+		self.max_queue_depth = 0
+		self.wait_times = LatencyTracker()
+		self.service_times = LatencyTracker()
+
+	@property
+	def queue_depth(self) -> int:
+		return len(self._waiters)
+
+	def retry_after(self) -> float:
+		"""대기열이 현재 한도로 처리되기까지 걸릴 예상 시간(초)"""
+		service_time = self.service_times.percentile(50) or DEFAULT_SERVICE_TIME
+		return max(1.0, math.ceil((self.queue_depth + 1) / max(1, self.limit.limit) * service_time))
+
+	def _reject(self, reason: str, message: str) -> AdmissionRejectedError:
+		self.rejected[reason] += 1
+		record_admission(reason)
+		retry_after = self.retry_after()
+		logger.warning(f"추론 요청 거부 ({reason}): 실행 {self.in_flight}/{self.limit.limit}, 대기열 {self.queue_depth}/{self.max_queue}")
+		return AdmissionRejectedError(message, reason, retry_after)
+
+	def _admit(self, waited: float) -> float:
+		self.admitted += 1
+		self.wait_times.record(waited)
+		record_admission(ADMISSION_ADMITTED)
+		return waited
+
+	async def acquire(self, timeout: Optional[float] = None) -> float:
+		"""
+		실행 슬롯을 확보할 때까지 대기하고 대기 시간(초) 반환
+		대기열이 가득 찼거나 min(timeout, max_queue_wait) 안에 확보하지 못하면 AdmissionRejectedError 발생
+		"""
+		if self.in_flight < self.limit.limit and not self._waiters:
+			self.in_flight += 1
+			return self._admit(0.0)
+
+		if timeout is not None and timeout <= 0:
+			raise self._reject(REJECT_DEADLINE, "요청 기한이 지났습니다.")
+		if len(self._waiters) >= self.max_queue:
+			raise self._reject(REJECT_QUEUE_FULL, "추론 대기열이 가득 찼습니다.")
+
+		wait = self.max_queue_wait if timeout is None else min(timeout, self.max_queue_wait)
+		started = self._clock()
+		waiter = asyncio.get_running_loop().create_future()
+		self._waiters.append(waiter)
+		self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+		try:
+			await asyncio.wait_for(asyncio.shield(waiter), timeout=wait)
+		except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+			if waiter.done():
+				# 대기 종료와 동시에 슬롯을 넘겨받은 경우
+				if isinstance(e, asyncio.CancelledError):
+					self._release_slot()
+					raise
+			else:
+				waiter.cancel()
+				self._waiters.remove(waiter)
+				if isinstance(e, asyncio.CancelledError):
+					raise
+				if timeout is not None and timeout <= self.max_queue_wait:
+					raise self._reject(REJECT_DEADLINE, "요청 기한 안에 실행 순서가 오지 않았습니다.") from None
+				raise self._reject(REJECT_QUEUE_TIMEOUT, "추론 대기열 대기 시간을 초과했습니다.") from None
+		return self._admit(self._clock() - started)
+
+	def _release_slot(self) -> None:
+		self.in_flight -= 1
+		# 줄어든 한도를 넘지 않는 만큼만 대기 요청에 슬롯을 넘겨줌
+		while self._waiters and self.in_flight < self.limit.limit:
+			waiter = self._waiters.popleft()
+			if not waiter.done():
+				self.in_flight += 1
+				waiter.set_result(None)
+
+	def release(self, latency: Optional[float] = None, dropped: bool = False) -> None:
+		"""실행 슬롯 반환, latency 가 있으면 동시 실행 한도 조정"""
+		if latency is not None:
+			if not dropped:
+				self.service_times.record(latency)
+			self.limit.on_sample(latency, self.in_flight, dropped)
+		self._release_slot()
+
+	@asynccontextmanager
+	async def admit(self, timeout: Optional[float] = None) -> AsyncIterator[float]:
+		"""
+		슬롯을 확보한 뒤 블록을 실행하고 처리 시간으로 한도 조정
+		timeout 이 있으면 블록 안의 LLM 호출 기한도 남은 시간으로 제한됩니다 (bounded_deadline).
+		"""
+		deadline = None if timeout is None else time.monotonic() + timeout
+		waited = await self.acquire(timeout)
+		token = _request_deadline.set(deadline)
+		started = self._clock()
+		try:
+			yield waited
+		except self.overload_errors:
+			self.release(self._clock() - started, dropped=True)
+			raise
+		except BaseException:
+			# 요청 오류, 취소는 처리 시간 샘플로 사용하지 않음
+			self.release()
+			raise
+		else:
+			self.release(self._clock() - started)
+		finally:
+			_request_deadline.reset(token)
+
+	def snapshot(self) -> Dict[str, Any]:
+		return {
+			"limit": self.limit.limit,
+			"in_flight": self.in_flight,
+			"queue_depth": self.queue_depth,
+			"max_queue_depth": self.max_queue_depth,
+			"admitted": self.admitted,
+			"rejected": dict(self.rejected),
+			"p95_wait": self.wait_times.percentile(95),
+			"p50_service_time": self.service_times.percentile(50),
+		}
+
+
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> Optional[AdmissionController]:
+	"""ADMISSION_CONTROL_ENABLED 일 때 워커 프로세스의 컨트롤러, 아니면 None"""
+	global _admission_controller
+	settings = get_settings()
+	if not settings.ADMISSION_CONTROL_ENABLED:
+		return None
+	if _admission_controller is None:
+		# llm_services 가 bounded_deadline 을 사용하므로 지연 import
+		from app.core.llm_services import LLMCircuitOpenError, LLMRateLimitedError, LLMTimeoutError
+
+		_admission_controller = AdmissionController(
+			AdaptiveConcurrencyLimit(
+				initial = settings.ADMISSION_INITIAL_LIMIT,
+				min_limit = settings.ADMISSION_MIN_LIMIT,
+				max_limit = settings.ADMISSION_MAX_LIMIT,
+				latency_target = settings.ADMISSION_LATENCY_TARGET,
+			),
+			max_queue = settings.ADMISSION_MAX_QUEUE,
+			max_queue_wait = settings.ADMISSION_MAX_QUEUE_WAIT,
+			overload_errors = (LLMCircuitOpenError, LLMRateLimitedError, LLMTimeoutError),
+		)
+	return _admission_controller
+
+
+def get_admission_metrics() -> Optional[Dict[str, Any]]:
+	"""동시 실행 한도, 대기열 길이, 거부 수 (비활성화 상태면 None)"""
+	return _admission_controller.snapshot() if _admission_controller is not None else None
+
+
+def reset_admission_controller() -> None:
+	global _admission_controller
+	_admission_controller = None
@@ -1,5 +1,11 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# 프로젝트 루트 경로
+BASE_DIR = Path(__file__).resolve().parents[2]
+
 # OPENAI 세팅값
 class Settings(BaseSettings):
 	OPENAI_API_KEY: str
@@ -8,6 +14,163 @@ class Settings(BaseSettings):
 	OPENAI_MODEL_NAME: str = "gpt-4o"
 	# TEMPERATURE 값 0.0 ~ 0.3 사이로 설정, 정확한 결과를 위해 0.0으로 우선 사용함.
 	OPENAI_TEMPERATURE: float = 0.0
+	# OpenAI 호환 API 주소 (로컬 fake 서버, 프록시 사용 시 지정)
+	OPENAI_BASE_URL: Optional[str] = None
+
+	# LLM 호출 안정성 설정
+	# 단일 HTTP 요청 타임아웃(초)과 재시도/헤징을 포함한 호출 전체 기한(초)
+	LLM_REQUEST_TIMEOUT: float = 30.0
+	LLM_CALL_DEADLINE: float = 60.0
+	# 429, 5xx, 연결 오류 시 jitter 지수 백오프로 재시도
+	LLM_MAX_RETRIES: int = 2
+	LLM_RETRY_BASE_DELAY: float = 0.5
+	LLM_RETRY_MAX_DELAY: float = 8.0
+	# 응답이 최근 지연 시간 백분위(LLM_HEDGE_PERCENTILE)를 넘으면 동일 요청을 한 번 더 전송 (토큰 비용 증가)
+	LLM_HEDGE_ENABLED: bool = False
+	LLM_HEDGE_PERCENTILE: float = 95.0
+	LLM_HEDGE_MIN_SAMPLES: int = 20
+	LLM_HEDGE_MIN_DELAY: float = 1.0
+	# 연속 실패 시 일정 시간 LLM 호출 차단
+	LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5
+	LLM_CIRCUIT_RECOVERY_TIMEOUT: float = 30.0
+
+	# cascade 모드: 작은 모델(OPENAI_FAST_MODEL_NAME)로 먼저 추론하고 신뢰도가 낮을 때만 OPENAI_MODEL_NAME 으로 escalate
+	LLM_CASCADE_ENABLED: bool = False
+	OPENAI_FAST_MODEL_NAME: str = "gpt-4o-mini"
+	# 작은 모델 응답을 그대로 사용할 최소 신뢰도 (0 ~ 1)
+	LLM_CASCADE_MIN_CONFIDENCE: float = 0.8
+	# 작은 모델 호출 기한(초), 남은 시간은 큰 모델 호출에 사용
+	LLM_FAST_CALL_DEADLINE: float = 15.0
+
+	# OpenAI 호출 한도 (0 이면 제한 없음), 한도에 도달하면 호출 전에 대기열에서 기다림
+	LLM_RPM_LIMIT: int = 0
+	LLM_TPM_LIMIT: int = 0
+	EMBEDDING_RPM_LIMIT: int = 0
+	EMBEDDING_TPM_LIMIT: int = 0
+	# 대기열 최대 대기 시간(초), 넘으면 호출하지 않고 거부
+	RATE_LIMIT_MAX_QUEUE_TIME: float = 10.0
+	# TPM 계산 시 응답 토큰 예약량 (응답 후 실제 사용량으로 보정)
+	LLM_RATE_LIMIT_COMPLETION_TOKENS: int = 500
+	# local: 프로세스 단위, postgres: rate_limit_buckets 테이블로 워커 간 공유
+	RATE_LIMIT_BACKEND: str = "local"
+
+	# Batch API 오프라인 재태깅 설정
+	# 결과 조회 주기(초), 완료 기한, 프롬프트 생성(문서 검색, 관계형 조회) 동시 실행 수
+	BATCH_POLL_INTERVAL: float = 60.0
+	BATCH_COMPLETION_WINDOW: str = "24h"
+	BATCH_PREPARE_CONCURRENCY: int = 4
+
+	# 관계형 DB(company, company_news) 요청 시점 조회 설정
+	RELATIONAL_DB_ENABLED: bool = True
+	RELATIONAL_DB_POOL_MIN_SIZE: int = 1
+	RELATIONAL_DB_POOL_MAX_SIZE: int = 10
+	RELATIONAL_DB_COMMAND_TIMEOUT: float = 5.0
+	# 재직 기간 내 회사 별 최대 뉴스 수
+	TENURE_NEWS_LIMIT: int = 10
+
+	# 워커 간 캐시 (local: 워커 별 LRU, postgres: 워커 별 LRU + shared_cache 테이블 공유)
+	CACHE_BACKEND: str = "local"
+	# 캐시 별 워커 내 LRU 최대 항목 수
+	CACHE_LOCAL_MAX_ENTRIES: int = 2000
+	# 캐시 별 TTL(초), 0 이면 사용하지 않음
+	# 추론 결과 (같은 프로필, 같은 모델 설정이면 LLM 호출 생략), 검색 쿼리 임베딩, 재직 기간 회사 정보/뉴스
+	INFERENCE_CACHE_TTL: float = 0.0
+	EMBEDDING_CACHE_TTL: float = 0.0
+	COMPANY_CONTEXT_CACHE_TTL: float = 0.0
+	# nginx proxy_cache 허용 시간(초), 0 보다 크면 추론 성공 응답에 캐시 키를 추가하고
+	# 요청 헤더의 키가 같은 응답에 Cache-Control 헤더 추가 (nginx/conf.d/searchright.conf)
+	EDGE_CACHE_TTL: int = 0
+
+	# /api/v1/inference admission control (워커 프로세스 단위, app/core/admission.py)
+	ADMISSION_CONTROL_ENABLED: bool = False
+	# 동시 실행 한도 초기값과 범위, 처리 시간이 ADMISSION_LATENCY_TARGET(초)을 넘거나 LLM 과부하 오류가 나면 줄어듦 (AIMD)
+	ADMISSION_INITIAL_LIMIT: int = 16
+	ADMISSION_MIN_LIMIT: int = 2
+	ADMISSION_MAX_LIMIT: int = 64
+	ADMISSION_LATENCY_TARGET: float = 20.0
+	# 한도를 넘는 요청의 최대 대기 수와 최대 대기 시간(초), 넘으면 LLM 호출 없이 429/503 으로 거부
+	ADMISSION_MAX_QUEUE: int = 64
+	ADMISSION_MAX_QUEUE_WAIT: float = 5.0
+
+	# 부분 장애 시 응답 등급 낮추기 (app/core/degradation.py, 응답 헤더 X-Inference-Tier)
+	# 뉴스 벡터 검색 시간 예산(초), 넘으면 뉴스 없이 추론하고 연속 DEGRADE_NEWS_FAILURE_THRESHOLD 회 넘으면 DEGRADE_NEWS_COOLDOWN 동안 뉴스 검색 생략 (0 이면 사용하지 않음)
+	DEGRADE_NEWS_TIMEOUT: float = 0.0
+	DEGRADE_NEWS_FAILURE_THRESHOLD: int = 3
+	DEGRADE_NEWS_COOLDOWN: float = 30.0
+	# LLM 호출 실패(기한 초과, 서킷 브레이커, 호출 한도 등) 시 오류 대신 규칙 엔진으로 결정된 태그만 반환
+	DEGRADE_RULES_ONLY_ON_LLM_FAILURE: bool = False
+	# 정상 추론 결과 보관 시간(초), LLM 호출 실패 시 이 결과를 먼저 반환 (0 이면 사용하지 않음)
+	INFERENCE_STALE_TTL: float = 0.0
+
+	# 비동기 추론 작업 큐 (/api/v1/inference/jobs, inference_jobs 테이블)
+	JOB_QUEUE_ENABLED: bool = False
+	# 앱 프로세스 안에서 실행할 작업 워커 수 (0 이면 python -m app.services.job_worker_service 로 별도 실행)
+	JOB_WORKER_CONCURRENCY: int = 2
+	# 대기 작업 최대 수, 우선순위가 낮은 lane 은 더 일찍 거부됨 (app/core/job_queue.py LANE_ADMISSION_RATIO)
+	JOB_QUEUE_MAX_DEPTH: int = 1000
+	# 대기 작업이 없을 때 조회 주기(초)
+	JOB_POLL_INTERVAL: float = 0.5
+	# 실행 중 워커가 종료된 작업을 다시 대기 상태로 돌리는 기준 시간(초)
+	JOB_STALE_TIMEOUT: float = 300.0
+	# 일시적 오류(LLM 한도, 서킷 브레이커) 최대 시도 수
+	JOB_MAX_ATTEMPTS: int = 3
+	# 완료된 작업 보관 시간(초)
+	JOB_RESULT_TTL: float = 86400.0
+	# 콜백 허용 호스트 (쉼표 구분), 비어있으면 콜백 사용 불가
+	JOB_CALLBACK_ALLOWED_HOSTS: str = ""
+	JOB_CALLBACK_TIMEOUT: float = 10.0
+	JOB_CALLBACK_MAX_ATTEMPTS: int = 3
+
+	# 벡터 검색 백엔드 (pgvector: PGVector 컬렉션, local: 컬렉션 스냅샷을 워커 메모리에서 전수 검색, app/core/vector_index.py)
+	VECTOR_BACKEND: str = "pgvector"
+	# 컬렉션 스냅샷 디렉터리 (<VECTOR_SNAPSHOT_DIR>/<컬렉션 이름>), python -m app.core.vector_snapshot export 로 생성
+	VECTOR_SNAPSHOT_DIR: str = str(BASE_DIR / "vector_snapshots")
+	# 컬렉션 별 검색 차원 (JSON, 예: {"company_news_collection": 512}), text-embedding-3 임베딩의 앞쪽 N 차원만 사용 (Matryoshka)
+	# pgvector: 스냅샷을 import --dimensions N 으로 적재한 컬렉션에 쿼리 임베딩도 N 차원으로 잘라 검색
+	# local: N 차원으로 후보를 고른 뒤 스냅샷의 전체 차원으로 재정렬
+	VECTOR_DIMENSIONS: Dict[str, int] = {}
+	# 컬렉션 별 로컬 인덱스 양자화 (JSON, 예: {"company_news_collection": "binary"}, none: 양자화 없음)
+	VECTOR_QUANTIZATION: Dict[str, str] = {}
+	# 축소 벡터로 고르는 재정렬 후보 수 (k 배수), 클수록 recall 이 오르고 지연 시간이 늘어남
+	VECTOR_RESCORE_MULTIPLIER: int = 4
+
+	# 정적 데이터 경로
+	UNIVERSITY_RANK_CSV_PATH: str = str(BASE_DIR / "example_datas" / "university_rank.csv")
+
+	# 로그 설정 (format: text, json)
+	LOG_LEVEL: str = "INFO"
+	LOG_FORMAT: str = "text"
+	# 프롬프트, LLM 응답 등 요청 본문을 INFO 로 기록할 요청 비율 (0 ~ 1, DEBUG 레벨에서는 항상 기록)
+	LOG_PAYLOAD_SAMPLE_RATE: float = 0.0
+	LOG_PAYLOAD_MAX_CHARS: int = 2000
+
+	# 추론 요청 샘플 기록 (JSONL, benchmarks/replay.py 로 재생), 경로 미지정 또는 비율 0 이면 기록하지 않음
+	REQUEST_RECORD_PATH: Optional[str] = None
+	REQUEST_RECORD_SAMPLE_RATE: float = 0.0
+
+	# 추론 단계 별 OpenTelemetry span 생성 (opentelemetry-api 설치 및 exporter 설정 필요)
+	OTEL_ENABLED: bool = False
+	# 요청 별 단계 소요 시간을 Server-Timing 응답 헤더로 반환 (부하 테스트용, 내부 처리 시간이 노출되므로 기본 비활성화)
+	SERVER_TIMING_ENABLED: bool = False
+
+	# 애플리케이션 시작 시 warm-up 설정
+	WARMUP_ENABLED: bool = True
+	# warm-up 마지막 단계로 샘플 인재 데이터 추론을 1회 실행 (LLM 토큰 사용)
+	WARMUP_SYNTHETIC_REQUEST: bool = False
+	# warm-up 실패 시 백그라운드 재시도 대기 시간(초, full jitter 지수 백오프), 준비될 때까지 재시도
+	WARMUP_RETRY_BASE_DELAY: float = 1.0
+	WARMUP_RETRY_MAX_DELAY: float = 30.0
+
 	model_config = SettingsConfigDict(env_file=".env", extra='ignore')
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+	"""설정 인스턴스 (최초 호출 시 환경 변수/.env 로드)"""
+	return Settings()
+
+
+def __getattr__(name: str):
+	# 기존 `from app.core.config import settings` 사용처 호환, import 시점이 아닌 최초 접근 시 생성
+	if name == "settings":
+		return get_settings()
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,64 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, List, Optional
+
+from app.core.metrics import record_degradation
+
+# 추론 응답 등급(tier)과 등급을 낮춘 사유
+# 검색, 관계형 조회, LLM 단계가 실패하거나 시간 예산을 넘겨 결과를 줄인 경우 mark_degraded 로 사유를 기록하고,
+# 라우터가 collect_degradations 로 모은 사유를 X-Inference-Tier 응답 헤더로 반환합니다.
+
+# 사유 (inference_degradations_total 의 reason 레이블)
+DEGRADED_NEWS_SKIPPED = "news_skipped"
+DEGRADED_RETRIEVAL_FAILED = "retrieval_failed"
+DEGRADED_RELATIONAL_FAILED = "relational_failed"
+DEGRADED_RULES_ONLY = "rules_only"
+DEGRADED_STALE_CACHE = "stale_cache"
+
+# 응답 등급 (앞쪽일수록 온전한 결과)
+TIER_FULL = "full"
+# 일부 참고 자료(뉴스 검색 등) 없이 추론
+TIER_REDUCED_CONTEXT = "reduced_context"
+# LLM 없이 규칙 엔진으로 결정된 태그만 반환
+TIER_RULES_ONLY = "rules_only"
+# 최근 정상 추론 결과(만료된 캐시)를 반환
+TIER_STALE_CACHE = "stale_cache"
+
+# 현재 요청의 등급을 낮춘 사유, collect_degradations 블록 안에서만 기록
+_degradations: ContextVar[Optional[List[str]]] = ContextVar("degradations", default=None)
+
+
+def mark_degraded(reason: str) -> None:
+	"""현재 요청의 등급을 낮춘 사유 기록 (같은 사유는 한 번만)"""
+	record_degradation(reason)
+	reasons = _degradations.get()
+	if reasons is not None and reason not in reasons:
+		reasons.append(reason)
+
+
+@contextmanager
+def collect_degradations() -> Iterator[List[str]]:
+	"""
+	with 블록 안에서 기록된 사유를 모음 (블록이 끝나면 바깥 collect_degradations 에도 전달)
+	asyncio.gather 로 분기한 작업도 같은 list 에 기록됩니다 (context 복사 시 참조 공유).
+	"""
+	outer = _degradations.get()
+	reasons: List[str] = []
+	token = _degradations.set(reasons)
+	try:
+		yield reasons
+	finally:
+		_degradations.reset(token)
+		if outer is not None:
+			outer.extend(reason for reason in reasons if reason not in outer)
+
+
+def degradation_tier(reasons: Iterable[str]) -> str:
+	reasons = set(reasons)
+	if DEGRADED_STALE_CACHE in reasons:
+		return TIER_STALE_CACHE
+	if DEGRADED_RULES_ONLY in reasons:
+		return TIER_RULES_ONLY
+	if reasons:
+		return TIER_REDUCED_CONTEXT
+	return TIER_FULL
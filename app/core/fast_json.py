@@ -0,0 +1,30 @@
+from typing import Any, Callable, Coroutine
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+# 요청 본문 JSON 파싱을 orjson 으로 처리 (응답은 main.py 의 default_response_class=ORJSONResponse)
+# 큰 인재 데이터(경력 설명, projects/recommendations 등)는 표준 json 모듈 파싱 비용이 검증 비용보다 커서
+# 이벤트 루프 점유 시간이 늘어납니다. benchmarks/request_parsing.py 로 비교할 수 있습니다.
+
+
+class ORJSONRequest(Request):
+	"""json() 을 orjson 으로 파싱하는 Request (orjson.JSONDecodeError 는 json.JSONDecodeError 하위 클래스라 422 처리 동일)"""
+
+	async def json(self) -> Any:
+		if not hasattr(self, "_json"):
+			self._json = orjson.loads(await self.body())
+		return self._json
+
+
+class ORJSONRoute(APIRoute):
+	"""요청 본문을 ORJSONRequest 로 파싱하는 라우트 (APIRouter(route_class=ORJSONRoute))"""
+
+	def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+		original_route_handler = super().get_route_handler()
+
+		async def orjson_route_handler(request: Request) -> Response:
+			return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+		return orjson_route_handler
@@ -0,0 +1,282 @@
+import logging
+import math
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import orjson
+
+from app.core.config import get_settings
+from app.schemas.inference import TalentDataInput
+from app.schemas.job import JobStatusResponse
+
+# 비동기 추론 작업 큐 (inference_jobs 테이블)
+# 여러 워커(프로세스)가 FOR UPDATE SKIP LOCKED 로 서로 다른 작업을 가져가며, 작업 상태와 결과도 같은 테이블에 저장합니다.
+# 시각은 rate_limiter 의 버킷 저장소와 같이 DB 시계(clock_timestamp)를 사용합니다.
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 lane (값이 작을수록 먼저 처리)
+PRIORITY_LANES: Dict[str, int] = {"high": 0, "normal": 1, "low": 2}
+LANE_NAMES = {value: name for name, value in PRIORITY_LANES.items()}
+
+# lane 별 접수 가능한 대기 작업 수 비율 (JOB_QUEUE_MAX_DEPTH 기준)
+# 대기열이 찰수록 low, normal 순서로 거부해 high 요청 자리를 남겨둡니다.
+LANE_ADMISSION_RATIO: Dict[str, float] = {"high": 1.0, "normal": 0.8, "low": 0.5}
+
+# 대기열이 가득 찬 경우 Retry-After (초)
+QUEUE_FULL_RETRY_AFTER = 10.0
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_SUCCEEDED = "succeeded"
+JOB_STATUS_FAILED = "failed"
+
+
+class JobQueueFullError(Exception):
+	"""lane 의 대기 작업 수가 한도에 도달해 접수를 거부한 경우"""
+
+	def __init__(self, priority: str, depth: int, retry_after: float = QUEUE_FULL_RETRY_AFTER):
+		super().__init__(f"'{priority}' lane 대기열이 가득 찼습니다 (대기 작업 {depth}개)")
+		self.priority = priority
+		self.depth = depth
+		self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class ClaimedJob:
+	"""워커가 가져간 실행 대상 작업"""
+	job_id: str
+	priority: str
+	talent_data: TalentDataInput
+	callback_url: Optional[str]
+	attempts: int
+
+
+CREATE_JOB_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS inference_jobs (
+	id UUID PRIMARY KEY,
+	priority SMALLINT NOT NULL,
+	status TEXT NOT NULL DEFAULT 'queued',
+	payload JSONB NOT NULL,
+	callback_url TEXT,
+	result JSONB,
+	error TEXT,
+	attempts INTEGER NOT NULL DEFAULT 0,
+	created_at TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp(),
+	available_at TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp(),
+	started_at TIMESTAMPTZ,
+	finished_at TIMESTAMPTZ
+);
+CREATE INDEX IF NOT EXISTS inference_jobs_queued_idx ON inference_jobs (priority, available_at, created_at) WHERE status = 'queued';
+CREATE INDEX IF NOT EXISTS inference_jobs_running_idx ON inference_jobs (started_at) WHERE status = 'running';
+CREATE INDEX IF NOT EXISTS inference_jobs_finished_idx ON inference_jobs (finished_at) WHERE status IN ('succeeded', 'failed');
+"""
+
+# 대기 작업 수가 한도 미만일 때만 추가 (동시 접수 시 한도를 조금 넘을 수 있는 느슨한 한도)
+ENQUEUE_JOB_SQL = """
+INSERT INTO inference_jobs (id, priority, payload, callback_url)
+SELECT $1, $2, $3::text::jsonb, $4
+WHERE (SELECT count(*) FROM inference_jobs WHERE status = 'queued') < $5
+RETURNING id
+"""
+
+QUEUED_DEPTH_BY_LANE_SQL = """
+SELECT priority, count(*) AS depth
+FROM inference_jobs
+WHERE status = 'queued'
+GROUP BY priority
+"""
+
+# 우선순위, 실행 가능 시각 순으로 다른 워커가 잠그지 않은 작업 1개를 실행 상태로 변경
+CLAIM_JOB_SQL = """
+UPDATE inference_jobs j
+SET status = 'running', started_at = clock_timestamp(), attempts = j.attempts + 1
+FROM (
+	SELECT id
+	FROM inference_jobs
+	WHERE status = 'queued' AND available_at <= clock_timestamp()
+	ORDER BY priority, available_at, created_at
+	FOR UPDATE SKIP LOCKED
+	LIMIT 1
+) next_job
+WHERE j.id = next_job.id
+RETURNING j.id, j.priority, j.payload::text AS payload, j.callback_url, j.attempts
+"""
+
+_JOB_STATUS_COLUMNS = "id, priority, status, result::text AS result, error, attempts, created_at, started_at, finished_at"
+
+SELECT_JOB_SQL = f"SELECT {_JOB_STATUS_COLUMNS} FROM inference_jobs WHERE id = $1"
+
+COMPLETE_JOB_SQL = f"""
+UPDATE inference_jobs
+SET status = 'succeeded', result = $2::text::jsonb, error = NULL, finished_at = clock_timestamp()
+WHERE id = $1 AND status = 'running'
+RETURNING {_JOB_STATUS_COLUMNS}
+"""
+
+FAIL_JOB_SQL = f"""
+UPDATE inference_jobs
+SET status = 'failed', error = $2, finished_at = clock_timestamp()
+WHERE id = $1 AND status = 'running'
+RETURNING {_JOB_STATUS_COLUMNS}
+"""
+
+RETRY_JOB_SQL = """
+UPDATE inference_jobs
+SET status = 'queued', error = $2, available_at = clock_timestamp() + make_interval(secs => $3)
+WHERE id = $1 AND status = 'running'
+"""
+
+# 실행 중 워커가 종료된 작업 복구 (시도 수를 모두 쓴 작업은 실패 처리)
+REQUEUE_STALE_JOBS_SQL = """
+UPDATE inference_jobs
+SET
+	status = CASE WHEN attempts >= $2 THEN 'failed' ELSE 'queued' END,
+	error = '실행 시간 초과 (워커 종료 추정)',
+	available_at = clock_timestamp(),
+	finished_at = CASE WHEN attempts >= $2 THEN clock_timestamp() ELSE NULL END
+WHERE status = 'running' AND started_at < clock_timestamp() - make_interval(secs => $1)
+RETURNING id
+"""
+
+PURGE_FINISHED_JOBS_SQL = """
+DELETE FROM inference_jobs
+WHERE status IN ('succeeded', 'failed') AND finished_at < clock_timestamp() - make_interval(secs => $1)
+"""
+
+
+def lane_capacity(priority: str, max_depth: int) -> int:
+	"""lane 별 접수 가능한 최대 대기 작업 수"""
+	return max(1, math.floor(max_depth * LANE_ADMISSION_RATIO[priority]))
+
+
+def _status_from_row(row) -> JobStatusResponse:
+	return JobStatusResponse(
+		job_id = str(row["id"]),
+		status = row["status"],
+		priority = LANE_NAMES[row["priority"]],
+		result = orjson.loads(row["result"]) if row["result"] is not None else None,
+		error = row["error"],
+		attempts = row["attempts"],
+		created_at = row["created_at"],
+		started_at = row["started_at"],
+		finished_at = row["finished_at"],
+	)
+
+
+def _parse_job_id(job_id: str) -> Optional[uuid.UUID]:
+	try:
+		return uuid.UUID(job_id)
+	except ValueError:
+		return None
+
+
+class PostgresJobQueue:
+	"""
+	inference_jobs 테이블 기반 작업 큐
+	JSONB 값은 text 로 주고받아 커넥션의 JSON 코덱 설정과 관계없이 동작합니다.
+	"""
+
+	def __init__(self, pool_factory: Optional[Callable[[], Awaitable[Any]]] = None, max_depth: Optional[int] = None):
+		self._pool_factory = pool_factory
+		self._max_depth = max_depth
+		self._table_ready = False
+
+	@property
+	def max_depth(self) -> int:
+		return self._max_depth if self._max_depth is not None else get_settings().JOB_QUEUE_MAX_DEPTH
+
+	async def _pool(self):
+		if self._pool_factory is None:
+			from app.core.relational_db import get_relational_pool
+			self._pool_factory = get_relational_pool
+		pool = await self._pool_factory()
+		if not self._table_ready:
+			await pool.execute(CREATE_JOB_TABLE_SQL)
+			self._table_ready = True
+		return pool
+
+	async def enqueue(self, talent_data: TalentDataInput, priority: str = "normal", callback_url: Optional[str] = None) -> str:
+		"""작업 추가 후 작업 ID 반환, lane 한도 초과 시 JobQueueFullError"""
+		pool = await self._pool()
+		job_id = uuid.uuid4()
+		payload = orjson.dumps(talent_data.model_dump(mode="json", exclude_none=True)).decode()
+		capacity = lane_capacity(priority, self.max_depth)
+		inserted = await pool.fetchval(ENQUEUE_JOB_SQL, job_id, PRIORITY_LANES[priority], payload, callback_url, capacity)
+		if inserted is None:
+			raise JobQueueFullError(priority, capacity)
+		return str(job_id)
+
+	async def claim(self) -> Optional[ClaimedJob]:
+		"""실행 가능한 작업 1개를 실행 상태로 가져옴, 없으면 None"""
+		pool = await self._pool()
+		row = await pool.fetchrow(CLAIM_JOB_SQL)
+		if row is None:
+			return None
+		return ClaimedJob(
+			job_id = str(row["id"]),
+			priority = LANE_NAMES[row["priority"]],
+			talent_data = TalentDataInput.model_validate(orjson.loads(row["payload"])),
+			callback_url = row["callback_url"],
+			attempts = row["attempts"],
+		)
+
+	async def complete(self, job_id: str, result: List[str]) -> Optional[JobStatusResponse]:
+		pool = await self._pool()
+		row = await pool.fetchrow(COMPLETE_JOB_SQL, uuid.UUID(job_id), orjson.dumps(result).decode())
+		return _status_from_row(row) if row is not None else None
+
+	async def fail(self, job_id: str, error: str) -> Optional[JobStatusResponse]:
+		pool = await self._pool()
+		row = await pool.fetchrow(FAIL_JOB_SQL, uuid.UUID(job_id), error)
+		return _status_from_row(row) if row is not None else None
+
+	async def retry(self, job_id: str, error: str, delay: float) -> None:
+		"""delay 초 후 다시 실행되도록 대기 상태로 변경"""
+		pool = await self._pool()
+		await pool.execute(RETRY_JOB_SQL, uuid.UUID(job_id), error, delay)
+
+	async def get(self, job_id: str) -> Optional[JobStatusResponse]:
+		parsed = _parse_job_id(job_id)
+		if parsed is None:
+			return None
+		pool = await self._pool()
+		row = await pool.fetchrow(SELECT_JOB_SQL, parsed)
+		return _status_from_row(row) if row is not None else None
+
+	async def queued_depth(self) -> Dict[str, int]:
+		"""lane 별 대기 작업 수"""
+		pool = await self._pool()
+		rows = await pool.fetch(QUEUED_DEPTH_BY_LANE_SQL)
+		depth = {name: 0 for name in PRIORITY_LANES}
+		for row in rows:
+			depth[LANE_NAMES[row["priority"]]] = row["depth"]
+		return depth
+
+	async def requeue_stale(self, timeout: float, max_attempts: int) -> int:
+		pool = await self._pool()
+		rows = await pool.fetch(REQUEUE_STALE_JOBS_SQL, timeout, max_attempts)
+		if rows:
+			logger.warning(f"실행 시간을 초과한 작업 {len(rows)}개를 다시 대기 상태로 변경했습니다.")
+		return len(rows)
+
+	async def purge_finished(self, ttl: float) -> int:
+		pool = await self._pool()
+		status = await pool.execute(PURGE_FINISHED_JOBS_SQL, ttl)
+		return int(status.split()[-1])
+
+
+_job_queue: Optional[PostgresJobQueue] = None
+
+
+def get_job_queue() -> PostgresJobQueue:
+	global _job_queue
+	if _job_queue is None:
+		_job_queue = PostgresJobQueue()
+	return _job_queue
+
+
+def reset_job_queue() -> None:
+	global _job_queue
+	_job_queue = None
@@ -1,66 +1,399 @@
+import asyncio
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional
 
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage
-from app.core.config import settings
+from app.core.admission import bounded_deadline
+from app.core.config import get_settings
+from app.core.logging_config import log_payload
+from app.core.metrics import LLM_REQUESTS, LLM_RETRIES, record_llm_usage
+from app.core.rate_limiter import RateLimitTimeoutError, estimate_tokens, get_rate_limiter
+from app.core.resilience import CircuitBreaker, LatencyTracker, hedged_call, jittered_backoff
+
+# langchain_openai 는 import 비용이 커서 최초 호출 시점에 로드합니다.
+if TYPE_CHECKING:
+	from langchain_core.messages import BaseMessage
+	from langchain_openai import ChatOpenAI
 
 logger = logging.getLogger(__name__)
 
+
+class LLMInvocationError(Exception):
+	"""LLM 호출 실패 (재시도 소진, 재시도 불가 오류, 잘못된 응답)"""
+
+
+class LLMTimeoutError(LLMInvocationError):
+	"""LLM 호출 기한(deadline) 초과"""
+
+
+class LLMCircuitOpenError(LLMInvocationError):
+	"""서킷 브레이커 open 상태로 LLM 호출 차단"""
+
+	def __init__(self, message: str, retry_after: float):
+		super().__init__(message)
+		self.retry_after = retry_after
+
+
+class LLMRateLimitedError(LLMInvocationError):
+	"""호출 한도(RPM/TPM) 대기열에서 최대 대기 시간 초과"""
+
+	def __init__(self, message: str, retry_after: float):
+		super().__init__(message)
+		self.retry_after = retry_after
+
+
 # LLM 인스턴스 생성
-llm_instance : Optional[ChatOpenAI] = None
+llm_instance : Optional["ChatOpenAI"] = None
+fast_llm_instance : Optional["ChatOpenAI"] = None
 
-def get_llm_instance() -> ChatOpenAI:
+# 모델 별 서킷 브레이커 / 지연 시간 기록
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_latency_trackers: Dict[str, LatencyTracker] = {}
+
+def _create_chat_model(model_name: str) -> "ChatOpenAI":
+	"""ChatOpenAI 인스턴스 생성"""
+	from langchain_openai import ChatOpenAI
+
+	settings = get_settings()
+	if not settings.OPENAI_API_KEY:
+		logger.error("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
+		raise ValueError("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
+
+	logger.info(f"ChatOpenAI 모델 {model_name} 초기화 중 ...")
+	try:
+		# LLM 인스턴스 세팅 정보
+		# 재시도는 invoke_llm_with_resilience 에서 직접 처리하므로 클라이언트 자체 재시도는 끔
+		chat_model = ChatOpenAI(
+			openai_api_key = settings.OPENAI_API_KEY,
+			model_name = model_name,
+			temperature = settings.OPENAI_TEMPERATURE,
+			base_url = settings.OPENAI_BASE_URL,
+			timeout = settings.LLM_REQUEST_TIMEOUT,
+			max_retries = 0,
+		)
+		logger.info(f"ChatOpenAI 모델 {model_name} 초기화 완료")
+
+	except Exception as e:
+		logger.error(f"ChatOpenAI 모델 초기화 실패: {e}", exc_info=True)
+		raise
+
+	return chat_model
+
+
+def get_llm_instance() -> "ChatOpenAI":
 	"""LLM 인스턴스 생성"""
 	global llm_instance
 
 	if llm_instance is None:
-		if not settings.OPENAI_API_KEY:
-			logger.error("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
-			raise ValueError("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
-		
-		logger.info(f"ChatOpenAI 모델 {settings.OPENAI_MODEL_NAME} 초기화 중 ...")
+		llm_instance = _create_chat_model(get_settings().OPENAI_MODEL_NAME)
+	return llm_instance
+
+
+def get_fast_llm_instance() -> "ChatOpenAI":
+	"""cascade 1단계용 작은 모델 인스턴스 생성"""
+	global fast_llm_instance
+
+	if fast_llm_instance is None:
+		fast_llm_instance = _create_chat_model(get_settings().OPENAI_FAST_MODEL_NAME)
+	return fast_llm_instance
+
+
+def get_circuit_breaker(model_name: str) -> CircuitBreaker:
+	"""모델 별 서킷 브레이커"""
+	if model_name not in _circuit_breakers:
+		settings = get_settings()
+		_circuit_breakers[model_name] = CircuitBreaker(
+			failure_threshold = settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+			recovery_timeout = settings.LLM_CIRCUIT_RECOVERY_TIMEOUT,
+		)
+	return _circuit_breakers[model_name]
+
+
+def get_latency_tracker(model_name: str) -> LatencyTracker:
+	"""모델 별 최근 호출 지연 시간 기록"""
+	if model_name not in _latency_trackers:
+		_latency_trackers[model_name] = LatencyTracker()
+	return _latency_trackers[model_name]
+
+
+def is_retryable_llm_error(error: BaseException) -> bool:
+	"""재시도 대상 오류 여부 (429, 408, 5xx, 연결 오류/요청 타임아웃)"""
+	status_code = getattr(error, "status_code", None)
+	if status_code is not None:
+		return status_code in (408, 429) or status_code >= 500
+
+	import openai
+	return isinstance(error, openai.APIConnectionError)
+
+
+def _retry_after_seconds(error: BaseException) -> Optional[float]:
+	"""429/503 응답의 Retry-After 헤더(초)"""
+	response = getattr(error, "response", None)
+	value = getattr(response, "headers", {}).get("retry-after") if response is not None else None
+	try:
+		return float(value) if value is not None else None
+	except ValueError:
+		return None
+
+
+def _total_tokens(response: Any) -> Optional[int]:
+	"""응답 메세지의 실제 토큰 사용량"""
+	usage = getattr(response, "usage_metadata", None) or {}
+	return usage.get("total_tokens")
+
+
+def _hedge_delay(tracker: LatencyTracker) -> Optional[float]:
+	"""헤징 요청을 보낼 대기 시간 (최근 지연 시간 백분위, 샘플이 부족하면 헤징하지 않음)"""
+	settings = get_settings()
+	if not settings.LLM_HEDGE_ENABLED or len(tracker) < settings.LLM_HEDGE_MIN_SAMPLES:
+		return None
+	percentile = tracker.percentile(settings.LLM_HEDGE_PERCENTILE) or 0.0
+	return max(settings.LLM_HEDGE_MIN_DELAY, percentile)
+
+
+async def invoke_llm_with_resilience(
+	llm: "ChatOpenAI",
+	messages: List["BaseMessage"],
+	deadline: Optional[float] = None,
+	) -> Any:
+	"""
+	호출 기한 내에서 재시도(jitter 백오프), 헤징, 서킷 브레이커를 적용해 LLM 호출
+	실패 시 LLMTimeoutError / LLMCircuitOpenError / LLMInvocationError 발생
+	"""
+	settings = get_settings()
+	model_name = getattr(llm, "model_name", None) or settings.OPENAI_MODEL_NAME
+	# 클라이언트 요청 기한(X-Request-Timeout)이 있으면 남은 시간 안에서만 호출
+	deadline = bounded_deadline(settings.LLM_CALL_DEADLINE if deadline is None else deadline)
+
+	breaker = get_circuit_breaker(model_name)
+	tracker = get_latency_tracker(model_name)
+
+	if not breaker.allow_request():
+		retry_after = breaker.retry_after()
+		logger.warning(f"LLM '{model_name}' 서킷 브레이커 open 상태, {retry_after:.1f}초 후 재시도 가능")
+		LLM_REQUESTS.labels(model_name, "circuit_open").inc()
+		raise LLMCircuitOpenError(f"LLM '{model_name}' 호출이 일시적으로 차단되었습니다.", retry_after=retry_after)
+
+	def on_hedge() -> None:
+		logger.info(f"LLM '{model_name}' 응답 지연으로 헤징 요청 전송")
+
+	loop = asyncio.get_running_loop()
+	deadline_at = loop.time() + deadline
+	last_error: Optional[BaseException] = None
+
+	limiter = get_rate_limiter("llm", model_name)
+	estimated_tokens = 0
+	if limiter.enabled:
+		estimated_tokens = estimate_tokens("".join(str(message.content) for message in messages), settings.LLM_RATE_LIMIT_COMPLETION_TOKENS)
+
+	async def call() -> Any:
+		# 호출 한도(RPM/TPM)를 확보한 뒤 요청, 재시도/헤징 요청도 한도를 사용
+		if limiter.enabled:
+			await limiter.acquire(estimated_tokens, timeout=deadline_at - loop.time())
+		response = await llm.ainvoke(messages)
+		record_llm_usage(model_name, response)
+		if limiter.enabled:
+			await limiter.reconcile(estimated_tokens, _total_tokens(response))
+		return response
+
+	for attempt in range(settings.LLM_MAX_RETRIES + 1):
+		remaining = deadline_at - loop.time()
+		if remaining <= 0:
+			last_error = TimeoutError()
+			break
+
+		started = loop.time()
 		try:
-			# LLM 인스턴스 세팅 정보
-			llm_instance = ChatOpenAI(
-				openai_api_key = settings.OPENAI_API_KEY,
-				model_name = settings.OPENAI_MODEL_NAME,
-				temperature = settings.OPENAI_TEMPERATURE,
+			response = await asyncio.wait_for(
+				hedged_call(call, _hedge_delay(tracker), on_hedge=on_hedge),
+				timeout = remaining,
 			)
-			logger.info("ChatOpenAI 모델 초기화 완료")
-
+		except TimeoutError as e:
+			last_error = e
+			break
+		except RateLimitTimeoutError as e:
+			# 클라이언트 측 대기열 거부는 LLM 장애가 아니므로 서킷 브레이커에 기록하지 않음
+			LLM_REQUESTS.labels(model_name, "rate_limited").inc()
+			raise LLMRateLimitedError(f"LLM '{model_name}' 호출 한도 대기 시간을 초과했습니다.", retry_after=e.retry_after) from e
 		except Exception as e:
-			logger.error(f"ChatOpenAI 모델 초기화 실패: {e}", exc_info=True)
-			raise
+			last_error = e
+			if not is_retryable_llm_error(e):
+				logger.error(f"LLM 호출 중 재시도 불가 오류 발생: {e}", exc_info=True)
+				break
+
+			delay = max(jittered_backoff(attempt, settings.LLM_RETRY_BASE_DELAY, settings.LLM_RETRY_MAX_DELAY), _retry_after_seconds(e) or 0.0)
+			if attempt == settings.LLM_MAX_RETRIES or loop.time() + delay >= deadline_at:
+				logger.error(f"LLM 호출 재시도 중단 ({attempt + 1}회 시도): {e}")
+				break
+
+			logger.warning(f"LLM 호출 실패 ({attempt + 1}회), {delay:.2f}초 후 재시도: {e}")
+			LLM_RETRIES.labels(model_name).inc()
+			await asyncio.sleep(delay)
+		else:
+			tracker.record(loop.time() - started)
+			breaker.record_success()
+			LLM_REQUESTS.labels(model_name, "success").inc()
+			return response
+
+	# 4xx(잘못된/너무 긴 프롬프트, 인증 오류 등)는 요청 자체의 문제이므로 서킷 브레이커에 기록하지 않음
+	if isinstance(last_error, TimeoutError) or is_retryable_llm_error(last_error):
+		breaker.record_failure()
+	if isinstance(last_error, TimeoutError):
+		LLM_REQUESTS.labels(model_name, "timeout").inc()
+		logger.error(f"LLM 호출 기한({deadline}초) 초과")
+		raise LLMTimeoutError(f"LLM 호출 기한({deadline}초)을 초과했습니다.") from last_error
+	LLM_REQUESTS.labels(model_name, "error").inc()
+	raise LLMInvocationError(f"LLM 호출 실패: {last_error}") from last_error
 
-	return llm_instance
 
+def _response_content(response: Any) -> str:
+	"""LLM 응답 메세지에서 텍스트 추출"""
+	if response and hasattr(response, "content"):
+		log_payload(logger, "LLM 응답", response.content)
+		return response.content
 
-async def invoke_llm_for_experience(prompt: str) -> Optional[str]:
+	logger.warning("LLM 응답이 비어있거나 잘못된 형식입니다.")
+	raise LLMInvocationError("LLM 응답이 비어있거나 잘못된 형식입니다.")
+
+
+async def invoke_llm_for_experience(prompt: str, deadline: Optional[float] = None, llm: Optional["ChatOpenAI"] = None) -> str:
 	"""
 	주어진 프롬프트를 사용하여 LLM을 비동기로 호출하고 응답 텍스트 반환
+	호출 실패는 빈 결과 대신 LLMInvocationError 계열 예외로 전달됩니다.
 	"""
-	try:
-		# LLM 인스턴스 가져오기
-		llm = get_llm_instance()
+	from langchain_core.messages import HumanMessage
 
-		# LLM 전달할 메세지 리스트 생성
-		messages = [
-			HumanMessage(content=prompt)
-		]
+	# LLM 인스턴스 가져오기
+	if llm is None:
+		try:
+			llm = get_llm_instance()
+		except Exception as e:
+			raise LLMInvocationError(f"LLM 클라이언트 초기화 실패: {e}") from e
 
-		logger.debug(f"LLM 전달 메세지 : {str(messages)[:300]}...")
+	# LLM 전달할 메세지 리스트 생성
+	messages = [
+		HumanMessage(content=prompt)
+	]
 
-		# LLM 비동기 호출
-		response = await llm.ainvoke(messages)
+	log_payload(logger, "LLM 전달 메세지", prompt)
 
-		if response and hasattr(response, "content"):
-			logger.debug(f"LLM 응답 : {str(response.content)[:300]}...")
-			return response.content
-		else:
-			logger.warning("LLM 응답이 비어있거나 잘못된 형식입니다.")
-			return None
-	
+	# LLM 비동기 호출
+	response = await invoke_llm_with_resilience(llm, messages, deadline=deadline)
+	return _response_content(response)
+
+
+# cascade 단계 이름
+CASCADE_TIER_FAST = "fast"
+CASCADE_TIER_PRIMARY = "primary"
+
+
+class CascadeTierMetrics:
+	"""cascade 단계 별 호출 통계 (임계치 튜닝용)"""
+
+	def __init__(self):
+		self.calls = 0
+		self.accepted = 0
+		self.escalated = 0
+		self.failures = 0
+		self.total_latency = 0.0
+		# 신뢰도 분포 (0.0, 0.1, ..., 1.0 구간 별 개수)
+		self.confidence_buckets = [0] * 11
+
+	def record_call(self, latency: float) -> None:
+		self.calls += 1
+		self.total_latency += latency
+
+	def record_confidence(self, confidence: float) -> None:
+		bucket = min(10, max(0, int(confidence * 10)))
+		self.confidence_buckets[bucket] += 1
+
+	def snapshot(self) -> Dict[str, Any]:
+		return {
+			"calls": self.calls,
+			"accepted": self.accepted,
+			"escalated": self.escalated,
+			"failures": self.failures,
+			"accept_rate": round(self.accepted / self.calls, 4) if self.calls else None,
+			"avg_latency_ms": round(self.total_latency / self.calls * 1000, 2) if self.calls else None,
+			"confidence_buckets": list(self.confidence_buckets),
+		}
+
+
+_cascade_metrics: Dict[str, CascadeTierMetrics] = {
+	CASCADE_TIER_FAST: CascadeTierMetrics(),
+	CASCADE_TIER_PRIMARY: CascadeTierMetrics(),
+}
+
+
+def get_cascade_metrics() -> Dict[str, Dict[str, Any]]:
+	"""cascade 단계 별 통계 조회"""
+	return {tier: metrics.snapshot() for tier, metrics in _cascade_metrics.items()}
+
+
+def reset_cascade_metrics() -> None:
+	for tier in _cascade_metrics:
+		_cascade_metrics[tier] = CascadeTierMetrics()
+
+
+class CascadeResult(NamedTuple):
+	content: str
+	# 최종 응답을 만든 단계 (fast / primary)
+	tier: str
+	# 작은 모델 응답의 신뢰도 (작은 모델 호출 실패 시 None)
+	confidence: Optional[float]
+
+
+async def invoke_llm_cascade(
+	prompt: str,
+	assess: Callable[[str], float],
+	deadline: Optional[float] = None,
+	) -> CascadeResult:
+	"""
+	작은 모델로 먼저 추론하고 assess(응답) 신뢰도가 LLM_CASCADE_MIN_CONFIDENCE 이상이면 그대로 사용
+	신뢰도가 낮거나 작은 모델 호출이 실패하면 큰 모델(OPENAI_MODEL_NAME)로 escalate 합니다.
+	"""
+	settings = get_settings()
+	deadline = bounded_deadline(settings.LLM_CALL_DEADLINE if deadline is None else deadline)
+	loop = asyncio.get_running_loop()
+	deadline_at = loop.time() + deadline
+
+	fast_metrics = _cascade_metrics[CASCADE_TIER_FAST]
+	primary_metrics = _cascade_metrics[CASCADE_TIER_PRIMARY]
+	confidence: Optional[float] = None
+
+	started = loop.time()
+	try:
+		fast_content = await invoke_llm_for_experience(
+			prompt,
+			deadline = min(settings.LLM_FAST_CALL_DEADLINE, deadline),
+			llm = get_fast_llm_instance(),
+		)
 	except Exception as e:
-		logger.error(f"LLM 호출 중 오류 발생: {e}", exc_info=True)
-		return None
+		# 작은 모델 실패는 요청 실패가 아닌 escalate 사유
+		fast_metrics.record_call(loop.time() - started)
+		fast_metrics.failures += 1
+		fast_metrics.escalated += 1
+		logger.warning(f"cascade 작은 모델 호출 실패, 큰 모델로 escalate: {e}")
+	else:
+		fast_metrics.record_call(loop.time() - started)
+		confidence = assess(fast_content)
+		fast_metrics.record_confidence(confidence)
+
+		if confidence >= settings.LLM_CASCADE_MIN_CONFIDENCE:
+			fast_metrics.accepted += 1
+			logger.info(f"cascade 작은 모델 응답 사용 (신뢰도 {confidence:.2f})")
+			return CascadeResult(fast_content, CASCADE_TIER_FAST, confidence)
+
+		fast_metrics.escalated += 1
+		logger.info(f"cascade 작은 모델 신뢰도 {confidence:.2f} < {settings.LLM_CASCADE_MIN_CONFIDENCE}, 큰 모델로 escalate")
+
+	started = loop.time()
+	try:
+		content = await invoke_llm_for_experience(prompt, deadline=max(0.0, deadline_at - loop.time()))
+	except Exception:
+		primary_metrics.record_call(loop.time() - started)
+		primary_metrics.failures += 1
+		raise
+
+	primary_metrics.record_call(loop.time() - started)
+	primary_metrics.accepted += 1
+	return CascadeResult(content, CASCADE_TIER_PRIMARY, confidence)
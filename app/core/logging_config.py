@@ -0,0 +1,132 @@
+import json
+import logging
+import queue
+import random
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Iterator, Optional, TextIO
+
+from app.core.config import get_settings
+
+# 로그 포맷팅과 출력(I/O)을 별도 스레드(QueueListener)에서 처리해 요청 처리 경로에서는 큐에 넣기만 합니다.
+# 프롬프트, LLM 응답 등 수 KB 본문은 log_payload 로 기록하며 DEBUG 레벨이거나 샘플링된 요청만 남깁니다.
+# 샘플링은 sample_request_payloads 블록(요청 1건) 단위로 한 번 결정해 같은 요청의 프롬프트와 응답이 함께 기록됩니다.
+
+LOG_FORMAT_TEXT = "text"
+LOG_FORMAT_JSON = "json"
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# LogRecord 기본 속성 (extra 로 전달된 필드만 JSON 에 포함하기 위해)
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+# 현재 요청의 본문 로그 샘플링 여부, sample_request_payloads 블록 안에서만 설정
+_payload_sampled: ContextVar[Optional[bool]] = ContextVar("payload_sampled", default=None)
+
+
+class JsonFormatter(logging.Formatter):
+	"""한 줄 JSON 로그 (extra 로 전달된 필드 포함)"""
+
+	def format(self, record: logging.LogRecord) -> str:
+		entry = {
+			"time": self.formatTime(record),
+			"level": record.levelname,
+			"logger": record.name,
+			"message": record.getMessage(),
+		}
+		for key, value in vars(record).items():
+			if key not in _RECORD_ATTRIBUTES:
+				entry[key] = value
+		if record.exc_info:
+			entry["exc_info"] = self.formatException(record.exc_info)
+		return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(
+	level: Optional[str] = None,
+	log_format: Optional[str] = None,
+	stream: Optional[TextIO] = None,
+	) -> QueueListener:
+	"""
+	root 로거에 QueueHandler 를 설치하고 QueueListener 스레드에서 stream 으로 출력
+	다시 호출하면 이전 핸들러/리스너를 정리하고 새 설정으로 교체합니다.
+	"""
+	global _queue_handler, _listener
+
+	settings = get_settings()
+	level = level or settings.LOG_LEVEL
+	log_format = log_format or settings.LOG_FORMAT
+
+	shutdown_logging()
+
+	output_handler = logging.StreamHandler(stream or sys.stderr)
+	output_handler.setFormatter(JsonFormatter() if log_format == LOG_FORMAT_JSON else logging.Formatter(TEXT_FORMAT))
+
+	log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+	_queue_handler = QueueHandler(log_queue)
+	_listener = QueueListener(log_queue, output_handler, respect_handler_level=True)
+
+	root = logging.getLogger()
+	root.setLevel(level.upper())
+	root.addHandler(_queue_handler)
+	_listener.start()
+	return _listener
+
+
+def shutdown_logging() -> None:
+	"""큐에 남은 로그를 모두 출력한 뒤 리스너 종료"""
+	global _queue_handler, _listener
+
+	if _listener is not None:
+		_listener.stop()
+		_listener = None
+	if _queue_handler is not None:
+		logging.getLogger().removeHandler(_queue_handler)
+		_queue_handler = None
+
+
+def _draw_payload_sample() -> bool:
+	sample_rate = get_settings().LOG_PAYLOAD_SAMPLE_RATE
+	return sample_rate > 0 and random.random() < sample_rate
+
+
+@contextmanager
+def sample_request_payloads() -> Iterator[bool]:
+	"""
+	with 블록(요청 1건) 안의 log_payload 샘플링 여부를 한 번만 결정
+	asyncio.gather 로 분기한 작업도 같은 결정을 사용합니다 (context 복사).
+	"""
+	sampled = _draw_payload_sample()
+	token = _payload_sampled.set(sampled)
+	try:
+		yield sampled
+	finally:
+		_payload_sampled.reset(token)
+
+
+def log_payload(logger: logging.Logger, label: str, payload: Any) -> None:
+	"""
+	프롬프트, LLM 응답 같은 요청 본문 로그
+	DEBUG 레벨이면 항상, 아니면 LOG_PAYLOAD_SAMPLE_RATE 확률로 샘플링된 요청만 INFO 로 기록하며
+	기록하지 않는 경우 문자열 변환도 하지 않습니다.
+	sample_request_payloads 블록 밖(배치 준비 등)에서는 호출마다 샘플링합니다.
+	"""
+	if logger.isEnabledFor(logging.DEBUG):
+		level = logging.DEBUG
+	else:
+		sampled = _payload_sampled.get()
+		if sampled is None:
+			sampled = _draw_payload_sample()
+		if not sampled or not logger.isEnabledFor(logging.INFO):
+			return
+		level = logging.INFO
+
+	text = str(payload)
+	max_chars = get_settings().LOG_PAYLOAD_MAX_CHARS
+	truncated = text if len(text) <= max_chars else text[:max_chars] + "..."
+	logger.log(level, "%s : %s", label, truncated, extra={"payload_label": label, "payload_chars": len(text)})
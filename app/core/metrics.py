@@ -0,0 +1,207 @@
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+
+from app.core.config import get_settings
+
+# 추론 파이프라인 단계 별 지연 시간, LLM 토큰/재시도, 캐시 적중 지표 (Prometheus, /metrics 로 노출)
+# OTEL_ENABLED=true 이고 opentelemetry-api 가 설치되어 있으면 단계 별 span 도 함께 생성합니다.
+# SERVER_TIMING_ENABLED=true 이면 요청 별 단계 소요 시간을 Server-Timing 응답 헤더로 반환합니다 (부하 테스트용).
+
+logger = logging.getLogger(__name__)
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# 단계 이름 (inference_stage_duration_seconds 의 stage 레이블)
+STAGE_TOTAL = "total"
+STAGE_PREPROCESS = "preprocess"
+STAGE_EMBED_QUERY = "embed_query"
+STAGE_RETRIEVE_UNIVERSITY = "retrieve_university"
+STAGE_RETRIEVE_COMPANY = "retrieve_company"
+STAGE_RETRIEVE_NEWS = "retrieve_news"
+STAGE_RELATIONAL = "relational"
+STAGE_FORMAT_CONTEXT = "format_context"
+STAGE_RULES = "rules"
+STAGE_PROMPT = "prompt"
+STAGE_LLM = "llm"
+STAGE_POSTPROCESS = "postprocess"
+STAGE_CACHE_LOOKUP = "cache_lookup"
+
+# 수 ms 단위 전처리부터 수십 초 LLM 호출까지
+STAGE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+STAGE_DURATION = Histogram(
+	"inference_stage_duration_seconds",
+	"추론 파이프라인 단계 별 소요 시간",
+	["stage"],
+	buckets = STAGE_BUCKETS,
+)
+
+LLM_TOKENS = Counter(
+	"llm_tokens_total",
+	"LLM 토큰 사용량 (kind: prompt, completion)",
+	["model", "kind"],
+)
+
+LLM_REQUESTS = Counter(
+	"llm_requests_total",
+	"LLM 호출 결과 (outcome: success, error, timeout, circuit_open, rate_limited)",
+	["model", "outcome"],
+)
+
+LLM_RETRIES = Counter(
+	"llm_retries_total",
+	"LLM 호출 재시도 수",
+	["model"],
+)
+
+CACHE_REQUESTS = Counter(
+	"cache_requests_total",
+	"캐시 조회 결과 (result: hit, miss)",
+	["cache", "result"],
+)
+
+JOB_EVENTS = Counter(
+	"inference_jobs_total",
+	"비동기 추론 작업 이벤트 (event: submitted, rejected, succeeded, failed, retried)",
+	["priority", "event"],
+)
+
+ADMISSION_REQUESTS = Counter(
+	"admission_requests_total",
+	"추론 요청 admission 결과 (result: admitted, queue_full, queue_timeout, deadline)",
+	["result"],
+)
+
+DEGRADATIONS = Counter(
+	"inference_degradations_total",
+	"추론 응답 등급을 낮춘 사유 (reason: news_skipped, retrieval_failed, relational_failed, rules_only, stale_cache)",
+	["reason"],
+)
+
+
+_tracer: Optional[Any] = None
+_tracer_checked = False
+
+# 현재 요청의 단계 별 누적 소요 시간(초), collect_stage_timings 블록 안에서만 기록
+_stage_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("stage_timings", default=None)
+
+
+def _get_tracer() -> Optional[Any]:
+	"""OTEL_ENABLED 이고 opentelemetry 가 설치된 경우에만 tracer 반환"""
+	global _tracer, _tracer_checked
+
+	if not _tracer_checked:
+		_tracer_checked = True
+		if get_settings().OTEL_ENABLED:
+			try:
+				from opentelemetry import trace
+				_tracer = trace.get_tracer("app.inference")
+			except ImportError:
+				logger.warning("OTEL_ENABLED=true 이지만 opentelemetry-api 가 설치되어 있지 않아 span 을 생성하지 않습니다.")
+	return _tracer
+
+
+@contextmanager
+def track_stage(stage: str) -> Iterator[None]:
+	"""with 블록의 소요 시간을 단계 지표로 기록 (예외가 발생해도 기록)"""
+	tracer = _get_tracer()
+	started = time.perf_counter()
+	try:
+		if tracer is None:
+			yield
+		else:
+			with tracer.start_as_current_span(f"inference.{stage}"):
+				yield
+	finally:
+		elapsed = time.perf_counter() - started
+		STAGE_DURATION.labels(stage).observe(elapsed)
+		timings = _stage_timings.get()
+		if timings is not None:
+			timings[stage] = timings.get(stage, 0.0) + elapsed
+
+
+@contextmanager
+def collect_stage_timings() -> Iterator[Dict[str, float]]:
+	"""
+	with 블록 안에서 실행된 track_stage 소요 시간을 단계 별로 합산
+	asyncio.gather 로 분기한 작업도 같은 dict 에 기록됩니다 (context 복사 시 참조 공유).
+	"""
+	timings: Dict[str, float] = {}
+	token = _stage_timings.set(timings)
+	try:
+		yield timings
+	finally:
+		_stage_timings.reset(token)
+
+
+def format_server_timing(timings: Dict[str, float]) -> str:
+	"""Server-Timing 헤더 값 (예: "llm;dur=812.3, total;dur=840.1")"""
+	return ", ".join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in timings.items())
+
+
+class ServerTimingMiddleware:
+	"""
+	요청 별 단계 소요 시간을 Server-Timing 응답 헤더로 추가하는 ASGI 미들웨어
+	내부 처리 시간이 노출되므로 SERVER_TIMING_ENABLED=true 일 때만 동작합니다.
+	"""
+
+	def __init__(self, app):
+		self.app = app
+
+	async def __call__(self, scope, receive, send):
+		if scope["type"] != "http" or not get_settings().SERVER_TIMING_ENABLED:
+			await self.app(scope, receive, send)
+			return
+
+		with collect_stage_timings() as timings:
+			async def send_with_timing(message):
+				if message["type"] == "http.response.start" and timings:
+					headers = list(message.get("headers", []))
+					headers.append((b"server-timing", format_server_timing(timings).encode("latin-1")))
+					message = {**message, "headers": headers}
+				await send(message)
+
+			await self.app(scope, receive, send_with_timing)
+
+
+def record_llm_usage(model_name: str, response: Any) -> None:
+	"""LLM 응답 메세지의 토큰 사용량 기록"""
+	usage = getattr(response, "usage_metadata", None) or {}
+	if usage.get("input_tokens"):
+		LLM_TOKENS.labels(model_name, "prompt").inc(usage["input_tokens"])
+	if usage.get("output_tokens"):
+		LLM_TOKENS.labels(model_name, "completion").inc(usage["output_tokens"])
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+	CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def record_job_event(priority: str, event: str) -> None:
+	JOB_EVENTS.labels(priority, event).inc()
+
+
+def record_admission(result: str) -> None:
+	ADMISSION_REQUESTS.labels(result).inc()
+
+
+def record_degradation(reason: str) -> None:
+	DEGRADATIONS.labels(reason).inc()
+
+
+def render_metrics() -> bytes:
+	"""
+	Prometheus 텍스트 형식 지표
+	멀티 워커 실행 시 PROMETHEUS_MULTIPROC_DIR 가 설정되어 있으면 모든 워커의 지표를 합산합니다 (gunicorn.conf.py).
+	"""
+	if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+		registry = CollectorRegistry()
+		multiprocess.MultiProcessCollector(registry)
+		return generate_latest(registry)
+	return generate_latest(REGISTRY)
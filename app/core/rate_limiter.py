@@ -0,0 +1,333 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+from app.core.config import get_settings
+from app.core.resilience import LatencyTracker
+
+# OpenAI 분당 요청 수(RPM), 분당 토큰 수(TPM) 한도를 넘지 않도록 호출 전에 대기시키는 토큰 버킷 리미터
+# 대기열은 도착 순서(FIFO)로 처리하고, 최대 대기 시간(max_queue_time) 안에 차례가 오지 않으면 거부합니다.
+# 기본은 프로세스 단위이며, RATE_LIMIT_BACKEND=postgres 설정 시 rate_limit_buckets 테이블로 워커 간에 공유합니다.
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_BACKEND_LOCAL = "local"
+RATE_LIMIT_BACKEND_POSTGRES = "postgres"
+
+
+class RateLimitTimeoutError(Exception):
+	"""최대 대기 시간 안에 호출 한도를 확보하지 못함"""
+
+	def __init__(self, message: str, retry_after: float):
+		super().__init__(message)
+		self.retry_after = retry_after
+
+
+class BucketRequest(NamedTuple):
+	"""버킷 1개에서 가져갈 양"""
+	key: str
+	capacity: float
+	# 초당 채워지는 양
+	refill_rate: float
+	amount: float
+
+
+def estimate_tokens(text: str, completion_tokens: int = 0) -> int:
+	"""
+	요청 토큰 수 추정 (한글은 글자 당 약 1토큰, 영문은 4글자 당 약 1토큰)
+	실제 사용량은 응답 후 reconcile 로 보정합니다.
+	"""
+	ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+	return (ascii_chars // 4) + (len(text) - ascii_chars) + completion_tokens
+
+
+class TokenBucket:
+	"""capacity 까지 쌓이고 초당 refill_rate 만큼 채워지는 토큰 버킷"""
+
+	def __init__(self, capacity: float, refill_rate: float, clock: Callable[[], float] = time.monotonic):
+		self.capacity = capacity
+		self.refill_rate = refill_rate
+		self._clock = clock
+		self._tokens = capacity
+		self._updated_at = clock()
+
+	@property
+	def tokens(self) -> float:
+		now = self._clock()
+		self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.refill_rate)
+		self._updated_at = now
+		return self._tokens
+
+	def wait_time(self, amount: float) -> float:
+		"""amount 를 가져가기까지 기다려야 하는 시간(초), capacity 를 넘는 요청은 capacity 로 계산"""
+		shortage = min(amount, self.capacity) - self.tokens
+		return max(0.0, shortage / self.refill_rate)
+
+	def consume(self, amount: float) -> None:
+		# 실제 사용량 보정으로 음수가 될 수 있으며, 그만큼 다음 요청이 기다립니다.
+		self._tokens = self.tokens - amount
+
+	def refund(self, amount: float) -> None:
+		self._tokens = min(self.capacity, self.tokens + amount)
+
+
+class LocalBucketStore:
+	"""프로세스 내 버킷 저장소"""
+
+	def __init__(self, clock: Callable[[], float] = time.monotonic):
+		self._clock = clock
+		self._buckets: Dict[str, TokenBucket] = {}
+
+	def _bucket(self, request: BucketRequest) -> TokenBucket:
+		if request.key not in self._buckets:
+			self._buckets[request.key] = TokenBucket(request.capacity, request.refill_rate, self._clock)
+		return self._buckets[request.key]
+
+	async def try_take(self, requests: List[BucketRequest]) -> float:
+		"""모든 버킷에 여유가 있으면 가져가고 0, 아니면 가져가지 않고 필요한 대기 시간 반환"""
+		wait = max(self._bucket(request).wait_time(request.amount) for request in requests)
+		if wait > 0:
+			return wait
+		for request in requests:
+			self._bucket(request).consume(request.amount)
+		return 0.0
+
+	async def adjust(self, request: BucketRequest) -> None:
+		"""사용량 보정 (amount 양수면 추가 차감, 음수면 반환)"""
+		bucket = self._bucket(request)
+		if request.amount >= 0:
+			bucket.consume(request.amount)
+		else:
+			bucket.refund(-request.amount)
+
+
+CREATE_BUCKET_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+	name TEXT PRIMARY KEY,
+	tokens DOUBLE PRECISION NOT NULL,
+	updated_at TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()
+)
+"""
+
+SELECT_BUCKETS_SQL = """
+SELECT name, tokens, EXTRACT(EPOCH FROM clock_timestamp() - updated_at)::float8 AS elapsed
+FROM rate_limit_buckets
+WHERE name = ANY($1::text[])
+"""
+
+UPSERT_BUCKET_SQL = """
+INSERT INTO rate_limit_buckets (name, tokens, updated_at)
+VALUES ($1, $2, clock_timestamp())
+ON CONFLICT (name) DO UPDATE SET tokens = EXCLUDED.tokens, updated_at = EXCLUDED.updated_at
+"""
+
+
+class PostgresBucketStore:
+	"""
+	여러 워커(프로세스)가 공유하는 버킷 저장소
+	버킷 이름 별 advisory lock(트랜잭션 범위)으로 갱신을 직렬화하며, 시각은 DB 시계(clock_timestamp)를 사용합니다.
+	"""
+
+	def __init__(self, pool_factory: Optional[Callable[[], Awaitable[Any]]] = None):
+		self._pool_factory = pool_factory
+		self._table_ready = False
+
+	async def _pool(self):
+		if self._pool_factory is None:
+			from app.core.relational_db import get_relational_pool
+			self._pool_factory = get_relational_pool
+		pool = await self._pool_factory()
+		if not self._table_ready:
+			await pool.execute(CREATE_BUCKET_TABLE_SQL)
+			self._table_ready = True
+		return pool
+
+	async def _update(self, requests: List[BucketRequest], take: bool) -> float:
+		pool = await self._pool()
+		keys = sorted({request.key for request in requests})
+		async with pool.acquire() as conn:
+			async with conn.transaction():
+				# 교착 방지를 위해 항상 같은 순서로 잠금
+				for key in keys:
+					await conn.execute("SELECT pg_advisory_xact_lock(hashtext($1))", key)
+				rows = {row["name"]: row for row in await conn.fetch(SELECT_BUCKETS_SQL, keys)}
+
+				current = {}
+				for request in requests:
+					row = rows.get(request.key)
+					if row is None:
+						current[request.key] = request.capacity
+					else:
+						current[request.key] = min(request.capacity, row["tokens"] + row["elapsed"] * request.refill_rate)
+
+				if take:
+					wait = max(
+						max(0.0, (min(request.amount, request.capacity) - current[request.key]) / request.refill_rate)
+						for request in requests
+					)
+					if wait > 0:
+						return wait
+
+				for request in requests:
+					await conn.execute(UPSERT_BUCKET_SQL, request.key, min(request.capacity, current[request.key] - request.amount))
+		return 0.0
+
+	async def try_take(self, requests: List[BucketRequest]) -> float:
+		return await self._update(requests, take=True)
+
+	async def adjust(self, request: BucketRequest) -> None:
+		await self._update([request], take=False)
+
+
+class RateLimiter:
+	"""
+	RPM/TPM 토큰 버킷 리미터
+	대기 중인 호출은 asyncio.Lock(FIFO) 순서로 한 건씩 한도를 확보하므로 먼저 온 요청이 먼저 처리됩니다.
+	"""
+
+	def __init__(
+		self,
+		name: str,
+		requests_per_minute: int = 0,
+		tokens_per_minute: int = 0,
+		max_queue_time: float = 10.0,
+		store: Optional[Any] = None,
+		clock: Callable[[], float] = time.monotonic,
+		):
+		self.name = name
+		self.requests_per_minute = requests_per_minute
+		self.tokens_per_minute = tokens_per_minute
+		self.max_queue_time = max_queue_time
+		self._store = store or LocalBucketStore(clock)
+		self._clock = clock
+		self._lock = asyncio.Lock()
+
+		# 지표
+		self.queue_depth = 0
+		self.max_queue_depth = 0
+		self.acquired = 0
+		self.rejected = 0
+		self.total_wait = 0.0
+		self.wait_times = LatencyTracker()
+
+	@property
+	def enabled(self) -> bool:
+		return self.requests_per_minute > 0 or self.tokens_per_minute > 0
+
+	def _requests(self, tokens: int) -> List[BucketRequest]:
+		requests = []
+		if self.requests_per_minute > 0:
+			requests.append(BucketRequest(f"{self.name}:rpm", self.requests_per_minute, self.requests_per_minute / 60, 1))
+		if self.tokens_per_minute > 0 and tokens > 0:
+			requests.append(BucketRequest(f"{self.name}:tpm", self.tokens_per_minute, self.tokens_per_minute / 60, tokens))
+		return requests
+
+	def _reject(self, retry_after: float) -> RateLimitTimeoutError:
+		self.rejected += 1
+		logger.warning(f"호출 한도 '{self.name}' 대기 시간 초과로 요청 거부 (대기열 {self.queue_depth}건, {retry_after:.1f}초 후 가능)")
+		return RateLimitTimeoutError(f"호출 한도 '{self.name}' 대기 시간을 초과했습니다.", retry_after=retry_after)
+
+	async def acquire(self, tokens: int = 0, timeout: Optional[float] = None) -> float:
+		"""
+		호출 1건과 tokens 만큼의 한도를 확보할 때까지 대기하고 대기 시간(초) 반환
+		timeout(기본 max_queue_time) 안에 확보할 수 없으면 기다리지 않고 RateLimitTimeoutError 발생
+		"""
+		requests = self._requests(tokens)
+		if not requests:
+			return 0.0
+
+		timeout = self.max_queue_time if timeout is None else min(timeout, self.max_queue_time)
+		started = self._clock()
+		deadline = started + timeout
+
+		self.queue_depth += 1
+		self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+		try:
+			try:
+				await asyncio.wait_for(self._lock.acquire(), timeout=max(0.0, timeout))
+			except TimeoutError:
+				raise self._reject(timeout) from None
+
+			try:
+				while True:
+					wait = await self._store.try_take(requests)
+					if wait <= 0:
+						break
+					if self._clock() + wait > deadline:
+						raise self._reject(wait)
+					await asyncio.sleep(wait)
+			finally:
+				self._lock.release()
+		finally:
+			self.queue_depth -= 1
+
+		waited = self._clock() - started
+		self.acquired += 1
+		self.total_wait += waited
+		self.wait_times.record(waited)
+		return waited
+
+	async def reconcile(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+		"""응답의 실제 토큰 사용량으로 TPM 버킷 보정"""
+		if actual_tokens is None or self.tokens_per_minute <= 0 or actual_tokens == estimated_tokens:
+			return
+		await self._store.adjust(BucketRequest(f"{self.name}:tpm", self.tokens_per_minute, self.tokens_per_minute / 60, actual_tokens - estimated_tokens))
+
+	def snapshot(self) -> Dict[str, Any]:
+		return {
+			"requests_per_minute": self.requests_per_minute,
+			"tokens_per_minute": self.tokens_per_minute,
+			"queue_depth": self.queue_depth,
+			"max_queue_depth": self.max_queue_depth,
+			"acquired": self.acquired,
+			"rejected": self.rejected,
+			"avg_wait": round(self.total_wait / self.acquired, 4) if self.acquired else 0.0,
+			"p95_wait": self.wait_times.percentile(95),
+		}
+
+
+# 리미터 이름(llm:<모델>, embedding:<모델>) 별 인스턴스
+_rate_limiters: Dict[str, RateLimiter] = {}
+_shared_store: Optional[Any] = None
+
+
+def _get_store():
+	"""설정에 따른 버킷 저장소 (프로세스 내 리미터가 공유)"""
+	global _shared_store
+	if _shared_store is None:
+		if get_settings().RATE_LIMIT_BACKEND == RATE_LIMIT_BACKEND_POSTGRES:
+			_shared_store = PostgresBucketStore()
+		else:
+			_shared_store = LocalBucketStore()
+	return _shared_store
+
+
+def get_rate_limiter(kind: str, model_name: str) -> RateLimiter:
+	"""LLM(kind="llm") / 임베딩(kind="embedding") 모델 별 리미터"""
+	name = f"{kind}:{model_name}"
+	if name not in _rate_limiters:
+		settings = get_settings()
+		if kind == "embedding":
+			rpm, tpm = settings.EMBEDDING_RPM_LIMIT, settings.EMBEDDING_TPM_LIMIT
+		else:
+			rpm, tpm = settings.LLM_RPM_LIMIT, settings.LLM_TPM_LIMIT
+		_rate_limiters[name] = RateLimiter(
+			name,
+			requests_per_minute = rpm,
+			tokens_per_minute = tpm,
+			max_queue_time = settings.RATE_LIMIT_MAX_QUEUE_TIME,
+			store = _get_store(),
+		)
+	return _rate_limiters[name]
+
+
+def get_rate_limiter_metrics() -> Dict[str, Dict[str, Any]]:
+	"""리미터 별 대기열 길이, 대기 시간, 거부 수"""
+	return {name: limiter.snapshot() for name, limiter in _rate_limiters.items()}
+
+
+def reset_rate_limiters() -> None:
+	global _shared_store
+	_rate_limiters.clear()
+	_shared_store = None
@@ -0,0 +1,230 @@
+import asyncio
+import json
+import logging
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+
+import asyncpg
+
+from app.core.config import get_settings
+from app.core.degradation import DEGRADED_RELATIONAL_FAILED, mark_degraded
+from app.core.shared_cache import get_shared_cache, CACHE_COMPANY_CONTEXT
+from app.schemas.company import CompanyFacts, CompanyNewsItem, CompanyTenureContext
+
+logger = logging.getLogger(__name__)
+
+# setup_* 스크립트가 적재한 company / company_news 테이블을 요청 시점에 직접 조회
+# 조회는 모두 migrate_relational_schema.py 의 인덱스를 사용합니다.
+# company(name) -> company_name_key, company_news(company_id, news_date) -> company_news_company_id_news_date_idx
+
+_COMPANY_FACTS_COLUMNS = """
+	c.id,
+	c.name,
+	COALESCE(c.data->'base_company_info'->'data'->'seedCorp', '{}'::jsonb) AS seed_corp,
+	COALESCE(c.data->'organization'->'data', '[]'::jsonb) AS organization,
+	COALESCE(c.data->'investment'->'data', '[]'::jsonb) AS investment
+"""
+
+COMPANY_FACTS_SQL = f"""
+SELECT {_COMPANY_FACTS_COLUMNS}
+FROM company c
+WHERE c.name = $1
+"""
+
+COMPANY_NEWS_SQL = """
+SELECT title, original_link, news_date
+FROM company_news
+WHERE company_id = $1 AND news_date BETWEEN $2 AND $3
+ORDER BY news_date DESC
+LIMIT $4
+"""
+
+# 회사 정보와 재직 기간 뉴스를 한 번의 왕복으로 조회
+COMPANY_TENURE_SQL = f"""
+SELECT {_COMPANY_FACTS_COLUMNS},
+	COALESCE((
+		SELECT jsonb_agg(jsonb_build_object('title', n.title, 'original_link', n.original_link, 'news_date', n.news_date) ORDER BY n.news_date DESC)
+		FROM (
+			SELECT title, original_link, news_date
+			FROM company_news
+			WHERE company_id = c.id AND news_date BETWEEN $2 AND $3
+			ORDER BY news_date DESC
+			LIMIT $4
+		) n
+	), '[]'::jsonb) AS news
+FROM company c
+WHERE c.name = $1
+"""
+
+# asyncpg 커넥션 풀 인스턴스
+_relational_pool: Optional[asyncpg.Pool] = None
+_relational_pool_lock = asyncio.Lock()
+
+
+def to_asyncpg_dsn(database_url: str) -> str:
+	"""SQLAlchemy 형식 URL(postgresql+psycopg2://)을 asyncpg DSN으로 변환"""
+	scheme, sep, rest = database_url.partition("://")
+	if not sep:
+		return database_url
+	return f"{scheme.split('+', 1)[0]}://{rest}"
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+	"""JSONB 컬럼을 dict/list로 디코딩"""
+	await conn.set_type_codec("jsonb", encoder=json.dumps, decoder=json.loads, schema="pg_catalog")
+
+
+async def get_relational_pool() -> asyncpg.Pool:
+	"""관계형 조회용 asyncpg 커넥션 풀 생성"""
+	global _relational_pool
+
+	if _relational_pool is None:
+		async with _relational_pool_lock:
+			if _relational_pool is None:
+				settings = get_settings()
+				logger.info("관계형 DB 커넥션 풀 초기화 중 ...")
+				_relational_pool = await asyncpg.create_pool(
+					dsn = to_asyncpg_dsn(settings.DATABASE_URL),
+					min_size = settings.RELATIONAL_DB_POOL_MIN_SIZE,
+					max_size = settings.RELATIONAL_DB_POOL_MAX_SIZE,
+					command_timeout = settings.RELATIONAL_DB_COMMAND_TIMEOUT,
+					init = _init_connection,
+				)
+				logger.info("관계형 DB 커넥션 풀 초기화 완료")
+	return _relational_pool
+
+
+async def close_relational_pool() -> None:
+	"""커넥션 풀 종료"""
+	global _relational_pool
+
+	if _relational_pool is not None:
+		await _relational_pool.close()
+		_relational_pool = None
+		logger.info("관계형 DB 커넥션 풀 종료")
+
+
+def _facts_from_row(row) -> CompanyFacts:
+	return CompanyFacts(
+		company_id = row["id"],
+		name = row["name"],
+		seed_corp = row["seed_corp"] or {},
+		organization = row["organization"] or [],
+		investment = row["investment"] or [],
+	)
+
+
+async def fetch_company_facts(company_name: str) -> Optional[CompanyFacts]:
+	"""회사명으로 구조화된 회사 정보 조회"""
+	pool = await get_relational_pool()
+	row = await pool.fetchrow(COMPANY_FACTS_SQL, company_name)
+	if row is None:
+		logger.debug(f"회사 '{company_name}' 정보가 관계형 DB에 없습니다.")
+		return None
+	return _facts_from_row(row)
+
+
+async def fetch_company_news(
+	company_id: int,
+	start_date: Optional[date] = None,
+	end_date: Optional[date] = None,
+	limit: Optional[int] = None,
+	) -> List[CompanyNewsItem]:
+	"""회사 ID와 기간으로 뉴스 조회 (최신순)"""
+	pool = await get_relational_pool()
+	rows = await pool.fetch(
+		COMPANY_NEWS_SQL,
+		company_id,
+		start_date or date.min,
+		end_date or date.max,
+		limit or get_settings().TENURE_NEWS_LIMIT,
+	)
+	return [CompanyNewsItem(**dict(row)) for row in rows]
+
+
+async def fetch_company_tenure_context(
+	company_name: str,
+	start_date: Optional[date] = None,
+	end_date: Optional[date] = None,
+	limit: Optional[int] = None,
+	) -> Optional[CompanyTenureContext]:
+	"""
+	회사 정보와 재직 기간(start_date ~ end_date) 내 최신 뉴스 limit 개를 함께 조회
+	뉴스가 limit 개보다 적으면 재직 기간 뉴스 전체이므로 news_complete 가 True 입니다.
+	"""
+	limit = limit or get_settings().TENURE_NEWS_LIMIT
+	pool = await get_relational_pool()
+	row = await pool.fetchrow(
+		COMPANY_TENURE_SQL,
+		company_name,
+		start_date or date.min,
+		end_date or date.max,
+		limit,
+	)
+	if row is None:
+		logger.debug(f"회사 '{company_name}' 정보가 관계형 DB에 없습니다.")
+		return None
+
+	return CompanyTenureContext(
+		company_name = company_name,
+		start_date = start_date,
+		end_date = end_date,
+		facts = _facts_from_row(row),
+		news = [CompanyNewsItem(**news) for news in row["news"]],
+		news_complete = len(row["news"]) < limit,
+	)
+
+
+def _tenure_cache_key(company_name: str, start_date: Optional[date], end_date: Optional[date]) -> str:
+	return f"{company_name}|{start_date}|{end_date}|{get_settings().TENURE_NEWS_LIMIT}"
+
+
+async def fetch_company_tenure_contexts(
+	tenures: Sequence[Tuple[str, Optional[date], Optional[date]]],
+	) -> List[CompanyTenureContext]:
+	"""
+	여러 재직 이력(회사명, 시작일, 종료일)을 동시에 조회
+	조회 실패나 DB에 없는 회사는 결과에서 제외됩니다.
+	COMPANY_CONTEXT_CACHE_TTL 이 설정된 경우 조회 결과(DB에 없는 회사 포함)를 공유 캐시에서 재사용합니다.
+	"""
+	# 동일한 (회사, 기간) 중복 조회 방지
+	unique_tenures = list(dict.fromkeys(tenures))
+	if not unique_tenures:
+		return []
+
+	cache = get_shared_cache(CACHE_COMPANY_CONTEXT)
+	cache_keys = [_tenure_cache_key(*tenure) for tenure in unique_tenures]
+	cached = await cache.get_many(cache_keys)
+	missing = [(tenure, key) for tenure, key in zip(unique_tenures, cache_keys) if key not in cached]
+
+	results = await asyncio.gather(
+		*(fetch_company_tenure_context(name, start, end) for (name, start, end), _ in missing),
+		return_exceptions=True,
+	)
+
+	fetched = {}
+	for ((name, _, _), key), result in zip(missing, results):
+		if isinstance(result, BaseException):
+			# 오류는 캐시하지 않음
+			logger.error(f"회사 '{name}' 관계형 정보 조회 중 오류 발생: {result}")
+			mark_degraded(DEGRADED_RELATIONAL_FAILED)
+			continue
+		fetched[key] = result
+	if fetched:
+		await cache.set_many({
+			key: {"context": result.model_dump(mode="json") if result is not None else None}
+			for key, result in fetched.items()
+		})
+
+	contexts: List[CompanyTenureContext] = []
+	for key in cache_keys:
+		if key in cached:
+			context_data = cached[key]["context"]
+			result = CompanyTenureContext.model_validate(context_data) if context_data is not None else None
+		else:
+			result = fetched.get(key)
+		if result is not None:
+			contexts.append(result)
+
+	logger.info(f"관계형 DB 재직 기간 회사 정보 조회 결과 ({len(contexts)})개")
+	return contexts
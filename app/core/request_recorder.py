@@ -0,0 +1,104 @@
+import json
+import logging
+import queue
+import random
+import time
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional
+
+from app.core.config import get_settings
+
+# 운영 요청 샘플을 JSONL 로 기록 (benchmarks/replay.py 로 재생)
+# REQUEST_RECORD_PATH 가 지정되고 REQUEST_RECORD_SAMPLE_RATE 확률로 샘플링된 요청만 기록하며,
+# 파일 쓰기는 QueueListener 스레드에서 처리해 요청 처리 경로에서는 큐에 넣기만 합니다.
+# 기록 실패는 로그만 남기고 요청 결과에는 영향을 주지 않습니다.
+
+# 추론에 사용하지 않는 개인 식별 필드는 기록하지 않음
+EXCLUDED_PAYLOAD_FIELDS = {"lastName", "firstName", "photoUrl", "linkedinUrl", "website"}
+
+RECORD_LOGGER_NAME = "app.request_record"
+
+logger = logging.getLogger(__name__)
+
+_record_logger: Optional[logging.Logger] = None
+_listener: Optional[QueueListener] = None
+# 기록 파일을 열지 못한 경로 (요청마다 다시 열어 보지 않도록 기록 중단)
+_failed_path: Optional[str] = None
+
+
+def _get_record_logger(path: str) -> logging.Logger:
+	"""기록 전용 로거 (root 로 전파하지 않고 path 에 한 줄씩 기록)"""
+	global _record_logger, _listener
+
+	if _record_logger is None:
+		file_handler = logging.FileHandler(path, encoding="utf-8")
+		file_handler.setFormatter(logging.Formatter("%(message)s"))
+		log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+		_listener = QueueListener(log_queue, file_handler)
+		_listener.start()
+
+		record_logger = logging.getLogger(RECORD_LOGGER_NAME)
+		record_logger.setLevel(logging.INFO)
+		record_logger.propagate = False
+		record_logger.addHandler(QueueHandler(log_queue))
+		_record_logger = record_logger
+	return _record_logger
+
+
+def close_request_recorder() -> None:
+	"""큐에 남은 기록을 모두 쓴 뒤 파일 닫기"""
+	global _record_logger, _listener, _failed_path
+
+	if _listener is not None:
+		_listener.stop()
+		for handler in _listener.handlers:
+			handler.close()
+		_listener = None
+	if _record_logger is not None:
+		for handler in list(_record_logger.handlers):
+			_record_logger.removeHandler(handler)
+		_record_logger = None
+	_failed_path = None
+
+
+def build_record(payload: Dict[str, Any], output: Optional[List[str]], latency: float, outcome: str) -> Dict[str, Any]:
+	"""timestamp 는 요청 도착 시각 (replay 가 도착 간격 재현에 사용하므로 완료 시각에서 처리 시간을 뺌)"""
+	return {
+		"request_id": uuid.uuid4().hex,
+		"timestamp": round(time.time() - latency, 3),
+		"payload": {key: value for key, value in payload.items() if key not in EXCLUDED_PAYLOAD_FIELDS},
+		"output": output,
+		"outcome": outcome,
+		"latency_ms": round(latency * 1000, 2),
+	}
+
+
+def record_request(talent_data: Any, output: Optional[List[str]], latency: float, outcome: str) -> None:
+	"""
+	추론 요청 1건 기록 (샘플링되지 않으면 직렬화도 하지 않음)
+	outcome 은 성공 시 "ok", 실패 시 예외 클래스 이름입니다.
+	기록 중 오류는 예외로 전달하지 않으며, 기록 파일을 열 수 없으면 이후 기록을 중단합니다.
+	"""
+	global _failed_path
+
+	settings = get_settings()
+	path = settings.REQUEST_RECORD_PATH
+	if not path or path == _failed_path or settings.REQUEST_RECORD_SAMPLE_RATE <= 0:
+		return
+	if random.random() >= settings.REQUEST_RECORD_SAMPLE_RATE:
+		return
+
+	try:
+		record_logger = _get_record_logger(path)
+	except OSError:
+		logger.exception(f"요청 기록 파일을 열 수 없어 기록을 중단합니다 : {path}")
+		_failed_path = path
+		return
+
+	try:
+		payload = talent_data.model_dump(mode="json", exclude_none=True)
+		record = build_record(payload, output, latency, outcome)
+		record_logger.info(json.dumps(record, ensure_ascii=False))
+	except Exception:
+		logger.exception("요청 기록 실패")
@@ -0,0 +1,134 @@
+import asyncio
+import math
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, TypeVar
+
+# 외부 API(LLM) 호출 안정성을 위한 공통 도구
+# 서킷 브레이커, 지연 시간 백분위 추적, jitter 백오프, 헤징(hedged request)
+
+T = TypeVar("T")
+
+
+class CircuitBreaker:
+	"""
+	연속 실패가 임계치에 도달하면 일정 시간 호출을 차단
+	closed -> (연속 실패) -> open -> (recovery_timeout 경과) -> half_open -> (시험 호출 성공) -> closed
+	"""
+
+	CLOSED = "closed"
+	OPEN = "open"
+	HALF_OPEN = "half_open"
+
+	def __init__(self, failure_threshold: int, recovery_timeout: float, clock: Callable[[], float] = time.monotonic):
+		self.failure_threshold = failure_threshold
+		self.recovery_timeout = recovery_timeout
+		self._clock = clock
+		self._state = self.CLOSED
+		self._failures = 0
+		self._opened_at = 0.0
+		# half_open 상태에서 진행 중인 시험 호출 시작 시각
+		self._trial_started_at: Optional[float] = None
+
+	@property
+	def state(self) -> str:
+		if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+			return self.HALF_OPEN
+		return self._state
+
+	def allow_request(self) -> bool:
+		"""호출 가능 여부 (half_open 상태에서는 시험 호출 1건만 허용)"""
+		state = self.state
+		if state == self.CLOSED:
+			return True
+		if state == self.HALF_OPEN:
+			now = self._clock()
+			# 시험 호출이 결과 없이 취소된 경우를 대비해 recovery_timeout 이후 다시 허용
+			if self._trial_started_at is None or now - self._trial_started_at >= self.recovery_timeout:
+				self._state = self.HALF_OPEN
+				self._trial_started_at = now
+				return True
+		return False
+
+	def retry_after(self) -> float:
+		"""호출이 다시 허용되기까지 남은 시간(초)"""
+		if self.state != self.OPEN:
+			return 0.0
+		return max(0.0, self.recovery_timeout - (self._clock() - self._opened_at))
+
+	def record_success(self) -> None:
+		self._state = self.CLOSED
+		self._failures = 0
+		self._trial_started_at = None
+
+	def record_failure(self) -> None:
+		self._failures += 1
+		self._trial_started_at = None
+		if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+			self._state = self.OPEN
+			self._opened_at = self._clock()
+
+
+class LatencyTracker:
+	"""최근 성공 호출의 지연 시간(초)을 고정 크기 윈도우로 기록"""
+
+	def __init__(self, window: int = 200):
+		self._samples: Deque[float] = deque(maxlen=window)
+
+	def __len__(self) -> int:
+		return len(self._samples)
+
+	def record(self, seconds: float) -> None:
+		self._samples.append(seconds)
+
+	def percentile(self, p: float) -> Optional[float]:
+		"""nearest-rank 방식 백분위 (샘플이 없으면 None)"""
+		if not self._samples:
+			return None
+		ordered = sorted(self._samples)
+		rank = max(1, math.ceil(p / 100 * len(ordered)))
+		return ordered[min(rank, len(ordered)) - 1]
+
+
+def jittered_backoff(attempt: int, base_delay: float, max_delay: float) -> float:
+	"""full jitter 지수 백오프 대기 시간 (attempt 는 0부터 시작)"""
+	return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+async def hedged_call(
+	factory: Callable[[], Awaitable[T]],
+	hedge_delay: Optional[float],
+	on_hedge: Optional[Callable[[], None]] = None,
+	) -> T:
+	"""
+	factory 로 요청을 시작하고 hedge_delay 안에 끝나지 않으면 같은 요청을 한 번 더 보내
+	먼저 성공한 결과를 반환합니다. 남은 요청은 취소됩니다.
+	hedge_delay 가 None 이면 헤징 없이 단일 요청만 보냅니다.
+	"""
+	if hedge_delay is None:
+		return await factory()
+
+	tasks = [asyncio.ensure_future(factory())]
+	try:
+		done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+		if done:
+			return tasks[0].result()
+
+		if on_hedge is not None:
+			on_hedge()
+		tasks.append(asyncio.ensure_future(factory()))
+
+		pending = set(tasks)
+		error: Optional[BaseException] = None
+		while pending:
+			done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+			for task in done:
+				if task.exception() is None:
+					return task.result()
+				error = task.exception()
+		raise error
+	finally:
+		for task in tasks:
+			if not task.done():
+				task.cancel()
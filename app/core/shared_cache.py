@@ -0,0 +1,229 @@
+import logging
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import orjson
+
+from app.core.config import get_settings
+from app.core.metrics import record_cache_lookup
+
+# 여러 워커(프로세스)가 함께 사용하는 캐시
+# 각 워커의 프로세스 내 LRU(L1)를 먼저 확인하고, CACHE_BACKEND=postgres 설정 시 shared_cache 테이블(L2)을 확인합니다.
+# 캐시 오류는 요청을 실패시키지 않고 miss 로 처리하며, 캐시 별 TTL 이 0 이면 사용하지 않습니다.
+
+logger = logging.getLogger(__name__)
+
+CACHE_BACKEND_LOCAL = "local"
+CACHE_BACKEND_POSTGRES = "postgres"
+
+# 캐시 이름 (metrics cache_requests_total 의 cache 라벨)
+CACHE_INFERENCE = "inference"
+# LLM 호출 실패 시 반환할 최근 정상 추론 결과 (INFERENCE_STALE_TTL)
+CACHE_INFERENCE_STALE = "inference_stale"
+CACHE_EMBEDDING = "embedding"
+CACHE_COMPANY_CONTEXT = "company_context"
+
+# 만료된 행 정리 확률 (set 호출 당)
+PURGE_PROBABILITY = 0.01
+
+
+class LocalCacheStore:
+	"""프로세스 내 LRU + TTL 저장소"""
+
+	def __init__(self, max_entries: int = 2000, clock: Callable[[], float] = time.monotonic):
+		self.max_entries = max_entries
+		self._clock = clock
+		self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def get_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+		now = self._clock()
+		found = {}
+		for key in keys:
+			entry = self._entries.get(key)
+			if entry is None:
+				continue
+			expires_at, value = entry
+			if expires_at <= now:
+				del self._entries[key]
+				continue
+			self._entries.move_to_end(key)
+			found[key] = value
+		return found
+
+	def set_many(self, items: Dict[str, bytes], ttl: float) -> None:
+		expires_at = self._clock() + ttl
+		for key, value in items.items():
+			self._entries[key] = (expires_at, value)
+			self._entries.move_to_end(key)
+		while len(self._entries) > self.max_entries:
+			self._entries.popitem(last=False)
+
+
+CREATE_CACHE_TABLE_SQL = """
+CREATE UNLOGGED TABLE IF NOT EXISTS shared_cache (
+	namespace TEXT NOT NULL,
+	key TEXT NOT NULL,
+	value BYTEA NOT NULL,
+	expires_at TIMESTAMPTZ NOT NULL,
+	PRIMARY KEY (namespace, key)
+)
+"""
+
+SELECT_CACHE_SQL = """
+SELECT key, value, extract(epoch FROM expires_at - clock_timestamp())::float8 AS remaining_ttl
+FROM shared_cache
+WHERE namespace = $1 AND key = ANY($2::text[]) AND expires_at > clock_timestamp()
+"""
+
+UPSERT_CACHE_SQL = """
+INSERT INTO shared_cache (namespace, key, value, expires_at)
+SELECT $1, item.key, item.value, clock_timestamp() + make_interval(secs => $4)
+FROM unnest($2::text[], $3::bytea[]) AS item(key, value)
+ON CONFLICT (namespace, key) DO UPDATE SET value = EXCLUDED.value, expires_at = EXCLUDED.expires_at
+"""
+
+PURGE_CACHE_SQL = "DELETE FROM shared_cache WHERE expires_at <= clock_timestamp()"
+
+
+class PostgresCacheStore:
+	"""
+	워커 간 공유 저장소 (shared_cache 테이블)
+	캐시 데이터라 WAL 을 쓰지 않는 UNLOGGED 테이블을 사용하며, DB 재시작 시 비워질 수 있습니다.
+	"""
+
+	def __init__(self, pool_factory: Optional[Callable[[], Awaitable[Any]]] = None):
+		self._pool_factory = pool_factory
+		self._table_ready = False
+
+	async def _pool(self):
+		if self._pool_factory is None:
+			from app.core.relational_db import get_relational_pool
+			self._pool_factory = get_relational_pool
+		pool = await self._pool_factory()
+		if not self._table_ready:
+			await pool.execute(CREATE_CACHE_TABLE_SQL)
+			self._table_ready = True
+		return pool
+
+	async def get_many(self, namespace: str, keys: List[str]) -> Dict[str, Tuple[float, bytes]]:
+		"""찾은 키의 (남은 TTL(초), 값)"""
+		pool = await self._pool()
+		rows = await pool.fetch(SELECT_CACHE_SQL, namespace, keys)
+		return {row["key"]: (row["remaining_ttl"], bytes(row["value"])) for row in rows}
+
+	async def set_many(self, namespace: str, items: Dict[str, bytes], ttl: float) -> None:
+		pool = await self._pool()
+		await pool.execute(UPSERT_CACHE_SQL, namespace, list(items), list(items.values()), ttl)
+		if random.random() < PURGE_PROBABILITY:
+			await pool.execute(PURGE_CACHE_SQL)
+
+
+class SharedCache:
+	"""
+	이름(namespace) 별 캐시
+	값은 dumps/loads 로 bytes 직렬화하며 (기본 orjson), L2 에서 찾은 값은 L2 의 남은 TTL 동안 L1 에도 저장합니다.
+	"""
+
+	def __init__(
+		self,
+		namespace: str,
+		ttl: float,
+		local: Optional[LocalCacheStore] = None,
+		remote: Optional[PostgresCacheStore] = None,
+		dumps: Callable[[Any], bytes] = orjson.dumps,
+		loads: Callable[[bytes], Any] = orjson.loads,
+		):
+		self.namespace = namespace
+		self.ttl = ttl
+		self.local = local if local is not None else LocalCacheStore()
+		self.remote = remote
+		self._dumps = dumps
+		self._loads = loads
+
+	@property
+	def enabled(self) -> bool:
+		return self.ttl > 0
+
+	async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+		"""찾은 키의 값만 반환"""
+		keys = list(dict.fromkeys(keys))
+		if not self.enabled or not keys:
+			return {}
+
+		found = self.local.get_many(keys)
+		missing = [key for key in keys if key not in found]
+		if missing and self.remote is not None:
+			try:
+				remote_found = await self.remote.get_many(self.namespace, missing)
+			except Exception as e:
+				logger.warning(f"공유 캐시 '{self.namespace}' 조회 실패, miss 로 처리: {e}")
+				remote_found = {}
+			# L2 항목보다 오래 남지 않도록 남은 TTL 로 L1 에 저장
+			for key, (remaining_ttl, value) in remote_found.items():
+				self.local.set_many({key: value}, min(remaining_ttl, self.ttl))
+				found[key] = value
+
+		for key in keys:
+			record_cache_lookup(self.namespace, key in found)
+		return {key: self._loads(value) for key, value in found.items()}
+
+	async def get(self, key: str) -> Optional[Any]:
+		return (await self.get_many([key])).get(key)
+
+	async def set_many(self, items: Dict[str, Any]) -> None:
+		if not self.enabled or not items:
+			return
+		encoded = {key: self._dumps(value) for key, value in items.items()}
+		self.local.set_many(encoded, self.ttl)
+		if self.remote is not None:
+			try:
+				await self.remote.set_many(self.namespace, encoded, self.ttl)
+			except Exception as e:
+				logger.warning(f"공유 캐시 '{self.namespace}' 저장 실패: {e}")
+
+	async def set(self, key: str, value: Any) -> None:
+		await self.set_many({key: value})
+
+
+# 캐시 이름 별 인스턴스
+_shared_caches: Dict[str, SharedCache] = {}
+_remote_store: Optional[PostgresCacheStore] = None
+
+
+def _cache_ttl(namespace: str) -> float:
+	settings = get_settings()
+	return {
+		CACHE_INFERENCE: settings.INFERENCE_CACHE_TTL,
+		CACHE_INFERENCE_STALE: settings.INFERENCE_STALE_TTL,
+		CACHE_EMBEDDING: settings.EMBEDDING_CACHE_TTL,
+		CACHE_COMPANY_CONTEXT: settings.COMPANY_CONTEXT_CACHE_TTL,
+	}[namespace]
+
+
+def get_shared_cache(namespace: str, dumps: Callable[[Any], bytes] = orjson.dumps, loads: Callable[[bytes], Any] = orjson.loads) -> SharedCache:
+	"""설정(CACHE_BACKEND, 캐시 별 TTL)에 따른 캐시 (dumps/loads 는 최초 생성 시에만 적용)"""
+	global _remote_store
+	if namespace not in _shared_caches:
+		settings = get_settings()
+		if settings.CACHE_BACKEND == CACHE_BACKEND_POSTGRES and _remote_store is None:
+			_remote_store = PostgresCacheStore()
+		_shared_caches[namespace] = SharedCache(
+			namespace,
+			ttl = _cache_ttl(namespace),
+			local = LocalCacheStore(settings.CACHE_LOCAL_MAX_ENTRIES),
+			remote = _remote_store if settings.CACHE_BACKEND == CACHE_BACKEND_POSTGRES else None,
+			dumps = dumps,
+			loads = loads,
+		)
+	return _shared_caches[namespace]
+
+
+def reset_shared_caches() -> None:
+	global _remote_store
+	_shared_caches.clear()
+	_remote_store = None
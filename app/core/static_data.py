@@ -0,0 +1,112 @@
+import csv
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# 요청마다 다시 만들 필요가 없는 정적 데이터 (대학 순위, 경험 태그 테이블)
+# 애플리케이션 시작 시 warm-up 단계에서 미리 로드합니다.
+
+# 경험 태그 목록
+TARGET_EXPERIENCE_TAGS: List[str] = [
+	"물류 도메인 경험", "상위권 대학교", "대규모 회사 경험" ,"성장기 스타트업  경험", "리더쉽", "리더십", "대용량 데이터 처리 경험", "IPO", "M&A 경험", "신규 투자 유치 경험", "신기술 도입 경험", "글로벌 프로젝트 경험", "고객 관리 경험", "조직 관리 경험", "교육 및 멘토링 경험"
+]
+
+# 태그를 원하는 순서로 정렬하기 위한 기준 리스트
+DESIRED_TAG_ORDER: List[str] = [
+	"상위권 대학교", "대규모 회사 경험" ,"성장기 스타트업  경험", "리더쉽", "리더십", "대용량 데이터 처리 경험", "IPO", "M&A 경험", "신규 투자 유치 경험", "신기술 도입 경험", "글로벌 프로젝트 경험", "고객 관리 경험", "조직 관리 경험", "교육 및 멘토링 경험"
+]
+
+
+# "상위권 대학교" 로 판단하는 최대 순위 (university_rank.csv 기준)
+TOP_UNIVERSITY_MAX_RANK = 20
+
+
+class UniversityRank(BaseModel):
+	name: str = Field(..., description="대학명 (CSV 원본)")
+	rank: int = Field(..., description="순위")
+	score: Optional[float] = Field(None, description="평가 점수")
+	original_link: Optional[str] = Field(None, description="출처 링크")
+
+
+def normalize_university_name(name: str) -> str:
+	"""'OO대학교', 'OO대' 를 동일하게 비교하기 위한 정규화"""
+	normalized = name.strip().replace(" ", "")
+	if normalized.endswith("대학교"):
+		normalized = normalized[:-len("대학교")] + "대"
+	return normalized
+
+
+@lru_cache(maxsize=1)
+def get_university_rank_index() -> Dict[str, UniversityRank]:
+	"""
+	university_rank.csv 를 정규화된 대학명 -> 순위 정보로 로드
+	같은 대학이 여러 번 있으면 가장 높은 순위를 사용합니다.
+	파일이 없으면 예외를 그대로 전달합니다 (lru_cache 는 예외를 캐시하지 않으므로 warm-up 재시도 시 다시 로드).
+	"""
+	csv_path = Path(get_settings().UNIVERSITY_RANK_CSV_PATH)
+	index: Dict[str, UniversityRank] = {}
+
+	try:
+		with open(csv_path, "r", encoding="utf-8") as file:
+			for row in csv.DictReader(file):
+				name = (row.get("name") or "").strip()
+				rank_str = (row.get("rank") or "").strip()
+				if not name or not rank_str.isdigit():
+					continue
+				score_str = (row.get("score") or "").strip()
+				university = UniversityRank(
+					name = name,
+					rank = int(rank_str),
+					score = float(score_str) if score_str else None,
+					original_link = (row.get("original_link") or "").strip() or None,
+				)
+				key = normalize_university_name(name)
+				if key not in index or university.rank < index[key].rank:
+					index[key] = university
+	except FileNotFoundError:
+		logger.error(f"대학 순위 파일을 찾을 수 없습니다: {csv_path}")
+		raise
+
+	logger.info(f"대학 순위 인덱스 로드 완료 ({len(index)}개)")
+	return index
+
+
+def find_university_rank(school_name: Optional[str]) -> Optional[UniversityRank]:
+	"""학교명으로 대학 순위 조회"""
+	if not school_name:
+		return None
+	return get_university_rank_index().get(normalize_university_name(school_name))
+
+
+@lru_cache(maxsize=1)
+def get_tag_order_index() -> Dict[str, int]:
+	"""태그 -> 정렬 순서"""
+	index: Dict[str, int] = {}
+	for i, tag in enumerate(DESIRED_TAG_ORDER):
+		index.setdefault(tag, i)
+	return index
+
+
+@lru_cache(maxsize=1)
+def get_normalized_tag_index() -> Dict[str, str]:
+	"""정규화된 태그명(소문자, 공백 제거) -> 경험 태그명"""
+	index: Dict[str, str] = {}
+	for tag in TARGET_EXPERIENCE_TAGS:
+		index.setdefault(tag.lower().replace(" ", ""), tag)
+	return index
+
+
+def preload_static_indexes() -> Dict[str, int]:
+	"""정적 인덱스를 미리 로드하고 항목 수를 반환"""
+	return {
+		"university_ranks": len(get_university_rank_index()),
+		"tag_order": len(get_tag_order_index()),
+		"normalized_tags": len(get_normalized_tag_index()),
+	}
@@ -1,141 +1,309 @@
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Optional
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import PGVector
-from langchain_core.documents import Document
-from langchain_core.retrievers import BaseRetriever
-from app.core.config import settings
+import threading
+from array import array
+from typing import TYPE_CHECKING, List, Dict, Optional
+from app.core.config import get_settings
+from app.core.degradation import DEGRADED_NEWS_SKIPPED, DEGRADED_RETRIEVAL_FAILED, mark_degraded
+from app.core.metrics import track_stage, STAGE_EMBED_QUERY, STAGE_RETRIEVE_UNIVERSITY, STAGE_RETRIEVE_COMPANY, STAGE_RETRIEVE_NEWS
+from app.core.rate_limiter import estimate_tokens, get_rate_limiter
+from app.core.resilience import CircuitBreaker
+from app.core.shared_cache import CACHE_EMBEDDING, get_shared_cache
+
+# langchain_openai, langchain_community 는 import 비용이 커서 (수백 ms ~ 수 초)
+# 모듈 import 시점이 아닌 각 접근 함수의 최초 호출 시점에 로드합니다.
+if TYPE_CHECKING:
+	from langchain_openai import OpenAIEmbeddings
+	from langchain_core.documents import Document
+	from langchain_core.retrievers import BaseRetriever
+	from langchain_core.vectorstores import VectorStore
 
 logger = logging.getLogger(__name__)
 
-# LangChain 임베딩 모델 초기화, 상위 모델은 "text-embedding-3-large" 입니다.
-embeddings_model = OpenAIEmbeddings(openai_api_key=settings.OPENAI_API_KEY, model="text-embedding-3-small")
+# 임베딩 모델, 상위 모델은 "text-embedding-3-large" 입니다.
+EMBEDDING_MODEL_NAME = "text-embedding-3-small"
 
 # PGVector Collection 이름 정의
 COLLECTION_NAME_COMPANY = 'company_collection'
 COLLECTION_NAME_NEWS = 'company_news_collection'
 COLLECTION_NAME_UNIVERSITY = 'university_rank_collection'
 
-# PGVector 스토어 인스턴스 를 위한 변수 생성
+# LangChain 임베딩 모델 인스턴스
+_embeddings_model = None
+
+# Vector Store 인스턴스 를 위한 변수 생성 (VECTOR_BACKEND 에 따라 PGVector 또는 LocalVectorIndex)
 _company_vectorstore_instance = None
 _news_vectorstore_instance = None
 _university_vectorstore_instance = None
+# warm-up 에서 스레드로 동시에 생성하면 langchain PGVector 가 같은 SQLAlchemy MetaData 에 테이블을 중복 정의하므로 생성은 순차로 처리
+_vectorstore_lock = threading.Lock()
 
-# 각 정보 별 Vectorstore 생성 함수
-def get_company_vectorstore() -> PGVector:
-	global _company_vectorstore_instance
-	if _company_vectorstore_instance is None:
-		logger.info(f"PGVector store collection 초기화 : {COLLECTION_NAME_COMPANY}")
-		_company_vectorstore_instance =PGVector(
-			collection_name = COLLECTION_NAME_COMPANY,
+# 뉴스 검색이 시간 예산(DEGRADE_NEWS_TIMEOUT)을 연속으로 넘기면 일정 시간 뉴스 검색을 생략
+_news_circuit_breaker: Optional[CircuitBreaker] = None
+
+
+def get_embeddings_model() -> "OpenAIEmbeddings":
+	"""LangChain 임베딩 모델 초기화"""
+	global _embeddings_model
+	if _embeddings_model is None:
+		from langchain_openai import OpenAIEmbeddings
+
+		settings = get_settings()
+		_embeddings_model = OpenAIEmbeddings(
+			openai_api_key = settings.OPENAI_API_KEY,
+			model = EMBEDDING_MODEL_NAME,
+			base_url = settings.OPENAI_BASE_URL,
+		)
+	return _embeddings_model
+
+
+def _create_vectorstore(collection_name: str) -> "VectorStore":
+	"""
+	Vector store 생성
+	VECTOR_BACKEND 가 local 이면 VECTOR_SNAPSHOT_DIR 의 컬렉션 스냅샷을 워커 메모리에서 검색합니다 (app/core/vector_index.py).
+	"""
+	settings = get_settings()
+	backend = settings.VECTOR_BACKEND
+	if backend == "local":
+		from app.core.vector_index import LocalVectorIndex
+		from app.core.vector_snapshot import collection_snapshot_dir
+
+		logger.info(f"로컬 벡터 인덱스 collection 초기화 : {collection_name}")
+		with _vectorstore_lock:
+			return LocalVectorIndex.from_snapshot(
+				collection_snapshot_dir(collection_name),
+				embedding_function = get_embeddings_model(),
+				embedding_model = EMBEDDING_MODEL_NAME,
+				dimensions = settings.VECTOR_DIMENSIONS.get(collection_name),
+				quantization = settings.VECTOR_QUANTIZATION.get(collection_name, "none"),
+				rescore_multiplier = settings.VECTOR_RESCORE_MULTIPLIER,
+			)
+	if backend != "pgvector":
+		raise ValueError(f"지원하지 않는 VECTOR_BACKEND 입니다: {backend} (pgvector, local)")
+
+	from langchain_community.vectorstores import PGVector
+
+	logger.info(f"PGVector store collection 초기화 : {collection_name}")
+	with _vectorstore_lock:
+		return PGVector(
+			collection_name = collection_name,
 			connection_string = settings.DATABASE_URL,
-			embedding_function = embeddings_model,
+			embedding_function = get_embeddings_model(),
 			use_jsonb = True,
 			# JSONB 타입으로 메타데이터 필터링 성능 기대..
 		)
+
+# 각 정보 별 Vectorstore 생성 함수
+def get_company_vectorstore() -> "VectorStore":
+	global _company_vectorstore_instance
+	if _company_vectorstore_instance is None:
+		_company_vectorstore_instance = _create_vectorstore(COLLECTION_NAME_COMPANY)
 	return _company_vectorstore_instance
 
-def get_news_vectorstore() -> PGVector:
+def get_news_vectorstore() -> "VectorStore":
 	global _news_vectorstore_instance
 	if _news_vectorstore_instance is None:
-		logger.info(f"PGVector store collection 초기화 : {COLLECTION_NAME_NEWS}")
-		_news_vectorstore_instance = PGVector(
-			collection_name = COLLECTION_NAME_NEWS,
-			connection_string = settings.DATABASE_URL,
-			embedding_function = embeddings_model,
-			use_jsonb = True,
-		)
+		_news_vectorstore_instance = _create_vectorstore(COLLECTION_NAME_NEWS)
 	return _news_vectorstore_instance
 
-def get_university_vectorstore() -> PGVector:
+def get_university_vectorstore() -> "VectorStore":
 	global _university_vectorstore_instance
 	if _university_vectorstore_instance is None:
-		logger.info(f"PGVector store collection 초기화 : {COLLECTION_NAME_UNIVERSITY}")
-		_university_vectorstore_instance = PGVector(
-			collection_name = COLLECTION_NAME_UNIVERSITY,
-			connection_string = settings.DATABASE_URL,
-			embedding_function = embeddings_model,
-			use_jsonb = True,
-		)
+		_university_vectorstore_instance = _create_vectorstore(COLLECTION_NAME_UNIVERSITY)
 	return _university_vectorstore_instance
 
 # 각 정보 별 Retriever 생성 함수
-def get_company_retriever(top_k: int = 4) -> BaseRetriever:
+def get_company_retriever(top_k: int = 4) -> "BaseRetriever":
 	"""회사 정보 검색을 위한 Retriever 생성"""
 	# VectorStore 인스턴스 가져오기
 	vectorstore = get_company_vectorstore()
 	return vectorstore.as_retriever(search_kwargs={"k": top_k})    # 검색 결과 수 k 제어
 
-def get_news_retriever(top_k: int = 4) -> BaseRetriever:
+def get_news_retriever(top_k: int = 4) -> "BaseRetriever":
 	"""뉴스 정보 검색을 위한 Retriever 생성"""
 	vectorstore = get_news_vectorstore()
 	return vectorstore.as_retriever(search_kwargs={"k": top_k})
 
-def get_university_retriever(top_k : int = 1) -> BaseRetriever:
+def get_university_retriever(top_k : int = 1) -> "BaseRetriever":
 	"""대학 정보 검색을 위한 Retriever 생성"""
 	vectorstore = get_university_vectorstore()
 	return vectorstore.as_retriever(search_kwargs={"k": top_k})
 
 
+def get_news_circuit_breaker() -> CircuitBreaker:
+	global _news_circuit_breaker
+	if _news_circuit_breaker is None:
+		settings = get_settings()
+		_news_circuit_breaker = CircuitBreaker(
+			failure_threshold = settings.DEGRADE_NEWS_FAILURE_THRESHOLD,
+			recovery_timeout = settings.DEGRADE_NEWS_COOLDOWN,
+		)
+	return _news_circuit_breaker
+
+
+def reset_news_circuit_breaker() -> None:
+	global _news_circuit_breaker
+	_news_circuit_breaker = None
+
+
+def collection_query_embedding(collection_name: str, embedding: List[float]) -> List[float]:
+	"""
+	컬렉션 검색용 쿼리 임베딩
+	pgvector 컬렉션에 VECTOR_DIMENSIONS 가 지정되어 있으면 앞쪽 N 차원으로 자르고 다시 정규화합니다
+	(OpenAI embeddings API 의 dimensions 파라미터 결과와 같음). 로컬 인덱스는 전체 차원 쿼리를 받아 내부에서 자릅니다.
+	"""
+	settings = get_settings()
+	dimensions = settings.VECTOR_DIMENSIONS.get(collection_name)
+	if settings.VECTOR_BACKEND != "pgvector" or not dimensions or dimensions >= len(embedding):
+		return embedding
+	truncated = embedding[:dimensions]
+	norm = sum(value * value for value in truncated) ** 0.5
+	return [value / norm for value in truncated] if norm else truncated
+
+
+async def _search_news_within_budget(query_embedding: List[float], k: int) -> Optional[List["Document"]]:
+	"""
+	DEGRADE_NEWS_TIMEOUT 안에 뉴스 검색, 시간 예산을 넘기거나 지연이 계속되어 생략한 경우 None
+	DEGRADE_NEWS_TIMEOUT 이 0 이면 예산 없이 검색합니다.
+	"""
+	query_embedding = collection_query_embedding(COLLECTION_NAME_NEWS, query_embedding)
+	timeout = get_settings().DEGRADE_NEWS_TIMEOUT
+	if timeout <= 0:
+		return await get_news_vectorstore().asimilarity_search_by_vector(query_embedding, k=k)
+
+	breaker = get_news_circuit_breaker()
+	if not breaker.allow_request():
+		logger.warning(f"뉴스 검색 지연이 계속되어 {breaker.retry_after():.1f}초 동안 뉴스 검색을 생략합니다.")
+		return None
+	try:
+		news_docs = await asyncio.wait_for(get_news_vectorstore().asimilarity_search_by_vector(query_embedding, k=k), timeout=timeout)
+	except asyncio.TimeoutError:
+		breaker.record_failure()
+		logger.warning(f"뉴스 검색이 시간 예산({timeout}초)을 넘어 뉴스 없이 추론합니다.")
+		return None
+	breaker.record_success()
+	return news_docs
+
+
+async def acquire_embedding_quota(text: Optional[str]) -> None:
+	"""검색 쿼리 임베딩 전 호출 한도(RPM/TPM) 확보, 대기 시간 초과 시 RateLimitTimeoutError"""
+	limiter = get_rate_limiter("embedding", EMBEDDING_MODEL_NAME)
+	if limiter.enabled:
+		await limiter.acquire(estimate_tokens(text or ""))
+
+
+def _embedding_cache_key(text: str) -> str:
+	return hashlib.sha256(f"{EMBEDDING_MODEL_NAME}\n{text}".encode("utf-8")).hexdigest()
+
+def _pack_embedding(embedding: List[float]) -> bytes:
+	# float32 로 저장 (1536차원 약 6KB)
+	return array("f", embedding).tobytes()
+
+def _unpack_embedding(data: bytes) -> List[float]:
+	embedding = array("f")
+	embedding.frombytes(data)
+	return embedding.tolist()
+
+
+async def embed_query(text: str) -> List[float]:
+	"""
+	검색 쿼리 임베딩
+	EMBEDDING_CACHE_TTL 설정 시 워커 간 캐시를 먼저 확인하고, miss 일 때만 호출 한도 확보 후 API 를 호출합니다.
+	"""
+	cache = get_shared_cache(CACHE_EMBEDDING, dumps=_pack_embedding, loads=_unpack_embedding)
+	key = _embedding_cache_key(text)
+	cached = await cache.get(key)
+	if cached is not None:
+		return cached
+
+	await acquire_embedding_quota(text)
+	embedding = await get_embeddings_model().aembed_query(text)
+	await cache.set(key, embedding)
+	return embedding
+
+
 # 문서 검색 로직 함수
 async def retrieve_documents_from_sources(
 	query: str, # company, company_news의 주 쿼리
 	university_query: Optional[str] = None, # 대학 정보 검색 쿼리
 	top_k_per_source: int = 4, # company, company_news 가져올 문서 수
 	top_k_university: int = 1, # 대학 정보 가져올 문서 수
-	) -> List[Document]:
+	) -> List["Document"]:
+	"""
+	쿼리 별 임베딩을 한 번만 계산해 (company, company_news 는 같은 쿼리 임베딩 공유) 각 컬렉션을 벡터로 검색
+	"""
 
 	#검색된 모둔 문서 저장 리스트
 	retrieved_docs = []
 
 	# 대학 정보 검색
-	try:
-		university_retriever = get_university_retriever(top_k = top_k_university)
+	if university_query:
+		try:
+			with track_stage(STAGE_EMBED_QUERY):
+				university_embedding = await embed_query(university_query)
 
-		# 비동기로 문서 검색
-		university_docs = await university_retriever.aget_relevant_documents(university_query)
+			# 비동기로 문서 검색
+			with track_stage(STAGE_RETRIEVE_UNIVERSITY):
+				university_docs = await get_university_vectorstore().asimilarity_search_by_vector(
+					collection_query_embedding(COLLECTION_NAME_UNIVERSITY, university_embedding), k=top_k_university,
+				)
+
+			if university_docs:
+				logger.info(f"대학 정보 검색 결과 ({len(university_docs)})개")
+				retrieved_docs.extend(university_docs)
+			else:
+				logger.info(f"쿼리 '{university_query}'에 대한 대학 정보 검색 결과 없음")
+		except Exception as e:
+			logger.error(f"대학 정보 검색 중 오류 발생: {e}")
+			mark_degraded(DEGRADED_RETRIEVAL_FAILED)
 
-		if university_docs:
-			logger.info(f"대학 정보 검색 결과 ({len(university_docs)})개")
-			retrieved_docs.extend(university_docs)
-		else:
-			logger.info(f"쿼리 '{query}'에 대한 대학 정보 검색 결과 없음")
-	except Exception as e:
-		logger.error(f"대학 정보 검색 중 오류 발생: {e}")
-	
-	# 회사 정보 검색
 	try:
-		company_retriever = get_company_retriever(top_k=top_k_per_source)
+		with track_stage(STAGE_EMBED_QUERY):
+			query_embedding = await embed_query(query)
+	except Exception as e:
+		logger.error(f"검색 쿼리 임베딩 중 오류 발생: {e}")
+		mark_degraded(DEGRADED_RETRIEVAL_FAILED)
+		query_embedding = None
 
-		# 비동기로 문서 검색
-		company_docs = await company_retriever.aget_relevant_documents(query)
+	if query_embedding is not None:
+		# 회사 정보 검색
+		try:
+			# 비동기로 문서 검색
+			with track_stage(STAGE_RETRIEVE_COMPANY):
+				company_docs = await get_company_vectorstore().asimilarity_search_by_vector(
+					collection_query_embedding(COLLECTION_NAME_COMPANY, query_embedding), k=top_k_per_source,
+				)
 
-		if company_docs:
-			logger.info(f"회사 정보 검색 결과 ({len(company_docs)})개")
-			retrieved_docs.extend(company_docs)
-		else:
-			logger.info(f"쿼리 '{query}'에 대한 회사 정보 검색 결과 없음")
-	except Exception as e:
-		logger.error(f"회사 정보 검색 중 오류 발생: {e}")
-	
-	# 뉴스 정보 검색
-	try:
-		news_retriever = get_news_retriever(top_k=top_k_per_source)
+			if company_docs:
+				logger.info(f"회사 정보 검색 결과 ({len(company_docs)})개")
+				retrieved_docs.extend(company_docs)
+			else:
+				logger.info(f"쿼리 '{query}'에 대한 회사 정보 검색 결과 없음")
+		except Exception as e:
+			logger.error(f"회사 정보 검색 중 오류 발생: {e}")
+			mark_degraded(DEGRADED_RETRIEVAL_FAILED)
 
-		# 비동기로 문서 검색
-		news_docs = await news_retriever.aget_relevant_documents(query)
+		# 뉴스 정보 검색 (지연 시 DEGRADE_NEWS_TIMEOUT 설정에 따라 생략)
+		try:
+			# 비동기로 문서 검색
+			with track_stage(STAGE_RETRIEVE_NEWS):
+				news_docs = await _search_news_within_budget(query_embedding, top_k_per_source)
 
-		if news_docs:
-			logger.info(f"뉴스 정보 검색 결과 ({len(news_docs)})개")
-			retrieved_docs.extend(news_docs)
-		else:
-			logger.info(f"쿼리 '{query}'에 대한 뉴스 정보 검색 결과 없음")
-	except Exception as e:
-		logger.error(f"뉴스 정보 검색 중 오류 발생: {e}")
+			if news_docs is None:
+				mark_degraded(DEGRADED_NEWS_SKIPPED)
+			elif news_docs:
+				logger.info(f"뉴스 정보 검색 결과 ({len(news_docs)})개")
+				retrieved_docs.extend(news_docs)
+			else:
+				logger.info(f"쿼리 '{query}'에 대한 뉴스 정보 검색 결과 없음")
+		except Exception as e:
+			logger.error(f"뉴스 정보 검색 중 오류 발생: {e}")
+			mark_degraded(DEGRADED_RETRIEVAL_FAILED)
 	
 
 	# 간단한 중복 제거
-	unique_docs_dict: Dict[str, Document] = {}
+	unique_docs_dict: Dict[str, "Document"] = {}
 
 	for doc in retrieved_docs:
 		# page_content를 사용하여 고유성 보장
@@ -0,0 +1,365 @@
+import asyncio
+import logging
+import operator
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import orjson
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from app.core.vector_snapshot import load_snapshot, normalize_rows
+
+# 워커 프로세스 안에서 검색하는 로컬 벡터 인덱스 (VECTOR_BACKEND=local)
+# PGVector 컬렉션 스냅샷(app/core/vector_snapshot.py)을 로드해 NumPy 행렬 곱으로 전수 코사인 유사도 검색합니다.
+# 컬렉션이 메모리에 들어가는 크기(수만 건 이하)에서는 근사 인덱스 없이도 수 ms 안에 정확한 결과를 반환하며,
+# 검색마다 PostgreSQL 왕복이 없습니다. 결과 점수와 메타데이터 필터는 PGVector(use_jsonb=True)와 같은 형식입니다.
+
+logger = logging.getLogger(__name__)
+
+# 이 원소 수(문서 수 x 차원)를 넘는 검색은 이벤트 루프를 막지 않도록 스레드에서 실행 (NumPy 행렬 곱은 GIL 해제)
+# 1536차원 기준 약 1,300건, 1ms 안팎
+THREAD_OFFLOAD_MIN_ELEMENTS = 2_000_000
+
+# PGVector 메타데이터 필터 연산자 중 지원하는 연산자
+_COMPARISON_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+	"$eq": operator.eq,
+	"$ne": operator.ne,
+	"$lt": operator.lt,
+	"$lte": operator.le,
+	"$gt": operator.gt,
+	"$gte": operator.ge,
+}
+_SUPPORTED_OPERATORS = set(_COMPARISON_OPERATORS) | {"$in", "$nin", "$between", "$like", "$ilike"}
+
+# 검색 방식 (VECTOR_QUANTIZATION)
+# none: float32 전수 검색, binary: 차원 별 부호 비트(float32 의 1/32 크기) hamming 거리로 후보를 고른 뒤 원본 벡터로 다시 정렬
+QUANTIZATION_NONE = "none"
+QUANTIZATION_BINARY = "binary"
+QUANTIZATIONS = (QUANTIZATION_NONE, QUANTIZATION_BINARY)
+
+# 필터 별 후보 행 번호 캐시 크기 (인덱스는 읽기 전용이므로 같은 필터는 같은 행)
+FILTER_CACHE_SIZE = 256
+
+
+def _like_pattern(pattern: str, flags: int = 0) -> "re.Pattern[str]":
+	"""SQL LIKE 패턴(%, _)을 정규식으로 변환"""
+	regex = "".join(".*" if char == "%" else "." if char == "_" else re.escape(char) for char in pattern)
+	return re.compile(f"^{regex}$", flags | re.DOTALL)
+
+
+def _match_field(value: Any, condition: Any) -> bool:
+	if not isinstance(condition, dict):
+		condition = {"$eq": condition}
+	if len(condition) != 1:
+		raise ValueError(f"필드 조건에는 연산자가 하나만 있어야 합니다: {condition}")
+	(op, operand), = condition.items()
+	if op not in _SUPPORTED_OPERATORS:
+		raise ValueError(f"지원하지 않는 필터 연산자입니다: {op} (지원: {sorted(_SUPPORTED_OPERATORS)})")
+
+	# PostgreSQL 과 같이 없는 필드(NULL)는 어떤 조건도 만족하지 않음
+	if value is None:
+		return False
+	try:
+		if op in _COMPARISON_OPERATORS:
+			return _COMPARISON_OPERATORS[op](value, operand)
+		if op == "$in":
+			return value in operand
+		if op == "$nin":
+			return value not in operand
+		if op == "$between":
+			low, high = operand
+			return low <= value <= high
+		return _like_pattern(operand, re.IGNORECASE if op == "$ilike" else 0).match(str(value)) is not None
+	except TypeError:
+		# 타입이 다른 값 비교 (예: 문자열 필드와 숫자)
+		return False
+
+
+def match_metadata_filter(metadata: Dict[str, Any], filter: Optional[Dict[str, Any]]) -> bool:
+	"""
+	PGVector(use_jsonb=True) 와 같은 형식의 메타데이터 필터
+	{"company_name": "네이버"}, {"source": {"$in": [...]}}, {"$or": [{...}, {...}]} 등, 여러 필드는 AND 로 결합합니다.
+	"""
+	if not filter:
+		return True
+	for key, condition in filter.items():
+		if key in ("$and", "$or"):
+			if not isinstance(condition, list):
+				raise ValueError(f"{key} 의 값은 필터 목록이어야 합니다: {condition}")
+			results = (match_metadata_filter(metadata, sub_filter) for sub_filter in condition)
+			if not (all(results) if key == "$and" else any(results)):
+				return False
+		elif key.startswith("$"):
+			raise ValueError(f"지원하지 않는 필터 연산자입니다: {key}")
+		elif not _match_field(metadata.get(key), condition):
+			return False
+	return True
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+	"""점수가 큰 순서로 상위 k 개 위치"""
+	top = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+	return top[np.argsort(-scores[top], kind="stable")]
+
+
+class LocalVectorIndex(VectorStore):
+	"""
+	NumPy 전수 검색 벡터 스토어 (읽기 전용)
+	벡터는 단위 벡터로 정규화해 보관하고, 점수는 PGVector 기본값과 같은 코사인 거리(1 - 코사인 유사도)입니다.
+
+	dimensions(앞쪽 N 차원, Matryoshka) 또는 binary 양자화를 지정하면 줄인 벡터로 k x rescore_multiplier 개 후보를 고르고,
+	후보만 원본 벡터로 다시 계산해 상위 k 개를 반환합니다 (반환 점수는 원본 벡터 기준).
+	"""
+
+	def __init__(
+		self,
+		vectors: np.ndarray,
+		documents: Sequence[str],
+		metadatas: Optional[Sequence[Dict[str, Any]]] = None,
+		ids: Optional[Sequence[str]] = None,
+		embedding_function: Optional[Embeddings] = None,
+		normalized: bool = False,
+		collection_name: Optional[str] = None,
+		dimensions: Optional[int] = None,
+		quantization: str = QUANTIZATION_NONE,
+		rescore_multiplier: int = 4,
+		):
+		if quantization not in QUANTIZATIONS:
+			raise ValueError(f"지원하지 않는 양자화 방식입니다: {quantization} ({', '.join(QUANTIZATIONS)})")
+		# 스냅샷(np.memmap)은 이미 정규화되어 있으므로 복사하지 않음
+		self._vectors = vectors if normalized else normalize_rows(vectors)
+		if self._vectors.ndim != 2 or len(self._vectors) != len(documents):
+			raise ValueError(f"벡터 {self._vectors.shape} 와 문서 수 {len(documents)} 가 맞지 않습니다.")
+		self.quantization = quantization
+		self.rescore_multiplier = max(1, rescore_multiplier)
+		self.search_dimensions = min(dimensions or self.dimensions, self.dimensions)
+
+		# 후보 선택용 축소 벡터, 원본 벡터(mmap)는 후보 재정렬에만 사용하므로 후보 행만 메모리에 올라옴
+		self._bits: Optional[np.ndarray] = None
+		self._search_vectors: Optional[np.ndarray] = None
+		if quantization == QUANTIZATION_BINARY:
+			self._bits = np.packbits(np.asarray(self._vectors[:, :self.search_dimensions]) > 0, axis=1)
+		elif self.search_dimensions < self.dimensions:
+			self._search_vectors = normalize_rows(self._vectors[:, :self.search_dimensions])
+		elif self._vectors.dtype != np.float32:
+			# float16 행렬 곱은 BLAS 를 쓰지 못해 약 8배 느리므로 워커 메모리에 float32 로 변환 (워커 간 공유되지 않음)
+			self._vectors = np.asarray(self._vectors, dtype=np.float32)
+		self._documents = list(documents)
+		self._metadatas = list(metadatas) if metadatas is not None else [{} for _ in self._documents]
+		self._ids = list(ids) if ids is not None else [str(i) for i in range(len(self._documents))]
+		self.embedding_function = embedding_function
+		self.collection_name = collection_name
+		self._filter_rows: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
+	@classmethod
+	def from_snapshot(
+		cls,
+		directory: Path,
+		embedding_function: Optional[Embeddings] = None,
+		embedding_model: Optional[str] = None,
+		mmap: bool = True,
+		**kwargs: Any,
+		) -> "LocalVectorIndex":
+		"""
+		스냅샷 디렉터리에서 로드, embedding_model 을 지정하면 스냅샷의 임베딩 모델과 다를 때 ValueError
+		kwargs 는 생성자의 dimensions, quantization, rescore_multiplier
+		"""
+		snapshot = load_snapshot(directory, mmap=mmap)
+		snapshot_model = snapshot.manifest.get("embedding_model")
+		if embedding_model is not None and snapshot_model != embedding_model:
+			raise ValueError(f"스냅샷 임베딩 모델({snapshot_model})이 검색 쿼리 임베딩 모델({embedding_model})과 다릅니다: {directory}")
+		index = cls(
+			snapshot.vectors,
+			snapshot.documents,
+			snapshot.metadatas,
+			snapshot.ids,
+			embedding_function = embedding_function,
+			normalized = snapshot.manifest.get("normalized", False),
+			collection_name = snapshot.manifest["collection"],
+			**kwargs,
+		)
+		logger.info(
+			f"로컬 벡터 인덱스 로드: {index.collection_name} ({len(index)}개, {index.dimensions}차원, {snapshot.manifest['dtype']}, "
+			f"검색 {index.search_dimensions}차원 {index.quantization})"
+		)
+		return index
+
+	@classmethod
+	def from_texts(
+		cls: Type["LocalVectorIndex"],
+		texts: List[str],
+		embedding: Embeddings,
+		metadatas: Optional[List[dict]] = None,
+		*,
+		ids: Optional[List[str]] = None,
+		**kwargs: Any,
+		) -> "LocalVectorIndex":
+		vectors = np.array(embedding.embed_documents(texts), dtype=np.float32)
+		return cls(vectors, texts, metadatas, ids, embedding_function=embedding, **kwargs)
+
+	@property
+	def embeddings(self) -> Optional[Embeddings]:
+		return self.embedding_function
+
+	@property
+	def vectors(self) -> np.ndarray:
+		"""(문서 수, 차원) 정규화된 벡터 (읽기 전용)"""
+		return self._vectors
+
+	@property
+	def dimensions(self) -> int:
+		return int(self._vectors.shape[1])
+
+	@property
+	def approximate(self) -> bool:
+		"""축소 벡터로 후보를 고른 뒤 재정렬하는지 여부"""
+		return self._bits is not None or self._search_vectors is not None
+
+	@property
+	def search_bytes_per_vector(self) -> int:
+		"""후보 선택에 사용하는 벡터 1개 크기 (워커 메모리에 상주하는 검색 구조)"""
+		if self._bits is not None:
+			return int(self._bits.shape[1])
+		return self.search_dimensions * 4
+
+	def __len__(self) -> int:
+		return len(self._documents)
+
+	def _select_relevance_score_fn(self) -> Callable[[float], float]:
+		return self._cosine_relevance_score_fn
+
+	def _candidate_rows(self, filter: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+		"""필터를 만족하는 행 번호, 필터가 없으면 None (전체)"""
+		if not filter:
+			return None
+		key = orjson.dumps(filter, option=orjson.OPT_SORT_KEYS)
+		rows = self._filter_rows.get(key)
+		if rows is None:
+			rows = np.fromiter(
+				(i for i, metadata in enumerate(self._metadatas) if match_metadata_filter(metadata, filter)),
+				dtype=np.int64,
+			)
+			self._filter_rows[key] = rows
+			if len(self._filter_rows) > FILTER_CACHE_SIZE:
+				self._filter_rows.popitem(last=False)
+		else:
+			self._filter_rows.move_to_end(key)
+		return rows
+
+	def _search(self, embedding: Sequence[float], k: int, filter: Optional[Dict[str, Any]]) -> List[Tuple[int, float]]:
+		"""(행 번호, 코사인 거리) 상위 k 개"""
+		query = np.asarray(embedding, dtype=np.float32)
+		if query.shape != (self.dimensions,):
+			raise ValueError(f"쿼리 벡터 차원({query.shape[-1]})이 인덱스 차원({self.dimensions})과 다릅니다.")
+		norm = np.linalg.norm(query)
+		if norm > 0:
+			query = query / norm
+
+		rows = self._candidate_rows(filter)
+		count = len(self._vectors) if rows is None else len(rows)
+		k = min(k, count)
+		if k <= 0:
+			return []
+
+		if self.approximate:
+			candidates = self._approximate_candidates(query, rows, min(count, k * self.rescore_multiplier))
+			rows = candidates if rows is None else rows[candidates]
+
+		vectors = self._vectors if rows is None else self._vectors[rows]
+		similarities = np.asarray(vectors, dtype=np.float32) @ query
+		top = _top_k(similarities, k)
+		positions = top if rows is None else rows[top]
+		return [(int(position), float(1.0 - similarities[i])) for position, i in zip(positions, top)]
+
+	def _approximate_candidates(self, query: np.ndarray, rows: Optional[np.ndarray], count: int) -> np.ndarray:
+		"""축소 벡터 기준 상위 count 개 위치 (rows 가 있으면 rows 안의 위치), 원본 벡터 접근이 순차가 되도록 정렬"""
+		reduced = query[:self.search_dimensions]
+		if self._bits is not None:
+			bits = self._bits if rows is None else self._bits[rows]
+			query_bits = np.packbits(reduced > 0)
+			# 일치하는 비트 수가 많을수록 가까움 (hamming 거리의 반대)
+			scores = self.search_dimensions - np.bitwise_count(bits ^ query_bits).sum(axis=1, dtype=np.int32)
+		else:
+			vectors = self._search_vectors if rows is None else self._search_vectors[rows]
+			scores = vectors @ reduced
+		return np.sort(_top_k(scores, count))
+
+	def _to_document(self, row: int) -> Document:
+		return Document(id=self._ids[row], page_content=self._documents[row], metadata=self._metadatas[row])
+
+	def similarity_search_with_score_by_vector(
+		self,
+		embedding: List[float],
+		k: int = 4,
+		filter: Optional[Dict[str, Any]] = None,
+		**kwargs: Any,
+		) -> List[Tuple[Document, float]]:
+		return [(self._to_document(row), distance) for row, distance in self._search(embedding, k, filter)]
+
+	def similarity_search_by_vector(
+		self,
+		embedding: List[float],
+		k: int = 4,
+		filter: Optional[Dict[str, Any]] = None,
+		**kwargs: Any,
+		) -> List[Document]:
+		return [doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k, filter)]
+
+	async def asimilarity_search_by_vector(
+		self,
+		embedding: List[float],
+		k: int = 4,
+		filter: Optional[Dict[str, Any]] = None,
+		**kwargs: Any,
+		) -> List[Document]:
+		# 작은 컬렉션은 스레드 전환 비용이 검색보다 커서 이벤트 루프에서 바로 실행
+		if self._vectors.size < THREAD_OFFLOAD_MIN_ELEMENTS:
+			return self.similarity_search_by_vector(embedding, k, filter)
+		return await asyncio.to_thread(self.similarity_search_by_vector, embedding, k, filter)
+
+	def _embed_query(self, query: str) -> List[float]:
+		if self.embedding_function is None:
+			raise ValueError("텍스트 검색에는 embedding_function 이 필요합니다.")
+		return self.embedding_function.embed_query(query)
+
+	def similarity_search_with_score(
+		self,
+		query: str,
+		k: int = 4,
+		filter: Optional[Dict[str, Any]] = None,
+		**kwargs: Any,
+		) -> List[Tuple[Document, float]]:
+		return self.similarity_search_with_score_by_vector(self._embed_query(query), k, filter)
+
+	def similarity_search(
+		self,
+		query: str,
+		k: int = 4,
+		filter: Optional[Dict[str, Any]] = None,
+		**kwargs: Any,
+		) -> List[Document]:
+		return self.similarity_search_by_vector(self._embed_query(query), k, filter)
+
+	async def asimilarity_search(
+		self,
+		query: str,
+		k: int = 4,
+		filter: Optional[Dict[str, Any]] = None,
+		**kwargs: Any,
+		) -> List[Document]:
+		if self.embedding_function is None:
+			raise ValueError("텍스트 검색에는 embedding_function 이 필요합니다.")
+		embedding = await self.embedding_function.aembed_query(query)
+		return await self.asimilarity_search_by_vector(embedding, k, filter)
+
+	def get_by_ids(self, ids: Sequence[str], /) -> List[Document]:
+		positions = {doc_id: row for row, doc_id in enumerate(self._ids)}
+		return [self._to_document(positions[doc_id]) for doc_id in ids if doc_id in positions]
+
+	def add_texts(self, texts: Iterable[str], metadatas: Optional[List[dict]] = None, **kwargs: Any) -> List[str]:
+		raise NotImplementedError("로컬 벡터 인덱스는 읽기 전용입니다. PGVector 에 추가한 뒤 스냅샷을 다시 저장하세요.")
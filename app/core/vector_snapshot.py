@@ -0,0 +1,440 @@
+import argparse
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import asyncpg
+import numpy as np
+import orjson
+from pgvector import Vector
+
+from app.core.config import get_settings
+from app.core.relational_db import get_relational_pool, to_asyncpg_dsn
+from app.core.vector_db import (
+	COLLECTION_NAME_COMPANY,
+	COLLECTION_NAME_NEWS,
+	COLLECTION_NAME_UNIVERSITY,
+	EMBEDDING_MODEL_NAME,
+)
+
+# PGVector 컬렉션 스냅샷 저장/복원
+# 임베딩 API 를 다시 호출하지 않고 구축된 컬렉션을 다른 환경(로컬 벡터 인덱스 VECTOR_BACKEND=local, 다른 PostgreSQL, CI)으로 옮깁니다.
+# <디렉터리>/<컬렉션 이름>/ 아래에 다음 파일을 저장합니다.
+#   manifest.json   컬렉션, 임베딩 모델, 차원, 문서 수, 벡터 dtype, 파일 별 크기/sha256
+#   vectors.npy     (문서 수, 차원) float32 또는 float16, 단위 벡터로 정규화 (np.load(mmap_mode="r") 로 워커 간 페이지 캐시 공유)
+#   ids.json        vectors.npy 와 같은 순서의 문서 id 목록
+#   documents.json  같은 순서의 문서 본문 목록
+#   metadata.json   메타데이터 컬럼 별 값 목록 {"columns": {키: [값, ...]}} (없는 키는 null)
+#
+#   python -m app.core.vector_snapshot export --dtype float16 --output-dir snapshots
+#   python -m app.core.vector_snapshot import snapshots --target pgvector
+#   python -m app.core.vector_snapshot import snapshots --target local
+#   python -m app.core.vector_snapshot verify snapshots/company_collection
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 2
+MANIFEST_FILE = "manifest.json"
+VECTORS_FILE = "vectors.npy"
+IDS_FILE = "ids.json"
+DOCUMENTS_FILE = "documents.json"
+METADATA_FILE = "metadata.json"
+DATA_FILES = [VECTORS_FILE, IDS_FILE, DOCUMENTS_FILE, METADATA_FILE]
+
+# 저장 가능한 벡터 dtype (float16 은 파일 크기가 절반, 코사인 유사도 오차 약 1e-3)
+VECTOR_DTYPES = ("float32", "float16")
+
+COLLECTION_NAMES = [COLLECTION_NAME_COMPANY, COLLECTION_NAME_NEWS, COLLECTION_NAME_UNIVERSITY]
+
+PoolFactory = Callable[[], Awaitable[asyncpg.Pool]]
+
+# langchain PGVector 테이블 (langchain_pg_collection, langchain_pg_embedding)
+_EXPORT_QUERY = """
+	SELECT e.custom_id, e.uuid::text AS uuid, e.document, e.cmetadata::text AS cmetadata, e.embedding::text AS embedding
+	FROM langchain_pg_embedding e
+	JOIN langchain_pg_collection c ON e.collection_id = c.uuid
+	WHERE c.name = $1
+	ORDER BY e.uuid
+"""
+
+# PGVector(use_jsonb=True) 가 만드는 테이블과 같은 구조, 새 환경에서는 import 가 직접 생성
+_CREATE_PGVECTOR_TABLES = """
+	CREATE EXTENSION IF NOT EXISTS vector;
+	CREATE TABLE IF NOT EXISTS langchain_pg_collection (
+		uuid UUID PRIMARY KEY,
+		name VARCHAR,
+		cmetadata JSON
+	);
+	CREATE TABLE IF NOT EXISTS langchain_pg_embedding (
+		uuid UUID PRIMARY KEY,
+		collection_id UUID REFERENCES langchain_pg_collection (uuid) ON DELETE CASCADE,
+		embedding VECTOR,
+		document VARCHAR,
+		cmetadata JSONB,
+		custom_id VARCHAR
+	);
+	CREATE INDEX IF NOT EXISTS ix_cmetadata_gin ON langchain_pg_embedding USING gin (cmetadata jsonb_path_ops);
+"""
+
+# COPY 로 임시 테이블에 적재한 뒤 jsonb 로 변환해 한 번에 저장
+# (메타데이터는 커넥션 풀의 jsonb codec 설정과 무관하도록 텍스트로 전송)
+_CREATE_STAGING_TABLE = """
+	CREATE TEMPORARY TABLE vector_snapshot_staging (
+		uuid UUID,
+		embedding VECTOR,
+		document TEXT,
+		cmetadata TEXT,
+		custom_id TEXT
+	) ON COMMIT DROP
+"""
+
+_INSERT_FROM_STAGING = """
+	INSERT INTO langchain_pg_embedding (uuid, collection_id, embedding, document, cmetadata, custom_id)
+	SELECT uuid, $1, embedding, document, cmetadata::jsonb, custom_id FROM vector_snapshot_staging
+"""
+
+
+@dataclass
+class VectorSnapshot:
+	manifest: Dict[str, Any]
+	# (문서 수, 차원) float32/float16, mmap 으로 로드한 경우 np.memmap
+	vectors: np.ndarray
+	ids: List[str]
+	documents: List[str]
+	metadatas: List[Dict[str, Any]]
+
+
+def collection_snapshot_dir(collection_name: str, base_dir: Optional[str] = None) -> Path:
+	"""컬렉션 스냅샷 디렉터리, base_dir 을 지정하지 않으면 VECTOR_SNAPSHOT_DIR"""
+	return Path(base_dir or get_settings().VECTOR_SNAPSHOT_DIR) / collection_name
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+	"""행 별 단위 벡터 (코사인 유사도를 내적으로 계산), 길이가 0 인 행은 그대로"""
+	vectors = np.asarray(vectors, dtype=np.float32)
+	norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+	return vectors / np.where(norms == 0, 1.0, norms).astype(np.float32)
+
+
+def to_columns(metadatas: Sequence[Dict[str, Any]]) -> Dict[str, List[Any]]:
+	"""문서 별 메타데이터를 키 별 값 목록으로 변환 (키 순서는 처음 나온 순서)"""
+	keys: Dict[str, None] = {}
+	for metadata in metadatas:
+		keys.update(dict.fromkeys(metadata))
+	return {key: [metadata.get(key) for metadata in metadatas] for key in keys}
+
+
+def from_columns(columns: Dict[str, List[Any]], count: int) -> List[Dict[str, Any]]:
+	"""키 별 값 목록을 문서 별 메타데이터로 변환 (null 값은 없는 키로 처리)"""
+	metadatas: List[Dict[str, Any]] = [{} for _ in range(count)]
+	for key, values in columns.items():
+		if len(values) != count:
+			raise ValueError(f"메타데이터 컬럼 길이가 문서 수와 다릅니다: {key} ({len(values)} != {count})")
+		for metadata, value in zip(metadatas, values):
+			if value is not None:
+				metadata[key] = value
+	return metadatas
+
+
+def _file_sha256(path: Path) -> str:
+	digest = hashlib.sha256()
+	with open(path, "rb") as file:
+		for chunk in iter(lambda: file.read(1 << 20), b""):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+def write_snapshot(
+	directory: Path,
+	collection_name: str,
+	embedding_model: str,
+	vectors: np.ndarray,
+	ids: Sequence[str],
+	documents: Sequence[str],
+	metadatas: Sequence[Dict[str, Any]],
+	dtype: str = "float32",
+	collection_metadata: Optional[Dict[str, Any]] = None,
+	) -> Dict[str, Any]:
+	"""
+	스냅샷 저장 후 manifest 반환
+	임시 디렉터리에 모두 쓴 뒤 교체하므로 기존 스냅샷을 읽는 워커는 불완전한 파일을 보지 않습니다.
+	(이미 mmap 으로 연 워커는 재시작 전까지 이전 파일을 계속 사용)
+	"""
+	if dtype not in VECTOR_DTYPES:
+		raise ValueError(f"지원하지 않는 벡터 dtype 입니다: {dtype} ({', '.join(VECTOR_DTYPES)})")
+	vectors = np.asarray(vectors, dtype=np.float32)
+	if vectors.ndim != 2:
+		raise ValueError(f"벡터는 2차원 배열이어야 합니다: {vectors.shape}")
+	if not (len(vectors) == len(ids) == len(documents) == len(metadatas)):
+		raise ValueError("벡터, id, 문서, 메타데이터 수가 다릅니다.")
+
+	directory = Path(directory)
+	directory.parent.mkdir(parents=True, exist_ok=True)
+	staging = directory.with_name(f".{directory.name}.tmp-{os.getpid()}")
+	shutil.rmtree(staging, ignore_errors=True)
+	staging.mkdir()
+
+	np.save(staging / VECTORS_FILE, normalize_rows(vectors).astype(dtype))
+	(staging / IDS_FILE).write_bytes(orjson.dumps([str(doc_id) for doc_id in ids]))
+	(staging / DOCUMENTS_FILE).write_bytes(orjson.dumps(list(documents)))
+	(staging / METADATA_FILE).write_bytes(orjson.dumps({"columns": to_columns(metadatas)}))
+
+	manifest = {
+		"format_version": SNAPSHOT_FORMAT_VERSION,
+		"collection": collection_name,
+		"collection_metadata": collection_metadata,
+		"embedding_model": embedding_model,
+		"dimensions": int(vectors.shape[1]),
+		"count": int(vectors.shape[0]),
+		"dtype": dtype,
+		"normalized": True,
+		"created_at": datetime.now(timezone.utc).isoformat(),
+		"files": {
+			name: {"bytes": (staging / name).stat().st_size, "sha256": _file_sha256(staging / name)}
+			for name in DATA_FILES
+		},
+	}
+	(staging / MANIFEST_FILE).write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+
+	previous = directory.with_name(f".{directory.name}.old-{os.getpid()}")
+	if directory.exists():
+		directory.rename(previous)
+	staging.rename(directory)
+	shutil.rmtree(previous, ignore_errors=True)
+	return manifest
+
+
+def read_manifest(directory: Path) -> Dict[str, Any]:
+	manifest = orjson.loads((Path(directory) / MANIFEST_FILE).read_bytes())
+	if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+		raise ValueError(f"지원하지 않는 스냅샷 형식입니다: {manifest.get('format_version')} (다시 export 하세요)")
+	return manifest
+
+
+def verify_snapshot(directory: Path, checksums: bool = True) -> Dict[str, Any]:
+	"""파일 크기와 (checksums 이면) sha256 을 manifest 와 비교, 다르면 ValueError"""
+	directory = Path(directory)
+	manifest = read_manifest(directory)
+	for name, expected in manifest["files"].items():
+		path = directory / name
+		if not path.exists() or path.stat().st_size != expected["bytes"]:
+			raise ValueError(f"스냅샷 파일 크기가 manifest 와 다릅니다: {path}")
+		if checksums and _file_sha256(path) != expected["sha256"]:
+			raise ValueError(f"스냅샷 파일 checksum 이 manifest 와 다릅니다: {path}")
+	return manifest
+
+
+def load_snapshot(directory: Path, mmap: bool = True, verify_checksums: bool = False) -> VectorSnapshot:
+	"""
+	스냅샷 로드, mmap 이면 벡터 파일을 읽기 전용 memory map 으로 열어 같은 서버의 워커가 페이지 캐시를 공유
+	파일 크기는 항상 확인하고, sha256 은 verify_checksums 일 때만 확인합니다 (파일 전체를 읽음).
+	"""
+	directory = Path(directory)
+	manifest = verify_snapshot(directory, checksums=verify_checksums)
+
+	vectors = np.load(directory / VECTORS_FILE, mmap_mode="r" if mmap else None)
+	ids = orjson.loads((directory / IDS_FILE).read_bytes())
+	documents = orjson.loads((directory / DOCUMENTS_FILE).read_bytes())
+	count = manifest["count"]
+	metadatas = from_columns(orjson.loads((directory / METADATA_FILE).read_bytes())["columns"], count)
+
+	if vectors.shape != (count, manifest["dimensions"]) or len(ids) != count or len(documents) != count:
+		raise ValueError(f"스냅샷 파일이 manifest 와 다릅니다: {directory}")
+	return VectorSnapshot(manifest=manifest, vectors=vectors, ids=ids, documents=documents, metadatas=metadatas)
+
+
+async def export_collection(
+	collection_name: str,
+	directory: Path,
+	pool_factory: Optional[PoolFactory] = None,
+	embedding_model: str = EMBEDDING_MODEL_NAME,
+	dtype: str = "float32",
+	) -> Dict[str, Any]:
+	"""PGVector 컬렉션의 임베딩, 문서, 메타데이터를 스냅샷으로 저장"""
+	pool = await (pool_factory or get_relational_pool)()
+	async with pool.acquire() as conn:
+		collection_metadata = await conn.fetchval("SELECT cmetadata::text FROM langchain_pg_collection WHERE name = $1", collection_name)
+		rows = await conn.fetch(_EXPORT_QUERY, collection_name)
+	if not rows:
+		raise ValueError(f"컬렉션에 문서가 없습니다: {collection_name}")
+
+	# vector 타입의 텍스트 표현 "[0.1,0.2,...]" 은 JSON 배열과 같음
+	vectors = np.array([orjson.loads(row["embedding"]) for row in rows], dtype=np.float32)
+	manifest = write_snapshot(
+		directory,
+		collection_name,
+		embedding_model,
+		vectors,
+		ids = [row["custom_id"] or row["uuid"] for row in rows],
+		documents = [row["document"] or "" for row in rows],
+		metadatas = [orjson.loads(row["cmetadata"]) if row["cmetadata"] else {} for row in rows],
+		dtype = dtype,
+		collection_metadata = orjson.loads(collection_metadata) if collection_metadata else None,
+	)
+	logger.info(f"스냅샷 저장 완료: {collection_name} ({manifest['count']}개, {manifest['dimensions']}차원, {dtype}) -> {directory}")
+	return manifest
+
+
+async def import_to_pgvector(
+	directory: Path,
+	pool_factory: Optional[PoolFactory] = None,
+	collection_name: Optional[str] = None,
+	dimensions: Optional[int] = None,
+	) -> Dict[str, Any]:
+	"""
+	스냅샷을 PGVector 컬렉션으로 적재 (같은 이름의 기존 컬렉션은 교체)
+	checksum 확인 후 한 트랜잭션에서 COPY 로 적재하므로 실패하면 기존 컬렉션이 그대로 남습니다.
+	벡터는 정규화된 값으로 저장되며 코사인 거리 검색 결과는 원본 컬렉션과 같습니다.
+	dimensions 를 지정하면 앞쪽 N 차원으로 잘라 다시 정규화해 저장합니다 (VECTOR_DIMENSIONS 와 같은 값 사용).
+	"""
+	snapshot = load_snapshot(directory, verify_checksums=True)
+	name = collection_name or snapshot.manifest["collection"]
+	collection_metadata = snapshot.manifest.get("collection_metadata")
+
+	vectors = np.asarray(snapshot.vectors, dtype=np.float32)
+	if dimensions and dimensions < vectors.shape[1]:
+		vectors = normalize_rows(vectors[:, :dimensions])
+	records = [
+		(uuid.uuid4(), vector, document, orjson.dumps(metadata).decode(), doc_id)
+		for vector, document, metadata, doc_id in zip(vectors, snapshot.documents, snapshot.metadatas, snapshot.ids)
+	]
+
+	pool = await (pool_factory or get_relational_pool)()
+	async with pool.acquire() as conn:
+		await conn.execute(_CREATE_PGVECTOR_TABLES)
+		schema = await conn.fetchval(
+			"SELECT n.nspname FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace WHERE t.typname = 'vector'"
+		)
+		# vector 를 binary COPY 로 전송 (텍스트 표현 대비 약 50배 빠름), 풀의 커넥션이므로 끝나면 기본 codec 으로 복원
+		await conn.set_type_codec(
+			"vector", schema=schema, format="binary",
+			encoder=lambda value: Vector(value).to_binary(),
+			decoder=lambda data: Vector.from_binary(data).to_list(),
+		)
+		try:
+			await _copy_collection(conn, name, collection_metadata, records)
+		finally:
+			await conn.reset_type_codec("vector", schema=schema)
+
+	logger.info(f"PGVector 컬렉션 적재 완료: {name} ({len(records)}개, {vectors.shape[1]}차원) <- {directory}")
+	return snapshot.manifest
+
+
+async def _copy_collection(conn: asyncpg.Connection, name: str, collection_metadata: Optional[Dict[str, Any]], records: List[tuple]) -> None:
+	"""한 트랜잭션에서 같은 이름의 컬렉션을 교체 (실패하면 기존 컬렉션 유지)"""
+	async with conn.transaction():
+		# langchain_pg_embedding 은 collection 삭제 시 CASCADE 로 함께 삭제
+		await conn.execute("DELETE FROM langchain_pg_collection WHERE name = $1", name)
+		collection_id = uuid.uuid4()
+		await conn.execute(
+			"INSERT INTO langchain_pg_collection (uuid, name, cmetadata) VALUES ($1, $2, $3::text::json)",
+			collection_id, name, orjson.dumps(collection_metadata).decode() if collection_metadata is not None else None,
+		)
+		await conn.execute(_CREATE_STAGING_TABLE)
+		await conn.copy_records_to_table(
+			"vector_snapshot_staging",
+			records = records,
+			columns = ["uuid", "embedding", "document", "cmetadata", "custom_id"],
+		)
+		await conn.execute(_INSERT_FROM_STAGING, collection_id)
+
+
+def import_to_local(directory: Path, base_dir: Optional[str] = None, collection_name: Optional[str] = None) -> Dict[str, Any]:
+	"""checksum 확인 후 스냅샷을 로컬 벡터 인덱스 디렉터리(VECTOR_SNAPSHOT_DIR/<컬렉션 이름>)로 복사"""
+	directory = Path(directory)
+	manifest = verify_snapshot(directory)
+	target = collection_snapshot_dir(collection_name or manifest["collection"], base_dir)
+	if target.resolve() == directory.resolve():
+		return manifest
+
+	target.parent.mkdir(parents=True, exist_ok=True)
+	staging = target.with_name(f".{target.name}.tmp-{os.getpid()}")
+	shutil.rmtree(staging, ignore_errors=True)
+	shutil.copytree(directory, staging)
+	previous = target.with_name(f".{target.name}.old-{os.getpid()}")
+	if target.exists():
+		target.rename(previous)
+	staging.rename(target)
+	shutil.rmtree(previous, ignore_errors=True)
+	logger.info(f"로컬 벡터 인덱스 스냅샷 복사 완료: {manifest['collection']} -> {target}")
+	return manifest
+
+
+def find_snapshots(path: Path) -> List[Path]:
+	"""스냅샷 디렉터리 또는 컬렉션 별 스냅샷 디렉터리를 담은 상위 디렉터리"""
+	path = Path(path)
+	if (path / MANIFEST_FILE).exists():
+		return [path]
+	return sorted(child for child in path.iterdir() if (child / MANIFEST_FILE).exists())
+
+
+async def _export(args: argparse.Namespace, pool_factory: PoolFactory) -> None:
+	for collection_name in args.collection or COLLECTION_NAMES:
+		await export_collection(
+			collection_name, collection_snapshot_dir(collection_name, args.output_dir), pool_factory, dtype=args.dtype
+		)
+
+
+async def _import_pgvector(args: argparse.Namespace, pool_factory: PoolFactory) -> None:
+	dimensions = get_settings().VECTOR_DIMENSIONS
+	for directory in find_snapshots(args.path):
+		collection = read_manifest(directory)["collection"]
+		await import_to_pgvector(directory, pool_factory, dimensions=args.dimensions or dimensions.get(collection))
+
+
+async def _run_with_pool(command: Callable[[argparse.Namespace, PoolFactory], Awaitable[None]], args: argparse.Namespace) -> None:
+	pool = await asyncpg.create_pool(to_asyncpg_dsn(args.database_url or get_settings().DATABASE_URL), min_size=1, max_size=1)
+
+	async def pool_factory() -> asyncpg.Pool:
+		return pool
+
+	try:
+		await command(args, pool_factory)
+	finally:
+		await pool.close()
+
+
+def main():
+	parser = argparse.ArgumentParser(description="PGVector 컬렉션 스냅샷 저장/복원 (임베딩 API 호출 없이 컬렉션 이동)")
+	subparsers = parser.add_subparsers(dest="command", required=True)
+
+	export_parser = subparsers.add_parser("export", help="PGVector 컬렉션을 스냅샷으로 저장")
+	export_parser.add_argument("--collection", action="append", help="저장할 컬렉션 (여러 번 지정 가능), 기본값 전체 컬렉션")
+	export_parser.add_argument("--output-dir", default=None, help="스냅샷 디렉터리, 기본값 VECTOR_SNAPSHOT_DIR")
+	export_parser.add_argument("--dtype", choices=VECTOR_DTYPES, default="float32", help="벡터 저장 dtype")
+	export_parser.add_argument("--database-url", default=None, help="기본값 DATABASE_URL")
+
+	import_parser = subparsers.add_parser("import", help="스냅샷을 PGVector 컬렉션 또는 로컬 벡터 인덱스로 복원")
+	import_parser.add_argument("path", type=Path, help="컬렉션 스냅샷 디렉터리 또는 컬렉션 별 스냅샷을 담은 디렉터리")
+	import_parser.add_argument("--target", choices=["pgvector", "local"], default="pgvector")
+	import_parser.add_argument("--snapshot-dir", default=None, help="--target local 의 복사 위치, 기본값 VECTOR_SNAPSHOT_DIR")
+	import_parser.add_argument("--database-url", default=None, help="기본값 DATABASE_URL")
+	import_parser.add_argument("--dimensions", type=int, default=None, help="--target pgvector 저장 차원 (앞쪽 N 차원), 기본값 컬렉션 별 VECTOR_DIMENSIONS")
+
+	verify_parser = subparsers.add_parser("verify", help="스냅샷 파일 크기, checksum 확인")
+	verify_parser.add_argument("path", type=Path)
+	args = parser.parse_args()
+
+	logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+	if args.command == "export":
+		asyncio.run(_run_with_pool(_export, args))
+	elif args.command == "import" and args.target == "pgvector":
+		asyncio.run(_run_with_pool(_import_pgvector, args))
+	elif args.command == "import":
+		for directory in find_snapshots(args.path):
+			import_to_local(directory, args.snapshot_dir)
+	else:
+		for directory in find_snapshots(args.path):
+			manifest = verify_snapshot(directory)
+			logger.info(f"스냅샷 확인 완료: {manifest['collection']} ({manifest['count']}개, {manifest['embedding_model']}) {directory}")
+
+
+if __name__ == "__main__":
+	main()
@@ -1,24 +1,71 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import logging
-from app.routers import inference
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler()
-    ]
-)
+from app.core.config import get_settings
+from app.core.logging_config import configure_logging, shutdown_logging
+from app.core.metrics import ServerTimingMiddleware
+from app.core.relational_db import close_relational_pool
+from app.core.request_recorder import close_request_recorder
+from app.routers import inference, health, jobs, metrics
+from app.schemas.health import ReadinessResponse
+from app.services.job_worker_service import JobWorkerPool
+from app.services.warmup_service import retry_warm_up_until_ready, warm_up_application, set_readiness
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 로그 출력은 QueueListener 스레드에서 처리 (요청 처리 중에는 큐에 넣기만 함)
+    configure_logging()
+
+    # 첫 요청 전에 LLM 클라이언트, Vector Store, DB 커넥션 풀, 정적 인덱스 초기화
+    warm_up_retry = None
+    if get_settings().WARMUP_ENABLED:
+        readiness = await warm_up_application()
+        # 실패한 구성 요소는 백그라운드에서 재시도 (준비될 때까지 /health/ready 는 503)
+        if not readiness.ready:
+            warm_up_retry = asyncio.create_task(retry_warm_up_until_ready())
+    else:
+        logger.info("warm-up 비활성화, 지연 초기화 사용")
+        set_readiness(ReadinessResponse(ready=True))
+
+    # 비동기 추론 작업 워커 (JOB_WORKER_CONCURRENCY=0 이면 별도 프로세스로 실행)
+    settings = get_settings()
+    job_workers = None
+    if settings.JOB_QUEUE_ENABLED and settings.JOB_WORKER_CONCURRENCY > 0:
+        job_workers = JobWorkerPool()
+        job_workers.start()
+
+    yield
+
+    if warm_up_retry is not None:
+        warm_up_retry.cancel()
+    if job_workers is not None:
+        await job_workers.stop()
+    await close_relational_pool()
+    close_request_recorder()
+    shutdown_logging()
+
+
 app = FastAPI(
     title="서치라이트 기술 과제 API",
     version="0.1.0",
-    description="서치라이트 기술 과제입니다."
+    description="서치라이트 기술 과제입니다.",
+    lifespan=lifespan,
+    # 응답 직렬화를 orjson 으로 처리 (요청 본문 파싱은 app/core/fast_json.py 의 ORJSONRoute)
+    default_response_class=ORJSONResponse,
 )
 
+# SERVER_TIMING_ENABLED=true 일 때 단계 별 소요 시간을 Server-Timing 헤더로 반환 (benchmarks/load_test.py 에서 사용)
+app.add_middleware(ServerTimingMiddleware)
+
 app.include_router(inference.router)
+app.include_router(jobs.router)
+app.include_router(health.router)
+app.include_router(metrics.router)
 
 @app.get("/", tags=["Root"])
 async def read_root():
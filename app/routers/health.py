@@ -0,0 +1,34 @@
+import logging
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from app.schemas.health import ReadinessResponse
+from app.services.warmup_service import get_readiness
+
+logger = logging.getLogger(__name__)
+
+# 헬스 체크 라우터 (로드밸런서/오케스트레이터 용)
+router = APIRouter(
+	prefix="/health",
+	tags=["Health"],
+)
+
+@router.get(
+	"/live",
+	summary="Liveness 체크",
+	description="프로세스가 응답 가능한지 확인합니다.",
+)
+async def handle_liveness():
+	return {"status": "ok"}
+
+@router.get(
+	"/ready",
+	response_model=ReadinessResponse,
+	summary="Readiness 체크",
+	description="warm-up 이 완료되어 요청을 처리할 준비가 되었는지 확인합니다. 준비되지 않은 경우 503을 반환합니다.",
+	responses={503: {"model": ReadinessResponse, "description": "warm-up 진행 중 또는 실패"}},
+)
+async def handle_readiness():
+	readiness = get_readiness()
+	if not readiness.ready:
+		return JSONResponse(status_code=503, content=readiness.model_dump())
+	return readiness
@@ -1,8 +1,14 @@
 import logging
-from typing import List
-from fastapi import APIRouter, HTTPException, Body
+import math
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Body, Header, Response
+from app.core.admission import REQUEST_TIMEOUT_HEADER, REJECT_QUEUE_FULL, REJECT_DEADLINE, AdmissionRejectedError, get_admission_controller, parse_request_timeout
+from app.core.config import get_settings
+from app.core.degradation import TIER_FULL, collect_degradations, degradation_tier
+from app.core.fast_json import ORJSONRoute
+from app.core.llm_services import LLMCircuitOpenError, LLMInvocationError, LLMRateLimitedError, LLMTimeoutError
 from app.schemas.inference import TalentDataInput
-from app.services.inference_service import infer_experiences_service
+from app.services.inference_service import InferenceResult, infer_experiences_with_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -10,8 +16,52 @@ logger = logging.getLogger(__name__)
 router = APIRouter(
 	prefix="/api/v1",
 	tags=["Inference Service"],
+	# 큰 인재 데이터 본문을 orjson 으로 파싱
+	route_class=ORJSONRoute,
 )
 
+# 응답 등급 헤더 (full, reduced_context, rules_only, stale_cache), 등급을 낮춘 사유는 X-Inference-Degraded 에 쉼표로 구분
+INFERENCE_TIER_HEADER = "X-Inference-Tier"
+INFERENCE_DEGRADED_HEADER = "X-Inference-Degraded"
+# 결과 캐시 키 (응답으로 돌려주고, 클라이언트가 요청 헤더로 보내면 nginx proxy_cache 키로 사용)
+INFERENCE_CACHE_KEY_HEADER = "X-Inference-Cache-Key"
+
+
+def set_degradation_headers(response: Response, degradations: List[str]) -> str:
+	"""응답 등급 헤더를 추가하고 등급 반환"""
+	tier = degradation_tier(degradations)
+	response.headers[INFERENCE_TIER_HEADER] = tier
+	if degradations:
+		response.headers[INFERENCE_DEGRADED_HEADER] = ",".join(degradations)
+	return tier
+
+
+def set_edge_cache_headers(response: Response, cache_key: str, requested_cache_key: Optional[str]) -> None:
+	"""
+	EDGE_CACHE_TTL 설정 시 성공 응답에 결과 캐시 키(정규화 프로필 + 모델 설정 키, 같은 키의 응답은 같은 결과) 추가
+	요청 헤더로 받은 키가 본문에서 계산한 키와 같을 때만 nginx proxy_cache 가 저장할 수 있도록 Cache-Control 을 추가합니다
+	(다른 본문의 결과가 그 키로 저장되지 않도록).
+	오류 응답과 등급을 낮춘 응답에는 추가하지 않으므로 nginx 가 저장하지 않습니다.
+	"""
+	ttl = get_settings().EDGE_CACHE_TTL
+	if ttl <= 0:
+		return
+	response.headers[INFERENCE_CACHE_KEY_HEADER] = cache_key
+	if requested_cache_key == cache_key:
+		response.headers["Cache-Control"] = f"public, max-age={ttl}"
+	elif requested_cache_key:
+		logger.warning("요청 캐시 키가 본문의 정규화 프로필 키와 달라 edge cache 에 저장하지 않습니다.")
+
+
+async def run_with_admission(talent_data: TalentDataInput, request_timeout: Optional[float]) -> InferenceResult:
+	"""ADMISSION_CONTROL_ENABLED 이면 동시 실행 한도/대기열을 거쳐 추론 실행"""
+	controller = get_admission_controller()
+	if controller is None:
+		return await infer_experiences_with_cache_key(talent_data)
+	async with controller.admit(request_timeout):
+		return await infer_experiences_with_cache_key(talent_data)
+
+
 @router.post(
 	"/inference",
 	response_model=List[str],
@@ -21,6 +71,7 @@ router = APIRouter(
 )
 
 async def handle_infer_experience(
+	response: Response,
 	talent_data: TalentDataInput = Body(
 		...,
 		examples={
@@ -62,7 +113,9 @@ async def handle_infer_experience(
         }]
 			}
 		}
-	)
+	),
+	request_timeout: Optional[str] = Header(None, alias=REQUEST_TIMEOUT_HEADER, description="클라이언트가 기다릴 수 있는 남은 시간(초), 대기열 대기와 LLM 호출 기한에 반영"),
+	requested_cache_key: Optional[str] = Header(None, alias=INFERENCE_CACHE_KEY_HEADER, description="이전 응답의 결과 캐시 키, nginx 응답 캐시 키로 사용"),
 ): 
 	"""
 	JSON 기반으로 서비스 호출하고 결과를 반환합니다.
@@ -70,7 +123,9 @@ async def handle_infer_experience(
 
 	try:
 		logger.info(f"'/inference' API 요청 수신")
-		inferred_experience_strings = await infer_experiences_service(talent_data)
+		with collect_degradations() as degradations:
+			inference_result = await run_with_admission(talent_data, parse_request_timeout(request_timeout))
+		inferred_experience_strings = inference_result.tags
 
 		if not inferred_experience_strings and inferred_experience_strings is not None:
 			logger.info("추론된 경험이 없거나 LLM 응답이 비어있습니다.")
@@ -79,11 +134,50 @@ async def handle_infer_experience(
 			logger.error("None 반환했습니다.")
 			raise HTTPException(status_code=500, detail="추론 중 내부 서버 오류 발생")
 		
+		if set_degradation_headers(response, degradations) == TIER_FULL:
+			set_edge_cache_headers(response, inference_result.cache_key, requested_cache_key)
+		else:
+			logger.warning(f"'/inference' 응답 등급 낮춤: {degradations}")
 		logger.info(f"'/inference' API 응답 생성 완료")
 		return inferred_experience_strings
 	
 	except HTTPException as http_exc:
 		raise http_exc
+
+	# 과부하 시 LLM 호출 전에 바로 거부 (대기열 가득 참 429, 대기 시간 초과 503, 클라이언트 기한 초과 504)
+	except AdmissionRejectedError as ae:
+		if ae.reason == REJECT_DEADLINE:
+			raise HTTPException(status_code=504, detail="요청 기한 안에 처리할 수 없습니다.")
+		raise HTTPException(
+			status_code=429 if ae.reason == REJECT_QUEUE_FULL else 503,
+			detail="요청이 많아 일시적으로 처리할 수 없습니다.",
+			headers={"Retry-After": str(max(1, math.ceil(ae.retry_after)))},
+		)
+
+	# LLM 호출 실패는 빈 결과가 아닌 별도 상태 코드로 응답
+	except LLMCircuitOpenError as ce:
+		logger.error(f"LLM 서킷 브레이커 open 상태로 요청 거부: {ce}")
+		raise HTTPException(
+			status_code=503,
+			detail="LLM 서비스가 일시적으로 사용 불가합니다.",
+			headers={"Retry-After": str(max(1, math.ceil(ce.retry_after)))},
+		)
+
+	except LLMRateLimitedError as re:
+		logger.error(f"LLM 호출 한도 대기열 초과로 요청 거부: {re}")
+		raise HTTPException(
+			status_code=503,
+			detail="요청이 많아 일시적으로 처리할 수 없습니다.",
+			headers={"Retry-After": str(max(1, math.ceil(re.retry_after)))},
+		)
+
+	except LLMTimeoutError as te:
+		logger.error(f"LLM 호출 기한 초과: {te}")
+		raise HTTPException(status_code=504, detail="LLM 응답 시간 초과")
+
+	except LLMInvocationError as le:
+		logger.error(f"LLM 호출 실패: {le}")
+		raise HTTPException(status_code=502, detail="LLM 호출 실패")
 	
 	except ValueError as ve:
 		logger.error(f"API 요청 처리 중 오류 발생: {ve}", exc_info=True)
@@ -0,0 +1,72 @@
+import logging
+import math
+from fastapi import APIRouter, HTTPException, Response
+from app.core.config import get_settings
+from app.core.fast_json import ORJSONRoute
+from app.core.job_queue import JobQueueFullError, get_job_queue
+from app.core.metrics import record_job_event
+from app.schemas.job import JobSubmitRequest, JobSubmitResponse, JobStatusResponse
+from app.services.job_worker_service import is_callback_allowed
+
+logger = logging.getLogger(__name__)
+
+# 비동기 추론 작업 라우터 (JOB_QUEUE_ENABLED=true 일 때만 사용 가능)
+# 접수는 대기열 저장까지만 처리하므로 LLM 응답 지연과 관계없이 바로 응답합니다.
+router = APIRouter(
+	prefix="/api/v1/inference/jobs",
+	tags=["Inference Jobs"],
+	route_class=ORJSONRoute,
+)
+
+
+def _ensure_enabled() -> None:
+	if not get_settings().JOB_QUEUE_ENABLED:
+		raise HTTPException(status_code=404, detail="비동기 추론 작업 API가 비활성화되어 있습니다.")
+
+
+@router.post(
+	"",
+	status_code=202,
+	response_model=JobSubmitResponse,
+	summary="비동기 추론 작업 접수",
+	description="인재 데이터 추론 작업을 대기열에 추가하고 작업 ID를 바로 반환합니다. 결과는 GET /api/v1/inference/jobs/{job_id} 로 조회하거나 callback_url 로 전달받습니다.",
+	response_description="접수된 작업 ID",
+)
+async def handle_submit_job(request: JobSubmitRequest, response: Response):
+	_ensure_enabled()
+
+	if request.callback_url and not is_callback_allowed(request.callback_url):
+		raise HTTPException(status_code=422, detail="허용되지 않은 callback_url 입니다.")
+
+	try:
+		job_id = await get_job_queue().enqueue(request.talent_data, request.priority, request.callback_url)
+	except JobQueueFullError as e:
+		# 대기열이 찬 경우 접수하지 않음 (낮은 우선순위 lane 부터 거부)
+		logger.warning(f"작업 접수 거부: {e}")
+		record_job_event(request.priority, "rejected")
+		raise HTTPException(
+			status_code=503,
+			detail="대기 중인 작업이 많아 일시적으로 접수할 수 없습니다.",
+			headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+		)
+
+	record_job_event(request.priority, "submitted")
+	logger.info(f"작업 {job_id} 접수 (lane {request.priority})")
+	response.headers["Location"] = f"{router.prefix}/{job_id}"
+	return JobSubmitResponse(job_id=job_id, status="queued", priority=request.priority)
+
+
+@router.get(
+	"/{job_id}",
+	response_model=JobStatusResponse,
+	summary="비동기 추론 작업 조회",
+	description="작업 상태와 완료된 경우 추론 결과(또는 실패 사유)를 반환합니다. 완료된 작업은 JOB_RESULT_TTL 동안 보관됩니다.",
+	response_description="작업 상태",
+)
+async def handle_get_job(job_id: str):
+	_ensure_enabled()
+
+	status = await get_job_queue().get(job_id)
+	if status is None:
+		raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+	return status
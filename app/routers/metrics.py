@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Response
+from app.core.metrics import METRICS_CONTENT_TYPE, render_metrics
+
+# Prometheus 수집용 지표 라우터
+router = APIRouter(
+	tags=["Metrics"],
+)
+
+@router.get(
+	"/metrics",
+	summary="Prometheus 지표",
+	description="추론 단계 별 지연 시간 히스토그램, LLM 토큰/재시도, 캐시 적중 지표를 Prometheus 텍스트 형식으로 반환합니다.",
+	include_in_schema=False,
+)
+async def handle_metrics():
+	return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
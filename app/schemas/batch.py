@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
+
+"""Batch API 오프라인 재태깅 작업 상태 스키마 (상태 파일로 저장되어 재시작 시 이어서 실행)"""
+class BatchItemState(BaseModel):
+	talent_id: str = Field(..., description="인재 식별자 (Batch 요청 custom_id)")
+	target_tags: List[str] = Field(default_factory=list, description="LLM 판단이 필요한 태그 (비어있으면 Batch 요청 없이 규칙 결과만 저장)")
+	rule_tag_strings: List[str] = Field(default_factory=list, description="규칙으로 부여 확정된 태그 문자열")
+
+class BatchJobState(BaseModel):
+	stage: str = Field("preparing", description="작업 단계 (preparing, prepared, submitting, submitted, completed, stored)")
+	input_path: Optional[str] = Field(None, description="Batch 입력 JSONL 파일 경로")
+	input_file_id: Optional[str] = Field(None, description="업로드된 입력 파일 ID")
+	batch_id: Optional[str] = Field(None, description="Batch ID")
+	batch_status: Optional[str] = Field(None, description="마지막으로 조회한 Batch 상태")
+	output_file_id: Optional[str] = Field(None, description="결과 파일 ID")
+	error_file_id: Optional[str] = Field(None, description="오류 파일 ID")
+	items: Dict[str, BatchItemState] = Field(default_factory=dict, description="프롬프트 생성이 끝난 인재 (talent_id -> 상태)")
+	stored_ids: List[str] = Field(default_factory=list, description="결과 테이블에 저장된 인재")
+	failed_ids: Dict[str, str] = Field(default_factory=dict, description="Batch 요청이 실패한 인재 (talent_id -> 오류)")
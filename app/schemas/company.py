@@ -0,0 +1,24 @@
+from datetime import date
+from pydantic import BaseModel, Field
+from typing import Optional, List, Any, Dict
+
+"""관계형 테이블(company, company_news) 조회 결과 스키마"""
+class CompanyNewsItem(BaseModel):
+	title: str = Field(..., description="뉴스 제목")
+	original_link: Optional[str] = Field(None, description="뉴스 원문 링크")
+	news_date: date = Field(..., description="뉴스 날짜")
+
+class CompanyFacts(BaseModel):
+	company_id: int = Field(..., description="company 테이블 ID")
+	name: str = Field(..., description="회사명")
+	seed_corp: Dict[str, Any] = Field(default_factory=dict, description="기본 회사 정보 (base_company_info.data.seedCorp)")
+	organization: List[Dict[str, Any]] = Field(default_factory=list, description="월별 재직자 수 (organization.data)")
+	investment: List[Dict[str, Any]] = Field(default_factory=list, description="투자/M&A 이력 (investment.data)")
+
+class CompanyTenureContext(BaseModel):
+	company_name: str = Field(..., description="인재 경력의 회사명")
+	start_date: Optional[date] = Field(None, description="재직 시작일")
+	end_date: Optional[date] = Field(None, description="재직 종료일 (재직 중이면 None)")
+	facts: CompanyFacts = Field(..., description="회사 구조화 정보")
+	news: List[CompanyNewsItem] = Field(default_factory=list, description="재직 기간 내 뉴스")
+	news_complete: bool = Field(False, description="재직 기간 내 뉴스를 모두 조회했는지 (조회 한도로 잘리지 않음)")
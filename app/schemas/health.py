@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+
+"""헬스 체크 응답 스키마"""
+class ComponentStatus(BaseModel):
+	name: str = Field(..., description="warm-up 구성 요소 이름")
+	ok: bool = Field(..., description="초기화 성공 여부")
+	duration_ms: float = Field(0.0, description="초기화 소요 시간 (ms)")
+	detail: Optional[str] = Field(None, description="실패 사유 또는 부가 정보")
+
+class ReadinessResponse(BaseModel):
+	ready: bool = Field(..., description="요청 처리 준비 완료 여부")
+	components: List[ComponentStatus] = Field(default_factory=list, description="구성 요소 별 warm-up 결과")
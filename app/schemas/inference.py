@@ -1,10 +1,11 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Union, Any
+from typing import Optional, List, Union
 
 """공통 중첩 모델"""
 class YearMonth(BaseModel):
-	year: Optional[int] = Field(None, description="연도 (예: 2023)")
-	month: Optional[int] = Field(None, description="월 (예: 5)")
+	# 재직/재학 기간을 date 로 변환하므로 범위 밖의 값은 422 로 거부
+	year: Optional[int] = Field(None, ge=1, le=9999, description="연도 (예: 2023)")
+	month: Optional[int] = Field(None, ge=1, le=12, description="월 (예: 5)")
 
 class StartEndDate(BaseModel):
 	start: Optional[YearMonth] = Field(None, description="시작일")
@@ -21,7 +22,6 @@ class Position(BaseModel):
 	companyName: Optional[str] = Field(None, description="회사명")
 	description: Optional[str] = Field(None, description="경력 상세 설명")
 	startEndDate: Optional[StartEndDate] = Field(None, description="재직기간")
-	companyLocation: Optional[str] = Field(None, description="회사 위치")
 
 class Education(BaseModel):
 	degreeName: Optional[str] = Field(None, description="학위명")
@@ -31,19 +31,15 @@ class Education(BaseModel):
 	originStartEndDate: Optional[EducationStartEndDate] = None
 
 class TalentDataInput(BaseModel):
+	"""
+	추론에 사용하는 필드만 선언한 인재 데이터
+	talent_ex*.json 의 나머지 필드(이름, photoUrl, website, projects, recommendations 등)는 검증/저장 없이 무시합니다.
+	"""
 	skills: Optional[List[str]] = Field(None, description="보유 기술")
 	summary: Optional[str] = Field(None, description="개인 요약")
-	website: Optional[List[str]] = Field(None, description="웹사이트 목록")
 	headline: Optional[str] = Field(None, description="현재 직책/소속 요약")
-	lastName: Optional[str] = Field(None, description="성")
-	photoUrl: Optional[str] = Field(None, description="사진 URL")
-	projects: Optional[List[Any]] = Field(None, description="프로젝트 목록")
-	firstName: Optional[str] = Field(None, description="이름")
 	positions: Optional[List[Position]] = Field(None, description="경력 목록")
 	educations: Optional[List[Education]] = Field(None, description="학력 목록")
-	linkedinUrl: Optional[str] = Field(None, description="LinkedIn URL")
-	industryName: Optional[str] = Field(None, description="산업 분야")
-	recommendations: Optional[List[Any]] = Field(None, description="추천서 목록")
 
 
 # FastAPI에 표시할 모델 예시 값
@@ -0,0 +1,30 @@
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import Optional, List, Literal
+
+from app.schemas.inference import TalentDataInput
+
+"""비동기 추론 작업 API 스키마 (/api/v1/inference/jobs)"""
+JobPriority = Literal["high", "normal", "low"]
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+class JobSubmitRequest(BaseModel):
+	talent_data: TalentDataInput = Field(..., description="추론할 인재 데이터 (/api/v1/inference 요청 본문과 동일)")
+	priority: JobPriority = Field("normal", description="우선순위 lane (high 가 먼저 처리되며, 대기열이 찰수록 낮은 lane 부터 거부)")
+	callback_url: Optional[str] = Field(None, description="완료(성공/실패) 시 작업 상태를 POST 로 전달할 URL (JOB_CALLBACK_ALLOWED_HOSTS 의 호스트만 허용)")
+
+class JobSubmitResponse(BaseModel):
+	job_id: str = Field(..., description="작업 ID")
+	status: JobStatus = Field(..., description="작업 상태")
+	priority: JobPriority = Field(..., description="우선순위 lane")
+
+class JobStatusResponse(BaseModel):
+	job_id: str = Field(..., description="작업 ID")
+	status: JobStatus = Field(..., description="작업 상태")
+	priority: JobPriority = Field(..., description="우선순위 lane")
+	result: Optional[List[str]] = Field(None, description="추론된 경험 태그 리스트 (succeeded)")
+	error: Optional[str] = Field(None, description="실패 사유 (failed)")
+	attempts: int = Field(0, description="실행 시도 수")
+	created_at: datetime = Field(..., description="접수 시각")
+	started_at: Optional[datetime] = Field(None, description="마지막 실행 시작 시각")
+	finished_at: Optional[datetime] = Field(None, description="완료 시각")
@@ -0,0 +1,380 @@
+# 전체 인재 풀 야간 재태깅용 OpenAI Batch API 오프라인 작업
+# 실시간 추론과 같은 프롬프트(prepare_experience_prompt)를 Batch JSONL 로 작성해 제출하고,
+# 완료된 결과를 postprocess_llm_response 로 후처리해 talent_experience_tags 테이블에 저장합니다.
+# 각 단계가 끝날 때마다 상태 파일을 갱신하므로 중단되어도 같은 명령으로 이어서 실행할 수 있습니다.
+#
+#     python -m app.services.batch_inference_service example_datas/talent_ex*.json --state batch_state.json
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.relational_db import close_relational_pool, get_relational_pool
+from app.schemas.batch import BatchItemState, BatchJobState
+from app.schemas.inference import TalentDataInput
+from app.services.inference_service import finalize_experience_tags, prepare_experience_prompt
+
+if TYPE_CHECKING:
+	from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+# Batch 종료 상태 (failed 는 결과 파일 없이 종료)
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+CREATE_RESULTS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS talent_experience_tags (
+	talent_id TEXT PRIMARY KEY,
+	tags JSONB NOT NULL,
+	batch_id TEXT,
+	updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+)
+"""
+
+UPSERT_RESULT_SQL = """
+INSERT INTO talent_experience_tags (talent_id, tags, batch_id, updated_at)
+VALUES ($1, $2, $3, now())
+ON CONFLICT (talent_id) DO UPDATE
+SET tags = EXCLUDED.tags, batch_id = EXCLUDED.batch_id, updated_at = EXCLUDED.updated_at
+"""
+
+
+class BatchJobError(Exception):
+	"""Batch 작업이 결과 없이 종료된 경우 (failed, 결과 파일 없음)"""
+	pass
+
+
+def load_talent_inputs(paths: Iterable[Path]) -> List[Tuple[str, TalentDataInput]]:
+	"""
+	인재 데이터 파일 로드
+	.json 은 파일 하나가 인재 1명, .jsonl 은 한 줄이 인재 1명이며
+	talent_id 필드가 없으면 파일명(과 줄 번호)을 식별자로 사용합니다.
+	"""
+	talents: List[Tuple[str, TalentDataInput]] = []
+	for path in paths:
+		path = Path(path)
+		if path.suffix == ".jsonl":
+			with path.open(encoding="utf-8") as f:
+				rows = [(f"{path.stem}-{i}", json.loads(line)) for i, line in enumerate(f, start=1) if line.strip()]
+		else:
+			rows = [(path.stem, json.loads(path.read_text(encoding="utf-8")))]
+
+		for default_id, row in rows:
+			talents.append((str(row.get("talent_id") or default_id), TalentDataInput(**row)))
+	return talents
+
+
+def load_state(state_path: Path) -> BatchJobState:
+	"""상태 파일 로드 (없으면 새 작업)"""
+	if state_path.exists():
+		state = BatchJobState.model_validate_json(state_path.read_text(encoding="utf-8"))
+		logger.info(f"Batch 작업 상태 파일 로드 : 단계 {state.stage}, 준비된 인재 {len(state.items)}명")
+		return state
+	return BatchJobState()
+
+
+def save_state(state: BatchJobState, state_path: Path) -> None:
+	"""임시 파일에 쓴 뒤 교체 (쓰는 도중 중단되어도 이전 상태 유지)"""
+	tmp_path = state_path.with_name(state_path.name + ".tmp")
+	tmp_path.write_text(state.model_dump_json(indent=2), encoding="utf-8")
+	tmp_path.replace(state_path)
+
+
+def build_batch_request(custom_id: str, prompt: str) -> dict:
+	"""Batch 입력 JSONL 한 줄 (실시간 호출과 같은 모델, temperature 사용)"""
+	settings = get_settings()
+	return {
+		"custom_id": custom_id,
+		"method": "POST",
+		"url": BATCH_ENDPOINT,
+		"body": {
+			"model": settings.OPENAI_MODEL_NAME,
+			"temperature": settings.OPENAI_TEMPERATURE,
+			"messages": [{"role": "user", "content": prompt}],
+		},
+	}
+
+
+def parse_batch_output_line(line: str) -> Tuple[str, Optional[str], Optional[str]]:
+	"""Batch 결과 JSONL 한 줄을 (custom_id, 응답 본문, 오류) 로 변환"""
+	row = json.loads(line)
+	custom_id = row.get("custom_id")
+	if row.get("error"):
+		return custom_id, None, str(row["error"].get("message") or row["error"])
+
+	response = row.get("response") or {}
+	if response.get("status_code") != 200:
+		return custom_id, None, f"status_code {response.get('status_code')}"
+	try:
+		return custom_id, response["body"]["choices"][0]["message"]["content"], None
+	except (KeyError, IndexError, TypeError):
+		return custom_id, None, "응답 형식 오류"
+
+
+def get_batch_client() -> "AsyncOpenAI":
+	"""Batch/Files API 클라이언트 (OPENAI_BASE_URL 지정 시 fake 서버, 프록시 사용)"""
+	from openai import AsyncOpenAI
+
+	settings = get_settings()
+	return AsyncOpenAI(
+		api_key = settings.OPENAI_API_KEY,
+		base_url = settings.OPENAI_BASE_URL,
+		timeout = settings.LLM_REQUEST_TIMEOUT,
+	)
+
+
+async def prepare_batch_input(
+	talents: List[Tuple[str, TalentDataInput]],
+	state: BatchJobState,
+	state_path: Path,
+	) -> None:
+	"""
+	인재 별 프롬프트를 생성해 입력 JSONL 에 추가
+	이미 준비된 인재는 건너뛰므로 중단된 지점부터 이어서 생성합니다.
+	"""
+	input_path = Path(state.input_path or state_path.with_suffix(".input.jsonl"))
+	state.input_path = str(input_path)
+	if not state.items and input_path.exists():
+		# 상태 파일 없이 남아있는 이전 작업의 입력 파일
+		input_path.unlink()
+
+	pending = [(talent_id, talent) for talent_id, talent in talents if talent_id not in state.items]
+	logger.info(f"Batch 프롬프트 생성 : 대상 {len(talents)}명, 남은 인재 {len(pending)}명")
+
+	semaphore = asyncio.Semaphore(get_settings().BATCH_PREPARE_CONCURRENCY)
+	write_lock = asyncio.Lock()
+
+	async def prepare(talent_id: str, talent: TalentDataInput) -> None:
+		async with semaphore:
+			experience_prompt = await prepare_experience_prompt(talent)
+		async with write_lock:
+			# JSONL 에 먼저 쓰고 상태를 저장 (재시작 시 중복 줄은 custom_id 기준으로 한 번만 처리됨)
+			if experience_prompt.target_tags:
+				with input_path.open("a", encoding="utf-8") as f:
+					f.write(json.dumps(build_batch_request(talent_id, experience_prompt.prompt), ensure_ascii=False) + "\n")
+			state.items[talent_id] = BatchItemState(
+				talent_id = talent_id,
+				target_tags = experience_prompt.target_tags,
+				rule_tag_strings = experience_prompt.rule_result.tag_strings(),
+			)
+			save_state(state, state_path)
+
+	await asyncio.gather(*(prepare(talent_id, talent) for talent_id, talent in pending))
+
+	state.stage = "prepared"
+	save_state(state, state_path)
+
+
+def _deduplicated_input(input_path: Path) -> bytes:
+	"""중단 후 재생성으로 중복된 custom_id 줄 제거"""
+	seen = set()
+	lines = []
+	for line in input_path.read_text(encoding="utf-8").splitlines():
+		if not line.strip():
+			continue
+		custom_id = json.loads(line)["custom_id"]
+		if custom_id not in seen:
+			seen.add(custom_id)
+			lines.append(line)
+	return ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+
+async def _find_batch_for_input(client: "AsyncOpenAI", input_file_id: str) -> Optional[Any]:
+	"""입력 파일로 이미 생성된 Batch (없으면 None)"""
+	async for batch in client.batches.list(limit=100):
+		if batch.input_file_id == input_file_id:
+			return batch
+	return None
+
+
+async def submit_batch(client: "AsyncOpenAI", state: BatchJobState, state_path: Path) -> None:
+	"""
+	입력 파일 업로드 후 Batch 생성 (업로드만 끝난 경우 업로드 생략)
+	생성 요청 전에 submitting 단계를 저장하고, 그 단계에서 재실행하면 같은 입력 파일의 Batch 를 먼저 찾아
+	생성 응답을 받기 전에 중단된 경우에도 Batch 를 중복 제출(중복 과금)하지 않습니다.
+	"""
+	if not any(item.target_tags for item in state.items.values()):
+		logger.info("모든 인재의 태그가 규칙으로 결정되어 Batch 제출을 생략합니다.")
+		state.stage = "completed"
+		save_state(state, state_path)
+		return
+
+	if state.input_file_id is None:
+		input_path = Path(state.input_path)
+		uploaded = await client.files.create(file=(input_path.name, _deduplicated_input(input_path)), purpose="batch")
+		state.input_file_id = uploaded.id
+		save_state(state, state_path)
+		logger.info(f"Batch 입력 파일 업로드 완료 : {uploaded.id}")
+
+	batch = None
+	if state.stage == "submitting":
+		batch = await _find_batch_for_input(client, state.input_file_id)
+		if batch is not None:
+			logger.info(f"입력 파일 {state.input_file_id} 로 이미 생성된 Batch 를 이어서 사용합니다 : {batch.id}")
+	else:
+		state.stage = "submitting"
+		save_state(state, state_path)
+
+	if batch is None:
+		batch = await client.batches.create(
+			input_file_id = state.input_file_id,
+			endpoint = BATCH_ENDPOINT,
+			completion_window = get_settings().BATCH_COMPLETION_WINDOW,
+		)
+	state.batch_id = batch.id
+	state.batch_status = batch.status
+	state.stage = "submitted"
+	save_state(state, state_path)
+	logger.info(f"Batch 제출 완료 : {batch.id}")
+
+
+async def poll_batch(
+	client: "AsyncOpenAI",
+	state: BatchJobState,
+	state_path: Path,
+	wait: bool = True,
+	poll_interval: Optional[float] = None,
+	) -> bool:
+	"""
+	Batch 가 종료될 때까지 상태 조회, 종료되면 True
+	wait=False 이면 한 번만 조회하고 결과를 기다리지 않습니다.
+	"""
+	poll_interval = get_settings().BATCH_POLL_INTERVAL if poll_interval is None else poll_interval
+
+	while True:
+		batch = await client.batches.retrieve(state.batch_id)
+		if batch.status != state.batch_status:
+			logger.info(f"Batch {batch.id} 상태 : {batch.status} ({batch.request_counts})")
+		state.batch_status = batch.status
+
+		if batch.status in BATCH_TERMINAL_STATUSES:
+			state.output_file_id = batch.output_file_id
+			state.error_file_id = batch.error_file_id
+			if batch.status == "failed" or (batch.output_file_id is None and batch.error_file_id is None):
+				save_state(state, state_path)
+				raise BatchJobError(f"Batch {batch.id} 가 결과 없이 종료되었습니다. (상태 : {batch.status}, 오류 : {batch.errors})")
+			state.stage = "completed"
+			save_state(state, state_path)
+			return True
+
+		save_state(state, state_path)
+		if not wait:
+			return False
+		await asyncio.sleep(poll_interval)
+
+
+async def _read_file_lines(client: "AsyncOpenAI", file_id: Optional[str]) -> List[str]:
+	if not file_id:
+		return []
+	content = await client.files.content(file_id)
+	return [line for line in content.text.splitlines() if line.strip()]
+
+
+async def store_batch_results(client: Optional["AsyncOpenAI"], state: BatchJobState, state_path: Path) -> None:
+	"""결과 파일을 후처리해 결과 테이블에 저장 (규칙으로만 결정된 인재 포함)"""
+	responses = {}
+	if client is not None:
+		for line in await _read_file_lines(client, state.output_file_id) + await _read_file_lines(client, state.error_file_id):
+			custom_id, content, error = parse_batch_output_line(line)
+			if error:
+				state.failed_ids[custom_id] = error
+			else:
+				responses[custom_id] = content
+				state.failed_ids.pop(custom_id, None)
+
+	pool = await get_relational_pool()
+	await pool.execute(CREATE_RESULTS_TABLE_SQL)
+
+	stored = set(state.stored_ids)
+	rows = []
+	for talent_id, item in state.items.items():
+		if talent_id in stored:
+			continue
+		if item.target_tags and talent_id not in responses:
+			# 실패했거나 기한 만료로 응답이 없는 인재
+			state.failed_ids.setdefault(talent_id, "응답 없음")
+			continue
+		tags = finalize_experience_tags(item.rule_tag_strings, item.target_tags, responses.get(talent_id))
+		rows.append((talent_id, json.dumps(tags, ensure_ascii=False), state.batch_id))
+
+	if rows:
+		await pool.executemany(UPSERT_RESULT_SQL, rows)
+	state.stored_ids.extend(row[0] for row in rows)
+	state.stage = "stored"
+	save_state(state, state_path)
+	logger.info(f"Batch 결과 저장 완료 : 저장 {len(rows)}명, 실패 {len(state.failed_ids)}명")
+
+
+async def run_batch_job(
+	talents: List[Tuple[str, TalentDataInput]],
+	state_path: Path,
+	client: Optional["AsyncOpenAI"] = None,
+	wait: bool = True,
+	poll_interval: Optional[float] = None,
+	) -> BatchJobState:
+	"""
+	프롬프트 생성 -> 업로드/제출 -> 완료 대기 -> 결과 저장
+	상태 파일의 단계부터 이어서 실행하며, wait=False 이면 Batch 가 끝나지 않은 경우 제출 상태로 반환합니다.
+	"""
+	state_path = Path(state_path)
+	state = load_state(state_path)
+
+	if state.stage == "stored":
+		logger.info("이미 완료된 Batch 작업입니다. 새로 실행하려면 상태 파일을 삭제하십시오.")
+		return state
+
+	if state.stage == "preparing":
+		await prepare_batch_input(talents, state, state_path)
+
+	if state.stage in ("prepared", "submitting", "submitted") and client is None:
+		client = get_batch_client()
+
+	if state.stage in ("prepared", "submitting"):
+		await submit_batch(client, state, state_path)
+
+	if state.stage == "submitted":
+		if not await poll_batch(client, state, state_path, wait=wait, poll_interval=poll_interval):
+			logger.info(f"Batch {state.batch_id} 가 아직 진행 중입니다. (상태 : {state.batch_status})")
+			return state
+
+	if state.stage == "completed":
+		await store_batch_results(client if state.batch_id else None, state, state_path)
+
+	return state
+
+
+async def _main(args: argparse.Namespace) -> None:
+	started = time.perf_counter()
+	try:
+		state = await run_batch_job(
+			load_talent_inputs(args.inputs),
+			Path(args.state),
+			wait = not args.no_wait,
+			poll_interval = args.poll_interval,
+		)
+	finally:
+		await close_relational_pool()
+	logger.info(f"Batch 작업 종료 : 단계 {state.stage}, 저장 {len(state.stored_ids)}명, 실패 {len(state.failed_ids)}명 ({time.perf_counter() - started:.1f}초)")
+
+
+def main():
+	parser = argparse.ArgumentParser(description="OpenAI Batch API 오프라인 경험 태그 재추론")
+	parser.add_argument("inputs", nargs="+", type=Path, help="인재 데이터 파일 (.json, .jsonl)")
+	parser.add_argument("--state", default="batch_state.json", help="작업 상태 파일 (같은 파일로 재실행하면 이어서 실행)")
+	parser.add_argument("--no-wait", action="store_true", help="Batch 완료를 기다리지 않고 제출/상태 조회만 수행")
+	parser.add_argument("--poll-interval", type=float, default=None, help="상태 조회 주기(초), 기본값 BATCH_POLL_INTERVAL")
+	args = parser.parse_args()
+
+	logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+	asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+	main()
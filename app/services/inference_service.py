@@ -1,6 +1,6 @@
 # 인재 데이터로부터 경험 태그를 추론하는 전체 프로세스를 서비스합니다.
 # 주요 기능은 다음과 같습니다.
-# 1. 입력된 인재 데이터로부터 VectorDB 검색을 위한 쿼리 생성 (전처리)
+# 1. 입력된 인재 데이터를 한 번 정규화(profile_normalizer)하여 VectorDB 검색을 위한 쿼리 생성 (전처리)
 # 2. 인재 데이터를 LLM이 이해하기 쉬운 텍스트 형식으로 변환
 # 3. VectorDB에서 관련 문서 검색
 # 4. 검색된 문서를 LLM에 전달할 형식으로 변환
@@ -8,85 +8,77 @@
 # 6. LLM 응답 파싱 하여 최종 결과 형식으로 변환 (후처리)
 
 
+import asyncio
 import logging
-from typing import List, Dict, Optional
-from langchain_core.documents import Document
+import time
+from typing import TYPE_CHECKING, Iterable, List, Dict, NamedTuple, Optional
+from app.core.config import get_settings
 from app.core.vector_db import retrieve_documents_from_sources
-from app.core.llm_services import invoke_llm_for_experience
-from app.schemas.inference import TalentDataInput, StartEndDate, EducationStartEndDate, YearMonth
+from app.core.relational_db import fetch_company_tenure_contexts
+from app.core.llm_services import LLMInvocationError, invoke_llm_for_experience, invoke_llm_cascade
+from app.core.degradation import (
+	DEGRADED_RELATIONAL_FAILED,
+	DEGRADED_RETRIEVAL_FAILED,
+	DEGRADED_RULES_ONLY,
+	DEGRADED_STALE_CACHE,
+	collect_degradations,
+	mark_degraded,
+)
+from app.core.logging_config import log_payload, sample_request_payloads
+from app.core.request_recorder import record_request
+from app.core.metrics import (
+	track_stage,
+	STAGE_TOTAL,
+	STAGE_PREPROCESS,
+	STAGE_RELATIONAL,
+	STAGE_FORMAT_CONTEXT,
+	STAGE_RULES,
+	STAGE_PROMPT,
+	STAGE_LLM,
+	STAGE_POSTPROCESS,
+	STAGE_CACHE_LOOKUP,
+)
+from app.core.shared_cache import get_shared_cache, CACHE_INFERENCE, CACHE_INFERENCE_STALE
+from app.core.static_data import TARGET_EXPERIENCE_TAGS, DESIRED_TAG_ORDER, get_tag_order_index
+from app.schemas.company import CompanyTenureContext
+from app.schemas.inference import TalentDataInput
+from app.services.profile_normalizer import NormalizedProfile, normalize_talent_profile
+from app.services.rule_engine import RuleEngineResult, evaluate_rules
+
+if TYPE_CHECKING:
+	from langchain_core.documents import Document
 
 
 logger = logging.getLogger(__name__)
 
 
-# 검색 쿼리 질 향상을 위해 주요 사용할 키워드 목록
-# 이 키워드들을 통해 인재 설명에서 추출되어 검색 쿼리에 추가할 예정
-KEYWORDS = ["투자", "리드", "Leadership", "Data", "Lead", "책임자", "대표", "IPO", "총괄", "인수", "합병", "CTO", "CEO", "CPO", "Head", "Manager", "Director", "성장", "유치", "전략", "분석", "운영", "AI", "M&A",]
-
-# 키워드 단어 추출 함수
-def extract_keywords_from_text(text: str, keywords: List[str]) -> List[str]:
+def preprocess_talent_data_for_search_query(profile: NormalizedProfile) -> str:
 	"""
-	주어진 텍스트에서 정의된 키워드 목록에 있는 단어들을 추출합니다.
+	(전처리) 정규화된 인재 프로필에서 벡터 DB 검색에 사용할 핵심 쿼리 생성
 	"""
-	if not text or not keywords:
-		return []
-	
-	# 중복 방지 set
-	found_keywords = set()
-	# 대소문자 변환
-	text_lower = text.lower()
-	for kw in keywords:
-		if kw.lower() in text_lower:
-			found_keywords.add(kw)
-	return list(found_keywords)
 
+	query_parts: List[str] = []
 
-def preprocess_talent_data_for_search_query(talent_data: TalentDataInput) -> str:
-	"""
-	(전처리) 입력된 인재 데이터에서 벡터 DB 검색에 사용할 핵심 쿼리 생성
-	"""
+	# 1. 경력의 회사명과 직무, 설명 첫 줄, 설명 키워드를 주요 쿼리로 사용
+	for position in profile.positions:
+		if position.company_name:
+			query_parts.append(position.company_name)
+		if position.title:
+			query_parts.append(position.title)
+		if position.first_line:
+			query_parts.append(position.first_line)
+		query_parts.extend(position.keywords)
 
-	query_parts = []
-
-	# 1. 경력의 회사명과 직무를 주요 쿼리로 사용
-	if talent_data.positions:
-		for position in talent_data.positions:
-			if position.companyName:
-				query_parts.append(position.companyName)
-			if position.title:
-				query_parts.append(position.title)
-			if position.description:
-				# 설명의 첫 줄을 요약 정보로 활용
-				first_line = position.description.split('\n')[0].strip()
-				if first_line: query_parts.append(first_line[:100])
-				# 설명에서 KEYWORD 추출
-				keywords_in_desc = extract_keywords_from_text(position.description, KEYWORDS)
-				if keywords_in_desc:
-					query_parts.extend(keywords_in_desc)
-				
 	# 2. 기술/헤드라인/요약 정보 추가
-	if talent_data.skills:
-		query_parts.append(", ".join(talent_data.skills))
-	if talent_data.headline:
-		query_parts.append(talent_data.headline)
-	if talent_data.summary:
-		query_parts.append(talent_data.summary[:100])
-	
-	
-	# 3. 쿼리 조각 정리 및 결합
-	processed_query_parts = []
-	
-	for part in query_parts:
-		if isinstance(part, list):
-			# 각 요소 문자열 반환 및 공백 제거
-			processed_query_parts.extend([str(p).strip() for p in part if p])
-		elif isinstance(part, str):
-			processed_query_parts.append(part.strip())
+	if profile.skills:
+		query_parts.append(", ".join(profile.skills).strip())
+	if profile.headline:
+		query_parts.append(profile.headline)
+	if profile.summary:
+		query_parts.append(profile.summary[:100].strip())
 
-	# 문자열 공백 필터링 부분
-	filtered_parts = list(dict.fromkeys(filter(None, processed_query_parts)))
-
-	search_query = " ".join(filtered_parts)
+	# 3. 빈 조각 제거 및 중복 제거 후 결합
+	search_query = " ".join(dict.fromkeys(filter(None, query_parts)))
 
 	max_query_length = 5000
 	if len(search_query) > max_query_length:
@@ -97,114 +89,49 @@ def preprocess_talent_data_for_search_query(talent_data: TalentDataInput) -> str
 		logger.error("벡터 DB 검색 쿼리가 비어있습니다.")
 		return ""
 	
-	logger.info(f"생성된 벡터 DB 검색 쿼리 : '{search_query}'")
+	log_payload(logger, "생성된 벡터 DB 검색 쿼리", search_query)
 	return search_query
 
 
 # 데이터 - 텍스트 변환
-def format_talent_profile_for_llm(talent_data: TalentDataInput) -> str:
+def format_talent_profile_for_llm(profile: NormalizedProfile) -> str:
 	"""
-	인재 데이터를 LLM이 이해하기 좋은 텍스트 형식으로 변환
+	정규화된 인재 프로필을 LLM이 이해하기 좋은 텍스트 형식으로 변환
 	경력 기간, 학력 기간등의 날짜 정보 포함
 	"""
 	parts=[]
 
-	# 학력 사항 포맷팅
+	# 학력 사항 포매팅
 	parts.append("\n### 학력 사항")
-	if talent_data.educations:
-		for i, edu in enumerate(talent_data.educations):
-			edu_period = "기간 정보 없음"
-			
-			# 학력의 originStartEndDate 우선적으로 사용
-			if hasattr(edu, 'originStartEndDate') and edu.originStartEndDate and hasattr(edu.originStartEndDate, 'startDateOn') and hasattr(edu.originStartEndDate, 'endDateOn'):
-				start_obj = edu.originStartEndDate.startDateOn
-				end_obj = edu.originStartEndDate.endDateOn
-				# 연도.월 형식으로 시작일 포매팅
-				# 입학 연도
-				start_year_str = str(start_obj.year) if start_obj and hasattr(start_obj, 'year') and start_obj.year is not None else ""
-				# 입학 월
-				if start_obj and hasattr(start_obj, 'month') and start_obj.month is not None: start_year_str += f".{start_obj.month:02d}"
-				# 졸업 연도
-				end_year_str = str(end_obj.year) if end_obj and hasattr(end_obj, 'year') and end_obj.year is not None else ""
-				# 졸업 월
-				if end_obj and hasattr(end_obj, 'month') and end_obj.month is not None: end_year_str += f".{end_obj.month:02d}"
-
-				# 학력 포매팅
-				if start_year_str and end_year_str: edu_period = f"{start_year_str} ~ {end_year_str}"
-				elif start_year_str: edu_period = f"{start_year_str} ~ 현재"
-
-			# 학력의 startEndDate 사용
-			elif edu.startEndDate:
-				# 기간이 문자열인 경우
-				if isinstance(edu.startEndDate, str):
-					edu_period = edu.startEndDate
-				elif edu.startEndDate and hasattr(edu.startEndDate, 'startDateOn') and hasattr(edu.startEndDate, 'endDateOn'):
-					start_edu_obj = edu.startEndDate.startDateOn
-					end_edu_obj = edu.startEndDate.endDateOn
-					# 입학 연도
-					start_year_str = str(start_edu_obj.year) if start_edu_obj and hasattr(start_edu_obj, 'year') and start_edu_obj.year is not None else ""
-					# 입학 월
-					if start_edu_obj and hasattr(start_edu_obj, 'month') and start_edu_obj.month is not None: start_year_str += f".{start_edu_obj.month:02d}"
-					# 졸업 연도
-					end_year_str = str(end_edu_obj.year) if end_edu_obj and hasattr(end_edu_obj, 'year') and end_edu_obj.year is not None else ""
-					# 졸업 월
-					if end_edu_obj and hasattr(end_edu_obj, 'month') and end_edu_obj.month is not None:
-						end_year_str += f".{end_edu_obj.month:02d}"
-
-					# 학력 포매팅
-					if start_year_str and end_year_str:
-						edu_period = f"{start_year_str} ~ {end_year_str}"
-					elif start_year_str: 
-						edu_period = f"{start_year_str} ~ 현재"
-			# 학위, 전공 포매팅
-			degree_field_str = f"{edu.degreeName or ''} {edu.fieldOfStudy or ''}".strip()
-			# 학력 포매팅
-			education_line = f"{i+1}. {edu.schoolName or '학교명 미기재'} - {degree_field_str or '학위/전공 미기재'} ({edu_period})"
+	if profile.educations:
+		for i, edu in enumerate(profile.educations):
+			education_line = f"{i+1}. {edu.school_name or '학교명 미기재'} - {edu.degree_field or '학위/전공 미기재'} ({edu.period_label})"
 			parts.append(education_line)
 	else:
 		parts.append("  (학력 정보 없음)")
 
 	# 직무, 개인, 기술 요약 정보 포매팅
 	# 직무 요약
-	if talent_data.headline:
-		parts.append(f"### 직무 요약 : \n{talent_data.headline.strip()}")
+	if profile.headline:
+		parts.append(f"### 직무 요약 : \n{profile.headline}")
 	# 개인 요약
-	if talent_data.summary:
-		parts.append(f"### 개인 요약 : \n{talent_data.summary.strip()}")
+	if profile.summary:
+		parts.append(f"### 개인 요약 : \n{profile.summary}")
 	# 기술 요약
-	if talent_data.skills:
-		parts.append(f"### 기술 요약 : \n{", ".join(talent_data.skills)}")
+	if profile.skills:
+		parts.append(f"### 기술 요약 : \n{", ".join(profile.skills)}")
 
 	# 경력사항 포매팅
 	parts.append("\n### 경력 사항:")
-	if talent_data.positions:
-		for i, pos in enumerate(talent_data.positions):
-			start_str = "시작일 정보 없음"
-			end_str = "현재"
-
-			# 경력 시작일, 종료일 파싱
-			if pos.startEndDate:
-				# 경력 시작 연도
-				if pos.startEndDate.start and hasattr(pos.startEndDate.start, 'year') and pos.startEndDate.start.year is not None:
-					start_str = str(pos.startEndDate.start.year)
-					# 경력 시작 월
-					if hasattr(pos.startEndDate.start, 'month') and pos.startEndDate.start.month is not None:
-						start_str += f".{pos.startEndDate.start.month:02d}"
-
-				# 경력 종료 연도
-				if pos.startEndDate.end and hasattr(pos.startEndDate.end, 'year') and pos.startEndDate.end.year is not None:
-					end_str = str(pos.startEndDate.end.year)
-					# 경력 종료 월
-					if hasattr(pos.startEndDate.end, 'month') and pos.startEndDate.end.month is not None:
-						end_str += f".{pos.startEndDate.end.month:02d}"
-
-			position_line = f"{i+1}. {pos.companyName or '회사명 미기재'} - {pos.title or '직무 미기재'} ({start_str} ~ {end_str})"
-			
-			#직무 설명 포매팅
-			if pos.description:
-				desc_text = pos.description.strip().replace("\n", "\n    ")
-				position_line += f"\n    주요 업무/성과: \n    {desc_text}"
-				parts.append(position_line)
+	if profile.positions:
+		for i, pos in enumerate(profile.positions):
+			#직무 설명이 있는 경력만 포함
+			if not pos.description:
+				continue
+			desc_text = pos.description.replace("\n", "\n    ")
+			position_line = f"{i+1}. {pos.company_name or '회사명 미기재'} - {pos.title or '직무 미기재'} ({pos.period_label})"
+			position_line += f"\n    주요 업무/성과: \n    {desc_text}"
+			parts.append(position_line)
 	else:
 		parts.append("\n (경력정보없음)")
 			
@@ -213,7 +140,7 @@ def format_talent_profile_for_llm(talent_data: TalentDataInput) -> str:
 
 
 # 문서 전달 포매팅
-def format_retrieved_documents_for_llm(documents: List[Document], max_chars_per_doc: int=500, max_total_context_chars: int=10000) -> str:
+def format_retrieved_documents_for_llm(documents: List["Document"], max_chars_per_doc: int=500, max_total_context_chars: int=10000) -> str:
 	"""
 	(문서 전달)검색된 Document 객체를 LLM에 전달시키기 위하여 변환
 	"""
@@ -247,6 +174,50 @@ def format_retrieved_documents_for_llm(documents: List[Document], max_chars_per_
 	return context_str
 
 
+# 관계형 DB 회사 정보 포매팅
+def format_company_tenure_context_for_llm(contexts: List[CompanyTenureContext], max_news_per_company: int = 10) -> str:
+	"""
+	관계형 DB에서 조회한 재직 기간 회사 정보(직원 수, 투자/M&A, 뉴스)를 LLM에 전달하기 위하여 변환
+	"""
+	if not contexts:
+		return ""
+
+	context_str = "---재직 기간 회사 정보 시작---\n"
+
+	for i, context in enumerate(contexts):
+		start_str = context.start_date.strftime("%Y.%m") if context.start_date else "시작일 정보 없음"
+		end_str = context.end_date.strftime("%Y.%m") if context.end_date else "현재"
+		context_str += f"회사 {i+1}: {context.company_name} (재직 {start_str} ~ {end_str})\n"
+
+		seed_corp = context.facts.seed_corp
+		if seed_corp.get("corpStockCdKr"):
+			listing_date = seed_corp.get("listingDate")
+			context_str += f"  - 상장 여부: {seed_corp['corpStockCdKr']}" + (f" (상장일: {listing_date})" if listing_date else "") + "\n"
+
+		# 월별 재직자 수 중 가장 최근 값
+		headcounts = [item for item in context.facts.organization if item.get("value") is not None and item.get("referenceMonth")]
+		if headcounts:
+			latest = max(headcounts, key=lambda item: item["referenceMonth"])
+			context_str += f"  - 직원 수: {latest['value']:,}명 ({latest['referenceMonth']} 기준)\n"
+
+		# 재직 기간 내 투자/M&A 이벤트
+		start_iso = context.start_date.isoformat() if context.start_date else ""
+		end_iso = context.end_date.isoformat() if context.end_date else "9999-12-31"
+		events = [
+			f"{item.get('investAt')} {item.get('level')}"
+			for item in context.facts.investment
+			if item.get("investAt") and start_iso <= item["investAt"] <= end_iso
+		]
+		if events:
+			context_str += f"  - 재직 기간 투자/M&A: {', '.join(events)}\n"
+
+		for news in context.news[:max_news_per_company]:
+			context_str += f"  - 재직 기간 뉴스 ({news.news_date.isoformat()}): {news.title}\n"
+
+	context_str += "---재직 기간 회사 정보 끝---"
+	return context_str
+
+
 # 후처리 형식 변환
 def postprocess_llm_response(llm_output: Optional[str], target_experience_tags: List[str]) -> List[str]:
 	"""
@@ -332,104 +303,79 @@ def postprocess_llm_response(llm_output: Optional[str], target_experience_tags:
 			processed_results.append(f"{tag_part_final} ({evidence_part_final})")
 
 
-	logger.info(f"LLM 응답 후처리 결과 (항목 수 : {len(processed_results)}) : {processed_results}")
+	logger.debug("LLM 응답 후처리 결과 (항목 수 : %d) : %s", len(processed_results), processed_results)
 	return processed_results
 
-# 메인 추론 서비스  함수
-async def infer_experiences_service(talent_data: TalentDataInput) -> List[str]:
+def assess_llm_response_confidence(
+	llm_output: Optional[str],
+	target_experience_tags: List[str],
+	expected_tags: Iterable[str] = (),
+	rejected_tags: Iterable[str] = (),
+	) -> float:
 	"""
-	인재 데이터에 대한 경험 태그를 추론하는 서비스
+	cascade 작은 모델 응답의 신뢰도 (0 ~ 1)
+	- 응답 줄 중 경험 태그 목록으로 파싱되는 비율 (근거 없음/추정 근거는 절반만 인정)
+	- 구조화된 데이터로 부여 확정된 태그(expected_tags)가 빠지거나 미부여 확정된 태그(rejected_tags)가 있으면 불일치로 0
 	"""
+	lines = [line for line in (llm_output or "").strip().split("\n") if line.strip()]
+	if not lines:
+		return 0.0
 
-	# 벡터 DB에서 검색 쿼리 생성
-	search_query = preprocess_talent_data_for_search_query(talent_data)
-
-	# 별도로 대학교 쿼리 생성
-	university_query_str: Optional[str] = None
-
-	# 학력 정보 추가
-	if talent_data.educations:
-		for edu in talent_data.educations:
-			if edu.schoolName and edu.schoolName.strip():
-				university_query_str = edu.schoolName.strip()
-				logger.info(f"대학 검색을 위한 학교 명 : {university_query_str}")
-				break
+	parsed = postprocess_llm_response(llm_output, target_experience_tags)
+	parsed_tags = {result.split(" (", 1)[0] for result in parsed}
+	if not set(expected_tags) <= parsed_tags or parsed_tags & set(rejected_tags):
+		return 0.0
 
+	score = 0.0
+	for result in parsed:
+		evidence = result.split(" (", 1)[1] if " (" in result else ""
+		score += 0.5 if evidence.startswith("근거 명시 안됨") or "추정" in evidence else 1.0
+	return min(1.0, score / len(lines))
 
-	# 벡터 DB에서 문서 검색
-	retrieved_docs: List[Document] = []
-
-	# search_query, university_query_str 중 하나라도 존재해야 검색 시도
-	if search_query or university_query_str:
-		try:
-			# university_query_str 만 있을 경우
-			retrieved_docs = await retrieve_documents_from_sources(query= search_query if search_query else "정보없음", university_query=university_query_str, top_k_per_source=4, top_k_university=1)
-	
-		except Exception as e:
-			logger.error(f"문서 검색 단계 예외 발생: {e}", exc_info = True)
-
-	# LLM에 전달할 포맷으로 변환
-	formatted_context = format_retrieved_documents_for_llm(retrieved_docs)
-
-	# 경험 태그 목록
-	target_experience_tags_for_prompt = [
-		"물류 도메인 경험", "상위권 대학교", "대규모 회사 경험" ,"성장기 스타트업  경험", "리더쉽", "리더십", "대용량 데이터 처리 경험", "IPO", "M&A 경험", "신규 투자 유치 경험", "신기술 도입 경험", "글로벌 프로젝트 경험", "고객 관리 경험", "조직 관리 경험", "교육 및 멘토링 경험"
-	]
-
-	# 프롬프트에 넣을 경험 태그 변수
-	target_tags_str_for_prompt = ", ".join(target_experience_tags_for_prompt)
-
-	# 인재 프로필 요약 (LLM에게 전달하기 위해)
-	talent_profile_summary_parts = []
-
-	# 요약 정보 추가
-	if talent_data.headline:
-		talent_profile_summary_parts.append(talent_data.headline)
-	if talent_data.summary:
-		talent_profile_summary_parts.append(talent_data.summary)
-	if talent_data.skills:
-		talent_profile_summary_parts.append(f"보유 기술 : {','.join(talent_data.skills)}")
-	if talent_data.positions:
-		talent_profile_summary_parts.append("\n 경력 사항:")
-		# 회사 근무 경력 정보
-		for i, pos in enumerate(talent_data.positions):
-			start_str = "시작일 정보 없음"
-			end_str = "종료일 정보 없음"
-
-			if pos.startEndDate and pos.startEndDate.start:
-				start_str = str(pos.startEndDate.start.year)
-				if pos.startEndDate.start.month:
-					start_str += f".{pos.startEndDate.start.month:02d}"
-					end_str = "현재"
-			if pos.startEndDate and pos.startEndDate.end and pos.startEndDate.end.year: 
-				end_str = str(pos.startEndDate.end.year)
-				if pos.startEndDate.end.month:
-					end_str += f".{pos.startEndDate.end.month:02d}"
-			# 회사, 직책, 설명 정보
-			position_info = f"{pos.companyName} - {pos.title}"
-			if pos.description:
-				desc = "\n   ".join([line.strip() for line in pos.description.strip().split('\n') if line.strip()])
-				desc = desc[:400] + "..." if len(desc) > 400 else desc
-				position_info += f"\n 경력 설명 : {desc}"
-			talent_profile_summary_parts.append(position_info)
-	else:
-		talent_profile_summary_parts.append("\n 경력 사항:\n (경력 정보 없음)")
-
-	# 대학교 쿼리에 포함될 수 있도록
-	if talent_data.educations:
-		talent_profile_summary_parts.append("\n 학력 사항:")
-		university_names = [edu.schoolName.strip() for edu in talent_data.educations if edu.schoolName]
-		if university_names:
-			university_query_str = " ".join(university_names)
-	else:
-		talent_profile_summary_parts.append("\n 학력 사항:\n (학력 정보 없음)")
 
-	talent_profile_for_llm = format_talent_profile_for_llm(talent_data)
-	logging.info(f"llm에게 전달하는 talent_data: \n{talent_profile_for_llm}")
+# "상위권 대학교" 판단 규칙 (규칙 엔진에서 결정되지 않은 경우에만 프롬프트에 포함)
+TOP_UNIVERSITY_PROMPT_RULES = """7.  **"상위권대학교" 태그 생성 규칙 (매우 중요, 가장 우선적으로 판단하십시오):**
+    a.  인재 프로필의 학력 사항에 기재된 각 학교명(예: '서울대학교', '연세대학교')을 면밀히 확인합니다.
+    b.  '---참고 자료 시작---'과 '---참고 자료 끝---' 사이에 해당 학교명과 관련된 대학 순위 정보(예: '자료 X ... 대학명: 서울대학교, 순위: 1위 (출처: 중앙일보 2024년 평가)')가 있는지 찾아보십시오. **참고 자료에 있는 대학 순위 정보는 매우 중요한 판단 근거입니다.**
+    c.  **참고 자료에서 해당 학교가 명시적으로 상위권(예: 국내 대학 평가 1위~20위 이내)으로 확인되면, 반드시 "- 상위권대학교 (학교명, [참고 자료에 명시된 순위 및 출처 정보])" 형식으로 태그를 생성하십시오.** (예: "- 상위권대학교 (서울대학교, 중앙일보 2024년 평가 1위)")
+    d.  참고 자료에 해당 학교 정보가 없거나 순위 정보가 명확하지 않더라도, 해당 학교가 **대한민국 내에서 일반적으로 최상위 명문 대학(예: 서울대학교, 연세대학교, 고려대학교, KAIST, POSTECH 등 누구나 인정하는 수준의 대학)으로 널리 알려져 있다면, "- 상위권대학교 (학교명, 일반적인 사회적 인지도 기반)" 형식으로 태그를 생성**하십시오.
+    e.  해외 대학의 경우, 세계적으로 인정받는 최상위권 대학(예: MIT, Stanford, Harvard 등)이거나 참고 자료에서 명확한 상위권 근거가 있을 때만 "상위권대학교" 태그를 생성하고, 그 외 해외 대학은 이 태그를 생성하지 마십시오.
+    f.  'OO대'와 'OO대학교'는 동일하게 취급하여 판단하십시오."""
+
+# 태그 별 응답 예시 (프롬프트 대상 태그의 예시만 포함)
+PROMPT_TAG_EXAMPLES: Dict[str, str] = {
+	"상위권 대학교": "- 상위권대학교 (서울대학교, 중앙일보 2024년 평가 1위)",
+	"대규모 회사 경험": "- 대규모 회사 경험 (네이버 재직 중, 직원 수 5,000명 이상)",
+	"성장기 스타트업  경험": "- 성장기 스타트업 경험 (토스 재직 시, 시리즈 C 투자 유치 및 조직 3배 성장 기여)",
+	"리더십": "- 리더십 (엘박스 CTO, 개발팀 20명 총괄)",
+	"IPO": "- IPO (밀리의서재 CFO 재직 중, 2023년 코스닥 상장 성공)",
+	"M&A 경험": "- M&A 경험 (요기요 재직 중, 2021년 컴바인드딜리버리-딜리버리히어로 M&A 기술 실사 참여)",
+	"신규 투자 유치 경험": "- 신규 투자 유치 경험 (스타트업X 시리즈 A 투자 유치 IR 자료 작성 및 발표, 2022년)",
+	"대용량 데이터 처리 경험": "- 대용량 데이터 처리 및 분석 (빅데이터 플랫폼 Y 구축 프로젝트 참여, 일일 1TB 데이터 처리)",
+}
+
+
+def build_experience_prompt(
+	talent_profile_for_llm: str,
+	formatted_context: str,
+	formatted_tenure_context: str,
+	target_tags: List[str],
+	decided_tag_strings: Optional[List[str]] = None,
+	) -> str:
+	"""
+	경험 태그 추론 프롬프트 조립
+	규칙 엔진으로 결정된 태그는 목록/판단 규칙/예시에서 제외해 프롬프트를 줄입니다.
+	"""
+	target_tags_str_for_prompt = ", ".join(target_tags)
+	top_university_rules = TOP_UNIVERSITY_PROMPT_RULES if "상위권 대학교" in target_tags else ""
+	tag_examples = "\n".join(PROMPT_TAG_EXAMPLES[tag] for tag in target_tags if tag in PROMPT_TAG_EXAMPLES)
 
+	decided_section = ""
+	if decided_tag_strings:
+		decided_section = "--- 데이터로 확정된 태그 (아래 태그는 다시 출력하지 마십시오) ---\n"
+		decided_section += "\n".join(f"- {tag_string}" for tag_string in decided_tag_strings) + "\n"
 
-	# LLM에 전달할 프롬프트 조립
-	prompt = f"""
+	return f"""
 
 당신은 고도로 숙련된 HR 전문가이자 정교한 경력 분석가입니다. 
 당신의 주요 목표는 제공된 인재 프로필과 참고 자료를 **종합적으로 분석**하여, 사전에 정의된 '경험 태그 목록'에 해당하는 **모든 경험을 빠짐없이 식별**하고, 각 경험에 대한 **명확하고 타당한 근거를 제시**하는 것입니다.
@@ -440,6 +386,8 @@ async def infer_experiences_service(talent_data: TalentDataInput) -> List[str]:
 
 {formatted_context}
 
+{formatted_tenure_context}
+{decided_section}
 지시사항:
 1.  아래 '경험 태그 목록'에 있는 **각 태그에 대해 개별적으로 해당 여부를 판단**하고, 해당하는 경우 **목록에 있는 정확한 태그명만을 사용**하여 경험을 **전부** 식별하십시오. **절대로 여러 태그를 하나로 합치거나(예: 'IPO, M&A 경험'과 같이 쉼표로 연결 금지), 태그명을 변형하거나, 목록에 없는 새로운 태그를 만들지 마십시오. 태그를 변형하거나 합치는 행위는 금지됩니다.**
 2.  선택된 각 경험에 대해, 판단의 근거가 되는 구체적인 내용(예: 회사명, 프로젝트명, 성과, 기술 스택, 학교명, **근무 기간, 관련 이벤트 발생 시점** 등)을 **반드시 인재 프로필이나 참고 자료에서 찾아** 간략하게 괄호 안에 명시해주십시오. 특히, "IPO", "M&A 경험", "신규 투자 유치 경험" 태그는 **인재의 재직 기간과 이벤트 발생 시점이 일치하거나 밀접하게 연관되어야 하며, 이 시간적 연관성을 근거에 명시**해주십시오.
@@ -447,44 +395,119 @@ async def infer_experiences_service(talent_data: TalentDataInput) -> List[str]:
 4.  근거는 최대한 간결하고 핵심적인 내용만 포함시켜 주십시오. 만약 여러 근거가 있다면 가장 대표적인 것을 언급하거나 요약해주십시오.
 5.  '경험 태그 목록'에 없는 경험은 생성하지 마십시오.
 6.  만약 특정 경험 태그에 대한 명확한 근거를 찾기 어렵지만 강하게 추정된다면, 근거 부분에 '(추정 근거: [인재 프로필의 어떤 내용 또는 참고 자료의 어떤 정보 때문에 추정하는지에 대한 간략한 이유])'와 같이 **구체적인 추정 이유**를 명시해주십시오. (단순 '(추정)'만으로는 부족합니다.)
-7.  **"상위권대학교" 태그 생성 규칙 (매우 중요, 가장 우선적으로 판단하십시오):**
-    a.  인재 프로필의 학력 사항에 기재된 각 학교명(예: '서울대학교', '연세대학교')을 면밀히 확인합니다.
-    b.  '---참고 자료 시작---'과 '---참고 자료 끝---' 사이에 해당 학교명과 관련된 대학 순위 정보(예: '자료 X ... 대학명: 서울대학교, 순위: 1위 (출처: 중앙일보 2024년 평가)')가 있는지 찾아보십시오. **참고 자료에 있는 대학 순위 정보는 매우 중요한 판단 근거입니다.**
-    c.  **참고 자료에서 해당 학교가 명시적으로 상위권(예: 국내 대학 평가 1위~20위 이내)으로 확인되면, 반드시 "- 상위권대학교 (학교명, [참고 자료에 명시된 순위 및 출처 정보])" 형식으로 태그를 생성하십시오.** (예: "- 상위권대학교 (서울대학교, 중앙일보 2024년 평가 1위)")
-    d.  참고 자료에 해당 학교 정보가 없거나 순위 정보가 명확하지 않더라도, 해당 학교가 **대한민국 내에서 일반적으로 최상위 명문 대학(예: 서울대학교, 연세대학교, 고려대학교, KAIST, POSTECH 등 누구나 인정하는 수준의 대학)으로 널리 알려져 있다면, "- 상위권대학교 (학교명, 일반적인 사회적 인지도 기반)" 형식으로 태그를 생성**하십시오.
-    e.  해외 대학의 경우, 세계적으로 인정받는 최상위권 대학(예: MIT, Stanford, Harvard 등)이거나 참고 자료에서 명확한 상위권 근거가 있을 때만 "상위권대학교" 태그를 생성하고, 그 외 해외 대학은 이 태그를 생성하지 마십시오.
-    f.  'OO대'와 'OO대학교'는 동일하게 취급하여 판단하십시오.
+{top_university_rules}
 
 경험 태그 목록: {target_tags_str_for_prompt}
 
 추론된 경험 목록 예시 **(아래는 다양한 상황에 대한 예시이며, 실제 응답은 인재 프로필과 참고 자료에 따라 달라져야 합니다. 형식과 태그명 사용 방식을 주의 깊게 보십시오.)**: 
-- 상위권대학교 (서울대학교, 중앙일보 2024년 평가 1위)
-- 대규모 회사 경험 (네이버 재직 중, 직원 수 5,000명 이상)
-- 성장기 스타트업 경험 (토스 재직 시, 시리즈 C 투자 유치 및 조직 3배 성장 기여)
-- 리더십 (엘박스 CTO, 개발팀 20명 총괄)
-- IPO (밀리의서재 CFO 재직 중, 2023년 코스닥 상장 성공)
-- M&A 경험 (요기요 재직 중, 2021년 컴바인드딜리버리-딜리버리히어로 M&A 기술 실사 참여)
-- 신규 투자 유치 경험 (스타트업X 시리즈 A 투자 유치 IR 자료 작성 및 발표, 2022년)
-- 대용량 데이터 처리 및 분석 (빅데이터 플랫폼 Y 구축 프로젝트 참여, 일일 1TB 데이터 처리)
+{tag_examples}
 
 추론된 경험 목록:
 """
-	
-	# LLM 호출 (비동기)
-	llm_raw_response = await invoke_llm_for_experience(prompt)
 
-	if llm_raw_response is None:
-		logger.warning("LLM 응답이 없습니다.")
-		return []
-	
-	logger.info(f"LLM 원본 응답 수신 : {llm_raw_response}")
 
-	# LLM 응답 후처리
-	final_output_strings = postprocess_llm_response(llm_raw_response, target_experience_tags_for_prompt)
+# 메인 추론 서비스  함수
+class ExperiencePrompt(NamedTuple):
+	"""LLM 호출 직전까지 준비된 추론 입력 (실시간 추론, 배치 추론 공용)"""
+	prompt: str
+	# LLM 판단이 필요한 태그 (비어있으면 LLM 호출 생략)
+	target_tags: List[str]
+	rule_result: RuleEngineResult
+
+
+async def prepare_experience_prompt(talent_data: TalentDataInput, profile: Optional[NormalizedProfile] = None) -> ExperiencePrompt:
+	"""
+	문서 검색, 관계형 조회, 규칙 평가를 거쳐 LLM 프롬프트 생성
+	이미 정규화한 프로필(profile)이 있으면 다시 정규화하지 않습니다.
+	"""
+
+	settings = get_settings()
+
+	with track_stage(STAGE_PREPROCESS):
+		# 인재 데이터는 여기서 한 번만 순회하고 이후 단계는 정규화된 프로필을 사용
+		if profile is None:
+			profile = normalize_talent_profile(talent_data)
+
+		# 벡터 DB에서 검색 쿼리 생성
+		search_query = preprocess_talent_data_for_search_query(profile)
+
+		# 별도로 대학교 쿼리 생성
+		university_query_str = profile.university_query
+		if university_query_str:
+			logger.info(f"대학 검색을 위한 학교 명 : {university_query_str}")
+
+
+	# 벡터 DB에서 문서 검색
+	async def retrieve_docs() -> List["Document"]:
+		# search_query, university_query_str 중 하나라도 존재해야 검색 시도
+		if not (search_query or university_query_str):
+			return []
+		try:
+			# university_query_str 만 있을 경우
+			return await retrieve_documents_from_sources(query= search_query if search_query else "정보없음", university_query=university_query_str, top_k_per_source=4, top_k_university=1)
+		except Exception as e:
+			logger.error(f"문서 검색 단계 예외 발생: {e}", exc_info = True)
+			mark_degraded(DEGRADED_RETRIEVAL_FAILED)
+			return []
+
+	async def fetch_tenure_contexts() -> List[CompanyTenureContext]:
+		# 관계형 DB에서 재직 기간의 회사 정보, 뉴스 조회
+		tenures = profile.tenures
+		if not settings.RELATIONAL_DB_ENABLED or not tenures:
+			return []
+		try:
+			with track_stage(STAGE_RELATIONAL):
+				return await fetch_company_tenure_contexts(tenures)
+		except Exception as e:
+			logger.error(f"관계형 DB 조회 단계 예외 발생: {e}", exc_info = True)
+			mark_degraded(DEGRADED_RELATIONAL_FAILED)
+			return []
+
+	# 벡터 검색과 관계형 조회 동시 실행
+	retrieved_docs, tenure_contexts = await asyncio.gather(retrieve_docs(), fetch_tenure_contexts())
+
+	# LLM에 전달할 포맷으로 변환
+	with track_stage(STAGE_FORMAT_CONTEXT):
+		formatted_context = format_retrieved_documents_for_llm(retrieved_docs)
+		formatted_tenure_context = format_company_tenure_context_for_llm(tenure_contexts, max_news_per_company=settings.TENURE_NEWS_LIMIT)
+
+	# 구조화된 데이터로 판단 가능한 태그(대학 순위, 직원 수, 상장/M&A 이력)는 규칙으로 먼저 결정
+	with track_stage(STAGE_RULES):
+		rule_result = evaluate_rules(profile, tenure_contexts)
+
+	# LLM 판단이 필요한 경험 태그 목록
+	target_experience_tags_for_prompt = rule_result.undecided_tags(TARGET_EXPERIENCE_TAGS)
+
+	with track_stage(STAGE_PROMPT):
+		talent_profile_for_llm = format_talent_profile_for_llm(profile)
+		log_payload(logger, "llm에게 전달하는 talent_data", talent_profile_for_llm)
+
+		# LLM에 전달할 프롬프트 조립
+		prompt = build_experience_prompt(
+			talent_profile_for_llm,
+			formatted_context,
+			formatted_tenure_context,
+			target_experience_tags_for_prompt,
+			decided_tag_strings = rule_result.tag_strings(),
+		)
+	return ExperiencePrompt(prompt, target_experience_tags_for_prompt, rule_result)
+
+
+def finalize_experience_tags(rule_tag_strings: List[str], target_tags: List[str], llm_raw_response: Optional[str]) -> List[str]:
+	"""
+	LLM 응답 후처리 결과와 규칙으로 결정된 태그를 합쳐 정렬된 최종 결과 반환
+	"""
+	# LLM 응답 후처리 (규칙으로 결정된 태그는 제외)
+	llm_output_strings: List[str] = []
+	if target_tags:
+		with track_stage(STAGE_POSTPROCESS):
+			llm_output_strings = postprocess_llm_response(llm_raw_response, target_tags)
+
+	final_output_strings = rule_tag_strings + llm_output_strings
 
 	
-	# 태그를 원하는 순서로 정렬하기 위한 기준 리스트
-	DESIRED_TAG_ORDER = ["상위권 대학교", "대규모 회사 경험" ,"성장기 스타트업  경험", "리더쉽", "리더십", "대용량 데이터 처리 경험", "IPO", "M&A 경험", "신규 투자 유치 경험", "신기술 도입 경험", "글로벌 프로젝트 경험", "고객 관리 경험", "조직 관리 경험", "교육 및 멘토링 경험"]
+	# 태그를 원하는 순서로 정렬하기 위한 기준 (태그 -> 순서)
+	tag_order_index = get_tag_order_index()
 
 	def get_tag_from_final_string(result_str: str) -> Optional[str]:
 		"""
@@ -501,16 +524,131 @@ async def infer_experiences_service(talent_data: TalentDataInput) -> List[str]:
 		태그 원하는 순서로 정렬하는 함수
 		"""
 		tag = get_tag_from_final_string(result_str)
-		if tag and tag in DESIRED_TAG_ORDER:
-			try:
-				return DESIRED_TAG_ORDER.index(tag)
-			except ValueError:
-				return len(DESIRED_TAG_ORDER)
-		return len(DESIRED_TAG_ORDER)
+		return tag_order_index.get(tag, len(DESIRED_TAG_ORDER))
 	
 	# 최종 태그 결과 정렬
 	final_sorted_output_strings = sorted(final_output_strings, key=sort_key_for_tags)
 
-	logger.info(f"최종 출력 결과 : {final_sorted_output_strings}")
+	logger.debug("최종 출력 결과 : %s", final_sorted_output_strings)
 
-	return final_sorted_output_strings
\ No newline at end of file
+	return final_sorted_output_strings
+
+
+class InferenceResult(NamedTuple):
+	"""추론된 경험 태그와 결과 캐시 키"""
+	tags: List[str]
+	# 정규화 프로필 + 모델 설정 키 (같은 키의 요청은 같은 결과, 라우터의 edge cache 헤더에 사용)
+	cache_key: str
+
+
+async def infer_experiences_service(talent_data: TalentDataInput) -> List[str]:
+	"""인재 데이터에 대한 경험 태그를 추론하는 서비스"""
+	return (await infer_experiences_with_cache_key(talent_data)).tags
+
+
+async def infer_experiences_with_cache_key(talent_data: TalentDataInput) -> InferenceResult:
+	"""
+	경험 태그와 결과 캐시 키를 함께 반환 (프로필 정규화는 요청 당 한 번)
+	REQUEST_RECORD_PATH 가 설정되어 있으면 샘플링된 요청과 결과를 재생용으로 기록합니다.
+	"""
+	started = time.perf_counter()
+	result: Optional[List[str]] = None
+	outcome = "ok"
+	try:
+		with track_stage(STAGE_TOTAL), sample_request_payloads():
+			profile = normalize_talent_profile(talent_data)
+			result = await _infer_experiences(talent_data, profile)
+		return InferenceResult(result, inference_cache_key(profile))
+	except Exception as e:
+		outcome = type(e).__name__
+		raise
+	finally:
+		record_request(talent_data, result, time.perf_counter() - started, outcome)
+
+
+def inference_cache_key(profile: NormalizedProfile) -> str:
+	"""추론 결과 캐시 키 (프로필 키 + 결과에 영향을 주는 모델 설정)"""
+	settings = get_settings()
+	model_key = settings.OPENAI_MODEL_NAME
+	if settings.LLM_CASCADE_ENABLED:
+		model_key += f"|cascade:{settings.OPENAI_FAST_MODEL_NAME}:{settings.LLM_CASCADE_MIN_CONFIDENCE}"
+	return f"{profile.cache_key}:{model_key}"
+
+
+async def _infer_experiences(talent_data: TalentDataInput, profile: NormalizedProfile) -> List[str]:
+	# INFERENCE_CACHE_TTL 이 설정된 경우 같은 프로필의 추론 결과를 워커 간 공유 캐시에서 재사용
+	# 캐시에는 응답 등급을 낮추지 않은(full) 결과만 저장합니다.
+	cache = get_shared_cache(CACHE_INFERENCE)
+	stale_cache = get_shared_cache(CACHE_INFERENCE_STALE)
+	if not cache.enabled and not stale_cache.enabled:
+		return await _infer_experiences_uncached(talent_data, profile)
+
+	with track_stage(STAGE_CACHE_LOOKUP):
+		cache_key = inference_cache_key(profile)
+		cached = await cache.get(cache_key)
+	if cached is not None:
+		logger.info("추론 결과 캐시 hit, 검색/LLM 호출을 생략합니다.")
+		return cached
+
+	# 예외는 캐시하지 않음
+	with collect_degradations() as degradations:
+		result = await _infer_experiences_uncached(talent_data, profile)
+	if not degradations:
+		await cache.set(cache_key, result)
+		await stale_cache.set(cache_key, result)
+	return result
+
+
+async def _degraded_experiences(profile: NormalizedProfile, rule_result: RuleEngineResult, error: LLMInvocationError) -> Optional[List[str]]:
+	"""
+	LLM 호출 실패 시 오류 대신 반환할 결과 (설정에 따라)
+	1. INFERENCE_STALE_TTL 안의 최근 정상 추론 결과
+	2. DEGRADE_RULES_ONLY_ON_LLM_FAILURE 이면 규칙 엔진으로 결정된 태그만
+	둘 다 없으면 None (라우터까지 오류 전달)
+	"""
+	stale_cache = get_shared_cache(CACHE_INFERENCE_STALE)
+	if stale_cache.enabled:
+		stale = await stale_cache.get(inference_cache_key(profile))
+		if stale is not None:
+			logger.warning(f"LLM 호출 실패로 최근 추론 결과를 반환합니다: {error}")
+			mark_degraded(DEGRADED_STALE_CACHE)
+			return stale
+
+	if get_settings().DEGRADE_RULES_ONLY_ON_LLM_FAILURE:
+		logger.warning(f"LLM 호출 실패로 규칙 엔진 결과만 반환합니다: {error}")
+		mark_degraded(DEGRADED_RULES_ONLY)
+		return finalize_experience_tags(rule_result.tag_strings(), [], None)
+	return None
+
+
+async def _infer_experiences_uncached(talent_data: TalentDataInput, profile: NormalizedProfile) -> List[str]:
+	settings = get_settings()
+	experience_prompt = await prepare_experience_prompt(talent_data, profile)
+
+	if not experience_prompt.target_tags:
+		logger.info("모든 경험 태그가 규칙으로 결정되어 LLM 호출을 생략합니다.")
+		return finalize_experience_tags(experience_prompt.rule_result.tag_strings(), [], None)
+
+	# LLM 호출 (비동기), 실패 시 설정된 대체 결과가 없으면 LLMInvocationError 계열 예외가 라우터까지 전달됨
+	try:
+		with track_stage(STAGE_LLM):
+			if settings.LLM_CASCADE_ENABLED:
+				# 작은 모델 응답이 규칙 결정과 충돌하지 않고 형식이 온전할 때만 사용, 아니면 큰 모델로 escalate
+				rejected_tags = [decision.tag for decision in experience_prompt.rule_result.decisions.values() if not decision.matched]
+				cascade_result = await invoke_llm_cascade(
+					experience_prompt.prompt,
+					assess = lambda output: assess_llm_response_confidence(output, TARGET_EXPERIENCE_TAGS, rejected_tags=rejected_tags),
+				)
+				llm_raw_response = cascade_result.content
+				logger.info(f"cascade 응답 단계 : {cascade_result.tier} (작은 모델 신뢰도 : {cascade_result.confidence})")
+			else:
+				llm_raw_response = await invoke_llm_for_experience(experience_prompt.prompt)
+	except LLMInvocationError as e:
+		degraded = await _degraded_experiences(profile, experience_prompt.rule_result, e)
+		if degraded is None:
+			raise
+		return degraded
+
+	log_payload(logger, "LLM 원본 응답 수신", llm_raw_response)
+
+	return finalize_experience_tags(experience_prompt.rule_result.tag_strings(), experience_prompt.target_tags, llm_raw_response)
@@ -0,0 +1,191 @@
+# 비동기 추론 작업 워커
+# inference_jobs 대기열(app/core/job_queue.py)에서 작업을 가져와 실시간 추론과 같은 infer_experiences_service 로 처리하고,
+# 결과를 저장한 뒤 콜백 URL 이 있으면 작업 상태를 POST 로 전달합니다.
+# 앱 프로세스 안(JOB_WORKER_CONCURRENCY)이나 별도 프로세스로 실행하며, 여러 프로세스가 같은 대기열을 나눠 처리합니다.
+#
+#     python -m app.services.job_worker_service --concurrency 4
+
+import argparse
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+from urllib.parse import urlsplit
+
+from app.core.config import get_settings
+from app.core.job_queue import ClaimedJob, PostgresJobQueue, get_job_queue
+from app.core.llm_services import LLMCircuitOpenError, LLMRateLimitedError, LLMTimeoutError
+from app.core.metrics import record_job_event
+from app.core.relational_db import close_relational_pool
+from app.core.resilience import jittered_backoff
+from app.schemas.inference import TalentDataInput
+from app.schemas.job import JobStatusResponse
+from app.services.inference_service import infer_experiences_service
+
+logger = logging.getLogger(__name__)
+
+# 다시 시도하면 성공할 수 있는 LLM 오류 (retry_after 와 TRANSIENT_RETRY_DELAY 중 긴 시간 후 재시도)
+# half-open 서킷 브레이커는 retry_after=0 으로 거부하므로 최소 대기 시간이 없으면 시도 횟수를 바로 소진합니다.
+TRANSIENT_ERRORS = (LLMRateLimitedError, LLMCircuitOpenError, LLMTimeoutError)
+TRANSIENT_RETRY_DELAY = 5.0
+
+# 실행 시간 초과 작업 복구, 완료 작업 정리 주기(초)
+MAINTENANCE_INTERVAL = 60.0
+
+
+def is_callback_allowed(callback_url: str) -> bool:
+	"""JOB_CALLBACK_ALLOWED_HOSTS 에 등록된 호스트의 http(s) URL 만 허용"""
+	allowed_hosts = {host.strip().lower() for host in get_settings().JOB_CALLBACK_ALLOWED_HOSTS.split(",") if host.strip()}
+	parts = urlsplit(callback_url)
+	return parts.scheme in ("http", "https") and (parts.hostname or "").lower() in allowed_hosts
+
+
+async def deliver_callback(callback_url: str, status: JobStatusResponse) -> bool:
+	"""작업 상태를 콜백 URL 로 POST (연결 오류, 5xx 응답은 JOB_CALLBACK_MAX_ATTEMPTS 회까지 재시도)"""
+	import httpx
+
+	settings = get_settings()
+	body = status.model_dump(mode="json")
+	async with httpx.AsyncClient(timeout=settings.JOB_CALLBACK_TIMEOUT) as client:
+		for attempt in range(settings.JOB_CALLBACK_MAX_ATTEMPTS):
+			try:
+				response = await client.post(callback_url, json=body, headers={"X-Job-Id": status.job_id})
+				if response.status_code < 500:
+					if response.status_code >= 400:
+						logger.warning(f"작업 {status.job_id} 콜백 응답 오류 (재시도 안 함): {response.status_code}")
+					return response.status_code < 400
+				error = f"HTTP {response.status_code}"
+			except httpx.HTTPError as e:
+				error = repr(e)
+			logger.warning(f"작업 {status.job_id} 콜백 전달 실패 ({attempt + 1}/{settings.JOB_CALLBACK_MAX_ATTEMPTS}): {error}")
+			if attempt + 1 < settings.JOB_CALLBACK_MAX_ATTEMPTS:
+				await asyncio.sleep(jittered_backoff(attempt, 1.0, 10.0))
+	return False
+
+
+class JobWorkerPool:
+	"""
+	concurrency 개의 작업 루프와 유지보수 루프(실행 시간 초과 작업 복구, 완료 작업 정리)
+	대기 작업이 없으면 JOB_POLL_INTERVAL 마다 다시 조회합니다.
+	"""
+
+	def __init__(
+		self,
+		queue: Optional[PostgresJobQueue] = None,
+		concurrency: Optional[int] = None,
+		infer: Callable[[TalentDataInput], Awaitable[List[str]]] = infer_experiences_service,
+		deliver: Callable[[str, JobStatusResponse], Awaitable[bool]] = deliver_callback,
+		poll_interval: Optional[float] = None,
+		):
+		settings = get_settings()
+		self.queue = queue if queue is not None else get_job_queue()
+		self.concurrency = concurrency if concurrency is not None else settings.JOB_WORKER_CONCURRENCY
+		self.poll_interval = poll_interval if poll_interval is not None else settings.JOB_POLL_INTERVAL
+		self._infer = infer
+		self._deliver = deliver
+		self._tasks: List[asyncio.Task] = []
+		self._stopping = asyncio.Event()
+
+	async def run_once(self) -> bool:
+		"""작업 1개 처리, 대기 작업이 없으면 False"""
+		job = await self.queue.claim()
+		if job is None:
+			return False
+		await self._process(job)
+		return True
+
+	async def _process(self, job: ClaimedJob) -> None:
+		settings = get_settings()
+		logger.info(f"작업 {job.job_id} 실행 (lane {job.priority}, 시도 {job.attempts})")
+		try:
+			result = await self._infer(job.talent_data)
+		except TRANSIENT_ERRORS as e:
+			if job.attempts < settings.JOB_MAX_ATTEMPTS:
+				delay = max(getattr(e, "retry_after", None) or 0.0, TRANSIENT_RETRY_DELAY)
+				logger.warning(f"작업 {job.job_id} 일시적 오류, {delay:.1f}초 후 재시도: {e}")
+				await self.queue.retry(job.job_id, f"{type(e).__name__}: {e}", delay)
+				record_job_event(job.priority, "retried")
+				return
+			status = await self.queue.fail(job.job_id, f"{type(e).__name__}: {e}")
+			event = "failed"
+		except Exception as e:
+			logger.error(f"작업 {job.job_id} 실패: {e}", exc_info=True)
+			status = await self.queue.fail(job.job_id, f"{type(e).__name__}: {e}")
+			event = "failed"
+		else:
+			status = await self.queue.complete(job.job_id, result)
+			event = "succeeded"
+
+		record_job_event(job.priority, event)
+		# 실행 시간 초과로 다른 워커가 다시 가져간 작업이면 status 가 None
+		if status is not None and job.callback_url:
+			await self._deliver(job.callback_url, status)
+
+	async def _worker_loop(self, index: int) -> None:
+		while not self._stopping.is_set():
+			try:
+				processed = await self.run_once()
+			except Exception as e:
+				logger.error(f"작업 워커 {index} 대기열 처리 중 오류: {e}", exc_info=True)
+				processed = False
+			if not processed:
+				try:
+					await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+				except asyncio.TimeoutError:
+					pass
+
+	async def _maintenance_loop(self) -> None:
+		settings = get_settings()
+		while not self._stopping.is_set():
+			try:
+				await self.queue.requeue_stale(settings.JOB_STALE_TIMEOUT, settings.JOB_MAX_ATTEMPTS)
+				await self.queue.purge_finished(settings.JOB_RESULT_TTL)
+			except Exception as e:
+				logger.error(f"작업 대기열 유지보수 중 오류: {e}", exc_info=True)
+			try:
+				await asyncio.wait_for(self._stopping.wait(), timeout=MAINTENANCE_INTERVAL)
+			except asyncio.TimeoutError:
+				pass
+
+	def start(self) -> None:
+		self._stopping.clear()
+		self._tasks = [asyncio.create_task(self._worker_loop(i)) for i in range(self.concurrency)]
+		self._tasks.append(asyncio.create_task(self._maintenance_loop()))
+		logger.info(f"작업 워커 {self.concurrency}개 시작")
+
+	async def stop(self, timeout: float = 30.0) -> None:
+		"""실행 중인 작업은 timeout 초까지 기다린 뒤 취소 (취소된 작업은 JOB_STALE_TIMEOUT 후 다시 실행)"""
+		self._stopping.set()
+		if not self._tasks:
+			return
+		_, pending = await asyncio.wait(self._tasks, timeout=timeout)
+		for task in pending:
+			task.cancel()
+		await asyncio.gather(*pending, return_exceptions=True)
+		self._tasks = []
+		logger.info("작업 워커 종료")
+
+
+async def _main(args: argparse.Namespace) -> None:
+	pool = JobWorkerPool(concurrency=args.concurrency)
+	pool.start()
+	try:
+		await asyncio.Event().wait()
+	finally:
+		await pool.stop()
+		await close_relational_pool()
+
+
+def main():
+	parser = argparse.ArgumentParser(description="비동기 추론 작업 워커")
+	parser.add_argument("--concurrency", type=int, default=None, help="동시 처리 작업 수, 기본값 JOB_WORKER_CONCURRENCY")
+	args = parser.parse_args()
+
+	logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+	try:
+		asyncio.run(_main(args))
+	except KeyboardInterrupt:
+		pass
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,240 @@
+# 요청 당 한 번 TalentDataInput 을 순회해 이후 단계(검색 쿼리, LLM 프로필, 재직 기간 조회, 규칙 평가)가
+# 공통으로 사용하는 불변 중간 표현(NormalizedProfile)으로 변환합니다.
+# 각 단계가 pydantic 모델을 다시 순회하며 같은 문자열 정리/날짜 파싱/키워드 추출을 반복하지 않도록 하고,
+# 캐시에서 사용할 프로필 키(cache_key)도 함께 계산합니다.
+
+import calendar
+import hashlib
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Tuple, Union
+
+from app.schemas.inference import TalentDataInput, Position, Education, EducationStartEndDate, YearMonth
+
+
+# 검색 쿼리 질 향상을 위해 주요 사용할 키워드 목록
+# 이 키워드들을 통해 인재 설명에서 추출되어 검색 쿼리에 추가할 예정
+KEYWORDS = ["투자", "리드", "Leadership", "Data", "Lead", "책임자", "대표", "IPO", "총괄", "인수", "합병", "CTO", "CEO", "CPO", "Head", "Manager", "Director", "성장", "유치", "전략", "분석", "운영", "AI", "M&A",]
+
+# 캐시 키 형식이 바뀌면 올려서 이전 캐시 항목을 무효화
+CACHE_KEY_VERSION = 1
+
+
+# 키워드 단어 추출 함수
+def extract_keywords_from_text(text: str, keywords: List[str]) -> List[str]:
+	"""
+	주어진 텍스트에서 정의된 키워드 목록에 있는 단어들을 추출합니다.
+	키워드 목록 순서를 유지해 같은 입력이면 항상 같은 결과를 반환합니다.
+	"""
+	if not text or not keywords:
+		return []
+
+	# 대소문자 변환
+	text_lower = text.lower()
+	return [kw for kw in dict.fromkeys(keywords) if kw.lower() in text_lower]
+
+
+def year_month_to_date(year_month: Optional[YearMonth], is_end: bool = False) -> Optional[date]:
+	"""
+	YearMonth를 date로 변환
+	종료일은 해당 월(월 정보가 없으면 해당 연도)의 마지막 날로 변환합니다.
+	"""
+	if not year_month or year_month.year is None:
+		return None
+	if year_month.month is None:
+		return date(year_month.year, 12, 31) if is_end else date(year_month.year, 1, 1)
+	if is_end:
+		return date(year_month.year, year_month.month, calendar.monthrange(year_month.year, year_month.month)[1])
+	return date(year_month.year, year_month.month, 1)
+
+
+def format_year_month(year_month: Optional[YearMonth]) -> str:
+	"""YearMonth를 'YYYY.MM' (월 정보가 없으면 'YYYY') 문자열로 변환, 연도가 없으면 빈 문자열"""
+	if not year_month or year_month.year is None:
+		return ""
+	if year_month.month is None:
+		return str(year_month.year)
+	return f"{year_month.year}.{year_month.month:02d}"
+
+
+def _strip_or_none(value: Optional[str]) -> Optional[str]:
+	if value is None:
+		return None
+	value = value.strip()
+	return value or None
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedPosition:
+	company_name: Optional[str]
+	title: Optional[str]
+	# 앞뒤 공백을 제거한 경력 설명
+	description: Optional[str]
+	# 설명 첫 줄 (최대 100자, 검색 쿼리 요약 정보)
+	first_line: Optional[str]
+	start_date: Optional[date]
+	# 재직 중인 경우 None
+	end_date: Optional[date]
+	# LLM 프로필용 기간 표기 ('2020.08 ~ 2023.02', '2022.01 ~ 현재')
+	period_label: str
+	# 시작, 종료 연월이 모두 있는 경우의 재직 개월 수 (시작 월과 종료 월 포함)
+	tenure_months: Optional[int]
+	# 설명에서 추출한 KEYWORDS (KEYWORDS 순서)
+	keywords: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedEducation:
+	school_name: Optional[str]
+	# '학위 전공' (둘 다 없으면 빈 문자열)
+	degree_field: str
+	# LLM 프로필용 기간 표기 (기간 정보가 없으면 '기간 정보 없음')
+	period_label: str
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedProfile:
+	positions: Tuple[NormalizedPosition, ...]
+	educations: Tuple[NormalizedEducation, ...]
+	headline: Optional[str]
+	summary: Optional[str]
+	skills: Tuple[str, ...]
+	# 비어있지 않은 회사명, 학교명 (입력 순서)
+	company_names: Tuple[str, ...]
+	school_names: Tuple[str, ...]
+	# 모든 경력 설명에서 추출한 키워드 (처음 등장한 순서, 중복 제거)
+	keywords: Tuple[str, ...]
+	# 추론 결과에 영향을 주는 필드만으로 계산한 프로필 키 (이름, 사진 등 개인 식별 필드는 제외)
+	cache_key: str
+
+	@property
+	def tenures(self) -> List[Tuple[str, Optional[date], Optional[date]]]:
+		"""
+		경력 사항의 (회사명, 재직 시작일, 재직 종료일) 목록
+		재직 중인 경우 종료일은 None 입니다.
+		"""
+		return [
+			(position.company_name, position.start_date, position.end_date)
+			for position in self.positions
+			if position.company_name
+		]
+
+	@property
+	def university_query(self) -> Optional[str]:
+		"""대학 순위 검색에 사용할 첫 번째 학교명"""
+		return self.school_names[0] if self.school_names else None
+
+
+def _normalize_position(position: Position) -> NormalizedPosition:
+	description = _strip_or_none(position.description)
+	first_line = None
+	keywords: Tuple[str, ...] = ()
+	if description:
+		# 설명의 첫 줄을 요약 정보로 활용
+		first_line = description.split('\n', 1)[0].strip()[:100] or None
+		keywords = tuple(extract_keywords_from_text(description, KEYWORDS))
+
+	start = end = None
+	if position.startEndDate:
+		start, end = position.startEndDate.start, position.startEndDate.end
+	start_date = year_month_to_date(start)
+	end_date = year_month_to_date(end, is_end=True)
+
+	tenure_months = None
+	if start and end and start.year is not None and end.year is not None:
+		start_month = start.month or 1
+		end_month = end.month or 12
+		tenure_months = max(0, (end.year - start.year) * 12 + end_month - start_month + 1)
+
+	return NormalizedPosition(
+		company_name = _strip_or_none(position.companyName),
+		title = _strip_or_none(position.title),
+		description = description,
+		first_line = first_line,
+		start_date = start_date,
+		end_date = end_date,
+		period_label = f"{format_year_month(start) or '시작일 정보 없음'} ~ {format_year_month(end) or '현재'}",
+		tenure_months = tenure_months,
+		keywords = keywords,
+	)
+
+
+def _format_education_period(period: Optional[Union[str, EducationStartEndDate]]) -> Optional[str]:
+	if isinstance(period, str):
+		return period
+	start_str = format_year_month(period.startDateOn)
+	end_str = format_year_month(period.endDateOn)
+	if start_str and end_str:
+		return f"{start_str} ~ {end_str}"
+	if start_str:
+		return f"{start_str} ~ 현재"
+	return None
+
+
+def _normalize_education(education: Education) -> NormalizedEducation:
+	# 학력의 originStartEndDate 우선적으로 사용
+	period = education.originStartEndDate or education.startEndDate
+	period_label = _format_education_period(period) if period else None
+	return NormalizedEducation(
+		school_name = _strip_or_none(education.schoolName),
+		degree_field = f"{education.degreeName or ''} {education.fieldOfStudy or ''}".strip(),
+		period_label = period_label or "기간 정보 없음",
+	)
+
+
+def _build_cache_key(
+	positions: Tuple[NormalizedPosition, ...],
+	educations: Tuple[NormalizedEducation, ...],
+	headline: Optional[str],
+	summary: Optional[str],
+	skills: Tuple[str, ...],
+	) -> str:
+	"""
+	정규화된 필드를 순서대로 해시 (경력 설명 등 큰 문자열을 JSON 으로 한 번 더 직렬화하지 않음)
+	필드마다 길이를 함께 넣어 경계가 다른 입력이 같은 키가 되지 않게 합니다.
+	"""
+	digest = hashlib.sha256(f"v{CACHE_KEY_VERSION}".encode())
+
+	def update(value: Optional[str]) -> None:
+		if value is None:
+			digest.update(b"\x00")
+			return
+		encoded = value.encode("utf-8")
+		digest.update(b"%d:" % len(encoded))
+		digest.update(encoded)
+
+	for group, fields in (
+		("p", [(p.company_name, p.title, p.description, p.period_label) for p in positions]),
+		("e", [(e.school_name, e.degree_field, e.period_label) for e in educations]),
+		("k", [(skill,) for skill in skills]),
+	):
+		update(f"{group}{len(fields)}")
+		for row in fields:
+			for value in row:
+				update(value)
+	update(headline)
+	update(summary)
+	return digest.hexdigest()
+
+
+def normalize_talent_profile(talent_data: TalentDataInput) -> NormalizedProfile:
+	"""
+	인재 데이터를 한 번 순회해 NormalizedProfile 로 변환
+	"""
+	positions = tuple(_normalize_position(position) for position in (talent_data.positions or []))
+	educations = tuple(_normalize_education(education) for education in (talent_data.educations or []))
+	headline = _strip_or_none(talent_data.headline)
+	summary = _strip_or_none(talent_data.summary)
+	skills = tuple(talent_data.skills or ())
+
+	return NormalizedProfile(
+		positions = positions,
+		educations = educations,
+		headline = headline,
+		summary = summary,
+		skills = skills,
+		company_names = tuple(p.company_name for p in positions if p.company_name),
+		school_names = tuple(e.school_name for e in educations if e.school_name),
+		keywords = tuple(dict.fromkeys(kw for p in positions for kw in p.keywords)),
+		cache_key = _build_cache_key(positions, educations, headline, summary, skills),
+	)
@@ -0,0 +1,222 @@
+# 구조화된 데이터(대학 순위, 회사 직원 수, 상장/투자 이력)만으로 판단 가능한 경험 태그를
+# LLM 호출 전에 규칙으로 결정합니다.
+# 각 규칙은 태그 부여(matched=True), 미부여(matched=False) 또는 판단 불가(None)를 반환하고,
+# 판단 불가한 태그만 LLM에 전달됩니다.
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from app.core.static_data import TOP_UNIVERSITY_MAX_RANK, find_university_rank
+from app.schemas.company import CompanyTenureContext
+from app.services.profile_normalizer import NormalizedProfile
+
+logger = logging.getLogger(__name__)
+
+# "대규모 회사 경험" 으로 판단하는 재직 기간 내 최대 직원 수
+LARGE_COMPANY_MIN_HEADCOUNT = 1000
+
+# 재직 기간 뉴스 제목에 있으면 '미부여' 로 확정하지 않고 LLM 판단에 맡기는 키워드
+# "상장 추진/연기", "비상장", 다른 회사 인수 기사 등도 포함되므로 뉴스만으로 '부여' 를 확정하지 않습니다.
+IPO_NEWS_KEYWORDS = ("상장", "IPO")
+MNA_NEWS_KEYWORDS = ("인수", "합병", "M&A")
+
+
+class TagDecision(NamedTuple):
+	tag: str
+	# True: 태그 부여 확정, False: 태그 미부여 확정
+	matched: bool
+	evidence: Optional[str] = None
+
+
+@dataclass
+class RuleInput:
+	"""규칙 평가 입력 (정규화된 인재 프로필 + 재직 기간 회사 정보)"""
+	profile: NormalizedProfile
+	tenure_contexts: List[CompanyTenureContext] = field(default_factory=list)
+
+	@property
+	def all_companies_known(self) -> bool:
+		"""모든 경력 회사의 구조화 정보가 있는지 (없으면 '미부여' 확정 불가)"""
+		if not self.tenure_contexts:
+			return False
+		known = {context.company_name for context in self.tenure_contexts}
+		return all(name in known for name in self.profile.company_names)
+
+	@property
+	def all_news_complete(self) -> bool:
+		"""모든 재직 기간 뉴스를 조회했는지 (최신 TENURE_NEWS_LIMIT 개로 잘렸으면 이전 이벤트를 확인할 수 없음)"""
+		return all(context.news_complete for context in self.tenure_contexts)
+
+
+@dataclass
+class RuleEngineResult:
+	decisions: Dict[str, TagDecision] = field(default_factory=dict)
+
+	@property
+	def matched(self) -> List[TagDecision]:
+		return [decision for decision in self.decisions.values() if decision.matched]
+
+	def tag_strings(self) -> List[str]:
+		"""부여 확정 태그를 "태그 (근거)" 형식으로 반환"""
+		return [f"{decision.tag} ({decision.evidence})" for decision in self.matched]
+
+	def undecided_tags(self, target_tags: List[str]) -> List[str]:
+		"""규칙으로 결정되지 않아 LLM 판단이 필요한 태그"""
+		return [tag for tag in target_tags if tag not in self.decisions]
+
+
+def _in_tenure(event_date: Optional[date], context: CompanyTenureContext) -> bool:
+	if event_date is None:
+		return False
+	return (context.start_date or date.min) <= event_date <= (context.end_date or date.max)
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+	"""'YYYY-MM-DD' 또는 'YYYY-MM' 문자열을 date로 변환"""
+	if not value:
+		return None
+	try:
+		parts = [int(part) for part in str(value)[:10].split("-")]
+		return date(parts[0], parts[1], parts[2] if len(parts) > 2 else 1)
+	except (ValueError, IndexError):
+		return None
+
+
+def _format_tenure(context: CompanyTenureContext) -> str:
+	start = context.start_date.strftime("%Y.%m") if context.start_date else "?"
+	end = context.end_date.strftime("%Y.%m") if context.end_date else "현재"
+	return f"{start}~{end}"
+
+
+# 규칙 정의
+def rule_top_university(rule_input: RuleInput) -> Optional[TagDecision]:
+	"""상위권 대학교 : university_rank.csv 순위 TOP_UNIVERSITY_MAX_RANK 이내"""
+	tag = "상위권 대학교"
+	school_names = rule_input.profile.school_names
+	if not school_names:
+		return TagDecision(tag, False)
+
+	best = None
+	unknown_school = False
+	for school_name in school_names:
+		university = find_university_rank(school_name)
+		if university is None:
+			unknown_school = True
+		elif best is None or university.rank < best[1].rank:
+			best = (school_name, university)
+
+	if best and best[1].rank <= TOP_UNIVERSITY_MAX_RANK:
+		school_name, university = best
+		return TagDecision(tag, True, f"{school_name}, 대학 순위 {university.rank}위")
+	# 순위 데이터에 없는 학교(해외 대학 등)는 LLM 판단
+	if unknown_school:
+		return None
+	return TagDecision(tag, False)
+
+
+def rule_large_company(rule_input: RuleInput) -> Optional[TagDecision]:
+	"""대규모 회사 경험 : 재직 기간 내 직원 수 LARGE_COMPANY_MIN_HEADCOUNT 이상"""
+	tag = "대규모 회사 경험"
+	all_decided = rule_input.all_companies_known
+
+	for context in rule_input.tenure_contexts:
+		headcounts = [
+			row.get("value") or 0
+			for row in context.facts.organization
+			if _in_tenure(_parse_date(row.get("referenceMonth")), context)
+		]
+		if not headcounts:
+			# 재직 기간과 겹치는 직원 수 데이터 없음
+			all_decided = False
+			continue
+		max_headcount = max(headcounts)
+		if max_headcount >= LARGE_COMPANY_MIN_HEADCOUNT:
+			return TagDecision(tag, True, f"{context.company_name} 재직 {_format_tenure(context)}, 직원 수 {max_headcount:,}명")
+
+	return TagDecision(tag, False) if all_decided else None
+
+
+def _find_event(rule_input: RuleInput, investment_level: str, listing: bool = False) -> Optional[str]:
+	"""재직 기간 내 상장일 또는 투자 이력 이벤트를 찾아 근거 문자열 반환"""
+	for context in rule_input.tenure_contexts:
+		tenure = _format_tenure(context)
+		if listing:
+			listing_date = _parse_date(context.facts.seed_corp.get("listingDate"))
+			if _in_tenure(listing_date, context):
+				market = context.facts.seed_corp.get("corpStockCdKr")
+				listed = f"{market} 상장" if market and market != "비상장" else "상장"
+				return f"{context.company_name} 재직 {tenure}, {listing_date.isoformat()} {listed}"
+
+		for investment in context.facts.investment:
+			invest_at = _parse_date(investment.get("investAt"))
+			if investment.get("level") == investment_level and _in_tenure(invest_at, context):
+				return f"{context.company_name} 재직 {tenure}, {invest_at.isoformat()} {investment_level}"
+	return None
+
+
+def _has_event_news(rule_input: RuleInput, news_keywords: tuple) -> bool:
+	"""재직 기간 내 이벤트 키워드가 포함된 뉴스가 있는지"""
+	return any(
+		_in_tenure(news.news_date, context) and any(keyword in news.title for keyword in news_keywords)
+		for context in rule_input.tenure_contexts
+		for news in context.news
+	)
+
+
+def _no_event(rule_input: RuleInput, news_keywords: tuple) -> bool:
+	"""
+	'미부여' 확정 가능 여부 : 모든 회사 정보가 있고, 뉴스가 조회 한도로 잘리지 않았으며(재직 초기 뉴스 누락 가능),
+	이벤트 키워드 뉴스도 없어야 함 (키워드 뉴스는 실제 이벤트인지 LLM 판단)
+	"""
+	return rule_input.all_companies_known and rule_input.all_news_complete and not _has_event_news(rule_input, news_keywords)
+
+
+def rule_ipo(rule_input: RuleInput) -> Optional[TagDecision]:
+	"""IPO : 재직 기간 내 상장일(listingDate) 또는 IPO 투자 이력"""
+	evidence = _find_event(rule_input, "IPO", listing=True)
+	if evidence:
+		return TagDecision("IPO", True, evidence)
+	return TagDecision("IPO", False) if _no_event(rule_input, IPO_NEWS_KEYWORDS) else None
+
+
+def rule_mna(rule_input: RuleInput) -> Optional[TagDecision]:
+	"""M&A 경험 : 재직 기간 내 M&A 투자 이력"""
+	evidence = _find_event(rule_input, "M&A")
+	if evidence:
+		return TagDecision("M&A 경험", True, evidence)
+	return TagDecision("M&A 경험", False) if _no_event(rule_input, MNA_NEWS_KEYWORDS) else None
+
+
+RULES: List[Callable[[RuleInput], Optional[TagDecision]]] = [
+	rule_top_university,
+	rule_large_company,
+	rule_ipo,
+	rule_mna,
+]
+
+
+def evaluate_rules(
+	profile: NormalizedProfile,
+	tenure_contexts: Optional[List[CompanyTenureContext]] = None,
+	rules: Optional[List[Callable[[RuleInput], Optional[TagDecision]]]] = None,
+	) -> RuleEngineResult:
+	"""모든 규칙을 평가해 결정된 태그 반환 (규칙 오류 시 해당 태그는 LLM 판단으로 넘김)"""
+	rule_input = RuleInput(profile, list(tenure_contexts or []))
+	result = RuleEngineResult()
+
+	for rule in RULES if rules is None else rules:
+		try:
+			decision = rule(rule_input)
+		except Exception as e:
+			logger.error(f"규칙 '{rule.__name__}' 평가 중 오류 발생: {e}", exc_info=True)
+			continue
+		if decision is not None:
+			result.decisions[decision.tag] = decision
+
+	logger.info(
+		f"규칙 평가 결과 : 부여 {[d.tag for d in result.matched]}, "
+		f"미부여 {[d.tag for d in result.decisions.values() if not d.matched]}"
+	)
+	return result
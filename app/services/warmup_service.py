@@ -0,0 +1,141 @@
+# 애플리케이션 시작 시 지연 초기화 대상(LLM 클라이언트, Vector Store, DB 커넥션 풀, 정적 인덱스)을 미리 생성합니다.
+# 배포/오토스케일 직후 첫 요청이 초기화 비용을 부담하지 않도록 하고,
+# 모든 구성 요소가 준비된 뒤에만 readiness 를 준비 완료로 표시합니다.
+
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any, Callable, List, Optional
+
+from app.core.config import get_settings
+from app.core.llm_services import get_fast_llm_instance, get_llm_instance
+from app.core.vector_db import get_company_vectorstore, get_news_vectorstore, get_university_vectorstore
+from app.core.relational_db import get_relational_pool
+from app.core.resilience import jittered_backoff
+from app.core.static_data import preload_static_indexes
+from app.schemas.health import ComponentStatus, ReadinessResponse
+from app.schemas.inference import TalentDataInput, Position, Education, StartEndDate, YearMonth
+
+
+logger = logging.getLogger(__name__)
+
+# 현재 readiness 상태
+_readiness = ReadinessResponse(ready=False)
+
+# warm-up 용 샘플 인재 데이터
+SYNTHETIC_TALENT_DATA = TalentDataInput(
+	headline = "Backend Engineer",
+	skills = ["Python"],
+	positions = [
+		Position(
+			companyName = "네이버",
+			title = "Backend Engineer",
+			startEndDate = StartEndDate(start=YearMonth(year=2020, month=1)),
+		)
+	],
+	educations = [Education(schoolName="서울대학교", degreeName="학사")],
+)
+
+
+def get_readiness() -> ReadinessResponse:
+	"""현재 readiness 상태 반환"""
+	return _readiness
+
+
+def set_readiness(readiness: ReadinessResponse) -> None:
+	global _readiness
+	_readiness = readiness
+
+
+async def _run_component(name: str, init_func: Callable[[], Any]) -> ComponentStatus:
+	"""
+	구성 요소 하나를 초기화하고 결과를 반환
+	동기 초기화 함수(네트워크 연결 포함)는 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+	"""
+	started = time.perf_counter()
+	try:
+		if inspect.iscoroutinefunction(init_func):
+			result = await init_func()
+		else:
+			result = await asyncio.to_thread(init_func)
+		detail = str(result) if isinstance(result, dict) else None
+		status = ComponentStatus(name=name, ok=True, detail=detail)
+	except Exception as e:
+		logger.error(f"warm-up 구성 요소 '{name}' 초기화 실패: {e}", exc_info=True)
+		status = ComponentStatus(name=name, ok=False, detail=str(e))
+
+	status.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+	logger.info(f"warm-up 구성 요소 '{name}' : {'완료' if status.ok else '실패'} ({status.duration_ms}ms)")
+	return status
+
+
+async def _run_synthetic_request() -> dict:
+	"""샘플 인재 데이터로 추론 파이프라인 전체를 1회 실행"""
+	# 순환 import 방지
+	from app.services.inference_service import infer_experiences_service
+
+	result = await infer_experiences_service(SYNTHETIC_TALENT_DATA)
+	return {"tags": len(result or [])}
+
+
+async def warm_up_application(run_synthetic_request: Optional[bool] = None) -> ReadinessResponse:
+	"""
+	모든 클라이언트/풀/정적 인덱스를 동시에 초기화
+	모든 구성 요소가 성공해야 readiness 가 준비 완료가 됩니다.
+	"""
+	settings = get_settings()
+	if run_synthetic_request is None:
+		run_synthetic_request = settings.WARMUP_SYNTHETIC_REQUEST
+
+	logger.info("애플리케이션 warm-up 시작")
+	# 재시도 중에는 직전 실패 구성 요소를 계속 보여줌
+	set_readiness(ReadinessResponse(ready=False, components=get_readiness().components))
+
+	components = [
+		("llm_client", get_llm_instance),
+		("company_vectorstore", get_company_vectorstore),
+		("news_vectorstore", get_news_vectorstore),
+		("university_vectorstore", get_university_vectorstore),
+		("static_indexes", preload_static_indexes),
+	]
+	if settings.LLM_CASCADE_ENABLED:
+		components.append(("fast_llm_client", get_fast_llm_instance))
+	if settings.RELATIONAL_DB_ENABLED:
+		components.append(("relational_pool", get_relational_pool))
+
+	statuses: List[ComponentStatus] = list(
+		await asyncio.gather(*(_run_component(name, func) for name, func in components))
+	)
+
+	# 모든 구성 요소가 준비된 경우에만 샘플 요청 실행
+	if run_synthetic_request and all(status.ok for status in statuses):
+		statuses.append(await _run_component("synthetic_request", _run_synthetic_request))
+
+	readiness = ReadinessResponse(ready=all(status.ok for status in statuses), components=statuses)
+	set_readiness(readiness)
+
+	if readiness.ready:
+		logger.info("애플리케이션 warm-up 완료")
+	else:
+		failed = [status.name for status in statuses if not status.ok]
+		logger.error(f"애플리케이션 warm-up 실패 구성 요소: {failed}")
+	return readiness
+
+
+async def retry_warm_up_until_ready(run_synthetic_request: Optional[bool] = None) -> ReadinessResponse:
+	"""
+	readiness 가 준비 완료가 될 때까지 지수 백오프로 warm-up 재시도
+	시작 시 DB 등이 잠시 연결되지 않아 실패해도 프로세스를 재시작하지 않고 복구되면 요청을 받습니다.
+	이미 초기화된 구성 요소는 캐시된 인스턴스를 반환하므로 실패한 구성 요소만 다시 연결합니다.
+	"""
+	settings = get_settings()
+	attempt = 0
+	readiness = get_readiness()
+	while not readiness.ready:
+		delay = jittered_backoff(attempt, settings.WARMUP_RETRY_BASE_DELAY, settings.WARMUP_RETRY_MAX_DELAY)
+		logger.info(f"warm-up 재시도 대기 {delay:.1f}초 (재시도 {attempt + 1}회)")
+		await asyncio.sleep(delay)
+		readiness = await warm_up_application(run_synthetic_request)
+		attempt += 1
+	return readiness
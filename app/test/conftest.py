@@ -0,0 +1,71 @@
+import os
+import uuid
+import pytest
+import pytest_asyncio
+
+from app.core.relational_db import to_asyncpg_dsn
+
+
+# 실제 PostgreSQL 이 필요한 테스트 공용 fixture, TEST_DATABASE_URL 이 없으면 건너뜀
+
+def pytest_configure(config):
+	config.addinivalue_line("markers", "pgvector: postgres_pool 에 vector 확장(public 스키마)을 사용")
+	config.addinivalue_line("markers", "perf: 실행 시간(wall-clock) 예산 테스트, RUN_PERF_TESTS=1 일 때만 실행")
+
+
+def pytest_collection_modifyitems(config, items):
+	# 실행 시간 예산은 장비 부하에 따라 흔들리므로 기본 실행에서 제외
+	if os.getenv("RUN_PERF_TESTS"):
+		return
+	skip_perf = pytest.mark.skip(reason="RUN_PERF_TESTS=1 일 때만 실행")
+	for item in items:
+		if item.get_closest_marker("perf") is not None:
+			item.add_marker(skip_perf)
+
+
+@pytest.fixture
+def test_database_url() -> str:
+	database_url = os.getenv("TEST_DATABASE_URL")
+	if not database_url:
+		pytest.skip("TEST_DATABASE_URL 환경변수가 설정되지 않았습니다.")
+	return database_url
+
+
+@pytest.fixture
+def test_schema(request) -> str:
+	"""테스트 전용 스키마 이름 (test_<모듈>_<임의 값>)"""
+	module = request.module.__name__.rsplit(".", 1)[-1].removeprefix("test_")
+	return f"test_{module}_{uuid.uuid4().hex[:8]}"
+
+
+@pytest_asyncio.fixture
+async def postgres_pool(request, test_database_url: str, test_schema: str):
+	"""
+	테스트 전용 스키마를 search_path 로 사용하는 asyncpg 풀, 테스트가 끝나면 스키마 삭제
+	pgvector 마커가 있으면 vector 확장을 만들고 search_path 에 public 을 추가합니다 (vector 타입은 public 스키마).
+	"""
+	asyncpg = pytest.importorskip("asyncpg")
+	dsn = to_asyncpg_dsn(test_database_url)
+	pgvector = request.node.get_closest_marker("pgvector") is not None
+	try:
+		admin = await asyncpg.connect(dsn)
+		if pgvector:
+			await admin.execute("CREATE EXTENSION IF NOT EXISTS vector")
+	except (OSError, asyncpg.PostgresError) as e:
+		pytest.skip(f"테스트 데이터베이스 연결 실패: {e}")
+
+	await admin.execute(f"CREATE SCHEMA {test_schema}")
+	search_path = f"{test_schema}, public" if pgvector else test_schema
+	pool = await asyncpg.create_pool(dsn, min_size=1, max_size=4, server_settings={"search_path": search_path})
+	yield pool
+	await pool.close()
+	await admin.execute(f"DROP SCHEMA {test_schema} CASCADE")
+	await admin.close()
+
+
+@pytest.fixture
+def pool_factory(postgres_pool):
+	"""Postgres 저장소의 pool_factory 인자 (테스트 풀 반환)"""
+	async def factory():
+		return postgres_pool
+	return factory
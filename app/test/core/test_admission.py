@@ -0,0 +1,179 @@
+import asyncio
+import pytest
+
+from app.core.config import get_settings
+from app.core.llm_services import LLMTimeoutError
+from app.core.admission import (
+	AdaptiveConcurrencyLimit,
+	AdmissionController,
+	AdmissionRejectedError,
+	REJECT_DEADLINE,
+	REJECT_QUEUE_FULL,
+	REJECT_QUEUE_TIMEOUT,
+	bounded_deadline,
+	get_admission_controller,
+	parse_request_timeout,
+	remaining_request_time,
+	reset_admission_controller,
+)
+
+
+def make_controller(limit: int = 1, max_queue: int = 1, max_queue_wait: float = 1.0, latency_target: float = 10.0) -> AdmissionController:
+	return AdmissionController(
+		AdaptiveConcurrencyLimit(initial=limit, min_limit=1, max_limit=8, latency_target=latency_target),
+		max_queue = max_queue,
+		max_queue_wait = max_queue_wait,
+		overload_errors = (LLMTimeoutError,),
+	)
+
+
+def test_parse_request_timeout():
+	assert parse_request_timeout(None) is None
+	assert parse_request_timeout("2.5") == 2.5
+	assert parse_request_timeout("-1") == 0.0
+	assert parse_request_timeout("abc") is None
+	assert parse_request_timeout("inf") is None
+
+
+def test_aimd_limit_increases_slowly_and_backs_off():
+	limit = AdaptiveConcurrencyLimit(initial=4, min_limit=2, max_limit=5, latency_target=1.0)
+
+	# 한도 4 에서 5 까지 약 한도 수만큼의 샘플 필요
+	for _ in range(4):
+		limit.on_sample(0.5, in_flight=4)
+	assert limit.limit == 4
+	limit.on_sample(0.5, in_flight=4)
+	assert limit.limit == 5
+
+	# 한도를 거의 쓰지 않는 동안에는 늘리지 않음
+	for _ in range(20):
+		limit.on_sample(0.5, in_flight=1)
+	assert limit.limit == 5
+
+	limit.on_sample(2.0, in_flight=5)
+	assert limit.limit == 4
+	for _ in range(20):
+		limit.on_sample(0.1, in_flight=4, dropped=True)
+	assert limit.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_queued_request_takes_released_slot_in_order():
+	controller = make_controller(limit=1, max_queue=2)
+	order = []
+
+	async def request(name: str, hold: asyncio.Event):
+		async with controller.admit():
+			order.append(name)
+			await hold.wait()
+
+	holds = [asyncio.Event() for _ in range(3)]
+	tasks = [asyncio.create_task(request(f"r{i}", holds[i])) for i in range(3)]
+	await asyncio.sleep(0)
+	assert controller.in_flight == 1
+	assert controller.queue_depth == 2
+
+	for hold in holds:
+		hold.set()
+	await asyncio.gather(*tasks)
+
+	assert order == ["r0", "r1", "r2"]
+	assert controller.in_flight == 0
+	assert controller.admitted == 3
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_full():
+	controller = make_controller(limit=1, max_queue=1)
+	await controller.acquire()
+	waiting = asyncio.create_task(controller.acquire())
+	await asyncio.sleep(0)
+
+	with pytest.raises(AdmissionRejectedError) as exc_info:
+		await controller.acquire()
+	assert exc_info.value.reason == REJECT_QUEUE_FULL
+	assert exc_info.value.retry_after >= 1
+
+	controller.release()
+	await waiting
+	assert controller.rejected[REJECT_QUEUE_FULL] == 1
+
+@pytest.mark.asyncio
+async def test_rejects_after_queue_wait_and_client_deadline():
+	controller = make_controller(limit=1, max_queue=4, max_queue_wait=0.05)
+	await controller.acquire()
+
+	with pytest.raises(AdmissionRejectedError) as exc_info:
+		await controller.acquire()
+	assert exc_info.value.reason == REJECT_QUEUE_TIMEOUT
+
+	with pytest.raises(AdmissionRejectedError) as exc_info:
+		await controller.acquire(timeout=0.01)
+	assert exc_info.value.reason == REJECT_DEADLINE
+	with pytest.raises(AdmissionRejectedError) as exc_info:
+		await controller.acquire(timeout=0)
+	assert exc_info.value.reason == REJECT_DEADLINE
+
+	# 거부된 요청은 대기열에 남지 않음
+	assert controller.queue_depth == 0
+	controller.release()
+	assert controller.in_flight == 0
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+	controller = make_controller(limit=1, max_queue=2)
+	await controller.acquire()
+	waiting = asyncio.create_task(controller.acquire())
+	await asyncio.sleep(0)
+
+	waiting.cancel()
+	with pytest.raises(asyncio.CancelledError):
+		await waiting
+
+	assert controller.queue_depth == 0
+	controller.release()
+	assert controller.in_flight == 0
+
+@pytest.mark.asyncio
+async def test_overload_errors_shrink_limit():
+	controller = make_controller(limit=4)
+
+	with pytest.raises(LLMTimeoutError):
+		async with controller.admit():
+			raise LLMTimeoutError("시간 초과")
+	with pytest.raises(ValueError):
+		async with controller.admit():
+			raise ValueError("잘못된 요청")
+
+	assert controller.limit.limit == 3
+	assert controller.in_flight == 0
+
+@pytest.mark.asyncio
+async def test_admit_bounds_downstream_deadline():
+	controller = make_controller(limit=1)
+	assert remaining_request_time() is None
+	assert bounded_deadline(60.0) == 60.0
+
+	async with controller.admit(timeout=5.0):
+		assert 4.0 < remaining_request_time() <= 5.0
+		assert bounded_deadline(60.0) <= 5.0
+		assert bounded_deadline(1.0) == 1.0
+
+	assert remaining_request_time() is None
+
+
+def test_get_admission_controller_disabled_by_default():
+	reset_admission_controller()
+	assert get_admission_controller() is None
+
+def test_get_admission_controller_from_settings(mocker):
+	settings = get_settings()
+	mocker.patch.object(settings, "ADMISSION_CONTROL_ENABLED", True)
+	mocker.patch.object(settings, "ADMISSION_INITIAL_LIMIT", 3)
+	reset_admission_controller()
+	try:
+		controller = get_admission_controller()
+		assert controller.limit.limit == 3
+		assert get_admission_controller() is controller
+		assert controller.snapshot()["limit"] == 3
+	finally:
+		reset_admission_controller()
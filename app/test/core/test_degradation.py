@@ -0,0 +1,61 @@
+import asyncio
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.degradation import (
+	DEGRADED_NEWS_SKIPPED,
+	DEGRADED_RELATIONAL_FAILED,
+	DEGRADED_RULES_ONLY,
+	DEGRADED_STALE_CACHE,
+	TIER_FULL,
+	TIER_REDUCED_CONTEXT,
+	TIER_RULES_ONLY,
+	TIER_STALE_CACHE,
+	collect_degradations,
+	degradation_tier,
+	mark_degraded,
+)
+
+
+@pytest.mark.parametrize("reasons, tier", [
+	([], TIER_FULL),
+	([DEGRADED_NEWS_SKIPPED], TIER_REDUCED_CONTEXT),
+	([DEGRADED_NEWS_SKIPPED, DEGRADED_RULES_ONLY], TIER_RULES_ONLY),
+	([DEGRADED_RULES_ONLY, DEGRADED_STALE_CACHE], TIER_STALE_CACHE),
+])
+def test_degradation_tier(reasons, tier):
+	assert degradation_tier(reasons) == tier
+
+
+def test_mark_degraded_outside_collection_only_counts():
+	before = REGISTRY.get_sample_value("inference_degradations_total", {"reason": DEGRADED_NEWS_SKIPPED}) or 0.0
+
+	mark_degraded(DEGRADED_NEWS_SKIPPED)
+
+	assert REGISTRY.get_sample_value("inference_degradations_total", {"reason": DEGRADED_NEWS_SKIPPED}) == before + 1
+
+
+def test_nested_collection_propagates_to_outer():
+	with collect_degradations() as outer:
+		mark_degraded(DEGRADED_NEWS_SKIPPED)
+		with collect_degradations() as inner:
+			mark_degraded(DEGRADED_NEWS_SKIPPED)
+			mark_degraded(DEGRADED_RELATIONAL_FAILED)
+		assert inner == [DEGRADED_NEWS_SKIPPED, DEGRADED_RELATIONAL_FAILED]
+
+	assert outer == [DEGRADED_NEWS_SKIPPED, DEGRADED_RELATIONAL_FAILED]
+
+
+@pytest.mark.asyncio
+async def test_collection_shared_with_gathered_tasks():
+	async def fail_relational():
+		await asyncio.sleep(0)
+		mark_degraded(DEGRADED_RELATIONAL_FAILED)
+
+	async def skip_news():
+		mark_degraded(DEGRADED_NEWS_SKIPPED)
+
+	with collect_degradations() as reasons:
+		await asyncio.gather(fail_relational(), skip_news())
+
+	assert sorted(reasons) == sorted([DEGRADED_RELATIONAL_FAILED, DEGRADED_NEWS_SKIPPED])
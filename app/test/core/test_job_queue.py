@@ -0,0 +1,116 @@
+import asyncio
+import uuid
+import pytest
+
+from app.core.job_queue import PostgresJobQueue, JobQueueFullError, lane_capacity
+from app.schemas.inference import TalentDataInput, Position
+
+
+def talent(company_name: str) -> TalentDataInput:
+	return TalentDataInput(headline="Engineer", positions=[Position(companyName=company_name)])
+
+
+def test_lane_capacity():
+	assert lane_capacity("high", 100) == 100
+	assert lane_capacity("normal", 100) == 80
+	assert lane_capacity("low", 100) == 50
+	assert lane_capacity("low", 1) == 1
+
+
+@pytest.fixture
+def job_queue(pool_factory) -> PostgresJobQueue:
+	return PostgresJobQueue(pool_factory, max_depth=10)
+
+
+@pytest.mark.asyncio
+async def test_claim_by_priority_then_arrival(job_queue: PostgresJobQueue):
+	low = await job_queue.enqueue(talent("A"), "low")
+	normal_first = await job_queue.enqueue(talent("B"), "normal")
+	normal_second = await job_queue.enqueue(talent("C"), "normal")
+	high = await job_queue.enqueue(talent("D"), "high")
+
+	claimed = [await job_queue.claim() for _ in range(4)]
+
+	assert [job.job_id for job in claimed] == [high, normal_first, normal_second, low]
+	assert claimed[0].talent_data == talent("D")
+	assert claimed[0].attempts == 1
+	assert await job_queue.claim() is None
+	assert (await job_queue.get(low)).status == "running"
+
+@pytest.mark.asyncio
+async def test_concurrent_claims_skip_locked_rows(job_queue: PostgresJobQueue):
+	job_ids = {await job_queue.enqueue(talent(f"회사{i}")) for i in range(3)}
+
+	# 서로 다른 커넥션에서 동시에 가져가도 같은 작업을 두 번 가져가지 않음
+	claimed = await asyncio.gather(*(job_queue.claim() for _ in range(4)))
+
+	claimed_ids = [job.job_id for job in claimed if job is not None]
+	assert sorted(claimed_ids) == sorted(job_ids)
+
+@pytest.mark.asyncio
+async def test_enqueue_backpressure_by_lane(job_queue: PostgresJobQueue):
+	for i in range(5):
+		await job_queue.enqueue(talent(f"회사{i}"), "low")
+
+	# low lane 한도(10 * 0.5) 도달 후에도 normal, high 는 접수
+	with pytest.raises(JobQueueFullError) as exc_info:
+		await job_queue.enqueue(talent("초과"), "low")
+	assert exc_info.value.retry_after > 0
+
+	for i in range(3):
+		await job_queue.enqueue(talent(f"일반{i}"), "normal")
+	with pytest.raises(JobQueueFullError):
+		await job_queue.enqueue(talent("초과"), "normal")
+	await job_queue.enqueue(talent("우선"), "high")
+
+	assert await job_queue.queued_depth() == {"high": 1, "normal": 3, "low": 5}
+
+@pytest.mark.asyncio
+async def test_complete_fail_and_get(job_queue: PostgresJobQueue):
+	succeeded = await job_queue.enqueue(talent("A"), callback_url="https://callback.test/jobs")
+	failed = await job_queue.enqueue(talent("B"))
+	first, second = await job_queue.claim(), await job_queue.claim()
+	assert first.callback_url == "https://callback.test/jobs"
+
+	status = await job_queue.complete(first.job_id, ["리더십 (엘박스 CTO)"])
+	assert status.status == "succeeded"
+	assert status.result == ["리더십 (엘박스 CTO)"]
+	assert status.finished_at is not None
+	await job_queue.fail(second.job_id, "ValueError: 오류")
+
+	assert (await job_queue.get(succeeded)).result == ["리더십 (엘박스 CTO)"]
+	assert (await job_queue.get(failed)).error == "ValueError: 오류"
+	# 이미 완료된 작업은 다시 완료 처리하지 않음
+	assert await job_queue.complete(first.job_id, []) is None
+	assert await job_queue.get(str(uuid.uuid4())) is None
+	assert await job_queue.get("not-a-uuid") is None
+
+@pytest.mark.asyncio
+async def test_retry_delays_next_claim(job_queue: PostgresJobQueue):
+	job_id = await job_queue.enqueue(talent("A"))
+	await job_queue.claim()
+
+	await job_queue.retry(job_id, "LLMRateLimitedError: 한도 초과", delay=60)
+	assert await job_queue.claim() is None
+
+	await job_queue.retry(job_id, "무시됨", delay=0)  # 실행 중이 아니면 변경 없음
+	status = await job_queue.get(job_id)
+	assert status.status == "queued"
+	assert status.attempts == 1
+
+@pytest.mark.asyncio
+async def test_requeue_stale_and_purge(job_queue: PostgresJobQueue, postgres_pool):
+	retried = await job_queue.enqueue(talent("A"))
+	exhausted = await job_queue.enqueue(talent("B"))
+	await job_queue.claim()
+	await job_queue.claim()
+	await postgres_pool.execute("UPDATE inference_jobs SET started_at = now() - interval '10 minutes'")
+	await postgres_pool.execute("UPDATE inference_jobs SET attempts = 3 WHERE id = $1", uuid.UUID(exhausted))
+
+	assert await job_queue.requeue_stale(timeout=300, max_attempts=3) == 2
+	assert (await job_queue.get(retried)).status == "queued"
+	assert (await job_queue.get(exhausted)).status == "failed"
+
+	await postgres_pool.execute("UPDATE inference_jobs SET finished_at = now() - interval '2 days' WHERE finished_at IS NOT NULL")
+	assert await job_queue.purge_finished(ttl=86400) == 1
+	assert await job_queue.get(exhausted) is None
@@ -1,7 +1,24 @@
+import time
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
-from app.core.llm_services import get_llm_instance, invoke_llm_for_experience
+from app.core.llm_services import (
+	get_llm_instance,
+	invoke_llm_for_experience,
+	invoke_llm_cascade,
+	get_cascade_metrics,
+	reset_cascade_metrics,
+	CASCADE_TIER_FAST,
+	CASCADE_TIER_PRIMARY,
+	LLMInvocationError,
+	LLMTimeoutError,
+	LLMCircuitOpenError,
+	LLMRateLimitedError,
+)
+from app.core.rate_limiter import get_rate_limiter_metrics
+from app.core.admission import AdaptiveConcurrencyLimit, AdmissionController
+from prometheus_client import REGISTRY
 from app.core.config import settings
+from benchmarks.fake_openai import FakeOpenAIServer
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage
 
@@ -10,8 +27,10 @@ def test_get_llm_instance_succes(mocker):
 	mocker.patch.object(settings, "OPENAI_API_KEY", "test_api_key")
 	mocker.patch.object(settings, "OPENAI_MODEL_NAME", "gpt-test-model")
 	mocker.patch.object(settings, "OPENAI_TEMPERATURE", 0.1 )
+	mocker.patch.object(settings, "OPENAI_BASE_URL", None)
+	mocker.patch.object(settings, "LLM_REQUEST_TIMEOUT", 30.0)
 
-	mock_chat_open_ai_constructor = mocker.patch('app.core.llm_services.ChatOpenAI')
+	mock_chat_open_ai_constructor = mocker.patch('langchain_openai.ChatOpenAI')
 	mock_llm_obj = MagicMock(spec = ChatOpenAI)
 	mock_chat_open_ai_constructor.return_value = mock_llm_obj
 
@@ -25,7 +44,10 @@ def test_get_llm_instance_succes(mocker):
 	mock_chat_open_ai_constructor.assert_called_once_with(
 		openai_api_key = "test_api_key",
 		model_name = "gpt-test-model",
-		temperature = 0.1
+		temperature = 0.1,
+		base_url = None,
+		timeout = 30.0,
+		max_retries = 0,
 	)
 
 	assert llm1 is mock_llm_obj
@@ -58,12 +80,14 @@ async def test_invoke_llm_api_call_exception(mocker):
 	mock_llm_obj = AsyncMock(spec=ChatOpenAI)
 	mock_llm_obj.ainvoke.side_effect = Exception("Test API ERROR")
 	mocker.patch('app.core.llm_services.get_llm_instance', return_value = mock_llm_obj)
+	mocker.patch.dict('app.core.llm_services._circuit_breakers', clear=True)
 	mock_logger_error = mocker.patch('app.core.llm_services.logger.error')
 
-	# 언제
-	result = await invoke_llm_for_experience("프롬프트")
+	# 언제 : 재시도 불가 오류는 빈 결과 대신 예외로 전달
+	with pytest.raises(LLMInvocationError):
+		await invoke_llm_for_experience("프롬프트")
 
-	assert result is None
+	mock_llm_obj.ainvoke.assert_called_once()
 	mock_logger_error.assert_called_once()
 
 # LLM 응답 없음 또는 invalid
@@ -82,7 +106,212 @@ async def test_invoke_llm_empty_or_invalid_response(mocker):
 	mock_llm_obj.ainvoke.return_value = MagicMock(spec=AIMessage)
 	del mock_llm_obj.ainvoke.return_value.content
 
-	result_no_content_attr = await invoke_llm_for_experience("프롬프트2")
+	with pytest.raises(LLMInvocationError):
+		await invoke_llm_for_experience("프롬프트2")
+
+	mock_logger_warning.assert_called_with("LLM 응답이 비어있거나 잘못된 형식입니다.")
+
+
+# fake OpenAI 서버를 사용한 재시도/기한/헤징/서킷 브레이커 테스트
+@pytest.fixture
+def fake_llm_server(mocker):
+	server = FakeOpenAIServer(content="- 대규모 회사 경험 (네이버 재직)").start()
+	mocker.patch.object(settings, "OPENAI_BASE_URL", server.base_url)
+	mocker.patch.object(settings, "OPENAI_MODEL_NAME", "gpt-fake")
+	mocker.patch.object(settings, "LLM_REQUEST_TIMEOUT", 5.0)
+	mocker.patch.object(settings, "LLM_CALL_DEADLINE", 5.0)
+	mocker.patch.object(settings, "LLM_MAX_RETRIES", 2)
+	mocker.patch.object(settings, "LLM_RETRY_BASE_DELAY", 0.01)
+	mocker.patch.object(settings, "LLM_RETRY_MAX_DELAY", 0.05)
+	mocker.patch.object(settings, "LLM_HEDGE_ENABLED", False)
+	mocker.patch.object(settings, "LLM_CIRCUIT_FAILURE_THRESHOLD", 100)
+	mocker.patch.object(settings, "OPENAI_FAST_MODEL_NAME", "gpt-fake-mini")
+	mocker.patch.object(settings, "LLM_CASCADE_MIN_CONFIDENCE", 0.8)
+	mocker.patch('app.core.llm_services.llm_instance', None)
+	mocker.patch('app.core.llm_services.fast_llm_instance', None)
+	mocker.patch.dict('app.core.llm_services._circuit_breakers', clear=True)
+	mocker.patch.dict('app.core.llm_services._latency_trackers', clear=True)
+	mocker.patch.dict('app.core.rate_limiter._rate_limiters', clear=True)
+	reset_cascade_metrics()
+	yield server
+	server.stop()
+
+@pytest.mark.asyncio
+async def test_invoke_llm_retries_rate_limit_and_server_error(fake_llm_server: FakeOpenAIServer):
+	retries_before = REGISTRY.get_sample_value("llm_retries_total", {"model": "gpt-fake"}) or 0.0
+	tokens_before = REGISTRY.get_sample_value("llm_tokens_total", {"model": "gpt-fake", "kind": "completion"}) or 0.0
+	fake_llm_server.enqueue(status=429, headers={"Retry-After": "0"})
+	fake_llm_server.enqueue(status=503)
+
+	result = await invoke_llm_for_experience("프롬프트")
+
+	assert result == "- 대규모 회사 경험 (네이버 재직)"
+	assert fake_llm_server.request_count == 3
+	assert REGISTRY.get_sample_value("llm_retries_total", {"model": "gpt-fake"}) == retries_before + 2
+	assert REGISTRY.get_sample_value("llm_tokens_total", {"model": "gpt-fake", "kind": "completion"}) > tokens_before
+
+@pytest.mark.asyncio
+async def test_invoke_llm_retries_exhausted(fake_llm_server: FakeOpenAIServer):
+	for _ in range(3):
+		fake_llm_server.enqueue(status=500)
+
+	with pytest.raises(LLMInvocationError) as exc_info:
+		await invoke_llm_for_experience("프롬프트")
+
+	assert not isinstance(exc_info.value, LLMTimeoutError)
+	assert fake_llm_server.request_count == 3
+
+@pytest.mark.asyncio
+async def test_invoke_llm_does_not_retry_client_error(fake_llm_server: FakeOpenAIServer):
+	fake_llm_server.enqueue(status=400)
+
+	with pytest.raises(LLMInvocationError):
+		await invoke_llm_for_experience("프롬프트")
+
+	assert fake_llm_server.request_count == 1
+
+@pytest.mark.asyncio
+async def test_invoke_llm_deadline_exceeded(fake_llm_server: FakeOpenAIServer):
+	fake_llm_server.enqueue(delay=2.0)
+
+	started = time.perf_counter()
+	with pytest.raises(LLMTimeoutError):
+		await invoke_llm_for_experience("프롬프트", deadline=0.3)
+
+	assert time.perf_counter() - started < 1.0
+
+@pytest.mark.asyncio
+async def test_invoke_llm_bounded_by_request_timeout(fake_llm_server: FakeOpenAIServer):
+	# X-Request-Timeout 으로 받은 남은 시간이 호출 기한보다 짧으면 남은 시간까지만 호출
+	fake_llm_server.enqueue(delay=2.0)
+	controller = AdmissionController(AdaptiveConcurrencyLimit(4, 1, 8, 10.0), max_queue=1, max_queue_wait=1.0)
+
+	started = time.perf_counter()
+	with pytest.raises(LLMTimeoutError):
+		async with controller.admit(timeout=0.3):
+			await invoke_llm_for_experience("프롬프트", deadline=30.0)
+
+	assert time.perf_counter() - started < 1.0
+
+@pytest.mark.asyncio
+async def test_invoke_llm_hedged_request_wins(mocker, fake_llm_server: FakeOpenAIServer):
+	mocker.patch.object(settings, "LLM_HEDGE_ENABLED", True)
+	mocker.patch.object(settings, "LLM_HEDGE_MIN_SAMPLES", 0)
+	mocker.patch.object(settings, "LLM_HEDGE_MIN_DELAY", 0.1)
+	fake_llm_server.enqueue(delay=2.0, content="느린 응답")
+	fake_llm_server.enqueue(content="빠른 응답")
+
+	started = time.perf_counter()
+	result = await invoke_llm_for_experience("프롬프트")
+
+	assert result == "빠른 응답"
+	assert time.perf_counter() - started < 1.0
+	assert fake_llm_server.request_count == 2
+
+@pytest.mark.asyncio
+async def test_invoke_llm_circuit_breaker_opens(mocker, fake_llm_server: FakeOpenAIServer):
+	mocker.patch.object(settings, "LLM_CIRCUIT_FAILURE_THRESHOLD", 2)
+	mocker.patch.object(settings, "LLM_CIRCUIT_RECOVERY_TIMEOUT", 30.0)
+	mocker.patch.object(settings, "LLM_MAX_RETRIES", 0)
+	fake_llm_server.enqueue(status=500)
+	fake_llm_server.enqueue(status=503)
+
+	for _ in range(2):
+		with pytest.raises(LLMInvocationError):
+			await invoke_llm_for_experience("프롬프트")
+
+	with pytest.raises(LLMCircuitOpenError) as exc_info:
+		await invoke_llm_for_experience("프롬프트")
+
+	assert exc_info.value.retry_after > 0
+	assert fake_llm_server.request_count == 2
+
+@pytest.mark.asyncio
+async def test_invoke_llm_client_errors_do_not_open_circuit(mocker, fake_llm_server: FakeOpenAIServer):
+	mocker.patch.object(settings, "LLM_CIRCUIT_FAILURE_THRESHOLD", 2)
+	mocker.patch.object(settings, "LLM_CIRCUIT_RECOVERY_TIMEOUT", 30.0)
+	# 잘못된 프롬프트(400), 인증 오류(401)는 요청 자체의 문제
+	fake_llm_server.enqueue(status=400)
+	fake_llm_server.enqueue(status=401)
+	fake_llm_server.enqueue(status=400)
+	fake_llm_server.enqueue(content="정상 응답")
+
+	for _ in range(3):
+		with pytest.raises(LLMInvocationError):
+			await invoke_llm_for_experience("프롬프트")
+
+	assert await invoke_llm_for_experience("프롬프트") == "정상 응답"
+	assert fake_llm_server.request_count == 4
+
+
+# cascade 테스트
+@pytest.mark.asyncio
+async def test_invoke_llm_cascade_accepts_confident_fast_response(fake_llm_server: FakeOpenAIServer):
+	fake_llm_server.enqueue(content="작은 모델 응답")
+
+	result = await invoke_llm_cascade("프롬프트", assess=lambda output: 0.9)
+
+	assert result.content == "작은 모델 응답"
+	assert result.tier == CASCADE_TIER_FAST
+	assert result.confidence == 0.9
+	assert [request["model"] for request in fake_llm_server.requests] == ["gpt-fake-mini"]
+
+	metrics = get_cascade_metrics()
+	assert metrics[CASCADE_TIER_FAST]["accepted"] == 1
+	assert metrics[CASCADE_TIER_FAST]["confidence_buckets"][9] == 1
+	assert metrics[CASCADE_TIER_PRIMARY]["calls"] == 0
+
+@pytest.mark.asyncio
+async def test_invoke_llm_cascade_escalates_low_confidence(fake_llm_server: FakeOpenAIServer):
+	fake_llm_server.enqueue(content="애매한 응답")
+	fake_llm_server.enqueue(content="큰 모델 응답")
+
+	result = await invoke_llm_cascade("프롬프트", assess=lambda output: 0.3)
+
+	assert result.content == "큰 모델 응답"
+	assert result.tier == CASCADE_TIER_PRIMARY
+	assert result.confidence == 0.3
+	assert [request["model"] for request in fake_llm_server.requests] == ["gpt-fake-mini", "gpt-fake"]
+
+	metrics = get_cascade_metrics()
+	assert metrics[CASCADE_TIER_FAST]["escalated"] == 1
+	assert metrics[CASCADE_TIER_PRIMARY]["accepted"] == 1
+
+@pytest.mark.asyncio
+async def test_invoke_llm_cascade_escalates_on_fast_tier_failure(mocker, fake_llm_server: FakeOpenAIServer):
+	mocker.patch.object(settings, "LLM_MAX_RETRIES", 0)
+	fake_llm_server.enqueue(status=500)
+	fake_llm_server.enqueue(content="큰 모델 응답")
+
+	result = await invoke_llm_cascade("프롬프트", assess=lambda output: 1.0)
+
+	assert result.tier == CASCADE_TIER_PRIMARY
+	assert result.confidence is None
+	assert get_cascade_metrics()[CASCADE_TIER_FAST]["failures"] == 1
+
+@pytest.mark.asyncio
+async def test_invoke_llm_cascade_primary_failure_raises(mocker, fake_llm_server: FakeOpenAIServer):
+	mocker.patch.object(settings, "LLM_MAX_RETRIES", 0)
+	fake_llm_server.enqueue(content="애매한 응답")
+	fake_llm_server.enqueue(status=500)
+
+	with pytest.raises(LLMInvocationError):
+		await invoke_llm_cascade("프롬프트", assess=lambda output: 0.0)
+
+	assert get_cascade_metrics()[CASCADE_TIER_PRIMARY]["failures"] == 1
+
+@pytest.mark.asyncio
+async def test_invoke_llm_rate_limit_queues_then_rejects(mocker, fake_llm_server: FakeOpenAIServer):
+	# 분당 1건 한도: 두 번째 호출은 대기 시간(최대 0.1초) 안에 한도를 확보할 수 없어 요청 없이 거부
+	mocker.patch.object(settings, "LLM_RPM_LIMIT", 1)
+	mocker.patch.object(settings, "RATE_LIMIT_MAX_QUEUE_TIME", 0.1)
+
+	assert await invoke_llm_for_experience("프롬프트") == "- 대규모 회사 경험 (네이버 재직)"
+	with pytest.raises(LLMRateLimitedError) as exc_info:
+		await invoke_llm_for_experience("프롬프트")
 
-	assert result_no_content_attr is None
-	mock_logger_warning.assert_called_with("LLM 응답이 비어있거나 잘못된 형식입니다.")
\ No newline at end of file
+	assert exc_info.value.retry_after > 50
+	assert fake_llm_server.request_count == 1
+	metrics = get_rate_limiter_metrics()["llm:gpt-fake"]
+	assert metrics["acquired"] == 1
+	assert metrics["rejected"] == 1
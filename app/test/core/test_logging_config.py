@@ -0,0 +1,107 @@
+import io
+import json
+import logging
+import pytest
+from logging.handlers import QueueHandler
+
+from app.core.config import settings
+from app.core.logging_config import configure_logging, shutdown_logging, log_payload, sample_request_payloads
+
+
+# Fixtures
+@pytest.fixture
+def payload_logger():
+	logger = logging.getLogger("test.payload")
+	original_level = logger.level
+	logger.setLevel(logging.INFO)
+	yield logger
+	logger.setLevel(original_level)
+
+@pytest.fixture
+def restore_root_level():
+	root = logging.getLogger()
+	original_level = root.level
+	yield
+	shutdown_logging()
+	root.setLevel(original_level)
+
+
+# configure_logging 테스트
+def test_configure_logging_writes_through_queue_listener(restore_root_level):
+	stream = io.StringIO()
+	configure_logging(level="INFO", log_format="text", stream=stream)
+	configure_logging(level="INFO", log_format="text", stream=stream)
+
+	# 재설정해도 QueueHandler 는 하나만 설치
+	assert len([h for h in logging.getLogger().handlers if isinstance(h, QueueHandler)]) == 1
+
+	logging.getLogger("test.queue").info("큐 로그 %s", "확인")
+	shutdown_logging()
+
+	assert "test.queue - INFO - 큐 로그 확인" in stream.getvalue()
+	assert not [h for h in logging.getLogger().handlers if isinstance(h, QueueHandler)]
+
+def test_configure_logging_json_format_includes_extra_fields(restore_root_level):
+	stream = io.StringIO()
+	configure_logging(level="INFO", log_format="json", stream=stream)
+
+	logging.getLogger("test.json").info("요청 완료", extra={"talent_id": "t-1", "duration_ms": 12})
+	shutdown_logging()
+
+	entry = json.loads(stream.getvalue().strip().splitlines()[-1])
+	assert entry["logger"] == "test.json"
+	assert entry["message"] == "요청 완료"
+	assert entry["talent_id"] == "t-1"
+	assert entry["duration_ms"] == 12
+
+
+# log_payload 테스트
+def test_log_payload_skipped_at_info_without_sampling(mocker, caplog, payload_logger):
+	mocker.patch.object(settings, "LOG_PAYLOAD_SAMPLE_RATE", 0.0)
+	payload = mocker.MagicMock()
+
+	with caplog.at_level(logging.INFO, logger="test.payload"):
+		log_payload(payload_logger, "프롬프트", payload)
+
+	assert caplog.records == []
+	# 기록하지 않으면 문자열 변환도 하지 않음
+	payload.__str__.assert_not_called()
+
+def test_log_payload_sampled_and_truncated(mocker, caplog, payload_logger):
+	mocker.patch.object(settings, "LOG_PAYLOAD_SAMPLE_RATE", 1.0)
+	mocker.patch.object(settings, "LOG_PAYLOAD_MAX_CHARS", 10)
+
+	with caplog.at_level(logging.INFO, logger="test.payload"):
+		log_payload(payload_logger, "프롬프트", "가" * 30)
+
+	record = caplog.records[0]
+	assert record.levelno == logging.INFO
+	assert record.getMessage() == "프롬프트 : " + "가" * 10 + "..."
+	assert record.payload_chars == 30
+
+def test_log_payload_always_logged_at_debug(mocker, caplog, payload_logger):
+	mocker.patch.object(settings, "LOG_PAYLOAD_SAMPLE_RATE", 0.0)
+	payload_logger.setLevel(logging.DEBUG)
+
+	with caplog.at_level(logging.DEBUG, logger="test.payload"):
+		log_payload(payload_logger, "LLM 응답", "응답 본문")
+
+	assert [record.levelno for record in caplog.records] == [logging.DEBUG]
+
+def test_log_payload_sampled_once_per_request(mocker, caplog, payload_logger):
+	mocker.patch.object(settings, "LOG_PAYLOAD_SAMPLE_RATE", 0.5)
+	draw = mocker.patch("app.core.logging_config.random.random", side_effect=[0.1, 0.9])
+
+	with caplog.at_level(logging.INFO, logger="test.payload"):
+		# 샘플링된 요청은 프롬프트와 응답을 모두 기록
+		with sample_request_payloads() as sampled:
+			log_payload(payload_logger, "프롬프트", "프롬프트 본문")
+			log_payload(payload_logger, "LLM 응답", "응답 본문")
+		assert sampled
+		# 샘플링되지 않은 요청은 모두 생략
+		with sample_request_payloads():
+			log_payload(payload_logger, "프롬프트", "프롬프트 본문")
+			log_payload(payload_logger, "LLM 응답", "응답 본문")
+
+	assert [record.payload_label for record in caplog.records] == ["프롬프트", "LLM 응답"]
+	assert draw.call_count == 2
@@ -0,0 +1,109 @@
+import asyncio
+import sys
+import pytest
+from unittest.mock import MagicMock
+from prometheus_client import REGISTRY, generate_latest
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.metrics import (
+	track_stage,
+	collect_stage_timings,
+	format_server_timing,
+	record_llm_usage,
+	record_cache_lookup,
+	render_metrics,
+)
+
+
+def sample(name: str, labels: dict) -> float:
+	return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+# Fixtures
+@pytest.fixture(autouse=True)
+def reset_tracer(mocker):
+	mocker.patch.object(metrics, "_tracer", None)
+	mocker.patch.object(metrics, "_tracer_checked", False)
+
+
+# track_stage 테스트
+def test_track_stage_records_duration_even_on_error():
+	before = sample("inference_stage_duration_seconds_count", {"stage": "test_stage"})
+
+	with track_stage("test_stage"):
+		pass
+	with pytest.raises(ValueError):
+		with track_stage("test_stage"):
+			raise ValueError("실패")
+
+	assert sample("inference_stage_duration_seconds_count", {"stage": "test_stage"}) == before + 2
+
+def test_track_stage_creates_otel_span_when_enabled(mocker):
+	mocker.patch.object(settings, "OTEL_ENABLED", True)
+	tracer = MagicMock()
+	trace_module = MagicMock()
+	trace_module.get_tracer.return_value = tracer
+	mocker.patch.dict(sys.modules, {"opentelemetry": MagicMock(trace=trace_module), "opentelemetry.trace": trace_module})
+
+	with track_stage("llm"):
+		pass
+
+	tracer.start_as_current_span.assert_called_once_with("inference.llm")
+
+def test_track_stage_without_opentelemetry_installed(mocker):
+	mocker.patch.object(settings, "OTEL_ENABLED", True)
+	mocker.patch.dict(sys.modules, {"opentelemetry": None})
+
+	with track_stage("llm"):
+		pass
+
+	assert metrics._tracer is None
+
+
+# 요청 별 단계 소요 시간 수집 테스트
+@pytest.mark.asyncio
+async def test_collect_stage_timings_includes_gathered_tasks():
+	async def retrieve(stage: str):
+		with track_stage(stage):
+			await asyncio.sleep(0.01)
+
+	with collect_stage_timings() as timings:
+		await asyncio.gather(retrieve("retrieve_company"), retrieve("retrieve_news"))
+		await retrieve("retrieve_news")
+
+	assert set(timings) == {"retrieve_company", "retrieve_news"}
+	assert timings["retrieve_news"] >= 0.02
+
+	# 블록 밖에서는 수집하지 않음
+	company_before = timings["retrieve_company"]
+	with track_stage("retrieve_company"):
+		pass
+	assert timings["retrieve_company"] == company_before
+
+def test_format_server_timing():
+	assert format_server_timing({"llm": 0.8123, "total": 0.84}) == "llm;dur=812.3, total;dur=840.0"
+
+
+# 토큰, 캐시 지표 테스트
+def test_record_llm_usage_and_cache_lookup():
+	prompt_before = sample("llm_tokens_total", {"model": "gpt-test", "kind": "prompt"})
+	completion_before = sample("llm_tokens_total", {"model": "gpt-test", "kind": "completion"})
+	hit_before = sample("cache_requests_total", {"cache": "test", "result": "hit"})
+
+	record_llm_usage("gpt-test", MagicMock(usage_metadata={"input_tokens": 120, "output_tokens": 30, "total_tokens": 150}))
+	record_llm_usage("gpt-test", MagicMock(usage_metadata=None))
+	record_cache_lookup("test", hit=True)
+
+	assert sample("llm_tokens_total", {"model": "gpt-test", "kind": "prompt"}) == prompt_before + 120
+	assert sample("llm_tokens_total", {"model": "gpt-test", "kind": "completion"}) == completion_before + 30
+	assert sample("cache_requests_total", {"cache": "test", "result": "hit"}) == hit_before + 1
+	assert b"llm_tokens_total" in render_metrics()
+
+def test_render_metrics_multiprocess_mode(monkeypatch, tmp_path):
+	# 멀티 워커 모드에서는 워커 지표 파일(PROMETHEUS_MULTIPROC_DIR)만 합산
+	monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+	output = render_metrics()
+
+	assert b"python_gc" not in output
+	assert b"python_gc" in generate_latest(REGISTRY)
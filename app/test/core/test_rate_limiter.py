@@ -0,0 +1,133 @@
+import asyncio
+import pytest
+
+from app.core.rate_limiter import (
+	TokenBucket,
+	RateLimiter,
+	PostgresBucketStore,
+	RateLimitTimeoutError,
+	estimate_tokens,
+)
+
+
+class FakeClock:
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self) -> float:
+		return self.now
+
+
+# estimate_tokens 테스트
+def test_estimate_tokens():
+	assert estimate_tokens("abcdefgh") == 2
+	assert estimate_tokens("네이버 재직") == 5
+	assert estimate_tokens("", completion_tokens=500) == 500
+
+
+# TokenBucket 테스트
+def test_token_bucket_refill_and_wait_time():
+	clock = FakeClock()
+	bucket = TokenBucket(capacity=60, refill_rate=1, clock=clock)
+
+	assert bucket.wait_time(60) == 0
+	bucket.consume(60)
+	assert bucket.wait_time(10) == 10
+
+	clock.now = 4
+	assert bucket.tokens == 4
+	# capacity 를 넘는 요청은 가득 찰 때까지만 대기
+	assert bucket.wait_time(1000) == 56
+
+	clock.now = 1000
+	assert bucket.tokens == 60
+
+def test_token_bucket_refund_capped_at_capacity():
+	bucket = TokenBucket(capacity=10, refill_rate=1, clock=FakeClock())
+	bucket.consume(4)
+	bucket.refund(100)
+	assert bucket.tokens == 10
+
+
+# RateLimiter 테스트
+@pytest.mark.asyncio
+async def test_rate_limiter_disabled_does_not_wait():
+	limiter = RateLimiter("test")
+	assert not limiter.enabled
+	assert await limiter.acquire(tokens=10_000) == 0.0
+	assert limiter.acquired == 0
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits_for_tokens():
+	# 분당 6000 토큰 = 초당 100 토큰
+	limiter = RateLimiter("test", tokens_per_minute=6000, max_queue_time=1.0)
+
+	assert await limiter.acquire(tokens=6000) < 0.05
+	waited = await limiter.acquire(tokens=10)
+
+	assert 0.05 <= waited < 0.5
+	assert limiter.snapshot()["acquired"] == 2
+
+@pytest.mark.asyncio
+async def test_rate_limiter_serves_waiters_in_arrival_order():
+	limiter = RateLimiter("test", requests_per_minute=1200, max_queue_time=2.0)
+	await limiter.acquire()
+	limiter._store._buckets["test:rpm"].consume(1199)
+
+	order = []
+
+	async def request(i: int):
+		await limiter.acquire()
+		order.append(i)
+
+	tasks = []
+	for i in range(5):
+		tasks.append(asyncio.create_task(request(i)))
+		await asyncio.sleep(0)
+	assert limiter.queue_depth == 5
+
+	await asyncio.gather(*tasks)
+
+	assert order == [0, 1, 2, 3, 4]
+	assert limiter.max_queue_depth == 5
+	assert limiter.queue_depth == 0
+
+@pytest.mark.asyncio
+async def test_rate_limiter_rejects_when_wait_exceeds_max_queue_time():
+	limiter = RateLimiter("test", requests_per_minute=60, max_queue_time=0.2)
+	await limiter.acquire()
+	limiter._store._buckets["test:rpm"].consume(59)
+
+	with pytest.raises(RateLimitTimeoutError) as exc_info:
+		await limiter.acquire()
+
+	# 기다려도 시간 안에 확보할 수 없으면 바로 거부
+	assert exc_info.value.retry_after == pytest.approx(1.0, abs=0.05)
+	assert limiter.rejected == 1
+	assert limiter.queue_depth == 0
+
+@pytest.mark.asyncio
+async def test_rate_limiter_reconcile_refunds_overestimate():
+	limiter = RateLimiter("test", tokens_per_minute=600, max_queue_time=0.1)
+	await limiter.acquire(tokens=600)
+
+	await limiter.reconcile(estimated_tokens=600, actual_tokens=100)
+
+	assert await limiter.acquire(tokens=400) < 0.05
+
+
+# PostgresBucketStore 테스트 (워커 간 공유)
+@pytest.mark.asyncio
+async def test_postgres_bucket_store_shared_between_workers(postgres_pool, pool_factory):
+	# 서로 다른 워커의 리미터가 같은 버킷을 사용
+	worker_a = RateLimiter("shared", requests_per_minute=2, max_queue_time=0.1, store=PostgresBucketStore(pool_factory))
+	worker_b = RateLimiter("shared", requests_per_minute=2, max_queue_time=0.1, store=PostgresBucketStore(pool_factory))
+
+	await worker_a.acquire()
+	await worker_b.acquire()
+	with pytest.raises(RateLimitTimeoutError) as exc_info:
+		await worker_a.acquire()
+
+	assert exc_info.value.retry_after == pytest.approx(30, abs=1)
+	tokens = await postgres_pool.fetchval("SELECT tokens FROM rate_limit_buckets WHERE name = 'shared:rpm'")
+	assert tokens == pytest.approx(0, abs=0.1)
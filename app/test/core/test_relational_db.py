@@ -0,0 +1,181 @@
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core import relational_db
+from app.core.config import get_settings
+from app.core.relational_db import (
+	to_asyncpg_dsn,
+	get_relational_pool,
+	close_relational_pool,
+	fetch_company_facts,
+	fetch_company_news,
+	fetch_company_tenure_context,
+	fetch_company_tenure_contexts,
+	COMPANY_FACTS_SQL,
+	COMPANY_NEWS_SQL,
+	COMPANY_TENURE_SQL,
+)
+from app.core.shared_cache import SharedCache, CACHE_COMPANY_CONTEXT
+from app.schemas.company import CompanyFacts, CompanyNewsItem, CompanyTenureContext
+
+
+# Fixtures
+@pytest.fixture
+def mock_pool(mocker):
+	pool = MagicMock()
+	pool.fetchrow = AsyncMock()
+	pool.fetch = AsyncMock()
+	mocker.patch('app.core.relational_db.get_relational_pool', new_callable=AsyncMock, return_value=pool)
+	return pool
+
+@pytest.fixture
+def company_row() -> dict:
+	return {
+		"id": 3,
+		"name": "야놀자",
+		"seed_corp": {"corpStockCdKr": "비상장", "listingDate": None},
+		"organization": [{"value": 1200, "referenceMonth": "2024-12"}],
+		"investment": [{"level": "M&A", "investAt": "2021-08-13"}],
+		"news": [{"title": "요기요 매각", "original_link": "https://news", "news_date": "2021-08-13"}],
+	}
+
+
+# to_asyncpg_dsn 테스트
+def test_to_asyncpg_dsn_strips_driver():
+	assert to_asyncpg_dsn("postgresql+psycopg2://u:p@localhost:5432/db") == "postgresql://u:p@localhost:5432/db"
+	assert to_asyncpg_dsn("postgresql://u:p@localhost/db") == "postgresql://u:p@localhost/db"
+
+
+# get_relational_pool 테스트
+@pytest.mark.asyncio
+async def test_get_relational_pool_created_once(mocker):
+	mocker.patch('app.core.relational_db._relational_pool', None)
+	mock_pool_obj = MagicMock()
+	mock_pool_obj.close = AsyncMock()
+	mock_create_pool = mocker.patch('app.core.relational_db.asyncpg.create_pool', new_callable=AsyncMock, return_value=mock_pool_obj)
+
+	pool1 = await get_relational_pool()
+	pool2 = await get_relational_pool()
+
+	assert pool1 is mock_pool_obj
+	assert pool2 is mock_pool_obj
+	mock_create_pool.assert_called_once()
+
+	await close_relational_pool()
+	mock_pool_obj.close.assert_called_once()
+	assert relational_db._relational_pool is None
+
+
+# fetch 함수 테스트
+@pytest.mark.asyncio
+async def test_fetch_company_facts_found(mock_pool, company_row: dict):
+	mock_pool.fetchrow.return_value = company_row
+
+	facts = await fetch_company_facts("야놀자")
+
+	mock_pool.fetchrow.assert_called_once_with(COMPANY_FACTS_SQL, "야놀자")
+	assert isinstance(facts, CompanyFacts)
+	assert facts.company_id == 3
+	assert facts.organization[0]["value"] == 1200
+
+@pytest.mark.asyncio
+async def test_fetch_company_facts_not_found(mock_pool):
+	mock_pool.fetchrow.return_value = None
+	assert await fetch_company_facts("없는회사") is None
+
+@pytest.mark.asyncio
+async def test_fetch_company_news_open_range_uses_date_bounds(mock_pool):
+	mock_pool.fetch.return_value = [{"title": "뉴스", "original_link": None, "news_date": date(2024, 1, 1)}]
+
+	news = await fetch_company_news(3, start_date=date(2023, 1, 1), limit=5)
+
+	mock_pool.fetch.assert_called_once_with(COMPANY_NEWS_SQL, 3, date(2023, 1, 1), date.max, 5)
+	assert news == [CompanyNewsItem(title="뉴스", original_link=None, news_date=date(2024, 1, 1))]
+
+@pytest.mark.asyncio
+async def test_fetch_company_tenure_context(mock_pool, company_row: dict):
+	mock_pool.fetchrow.return_value = company_row
+
+	context = await fetch_company_tenure_context("야놀자", date(2020, 1, 1), date(2022, 12, 31), limit=3)
+
+	mock_pool.fetchrow.assert_called_once_with(COMPANY_TENURE_SQL, "야놀자", date(2020, 1, 1), date(2022, 12, 31), 3)
+	assert isinstance(context, CompanyTenureContext)
+	assert context.news[0].news_date == date(2021, 8, 13)
+	assert context.facts.investment[0]["level"] == "M&A"
+	assert context.news_complete is True
+
+	# 조회 한도만큼 뉴스가 있으면 이전 뉴스가 잘렸을 수 있음
+	context = await fetch_company_tenure_context("야놀자", date(2020, 1, 1), date(2022, 12, 31), limit=1)
+	assert context.news_complete is False
+
+@pytest.mark.asyncio
+async def test_fetch_company_tenure_contexts_dedup_and_skip_errors(mocker, company_row: dict):
+	context = CompanyTenureContext(
+		company_name="야놀자",
+		facts=CompanyFacts(company_id=3, name="야놀자"),
+	)
+	mock_fetch = mocker.patch(
+		'app.core.relational_db.fetch_company_tenure_context',
+		new_callable=AsyncMock,
+		side_effect=[context, Exception("DB 오류"), None],
+	)
+
+	results = await fetch_company_tenure_contexts([
+		("야놀자", None, None),
+		("야놀자", None, None),
+		("네이버", date(2020, 1, 1), None),
+		("없는회사", None, None),
+	])
+
+	assert mock_fetch.call_count == 3
+	assert results == [context]
+
+
+@pytest.mark.asyncio
+async def test_fetch_company_tenure_contexts_uses_shared_cache(mocker):
+	context = CompanyTenureContext(
+		company_name="야놀자",
+		start_date=date(2020, 1, 1),
+		facts=CompanyFacts(company_id=3, name="야놀자"),
+		news=[CompanyNewsItem(title="요기요 매각", news_date=date(2021, 8, 13))],
+	)
+	mocker.patch('app.core.relational_db.get_shared_cache', return_value=SharedCache(CACHE_COMPANY_CONTEXT, ttl=60))
+	mock_fetch = mocker.patch(
+		'app.core.relational_db.fetch_company_tenure_context',
+		new_callable=AsyncMock,
+		side_effect=[context, None, Exception("DB 오류")],
+	)
+	tenures = [("야놀자", date(2020, 1, 1), None), ("없는회사", None, None), ("네이버", None, None)]
+
+	first = await fetch_company_tenure_contexts(tenures)
+	mock_fetch.side_effect = [None]
+	second = await fetch_company_tenure_contexts(tenures)
+
+	assert first == second == [context]
+	# DB에 없는 회사 결과는 캐시하고, 오류가 난 조회만 다시 시도
+	assert mock_fetch.call_count == 4
+	mock_fetch.assert_called_with("네이버", None, None)
+
+
+# 실제 DB 통합 테스트 (setup_* 스크립트로 적재된 데이터 필요)
+@pytest.mark.asyncio
+async def test_fetch_company_tenure_context_integration(mocker, test_database_url: str):
+	mocker.patch('app.core.relational_db._relational_pool', None)
+	mocker.patch.object(get_settings(), "DATABASE_URL", test_database_url)
+	try:
+		pool = await get_relational_pool()
+		if await pool.fetchval("SELECT to_regclass('company_news') IS NULL"):
+			pytest.skip("company_news 테이블이 없습니다.")
+		company_name = await pool.fetchval("SELECT name FROM company ORDER BY id LIMIT 1")
+		if company_name is None:
+			pytest.skip("company 테이블이 비어있습니다.")
+
+		context = await fetch_company_tenure_context(company_name, date(2000, 1, 1), None, limit=5)
+
+		assert context is not None
+		assert context.company_name == company_name
+		assert len(context.news) <= 5
+		assert [n.news_date for n in context.news] == sorted((n.news_date for n in context.news), reverse=True)
+	finally:
+		await close_relational_pool()
@@ -0,0 +1,75 @@
+import json
+import logging
+import pytest
+
+from app.core.config import settings
+from app.core.request_recorder import record_request, close_request_recorder
+from app.schemas.inference import TalentDataInput
+
+
+# Fixtures
+@pytest.fixture
+def record_path(tmp_path, mocker):
+	path = tmp_path / "records.jsonl"
+	mocker.patch.object(settings, "REQUEST_RECORD_PATH", str(path))
+	yield path
+	close_request_recorder()
+
+@pytest.fixture
+def talent_data() -> TalentDataInput:
+	return TalentDataInput(
+		firstName="길동",
+		lastName="홍",
+		linkedinUrl="https://linkedin.example/hong",
+		positions=[{"title": "CTO", "companyName": "엘박스"}],
+	)
+
+
+# record_request 테스트
+def test_record_request_writes_jsonl_without_personal_fields(record_path, talent_data, mocker):
+	mocker.patch.object(settings, "REQUEST_RECORD_SAMPLE_RATE", 1.0)
+
+	record_request(talent_data, ["대규모 회사 경험"], 0.8123, "ok")
+	record_request(talent_data, None, 0.05, "LLMTimeoutError")
+	close_request_recorder()
+
+	records = [json.loads(line) for line in record_path.read_text(encoding="utf-8").splitlines()]
+	assert [record["outcome"] for record in records] == ["ok", "LLMTimeoutError"]
+	assert records[0]["output"] == ["대규모 회사 경험"]
+	assert records[0]["latency_ms"] == 812.3
+	assert records[0]["payload"] == {"positions": [{"title": "CTO", "companyName": "엘박스"}]}
+	assert records[0]["request_id"] != records[1]["request_id"]
+
+def test_record_request_timestamp_is_arrival_time(record_path, talent_data, mocker):
+	mocker.patch.object(settings, "REQUEST_RECORD_SAMPLE_RATE", 1.0)
+	mocker.patch("app.core.request_recorder.time.time", return_value=1000.0)
+
+	record_request(talent_data, ["대규모 회사 경험"], 2.5, "ok")
+	close_request_recorder()
+
+	# 완료 시각이 아니라 도착 시각 (benchmarks/replay.py 의 재생 간격 기준)
+	assert json.loads(record_path.read_text(encoding="utf-8"))["timestamp"] == 997.5
+
+def test_record_request_unwritable_path_does_not_raise(tmp_path, talent_data, mocker, caplog):
+	mocker.patch.object(settings, "REQUEST_RECORD_PATH", str(tmp_path / "missing" / "records.jsonl"))
+	mocker.patch.object(settings, "REQUEST_RECORD_SAMPLE_RATE", 1.0)
+	file_handler = mocker.spy(logging, "FileHandler")
+
+	with caplog.at_level(logging.ERROR, logger="app.core.request_recorder"):
+		record_request(talent_data, ["대규모 회사 경험"], 0.1, "ok")
+		record_request(talent_data, ["대규모 회사 경험"], 0.1, "ok")
+
+	# 파일을 열지 못하면 한 번만 로그를 남기고 이후 요청은 기록하지 않음
+	assert file_handler.call_count == 1
+	assert len(caplog.records) == 1
+	close_request_recorder()
+
+def test_record_request_skips_unsampled_requests(record_path, talent_data, mocker):
+	mocker.patch.object(settings, "REQUEST_RECORD_SAMPLE_RATE", 0.0)
+	dump = mocker.spy(TalentDataInput, "model_dump")
+
+	record_request(talent_data, ["대규모 회사 경험"], 0.1, "ok")
+	close_request_recorder()
+
+	assert not record_path.exists()
+	dump.assert_not_called()
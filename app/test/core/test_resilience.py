@@ -0,0 +1,107 @@
+import asyncio
+import pytest
+
+from app.core.resilience import CircuitBreaker, LatencyTracker, hedged_call, jittered_backoff
+
+
+class FakeClock:
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self) -> float:
+		return self.now
+
+
+# CircuitBreaker 테스트
+def test_circuit_breaker_opens_after_threshold_and_recovers():
+	clock = FakeClock()
+	breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock)
+
+	breaker.record_failure()
+	assert breaker.allow_request()
+	breaker.record_failure()
+
+	assert breaker.state == CircuitBreaker.OPEN
+	assert not breaker.allow_request()
+	assert breaker.retry_after() == 10
+
+	clock.now = 10
+	assert breaker.state == CircuitBreaker.HALF_OPEN
+	# half_open 상태에서는 시험 호출 1건만 허용
+	assert breaker.allow_request()
+	assert not breaker.allow_request()
+
+	breaker.record_success()
+	assert breaker.state == CircuitBreaker.CLOSED
+	assert breaker.allow_request()
+
+def test_circuit_breaker_half_open_failure_reopens():
+	clock = FakeClock()
+	breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+	breaker.record_failure()
+
+	clock.now = 5
+	assert breaker.allow_request()
+	breaker.record_failure()
+
+	assert breaker.state == CircuitBreaker.OPEN
+	assert breaker.retry_after() == 5
+
+
+# LatencyTracker 테스트
+def test_latency_tracker_percentile():
+	tracker = LatencyTracker(window=100)
+	assert tracker.percentile(95) is None
+
+	for value in range(1, 101):
+		tracker.record(value / 100)
+
+	assert len(tracker) == 100
+	assert tracker.percentile(50) == 0.5
+	assert tracker.percentile(95) == 0.95
+	assert tracker.percentile(100) == 1.0
+
+
+# jittered_backoff 테스트
+def test_jittered_backoff_bounds():
+	for attempt in range(6):
+		delay = jittered_backoff(attempt, base_delay=0.5, max_delay=4.0)
+		assert 0 <= delay <= min(4.0, 0.5 * 2 ** attempt)
+
+
+# hedged_call 테스트
+@pytest.mark.asyncio
+async def test_hedged_call_returns_first_success():
+	delays = [1.0, 0.0]
+	hedges = []
+
+	async def call():
+		delay = delays.pop(0)
+		await asyncio.sleep(delay)
+		return delay
+
+	result = await asyncio.wait_for(hedged_call(call, hedge_delay=0.05, on_hedge=lambda: hedges.append(1)), timeout=0.5)
+
+	assert result == 0.0
+	assert hedges == [1]
+
+@pytest.mark.asyncio
+async def test_hedged_call_without_delay_sends_single_request():
+	calls = []
+
+	async def call():
+		calls.append(1)
+		return "ok"
+
+	assert await hedged_call(call, hedge_delay=None) == "ok"
+	assert calls == [1]
+
+@pytest.mark.asyncio
+async def test_hedged_call_falls_back_when_one_fails():
+	async def failing():
+		await asyncio.sleep(0.1)
+		raise RuntimeError("실패")
+
+	results = iter([failing, lambda: asyncio.sleep(0.2, result="hedge")])
+
+	assert await hedged_call(lambda: next(results)(), hedge_delay=0.05) == "hedge"
@@ -0,0 +1,146 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.config import get_settings
+from app.core.shared_cache import (
+	LocalCacheStore,
+	PostgresCacheStore,
+	SharedCache,
+	get_shared_cache,
+	reset_shared_caches,
+	CACHE_INFERENCE,
+	CACHE_EMBEDDING,
+)
+
+
+class FakeClock:
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self) -> float:
+		return self.now
+
+
+# LocalCacheStore 테스트
+def test_local_cache_store_expires_entries():
+	clock = FakeClock()
+	store = LocalCacheStore(clock=clock)
+	store.set_many({"a": b"1"}, ttl=10)
+
+	clock.now = 9
+	assert store.get_many(["a", "b"]) == {"a": b"1"}
+
+	clock.now = 10
+	assert store.get_many(["a"]) == {}
+	assert len(store) == 0
+
+def test_local_cache_store_evicts_least_recently_used():
+	store = LocalCacheStore(max_entries=2)
+	store.set_many({"a": b"1", "b": b"2"}, ttl=60)
+
+	# a 를 최근 사용으로 갱신 후 c 추가 시 b 제거
+	store.get_many(["a"])
+	store.set_many({"c": b"3"}, ttl=60)
+
+	assert store.get_many(["a", "b", "c"]) == {"a": b"1", "c": b"3"}
+
+
+# SharedCache 테스트
+@pytest.fixture
+def remote_store():
+	store = MagicMock()
+	store.get_many = AsyncMock(return_value={})
+	store.set_many = AsyncMock()
+	return store
+
+@pytest.mark.asyncio
+async def test_shared_cache_disabled_when_ttl_zero(remote_store):
+	cache = SharedCache(CACHE_INFERENCE, ttl=0, remote=remote_store)
+	await cache.set("key", ["태그"])
+
+	assert not cache.enabled
+	assert await cache.get("key") is None
+	remote_store.set_many.assert_not_called()
+	remote_store.get_many.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_shared_cache_round_trip_and_writes_remote(remote_store):
+	cache = SharedCache(CACHE_INFERENCE, ttl=60, remote=remote_store)
+	await cache.set("key", ["리더십 (CTO)"])
+
+	assert await cache.get("key") == ["리더십 (CTO)"]
+	remote_store.set_many.assert_awaited_once_with(CACHE_INFERENCE, {"key": "[\"리더십 (CTO)\"]".encode()}, 60)
+	# L1 hit 이면 공유 저장소를 조회하지 않음
+	remote_store.get_many.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_shared_cache_fills_local_from_remote(remote_store):
+	clock = FakeClock()
+	remote_store.get_many.return_value = {"b": (15.0, b"2")}
+	cache = SharedCache(CACHE_INFERENCE, ttl=60, local=LocalCacheStore(clock=clock), remote=remote_store)
+	cache.local.set_many({"a": b"1"}, ttl=60)
+
+	assert await cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+	remote_store.get_many.assert_awaited_once_with(CACHE_INFERENCE, ["b", "c"])
+	# 다른 워커가 저장한 값은 L2 의 남은 TTL 동안 L1 에도 저장
+	clock.now = 14
+	assert cache.local.get_many(["a", "b"]) == {"a": b"1", "b": b"2"}
+	clock.now = 15
+	assert cache.local.get_many(["a", "b"]) == {"a": b"1"}
+
+@pytest.mark.asyncio
+async def test_shared_cache_remote_errors_are_misses(remote_store):
+	remote_store.get_many.side_effect = OSError("connection refused")
+	remote_store.set_many.side_effect = OSError("connection refused")
+	cache = SharedCache(CACHE_INFERENCE, ttl=60, remote=remote_store)
+
+	assert await cache.get("key") is None
+	await cache.set("key", 1)
+	assert await cache.get("key") == 1
+
+def test_get_shared_cache_uses_settings(mocker):
+	settings = get_settings().model_copy(update={"EMBEDDING_CACHE_TTL": 3600.0, "CACHE_BACKEND": "postgres"})
+	mocker.patch('app.core.shared_cache.get_settings', return_value=settings)
+	reset_shared_caches()
+	try:
+		embedding_cache = get_shared_cache(CACHE_EMBEDDING)
+		inference_cache = get_shared_cache(CACHE_INFERENCE)
+
+		assert embedding_cache is get_shared_cache(CACHE_EMBEDDING)
+		assert embedding_cache.ttl == 3600.0
+		assert not inference_cache.enabled
+		# 워커 내 캐시들은 같은 공유 저장소 사용
+		assert isinstance(embedding_cache.remote, PostgresCacheStore)
+		assert embedding_cache.remote is inference_cache.remote
+	finally:
+		reset_shared_caches()
+
+
+# PostgresCacheStore 테스트 (워커 간 공유)
+@pytest.mark.asyncio
+async def test_postgres_cache_store_shared_between_workers(postgres_pool, pool_factory):
+	# 서로 다른 워커의 캐시가 같은 테이블을 사용
+	worker_a = SharedCache(CACHE_INFERENCE, ttl=60, remote=PostgresCacheStore(pool_factory))
+	worker_b = SharedCache(CACHE_INFERENCE, ttl=60, remote=PostgresCacheStore(pool_factory))
+
+	await worker_a.set_many({"a": ["태그 A"], "b": None})
+	assert await worker_b.get_many(["a", "b", "c"]) == {"a": ["태그 A"], "b": None}
+
+	# 덮어쓰기
+	await worker_b.set("a", ["태그 B"])
+	worker_a.local = LocalCacheStore()
+	assert await worker_a.get("a") == ["태그 B"]
+
+@pytest.mark.asyncio
+async def test_postgres_cache_store_skips_expired_rows(postgres_pool, pool_factory):
+	store = PostgresCacheStore(pool_factory)
+	await store.set_many(CACHE_EMBEDDING, {"old": b"1", "new": b"2"}, ttl=60)
+	await postgres_pool.execute("UPDATE shared_cache SET expires_at = now() - interval '1 second' WHERE key = 'old'")
+
+	found = await store.get_many(CACHE_EMBEDDING, ["old", "new"])
+	assert list(found) == ["new"]
+	remaining_ttl, value = found["new"]
+	assert value == b"2"
+	assert 0 < remaining_ttl <= 60
+	# 이름(namespace)이 다르면 다른 항목
+	assert await store.get_many(CACHE_INFERENCE, ["new"]) == {}
@@ -0,0 +1,74 @@
+import pytest
+
+from app.core.config import settings
+from app.core.static_data import (
+	normalize_university_name,
+	get_university_rank_index,
+	find_university_rank,
+	get_tag_order_index,
+	get_normalized_tag_index,
+	preload_static_indexes,
+	DESIRED_TAG_ORDER,
+)
+
+
+@pytest.fixture
+def university_csv(tmp_path, mocker):
+	csv_path = tmp_path / "university_rank.csv"
+	csv_path.write_text(
+		'"name","rank","score","original_link","year","month","day"\n'
+		"서울대,1,220,https://rank,2024,11,19\n"
+		"한양대,5,203,https://rank,2024,11,19\n"
+		"한양대,16,144,https://rank,2024,11,19\n"
+		",3,100,https://rank,2024,11,19\n",
+		encoding="utf-8",
+	)
+	mocker.patch.object(settings, "UNIVERSITY_RANK_CSV_PATH", str(csv_path))
+	get_university_rank_index.cache_clear()
+	yield csv_path
+	get_university_rank_index.cache_clear()
+
+
+def test_normalize_university_name():
+	assert normalize_university_name("서울대학교") == "서울대"
+	assert normalize_university_name(" 서울 대 ") == "서울대"
+	assert normalize_university_name("KAIST") == "KAIST"
+
+def test_university_rank_index_keeps_best_rank(university_csv):
+	index = get_university_rank_index()
+	assert len(index) == 2
+	assert index["한양대"].rank == 5
+
+def test_university_rank_index_missing_file_is_not_cached(university_csv):
+	csv_text = university_csv.read_text(encoding="utf-8")
+	university_csv.unlink()
+
+	# 실패를 빈 인덱스로 캐시하지 않고 예외 전달 (warm-up 이 실패로 보고 재시도)
+	with pytest.raises(FileNotFoundError):
+		preload_static_indexes()
+
+	university_csv.write_text(csv_text, encoding="utf-8")
+	assert preload_static_indexes()["university_ranks"] == 2
+
+def test_find_university_rank(university_csv):
+	assert find_university_rank("서울대학교").rank == 1
+	assert find_university_rank("없는대학교") is None
+	assert find_university_rank(None) is None
+
+def test_university_rank_index_missing_file(mocker):
+	mocker.patch.object(settings, "UNIVERSITY_RANK_CSV_PATH", "/not/exists.csv")
+	get_university_rank_index.cache_clear()
+	with pytest.raises(FileNotFoundError):
+		get_university_rank_index()
+	get_university_rank_index.cache_clear()
+
+def test_default_university_rank_csv_loads():
+	get_university_rank_index.cache_clear()
+	assert find_university_rank("서울대학교").rank == 1
+
+def test_tag_tables():
+	order = get_tag_order_index()
+	assert order["상위권 대학교"] == 0
+	assert len(order) == len(DESIRED_TAG_ORDER)
+	assert get_normalized_tag_index()["m&a경험"] == "M&A 경험"
+	assert set(preload_static_indexes()) == {"university_ranks", "tag_order", "normalized_tags"}
@@ -10,9 +10,17 @@ from app.core.vector_db import (
     get_news_retriever,
     get_university_retriever,
     retrieve_documents_from_sources,
+    get_embeddings_model,
+    embed_query,
+    _pack_embedding,
+    _unpack_embedding,
+    reset_news_circuit_breaker,
     #상수
-    COLLECTION_NAME_COMPANY, COLLECTION_NAME_NEWS, COLLECTION_NAME_UNIVERSITY, embeddings_model
+    COLLECTION_NAME_COMPANY, COLLECTION_NAME_NEWS, COLLECTION_NAME_UNIVERSITY, EMBEDDING_MODEL_NAME
 )
+import asyncio
+from app.core.shared_cache import SharedCache, CACHE_EMBEDDING
+from app.core.degradation import collect_degradations, DEGRADED_NEWS_SKIPPED, DEGRADED_RETRIEVAL_FAILED
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 from langchain_community.vectorstores import PGVector
@@ -22,16 +30,24 @@ from app.core.config import settings
 # Fixtures
 @pytest.fixture
 def mock_pgvector_constructor(mocker):
-    return mocker.patch('app.core.vector_db.PGVector')
+    # PGVector 는 접근 함수 안에서 지연 import 되므로 원본 모듈을 패치
+    return mocker.patch('langchain_community.vectorstores.PGVector')
+
+@pytest.fixture
+def embeddings_model(mocker):
+    mock_embeddings = MagicMock()
+    mocker.patch('app.core.vector_db.get_embeddings_model', return_value=mock_embeddings)
+    return mock_embeddings
 
 @pytest.fixture(autouse=True)
 def reset_vectorstore_instances(mocker):
     mocker.patch('app.core.vector_db._company_vectorstore_instance',None)
     mocker.patch('app.core.vector_db._news_vectorstore_instance',None)
     mocker.patch('app.core.vector_db._university_vectorstore_instance',None)
+    mocker.patch('app.core.vector_db._embeddings_model',None)
 
 # get vectorstore 테스트
-def test_get_company_vectorstore_initialization(mock_pgvector_constructor: MagicMock):
+def test_get_company_vectorstore_initialization(mock_pgvector_constructor: MagicMock, embeddings_model: MagicMock):
     mock_instance = MagicMock(spec=PGVector)
     mock_pgvector_constructor.return_value = mock_instance
 
@@ -48,7 +64,7 @@ def test_get_company_vectorstore_initialization(mock_pgvector_constructor: Magic
     assert vs1 is mock_instance
     assert vs2 is mock_instance
 
-def test_get_news_vectorstore_initialization(mock_pgvector_constructor: MagicMock):
+def test_get_news_vectorstore_initialization(mock_pgvector_constructor: MagicMock, embeddings_model: MagicMock):
     mock_instance = MagicMock(spec=PGVector)
     mock_pgvector_constructor.return_value = mock_instance
 
@@ -65,7 +81,7 @@ def test_get_news_vectorstore_initialization(mock_pgvector_constructor: MagicMoc
     assert vs1 is mock_instance
     assert vs2 is mock_instance
 
-def test_get_university_vectorstore_initialization(mock_pgvector_constructor: MagicMock):
+def test_get_university_vectorstore_initialization(mock_pgvector_constructor: MagicMock, embeddings_model: MagicMock):
     mock_instance = MagicMock(spec=PGVector)
     mock_pgvector_constructor.return_value = mock_instance
 
@@ -83,6 +99,21 @@ def test_get_university_vectorstore_initialization(mock_pgvector_constructor: Ma
     assert vs2 is mock_instance
 
 
+# get_embeddings_model 테스트
+def test_get_embeddings_model_lazy_singleton(mocker):
+    mock_embeddings_constructor = mocker.patch('langchain_openai.OpenAIEmbeddings')
+
+    model1 = get_embeddings_model()
+    model2 = get_embeddings_model()
+
+    mock_embeddings_constructor.assert_called_once_with(
+        openai_api_key=settings.OPENAI_API_KEY,
+        model=EMBEDDING_MODEL_NAME,
+        base_url=settings.OPENAI_BASE_URL,
+    )
+    assert model1 is model2
+
+
 # get retriever 테스트
 def test_get_company_retriever_creation(mocker):
     mock_vectorstore_instance = MagicMock(spec=PGVector)
@@ -123,27 +154,38 @@ def test_get_university_retriever_creation(mocker):
 
 # retrieve_documents_from_sources 테스트
 @pytest.fixture
-def mock_retrievers(mocker):
-    mock_company_ret_obj = AsyncMock(spec=BaseRetriever)
-    mock_news_ret_obj = AsyncMock(spec=BaseRetriever)
-    mock_univeristy_ret_obj = AsyncMock(spec=BaseRetriever)
+def query_embeddings(mocker):
+    # 쿼리 별 고정 임베딩
+    embeddings = {"일반 쿼리": [0.1, 0.2], "대학 쿼리": [0.3, 0.4]}
+    mock_embeddings = MagicMock()
+    mock_embeddings.aembed_query = AsyncMock(side_effect=lambda text: embeddings.get(text, [0.5, 0.6]))
+    mocker.patch('app.core.vector_db.get_embeddings_model', return_value=mock_embeddings)
+    return mock_embeddings
 
-    mocker.patch('app.core.vector_db.get_company_retriever',return_value=mock_company_ret_obj)
-    mocker.patch('app.core.vector_db.get_news_retriever',return_value=mock_news_ret_obj)
-    mocker.patch('app.core.vector_db.get_university_retriever',return_value=mock_univeristy_ret_obj)
+@pytest.fixture
+def mock_vectorstores(mocker, query_embeddings):
+    mock_company_vs = MagicMock()
+    mock_news_vs = MagicMock()
+    mock_university_vs = MagicMock()
+    for vectorstore in (mock_company_vs, mock_news_vs, mock_university_vs):
+        vectorstore.asimilarity_search_by_vector = AsyncMock(return_value=[])
 
-    return mock_company_ret_obj, mock_news_ret_obj, mock_univeristy_ret_obj
+    mocker.patch('app.core.vector_db.get_company_vectorstore', return_value=mock_company_vs)
+    mocker.patch('app.core.vector_db.get_news_vectorstore', return_value=mock_news_vs)
+    mocker.patch('app.core.vector_db.get_university_vectorstore', return_value=mock_university_vs)
+
+    return mock_company_vs, mock_news_vs, mock_university_vs
 
 @pytest.mark.asyncio
-async def test_retrieve_documents_all_success(mock_retrievers: tuple):
-    mock_company_ret, mock_news_ret, mock_university_ret = mock_retrievers
+async def test_retrieve_documents_all_success(mock_vectorstores: tuple, query_embeddings: MagicMock):
+    mock_company_vs, mock_news_vs, mock_university_vs = mock_vectorstores
     doc_company1 = Document(page_content="CompanyDoc1")
     doc_news1 = Document(page_content="NewsDoc1")
     doc_univeristy1 = Document(page_content="UniversityDoc1")
 
-    mock_company_ret.aget_relevant_documents.return_value=[doc_company1]
-    mock_news_ret.aget_relevant_documents.return_value=[doc_news1]
-    mock_university_ret.aget_relevant_documents.return_value=[doc_univeristy1]
+    mock_company_vs.asimilarity_search_by_vector.return_value=[doc_company1]
+    mock_news_vs.asimilarity_search_by_vector.return_value=[doc_news1]
+    mock_university_vs.asimilarity_search_by_vector.return_value=[doc_univeristy1]
 
     #함수 호출
     result_docs = await retrieve_documents_from_sources(
@@ -159,20 +201,20 @@ async def test_retrieve_documents_all_success(mock_retrievers: tuple):
     assert "NewsDoc1" in contents
     assert "UniversityDoc1" in contents
     
-    mock_company_ret.aget_relevant_documents.assert_called_once_with("일반 쿼리")
-    mock_news_ret.aget_relevant_documents.assert_called_once_with("일반 쿼리")
-    mock_university_ret.aget_relevant_documents.assert_called_once_with("대학 쿼리")
+    mock_company_vs.asimilarity_search_by_vector.assert_called_once_with([0.1, 0.2], k=1)
+    mock_news_vs.asimilarity_search_by_vector.assert_called_once_with([0.1, 0.2], k=1)
+    mock_university_vs.asimilarity_search_by_vector.assert_called_once_with([0.3, 0.4], k=1)
+    # 회사, 뉴스 검색은 같은 쿼리 임베딩을 공유
+    assert query_embeddings.aembed_query.await_count == 2
 
 
 @pytest.mark.asyncio
-async def test_retrieve_documents_some_sources_empty(mock_retrievers: tuple):
+async def test_retrieve_documents_some_sources_empty(mock_vectorstores: tuple):
     # 뉴스 및 대학 정보는 검색 결과 없음, 회사 정보만 있을 때
-    mock_company_ret, mock_news_ret, mock_university_ret = mock_retrievers
+    mock_company_vs, mock_news_vs, mock_university_vs = mock_vectorstores
 
     doc_company1 = Document(page_content="CompanyDoc1")
-    mock_company_ret.aget_relevant_documents.return_value = [doc_company1]
-    mock_news_ret.aget_relevant_documents.return_value = []
-    mock_university_ret.aget_relevant_documents.return_value = []
+    mock_company_vs.asimilarity_search_by_vector.return_value = [doc_company1]
 
     # When
     result_docs = await retrieve_documents_from_sources(query="쿼리", university_query="대학쿼리")
@@ -182,13 +224,12 @@ async def test_retrieve_documents_some_sources_empty(mock_retrievers: tuple):
     assert result_docs[0].page_content == "CompanyDoc1"
 
 @pytest.mark.asyncio
-async def test_retrieve_documents_no_university_query(mock_retrievers: tuple):
+async def test_retrieve_documents_no_university_query(mock_vectorstores: tuple, query_embeddings: MagicMock):
     # university_query가 None인 경우 대학 검색을 시도하지 않아야 할 때
-    mock_company_ret, mock_news_ret, mock_university_ret = mock_retrievers
+    mock_company_vs, mock_news_vs, mock_university_vs = mock_vectorstores
 
     doc_company1 = Document(page_content="CompanyDoc1")
-    mock_company_ret.aget_relevant_documents.return_value = [doc_company1]
-    mock_news_ret.aget_relevant_documents.return_value = []
+    mock_company_vs.asimilarity_search_by_vector.return_value = [doc_company1]
 
     # When
     result_docs = await retrieve_documents_from_sources(query="쿼리", university_query=None, top_k_per_source=1, top_k_university=1)
@@ -196,15 +237,16 @@ async def test_retrieve_documents_no_university_query(mock_retrievers: tuple):
     # Then
     assert len(result_docs) == 1
     assert result_docs[0].page_content == "CompanyDoc1"
-    mock_university_ret.assert_not_called()
+    mock_university_vs.asimilarity_search_by_vector.assert_not_called()
+    query_embeddings.aembed_query.assert_awaited_once_with("쿼리")
 
 @pytest.mark.asyncio
-async def test_retrieve_documents_duplicate_content(mock_retrievers: tuple):
+async def test_retrieve_documents_duplicate_content(mock_vectorstores: tuple):
     # Given
-    mock_company_ret, mock_news_ret, _ = mock_retrievers # 대학은 사용 안한다고 가정하기
+    mock_company_vs, mock_news_vs, _ = mock_vectorstores # 대학은 사용 안한다고 가정하기
     doc_shared = Document(page_content="Shared Content")
-    mock_company_ret.aget_relevant_documents.return_value = [doc_shared, Document(page_content="Company Unique")]
-    mock_news_ret.aget_relevant_documents.return_value = [doc_shared, Document(page_content="News Unique")]
+    mock_company_vs.asimilarity_search_by_vector.return_value = [doc_shared, Document(page_content="Company Unique")]
+    mock_news_vs.asimilarity_search_by_vector.return_value = [doc_shared, Document(page_content="News Unique")]
 
     # When
     results = await retrieve_documents_from_sources("query", None)
@@ -215,3 +257,62 @@ async def test_retrieve_documents_duplicate_content(mock_retrievers: tuple):
     assert "Shared Content" in contents
     assert "Company Unique" in contents
     assert "News Unique" in contents
+
+@pytest.mark.asyncio
+async def test_retrieve_documents_embedding_failure_returns_empty(mock_vectorstores: tuple, query_embeddings: MagicMock):
+    # Given: 임베딩 API 오류
+    mock_company_vs, _, _ = mock_vectorstores
+    query_embeddings.aembed_query.side_effect = RuntimeError("embedding error")
+
+    # When
+    with collect_degradations() as degradations:
+        results = await retrieve_documents_from_sources("query", "대학 쿼리")
+
+    # Then: 빈 결과와 함께 응답 등급을 낮춘 사유 기록
+    assert results == []
+    assert degradations == [DEGRADED_RETRIEVAL_FAILED]
+    mock_company_vs.asimilarity_search_by_vector.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_retrieve_documents_skips_slow_news_search(mocker, mock_vectorstores: tuple):
+    # Given: 뉴스 검색 시간 예산 0.05초, 연속 2회 초과 시 뉴스 검색 생략
+    mocker.patch.object(settings, "DEGRADE_NEWS_TIMEOUT", 0.05)
+    mocker.patch.object(settings, "DEGRADE_NEWS_FAILURE_THRESHOLD", 2)
+    mocker.patch.object(settings, "DEGRADE_NEWS_COOLDOWN", 30.0)
+    reset_news_circuit_breaker()
+    mock_company_vs, mock_news_vs, _ = mock_vectorstores
+    mock_company_vs.asimilarity_search_by_vector.return_value = [Document(page_content="CompanyDoc1")]
+
+    async def slow_news_search(embedding, k):
+        await asyncio.sleep(1.0)
+        return [Document(page_content="NewsDoc1")]
+
+    mock_news_vs.asimilarity_search_by_vector = AsyncMock(side_effect=slow_news_search)
+
+    try:
+        for _ in range(3):
+            with collect_degradations() as degradations:
+                results = await retrieve_documents_from_sources("query", None)
+            # Then: 뉴스 없이 회사 정보만 반환
+            assert [doc.page_content for doc in results] == ["CompanyDoc1"]
+            assert degradations == [DEGRADED_NEWS_SKIPPED]
+    finally:
+        reset_news_circuit_breaker()
+
+    # 연속 2회 초과 후에는 뉴스 검색을 시도하지 않음
+    assert mock_news_vs.asimilarity_search_by_vector.await_count == 2
+
+
+# embed_query 캐시 테스트
+@pytest.mark.asyncio
+async def test_embed_query_uses_shared_cache(mocker, query_embeddings: MagicMock):
+    cache = SharedCache(CACHE_EMBEDDING, ttl=60, dumps=_pack_embedding, loads=_unpack_embedding)
+    mocker.patch('app.core.vector_db.get_shared_cache', return_value=cache)
+
+    first = await embed_query("일반 쿼리")
+    second = await embed_query("일반 쿼리")
+
+    # float32 로 저장
+    assert first == [0.1, 0.2]
+    assert second == pytest.approx([0.1, 0.2])
+    query_embeddings.aembed_query.assert_awaited_once_with("일반 쿼리")
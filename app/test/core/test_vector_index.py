@@ -0,0 +1,243 @@
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from app.core import vector_db
+from app.core.config import get_settings
+from app.core.vector_index import QUANTIZATION_BINARY, LocalVectorIndex, match_metadata_filter
+from app.core.vector_snapshot import collection_snapshot_dir, write_snapshot
+
+VECTORS = np.array([
+	[1.0, 0.0, 0.0],
+	[0.8, 0.6, 0.0],
+	[0.0, 1.0, 0.0],
+	[0.0, 0.0, 2.0],
+], dtype=np.float32)
+DOCUMENTS = ["네이버 회사 정보", "네이버 뉴스", "리디 뉴스", "대학 순위"]
+METADATAS = [
+	{"company_name": "네이버", "source": "company", "year": 2021},
+	{"company_name": "네이버", "source": "news", "year": 2023},
+	{"company_name": "리디", "source": "news", "year": 2022},
+	{"source": "university"},
+]
+IDS = ["c-1", "n-1", "n-2", "u-1"]
+
+
+@pytest.fixture
+def index() -> LocalVectorIndex:
+	return LocalVectorIndex(VECTORS, DOCUMENTS, METADATAS, IDS)
+
+
+def test_search_orders_by_cosine_distance(index: LocalVectorIndex):
+	results = index.similarity_search_with_score_by_vector([2.0, 0.0, 0.0], k=3)
+
+	assert [doc.id for doc, _ in results] == ["c-1", "n-1", "n-2"]
+	assert [round(distance, 4) for _, distance in results] == [0.0, 0.2, 1.0]
+	assert results[0][0].page_content == "네이버 회사 정보"
+	assert results[0][0].metadata["company_name"] == "네이버"
+
+
+def test_search_k_larger_than_collection(index: LocalVectorIndex):
+	assert len(index.similarity_search_by_vector([0.0, 0.0, 1.0], k=10)) == 4
+	assert index.similarity_search_by_vector([0.0, 0.0, 1.0], k=0) == []
+
+
+def test_search_rejects_dimension_mismatch(index: LocalVectorIndex):
+	with pytest.raises(ValueError):
+		index.similarity_search_by_vector([1.0, 0.0], k=1)
+
+
+@pytest.mark.parametrize("filter, expected", [
+	({"company_name": "네이버"}, ["c-1", "n-1"]),
+	({"company_name": {"$eq": "리디"}}, ["n-2"]),
+	({"company_name": "네이버", "source": "news"}, ["n-1"]),
+	({"source": {"$in": ["news", "university"]}}, ["n-1", "n-2", "u-1"]),
+	({"source": {"$nin": ["news"]}}, ["c-1", "u-1"]),
+	# 없는 필드는 $ne 도 만족하지 않음 (PostgreSQL NULL 비교와 같음)
+	({"company_name": {"$ne": "네이버"}}, ["n-2"]),
+	({"year": {"$gte": 2022}}, ["n-1", "n-2"]),
+	({"year": {"$between": [2021, 2022]}}, ["c-1", "n-2"]),
+	({"company_name": {"$like": "네%"}}, ["c-1", "n-1"]),
+	({"$or": [{"source": "university"}, {"company_name": "리디"}]}, ["n-2", "u-1"]),
+	({"$and": [{"source": "news"}, {"year": {"$lt": 2023}}]}, ["n-2"]),
+	({"year": {"$gt": "2020"}}, []),
+])
+def test_metadata_filter(index: LocalVectorIndex, filter, expected):
+	assert sorted(doc.id for doc in index.similarity_search_by_vector([1.0, 1.0, 1.0], k=10, filter=filter)) == expected
+
+
+def test_metadata_filter_rejects_unsupported_operator():
+	with pytest.raises(ValueError):
+		match_metadata_filter({"source": "news"}, {"source": {"$regex": "n.*"}})
+	with pytest.raises(ValueError):
+		match_metadata_filter({"source": "news"}, {"source": {"$eq": "news", "$ne": "company"}})
+
+
+def test_filtered_search_keeps_top_k_within_candidates(index: LocalVectorIndex):
+	results = index.similarity_search_with_score_by_vector([1.0, 0.0, 0.0], k=1, filter={"source": "news"})
+
+	assert [(doc.id, round(distance, 4)) for doc, distance in results] == [("n-1", 0.2)]
+
+
+@pytest.mark.asyncio
+async def test_async_search_with_text_query(mocker, index: LocalVectorIndex):
+	embeddings = MagicMock()
+	embeddings.aembed_query = mocker.AsyncMock(return_value=[0.0, 1.0, 0.0])
+	index.embedding_function = embeddings
+
+	docs = await index.asimilarity_search("리디", k=1)
+	assert [doc.id for doc in docs] == ["n-2"]
+
+	docs = await index.as_retriever(search_kwargs={"k": 2}).ainvoke("리디")
+	assert [doc.id for doc in docs] == ["n-2", "n-1"]
+
+
+def test_from_snapshot_memory_maps_float32_vectors(tmp_path):
+	write_snapshot(tmp_path / "company_collection", "company_collection", "test-model", VECTORS, IDS, DOCUMENTS, METADATAS)
+
+	index = LocalVectorIndex.from_snapshot(tmp_path / "company_collection", embedding_model="test-model")
+
+	assert isinstance(index.vectors, np.memmap)
+	assert index.collection_name == "company_collection"
+	assert [doc.id for doc in index.similarity_search_by_vector([0.0, 0.0, 1.0], k=1)] == ["u-1"]
+	assert index.get_by_ids(["n-2"])[0].metadata == METADATAS[2]
+
+
+def test_from_snapshot_converts_float16_vectors(tmp_path):
+	write_snapshot(tmp_path / "news", "news", "test-model", VECTORS, IDS, DOCUMENTS, METADATAS, dtype="float16")
+
+	index = LocalVectorIndex.from_snapshot(tmp_path / "news")
+
+	assert index.vectors.dtype == np.float32
+	results = index.similarity_search_with_score_by_vector([2.0, 0.0, 0.0], k=2)
+	assert [doc.id for doc, _ in results] == ["c-1", "n-1"]
+	assert results[1][1] == pytest.approx(0.2, abs=1e-3)
+
+
+def _random_collection(count: int = 500, dimensions: int = 64):
+	rng = np.random.default_rng(0)
+	vectors = rng.normal(size=(count, dimensions)).astype(np.float32)
+	queries = vectors[:20] + rng.normal(scale=0.3, size=(20, dimensions)).astype(np.float32)
+	ids = [str(i) for i in range(count)]
+	metadatas = [{"source": "news" if i % 2 else "company"} for i in range(count)]
+	return vectors, queries, ids, metadatas
+
+
+@pytest.mark.parametrize("options", [
+	{"dimensions": 32},
+	{"quantization": QUANTIZATION_BINARY},
+	{"dimensions": 32, "quantization": QUANTIZATION_BINARY},
+])
+def test_reduced_search_rescores_with_full_vectors(options):
+	vectors, queries, ids, metadatas = _random_collection()
+	documents = [f"문서 {i}" for i in ids]
+	exact = LocalVectorIndex(vectors, documents, metadatas, ids)
+	# 후보를 전체 문서로 잡으면 재정렬 결과가 전수 검색과 같음
+	full = LocalVectorIndex(vectors, documents, metadatas, ids, rescore_multiplier=len(ids), **options)
+	reduced = LocalVectorIndex(vectors, documents, metadatas, ids, rescore_multiplier=10, **options)
+	assert reduced.approximate
+
+	for query in queries.tolist():
+		expected = exact.similarity_search_with_score_by_vector(query, k=len(ids))
+		assert [(doc.id, round(score, 5)) for doc, score in full.similarity_search_with_score_by_vector(query, k=5)] == [
+			(doc.id, round(score, 5)) for doc, score in expected[:5]
+		]
+		# 쿼리를 만든 원본 문서는 축소 벡터 후보에도 포함되고, 반환 점수는 원본 벡터 기준 코사인 거리
+		results = reduced.similarity_search_with_score_by_vector(query, k=5)
+		assert results[0][0].id == expected[0][0].id
+		distances = {doc.id: score for doc, score in expected}
+		assert [score for _, score in results] == pytest.approx([distances[doc.id] for doc, _ in results], abs=1e-5)
+
+	filtered = reduced.similarity_search_by_vector(queries[0].tolist(), k=5, filter={"source": "news"})
+	assert len(filtered) == 5 and all(doc.metadata["source"] == "news" for doc in filtered)
+
+
+def test_binary_quantization_reduces_search_structure():
+	vectors, _, ids, metadatas = _random_collection(dimensions=1536 // 4)
+	index = LocalVectorIndex(vectors, ids, metadatas, ids, quantization=QUANTIZATION_BINARY)
+
+	assert index.search_bytes_per_vector == 384 // 8
+	assert LocalVectorIndex(vectors, ids, metadatas, ids).search_bytes_per_vector == 384 * 4
+	assert LocalVectorIndex(vectors, ids, metadatas, ids, dimensions=96).search_dimensions == 96
+	with pytest.raises(ValueError):
+		LocalVectorIndex(vectors, ids, metadatas, ids, quantization="pq")
+
+
+def test_binary_float16_snapshot_stays_memory_mapped(tmp_path):
+	write_snapshot(tmp_path / "news", "news", "test-model", VECTORS, IDS, DOCUMENTS, METADATAS, dtype="float16")
+
+	index = LocalVectorIndex.from_snapshot(tmp_path / "news", quantization=QUANTIZATION_BINARY, rescore_multiplier=4)
+
+	# 재정렬용 원본 벡터는 변환하지 않고 memory map 으로 유지
+	assert isinstance(index.vectors, np.memmap)
+	results = index.similarity_search_with_score_by_vector([2.0, 0.1, 0.0], k=2)
+	assert [doc.id for doc, _ in results] == ["c-1", "n-1"]
+
+
+def test_snapshot_rejects_other_embedding_model(tmp_path):
+	write_snapshot(tmp_path / "news", "news", "text-embedding-3-large", VECTORS, IDS, DOCUMENTS, METADATAS)
+
+	with pytest.raises(ValueError):
+		LocalVectorIndex.from_snapshot(tmp_path / "news", embedding_model="text-embedding-3-small")
+
+
+def test_local_backend_loads_collection_snapshot(mocker, tmp_path):
+	settings = get_settings()
+	mocker.patch.object(settings, "VECTOR_BACKEND", "local")
+	mocker.patch.object(settings, "VECTOR_SNAPSHOT_DIR", str(tmp_path))
+	mocker.patch.object(vector_db, "_company_vectorstore_instance", None)
+	embeddings = MagicMock()
+	mocker.patch.object(vector_db, "get_embeddings_model", return_value=embeddings)
+	write_snapshot(
+		collection_snapshot_dir(vector_db.COLLECTION_NAME_COMPANY),
+		vector_db.COLLECTION_NAME_COMPANY,
+		vector_db.EMBEDDING_MODEL_NAME,
+		VECTORS, IDS, DOCUMENTS, METADATAS,
+	)
+
+	vectorstore = vector_db.get_company_vectorstore()
+
+	assert isinstance(vectorstore, LocalVectorIndex)
+	assert vectorstore.embedding_function is embeddings
+	assert vectorstore.quantization == "none"
+	assert vector_db.get_company_vectorstore() is vectorstore
+
+
+def test_local_backend_applies_collection_quantization(mocker, tmp_path):
+	settings = get_settings()
+	mocker.patch.object(settings, "VECTOR_BACKEND", "local")
+	mocker.patch.object(settings, "VECTOR_SNAPSHOT_DIR", str(tmp_path))
+	mocker.patch.object(settings, "VECTOR_DIMENSIONS", {vector_db.COLLECTION_NAME_NEWS: 2})
+	mocker.patch.object(settings, "VECTOR_QUANTIZATION", {vector_db.COLLECTION_NAME_NEWS: "binary"})
+	mocker.patch.object(settings, "VECTOR_RESCORE_MULTIPLIER", 8)
+	mocker.patch.object(vector_db, "_news_vectorstore_instance", None)
+	mocker.patch.object(vector_db, "get_embeddings_model", return_value=MagicMock())
+	write_snapshot(
+		collection_snapshot_dir(vector_db.COLLECTION_NAME_NEWS),
+		vector_db.COLLECTION_NAME_NEWS,
+		vector_db.EMBEDDING_MODEL_NAME,
+		VECTORS, IDS, DOCUMENTS, METADATAS,
+	)
+
+	vectorstore = vector_db.get_news_vectorstore()
+
+	assert (vectorstore.search_dimensions, vectorstore.quantization, vectorstore.rescore_multiplier) == (2, "binary", 8)
+	# 로컬 인덱스는 전체 차원 쿼리를 받음
+	assert vector_db.collection_query_embedding(vector_db.COLLECTION_NAME_NEWS, [3.0, 4.0, 1.0]) == [3.0, 4.0, 1.0]
+
+
+def test_pgvector_query_embedding_truncated_to_collection_dimensions(mocker):
+	settings = get_settings()
+	mocker.patch.object(settings, "VECTOR_BACKEND", "pgvector")
+	mocker.patch.object(settings, "VECTOR_DIMENSIONS", {vector_db.COLLECTION_NAME_NEWS: 2})
+
+	assert vector_db.collection_query_embedding(vector_db.COLLECTION_NAME_NEWS, [3.0, 4.0, 1.0]) == pytest.approx([0.6, 0.8])
+	assert vector_db.collection_query_embedding(vector_db.COLLECTION_NAME_COMPANY, [3.0, 4.0, 1.0]) == [3.0, 4.0, 1.0]
+
+def test_unknown_backend_rejected(mocker):
+	mocker.patch.object(get_settings(), "VECTOR_BACKEND", "faiss")
+	mocker.patch.object(vector_db, "_news_vectorstore_instance", None)
+
+	with pytest.raises(ValueError):
+		vector_db.get_news_vectorstore()
+
@@ -0,0 +1,191 @@
+import json
+import numpy as np
+import orjson
+import pytest
+
+from app.core.vector_index import LocalVectorIndex
+from app.core.vector_snapshot import (
+	METADATA_FILE,
+	VECTORS_FILE,
+	export_collection,
+	find_snapshots,
+	from_columns,
+	import_to_local,
+	import_to_pgvector,
+	load_snapshot,
+	read_manifest,
+	to_columns,
+	verify_snapshot,
+	write_snapshot,
+)
+
+
+VECTORS = np.array([
+	[1.0, 0.0, 0.0],
+	[0.8, 0.6, 0.0],
+	[0.0, 1.0, 0.0],
+	[0.0, 0.0, 2.0],
+], dtype=np.float32)
+DOCUMENTS = ["네이버 회사 정보", "네이버 뉴스", "리디 뉴스", "대학 순위"]
+METADATAS = [
+	{"company_name": "네이버", "source": "company", "year": 2021},
+	{"company_name": "네이버", "source": "news", "year": 2023},
+	{"company_name": "리디", "source": "news", "year": 2022},
+	{"source": "university", "tags": ["상위권"]},
+]
+IDS = ["c-1", "n-1", "n-2", "u-1"]
+
+
+def test_metadata_columns_round_trip():
+	columns = to_columns(METADATAS)
+
+	assert list(columns) == ["company_name", "source", "year", "tags"]
+	assert columns["company_name"] == ["네이버", "네이버", "리디", None]
+	assert from_columns(columns, len(METADATAS)) == METADATAS
+	with pytest.raises(ValueError):
+		from_columns({"source": ["news"]}, 2)
+
+
+def test_snapshot_round_trip_memory_mapped(tmp_path):
+	directory = tmp_path / "company_collection"
+	manifest = write_snapshot(directory, "company_collection", "test-model", VECTORS, IDS, DOCUMENTS, METADATAS)
+	assert manifest["count"] == 4
+	assert manifest["dimensions"] == 3
+	assert manifest["dtype"] == "float32"
+	assert set(manifest["files"]) == {"vectors.npy", "ids.json", "documents.json", "metadata.json"}
+
+	snapshot = load_snapshot(directory, verify_checksums=True)
+	assert isinstance(snapshot.vectors, np.memmap)
+	assert snapshot.ids == IDS
+	assert snapshot.documents == DOCUMENTS
+	assert snapshot.metadatas == METADATAS
+	np.testing.assert_allclose(np.linalg.norm(snapshot.vectors, axis=1), 1.0, rtol=1e-6)
+
+	# 다시 저장하면 기존 디렉터리를 교체
+	write_snapshot(directory, "company_collection", "test-model", VECTORS[:2], IDS[:2], DOCUMENTS[:2], METADATAS[:2])
+	assert load_snapshot(directory).ids == IDS[:2]
+	assert sorted(path.name for path in tmp_path.iterdir()) == ["company_collection"]
+
+
+def test_float16_snapshot_is_half_size(tmp_path):
+	vectors = np.random.default_rng(0).normal(size=(64, 128)).astype(np.float32)
+	ids = [str(i) for i in range(64)]
+	documents = [f"문서 {i}" for i in range(64)]
+	metadatas = [{} for _ in range(64)]
+	float32 = write_snapshot(tmp_path / "f32", "c", "test-model", vectors, ids, documents, metadatas)
+	float16 = write_snapshot(tmp_path / "f16", "c", "test-model", vectors, ids, documents, metadatas, dtype="float16")
+
+	assert float16["files"][VECTORS_FILE]["bytes"] < float32["files"][VECTORS_FILE]["bytes"] * 0.55
+	snapshot = load_snapshot(tmp_path / "f16")
+	assert snapshot.vectors.dtype == np.float16
+	np.testing.assert_allclose(snapshot.vectors.astype(np.float32), load_snapshot(tmp_path / "f32").vectors, atol=1e-3)
+
+	with pytest.raises(ValueError):
+		write_snapshot(tmp_path / "i8", "c", "test-model", vectors, ids, documents, metadatas, dtype="int8")
+
+
+def test_verify_detects_modified_and_truncated_files(tmp_path):
+	directory = tmp_path / "news"
+	write_snapshot(directory, "news", "test-model", VECTORS, IDS, DOCUMENTS, METADATAS)
+
+	# 크기가 같은 변경은 checksum 으로만 확인 가능
+	metadata = (directory / METADATA_FILE).read_bytes()
+	(directory / METADATA_FILE).write_bytes(metadata.replace("리디".encode(), "토스".encode()))
+	load_snapshot(directory)
+	with pytest.raises(ValueError):
+		verify_snapshot(directory)
+
+	np.save(directory / VECTORS_FILE, VECTORS[:3])
+	with pytest.raises(ValueError):
+		load_snapshot(directory)
+
+
+def test_rejects_other_format_version(tmp_path):
+	directory = tmp_path / "news"
+	write_snapshot(directory, "news", "test-model", VECTORS, IDS, DOCUMENTS, METADATAS)
+	manifest = read_manifest(directory)
+	(directory / "manifest.json").write_bytes(orjson.dumps({**manifest, "format_version": 1}))
+
+	with pytest.raises(ValueError):
+		load_snapshot(directory)
+
+
+def test_import_to_local_copies_verified_snapshot(tmp_path):
+	exported = tmp_path / "exported"
+	write_snapshot(exported / "company_collection", "company_collection", "test-model", VECTORS, IDS, DOCUMENTS, METADATAS)
+	write_snapshot(exported / "company_news_collection", "company_news_collection", "test-model", VECTORS, IDS, DOCUMENTS, METADATAS)
+	(exported / "README").write_text("스냅샷이 아닌 파일")
+
+	snapshots = find_snapshots(exported)
+	assert [path.name for path in snapshots] == ["company_collection", "company_news_collection"]
+	assert find_snapshots(snapshots[0]) == [snapshots[0]]
+
+	for directory in snapshots:
+		import_to_local(directory, base_dir=str(tmp_path / "local"))
+
+	index = LocalVectorIndex.from_snapshot(tmp_path / "local" / "company_news_collection", embedding_model="test-model")
+	assert len(index) == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.pgvector
+async def test_import_to_pgvector_and_export_round_trip(postgres_pool, pool_factory, tmp_path):
+	source = tmp_path / "source"
+	write_snapshot(
+		source, "company_collection", "test-model", VECTORS, IDS, DOCUMENTS, METADATAS,
+		dtype="float16", collection_metadata={"source": "test"},
+	)
+
+	# 새 스키마에 테이블 생성 후 적재, 다시 적재하면 컬렉션 교체
+	await import_to_pgvector(source, pool_factory)
+	await import_to_pgvector(source, pool_factory)
+
+	async with postgres_pool.acquire() as conn:
+		assert await conn.fetchval("SELECT count(*) FROM langchain_pg_collection") == 1
+		assert await conn.fetchval("SELECT cmetadata::text FROM langchain_pg_collection") == '{"source":"test"}'
+		rows = await conn.fetch(
+			"SELECT custom_id, cmetadata::text AS cmetadata FROM langchain_pg_embedding ORDER BY embedding <=> '[0,1,0]' LIMIT 2"
+		)
+	assert [row["custom_id"] for row in rows] == ["n-2", "n-1"]
+	assert json.loads(rows[0]["cmetadata"]) == METADATAS[2]
+
+	manifest = await export_collection("company_collection", tmp_path / "exported", pool_factory, embedding_model="test-model")
+	assert manifest["collection_metadata"] == {"source": "test"}
+	exported = load_snapshot(tmp_path / "exported")
+	assert sorted(exported.ids) == sorted(IDS)
+	by_id = dict(zip(exported.ids, exported.metadatas))
+	assert by_id["u-1"] == METADATAS[3]
+
+	with pytest.raises(ValueError):
+		await export_collection("missing_collection", tmp_path / "missing", pool_factory)
+
+
+@pytest.mark.asyncio
+@pytest.mark.pgvector
+async def test_import_to_pgvector_truncates_dimensions(postgres_pool, pool_factory, tmp_path):
+	write_snapshot(tmp_path / "news", "news", "test-model", VECTORS, IDS, DOCUMENTS, METADATAS)
+
+	await import_to_pgvector(tmp_path / "news", pool_factory, dimensions=2)
+
+	async with postgres_pool.acquire() as conn:
+		assert await conn.fetchval("SELECT DISTINCT vector_dims(embedding) FROM langchain_pg_embedding") == 2
+		# 앞쪽 2차원이 0 인 벡터(u-1)는 정규화하지 않고 그대로 저장
+		rows = await conn.fetch("SELECT custom_id, embedding::text AS embedding FROM langchain_pg_embedding ORDER BY custom_id")
+	assert {row["custom_id"]: row["embedding"] for row in rows} == {
+		"c-1": "[1,0]", "n-1": "[0.8,0.6]", "n-2": "[0,1]", "u-1": "[0,0]",
+	}
+
+
+@pytest.mark.asyncio
+@pytest.mark.pgvector
+async def test_import_to_pgvector_rejects_corrupted_snapshot(postgres_pool, pool_factory, tmp_path):
+	write_snapshot(tmp_path / "news", "news", "test-model", VECTORS, IDS, DOCUMENTS, METADATAS)
+	documents = (tmp_path / "news" / "documents.json").read_bytes()
+	(tmp_path / "news" / "documents.json").write_bytes(documents.replace("리디".encode(), "토스".encode()))
+
+	with pytest.raises(ValueError):
+		await import_to_pgvector(tmp_path / "news", pool_factory)
+
+	async with postgres_pool.acquire() as conn:
+		# 테스트 스키마에 테이블을 만들기 전에 실패
+		assert await conn.fetchval("SELECT count(*) FROM pg_tables WHERE schemaname = current_schema()") == 0
@@ -0,0 +1,111 @@
+import threading
+import pytest
+from unittest.mock import MagicMock
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+import loader_db
+from loader_db import batch_insert, pooled_connection, run_parallel_by_company, to_libpq_dsn, transaction
+
+
+# Fixtures
+@pytest.fixture
+def fake_pool(mocker):
+	"""getconn 마다 새 MagicMock 커넥션을 반환하는 풀"""
+	pool = MagicMock()
+	pool.connections = []
+	lock = threading.Lock()
+
+	def getconn():
+		conn = MagicMock()
+		with lock:
+			pool.connections.append(conn)
+		return conn
+
+	pool.getconn.side_effect = getconn
+	mocker.patch.object(loader_db, "_connection_pool", None)
+	mocker.patch.object(loader_db, "ThreadedConnectionPool", return_value=pool)
+	return pool
+
+
+# 커넥션 풀 테스트
+def test_to_libpq_dsn():
+	assert to_libpq_dsn("postgresql+psycopg2://u:p@db:5432/app") == "postgresql://u:p@db:5432/app"
+	assert to_libpq_dsn("dbname=app") == "dbname=app"
+
+def test_get_connection_pool_is_created_once(fake_pool):
+	assert loader_db.get_connection_pool() is fake_pool
+	assert loader_db.get_connection_pool() is fake_pool
+	loader_db.ThreadedConnectionPool.assert_called_once()
+	assert loader_db.ThreadedConnectionPool.call_args.kwargs["maxconn"] == loader_db.LOADER_MAX_WORKERS + 1
+
+	loader_db.close_connection_pool()
+	fake_pool.closeall.assert_called_once()
+	assert loader_db._connection_pool is None
+
+def test_pooled_connection_returns_connection_on_error(fake_pool):
+	with pytest.raises(RuntimeError):
+		with pooled_connection() as conn:
+			raise RuntimeError("실패")
+
+	fake_pool.putconn.assert_called_once_with(conn)
+
+
+# 트랜잭션 테스트
+def test_transaction_commits_on_success():
+	conn = MagicMock()
+
+	with transaction(conn) as cursor:
+		cursor.execute("SELECT 1")
+
+	conn.commit.assert_called_once()
+	conn.rollback.assert_not_called()
+
+def test_transaction_rolls_back_on_error():
+	conn = MagicMock()
+
+	with pytest.raises(ValueError):
+		with transaction(conn):
+			raise ValueError("잘못된 데이터")
+
+	conn.rollback.assert_called_once()
+	conn.commit.assert_not_called()
+
+
+# batch_insert 테스트
+def test_batch_insert_fetches_only_with_returning(mocker):
+	execute_values = mocker.patch.object(loader_db, "execute_values", return_value=[(1,), (2,)])
+	cursor = MagicMock()
+
+	assert batch_insert(cursor, "INSERT INTO t (a) VALUES %s RETURNING id", [(1,), (2,)], page_size=10) == [(1,), (2,)]
+	assert execute_values.call_args.kwargs == {"page_size": 10, "fetch": True}
+
+	execute_values.return_value = None
+	assert batch_insert(cursor, "INSERT INTO t (a) VALUES %s", [(1,)]) == []
+	assert execute_values.call_args.kwargs["fetch"] is False
+
+	assert batch_insert(cursor, "INSERT INTO t (a) VALUES %s", []) == []
+	assert execute_values.call_count == 2
+
+
+# 회사 단위 병렬 처리 테스트
+def test_run_parallel_by_company_isolates_failures(fake_pool):
+	def worker(cursor, company_name, items):
+		if company_name == "DB 오류":
+			raise psycopg2.OperationalError("연결 끊김")
+		if company_name == "데이터 오류":
+			raise KeyError("title")
+		cursor.execute("INSERT", items)
+		return len(items)
+
+	groups = {"네이버": [1, 2, 3], "DB 오류": [1], "데이터 오류": [1, 2], "리디": [1]}
+	results = run_parallel_by_company(groups, worker, max_workers=2)
+
+	assert results == {"네이버": 3, "DB 오류": 0, "데이터 오류": 0, "리디": 1}
+	# 회사 별 트랜잭션: 성공한 회사는 commit, 실패한 회사만 rollback, 커넥션은 모두 반환
+	assert sorted((conn.commit.call_count, conn.rollback.call_count) for conn in fake_pool.connections) == [(0, 1), (0, 1), (1, 0), (1, 0)]
+	assert fake_pool.putconn.call_count == len(groups)
+
+def test_run_parallel_by_company_without_groups(fake_pool):
+	assert run_parallel_by_company({}, MagicMock()) == {}
+	fake_pool.getconn.assert_not_called()
@@ -0,0 +1,160 @@
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+from loader_db import to_libpq_dsn
+from migrate_relational_schema import (
+	apply_migrations,
+	MIGRATIONS,
+	COMPANY_NAME_INDEX,
+	COMPANY_NEWS_COMPANY_DATE_INDEX,
+	COMPANY_NEWS_DEDUP_INDEX,
+	COMPANY_NEWS_DEDUP_COLUMNS,
+)
+from setup_company_data import create_company_table
+from setup_company_news_data import create_company_news_table
+
+COMPANY_COUNT = 50
+NEWS_PER_COMPANY = 40
+
+
+# Fixtures
+@pytest.fixture
+def schema_cursor(test_database_url: str, test_schema: str):
+	try:
+		conn = psycopg2.connect(to_libpq_dsn(test_database_url))
+	except psycopg2.Error as e:
+		pytest.skip(f"테스트 데이터베이스 연결 실패: {e}")
+
+	# 테스트 전용 스키마에서 실행
+	conn.autocommit = True
+	cursor = conn.cursor()
+	cursor.execute(f"CREATE SCHEMA {test_schema}")
+	cursor.execute(f"SET search_path TO {test_schema}")
+
+	yield cursor
+
+	cursor.execute(f"DROP SCHEMA {test_schema} CASCADE")
+	cursor.close()
+	conn.close()
+
+
+@pytest.fixture
+def migrated_cursor(schema_cursor):
+	cursor = schema_cursor
+	create_company_table(cursor)
+	create_company_news_table(cursor)
+	apply_migrations(cursor)
+
+	cursor.execute(
+		"INSERT INTO company (name, data) SELECT '회사' || i, '{}'::jsonb FROM generate_series(1, %s) i",
+		(COMPANY_COUNT,),
+	)
+	cursor.execute(
+		"""
+		INSERT INTO company_news (company_id, title, original_link, news_date)
+		SELECT c.id, c.name || ' 뉴스 ' || n, NULL, DATE '2020-01-01' + n * 30
+		FROM company c, generate_series(1, %s) n
+		""",
+		(NEWS_PER_COMPANY,),
+	)
+	cursor.execute("ANALYZE company")
+	cursor.execute("ANALYZE company_news")
+	# 샘플 크기가 작아도 인덱스 사용 가능 여부만 판단하도록 순차 스캔 비활성화
+	cursor.execute("SET enable_seqscan = off")
+
+	yield cursor
+	cursor.execute("RESET enable_seqscan")
+
+
+def explain(cursor, sql: str, params: tuple) -> str:
+	cursor.execute("EXPLAIN " + sql, params)
+	return "\n".join(row[0] for row in cursor.fetchall())
+
+
+# apply_migrations 테스트
+def test_apply_migrations_is_idempotent(migrated_cursor):
+	assert apply_migrations(migrated_cursor) == []
+
+	migrated_cursor.execute("SELECT version FROM schema_migrations ORDER BY version")
+	assert [row[0] for row in migrated_cursor.fetchall()] == [m.version for m in MIGRATIONS]
+
+
+def test_company_dedup_moves_news_to_kept_company(schema_cursor):
+	create_company_table(schema_cursor)
+	create_company_news_table(schema_cursor)
+	schema_cursor.execute("INSERT INTO company (name, data) VALUES ('네이버', '{}'), ('리디', '{}'), ('네이버', '{}') RETURNING id")
+	naver, ridi, duplicate = [row[0] for row in schema_cursor.fetchall()]
+	schema_cursor.execute(
+		"""
+		INSERT INTO company_news (company_id, title, original_link, news_date) VALUES
+		(%(naver)s, '네이버 뉴스', NULL, DATE '2021-01-01'),
+		(%(duplicate)s, '네이버 뉴스', NULL, DATE '2021-01-01'),
+		(%(duplicate)s, '중복 회사에만 있던 뉴스', NULL, DATE '2022-01-01'),
+		(%(ridi)s, '리디 뉴스', NULL, DATE '2021-01-01')
+		""",
+		{"naver": naver, "ridi": ridi, "duplicate": duplicate},
+	)
+
+	apply_migrations(schema_cursor)
+
+	schema_cursor.execute("SELECT id FROM company ORDER BY id")
+	assert [row[0] for row in schema_cursor.fetchall()] == [naver, ridi]
+	# 중복 회사의 뉴스는 남은 회사로 이동하고, 겹치는 뉴스는 하나만 남음
+	schema_cursor.execute("SELECT company_id, title FROM company_news ORDER BY company_id, news_date")
+	assert schema_cursor.fetchall() == [(naver, "네이버 뉴스"), (naver, "중복 회사에만 있던 뉴스"), (ridi, "리디 뉴스")]
+
+def test_company_dedup_without_news_table(schema_cursor):
+	create_company_table(schema_cursor)
+	schema_cursor.execute("INSERT INTO company (name, data) VALUES ('네이버', '{}'), ('네이버', '{}')")
+
+	assert apply_migrations(schema_cursor) == ["0001_company_name_unique"]
+	schema_cursor.execute("SELECT count(*) FROM company")
+	assert schema_cursor.fetchone()[0] == 1
+
+
+# 쿼리 플랜 테스트
+def test_company_name_lookup_uses_unique_index(migrated_cursor):
+	plan = explain(migrated_cursor, "SELECT id, data FROM company WHERE name = %s", ("회사7",))
+	assert COMPANY_NAME_INDEX in plan
+	assert "Seq Scan" not in plan
+
+def test_company_news_time_range_uses_composite_index(migrated_cursor):
+	plan = explain(
+		migrated_cursor,
+		"SELECT title, news_date FROM company_news WHERE company_id = %s AND news_date BETWEEN %s AND %s ORDER BY news_date",
+		(7, "2021-01-01", "2022-12-31"),
+	)
+	assert COMPANY_NEWS_COMPANY_DATE_INDEX in plan
+	assert "Seq Scan" not in plan
+
+
+# 중복 키 테스트
+def test_company_news_dedup_key_skips_duplicates(migrated_cursor):
+	migrated_cursor.execute("SELECT company_id, title, news_date FROM company_news LIMIT 1")
+	company_id, title, news_date = migrated_cursor.fetchone()
+
+	migrated_cursor.execute(
+		f"""
+		INSERT INTO company_news (company_id, title, original_link, news_date)
+		VALUES (%s, %s, NULL, %s)
+		ON CONFLICT {COMPANY_NEWS_DEDUP_COLUMNS} DO NOTHING
+		RETURNING id
+		""",
+		(company_id, title, news_date),
+	)
+	assert migrated_cursor.fetchone() is None
+
+	with pytest.raises(psycopg2.errors.UniqueViolation):
+		migrated_cursor.execute(
+			"INSERT INTO company_news (company_id, title, original_link, news_date) VALUES (%s, %s, NULL, %s)",
+			(company_id, title, news_date),
+		)
+
+	plan = explain(
+		migrated_cursor,
+		"SELECT id FROM company_news WHERE company_id = %s AND md5(title) = md5(%s) AND news_date = %s",
+		(company_id, title, news_date),
+	)
+	assert "Seq Scan" not in plan
+	assert COMPANY_NEWS_DEDUP_INDEX in plan or COMPANY_NEWS_COMPANY_DATE_INDEX in plan
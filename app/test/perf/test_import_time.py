@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# app.main import 시간 / 워커 cold start 회귀 벤치마크
+# 측정값(로컬): app.main 누적 import 약 0.4초, 인터프리터 포함 cold start 약 0.55초
+# CI 장비 차이를 고려해 예산은 측정값의 약 2.5배로 설정하고, 환경변수로 조정할 수 있습니다.
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1000"))
+COLD_START_BUDGET_MS = float(os.getenv("COLD_START_BUDGET_MS", "1500"))
+
+# app.main import 시점에 로드되면 안 되는 무거운 의존성 (접근 함수 안에서 지연 로드)
+LAZY_MODULES = ("langchain_openai", "langchain_community", "openai", "langchain_core")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _run_import(*extra_args: str) -> subprocess.CompletedProcess:
+	# 설정(Settings) 역시 지연 평가되어야 하므로 OPENAI/DB 환경변수 없이 실행
+	env = {key: value for key, value in os.environ.items() if key not in ("OPENAI_API_KEY", "DATABASE_URL")}
+	return subprocess.run(
+		[sys.executable, *extra_args, "-c", "import app.main"],
+		cwd = PROJECT_ROOT,
+		env = env,
+		capture_output = True,
+		text = True,
+		timeout = 60,
+	)
+
+
+def _parse_importtime(stderr: str) -> dict:
+	"""-X importtime 출력에서 모듈별 누적 import 시간(us) 추출"""
+	cumulative = {}
+	for line in stderr.splitlines():
+		if not line.startswith("import time:") or "cumulative" in line:
+			continue
+		# "import time:  self [us] | cumulative | imported package"
+		_, cumulative_us, module = line.split("|")
+		cumulative[module.strip()] = int(cumulative_us)
+	return cumulative
+
+
+@pytest.fixture(scope="module")
+def importtime_result() -> dict:
+	result = _run_import("-X", "importtime")
+	assert result.returncode == 0, result.stderr
+	return _parse_importtime(result.stderr)
+
+
+def test_app_main_does_not_import_heavy_dependencies(importtime_result: dict):
+	loaded = sorted(
+		module for module in importtime_result
+		if module.split(".", 1)[0] in LAZY_MODULES
+	)
+	assert loaded == []
+
+
+def test_app_main_import_time_budget(importtime_result: dict):
+	import_ms = importtime_result["app.main"] / 1000
+	assert import_ms < IMPORT_TIME_BUDGET_MS, f"app.main import {import_ms:.0f}ms (예산 {IMPORT_TIME_BUDGET_MS:.0f}ms)"
+
+
+def test_cold_start_time_budget():
+	started = time.perf_counter()
+	result = _run_import()
+	cold_start_ms = (time.perf_counter() - started) * 1000
+
+	assert result.returncode == 0, result.stderr
+	assert cold_start_ms < COLD_START_BUDGET_MS, f"cold start {cold_start_ms:.0f}ms (예산 {COLD_START_BUDGET_MS:.0f}ms)"
@@ -0,0 +1,104 @@
+import pytest
+
+from benchmarks.load_test import (
+	RequestSample,
+	parse_server_timing,
+	percentile,
+	summarize_step,
+	compare_results,
+	summarize_worker_scaling,
+)
+
+
+# benchmarks/load_test.py 집계/회귀 판정 테스트 (부하 테스트 자체는 수동 실행)
+
+def test_parse_server_timing():
+	assert parse_server_timing("llm;dur=812.3, total;dur=840.1") == {"llm": 812.3, "total": 840.1}
+	assert parse_server_timing('cache;desc="hit", db;dur=2') == {"db": 2.0}
+	assert parse_server_timing(None) == {}
+
+def test_percentile_nearest_rank():
+	values = list(range(1, 101))
+	assert percentile(values, 50) == 50
+	assert percentile(values, 95) == 95
+	assert percentile(values, 99) == 99
+	assert percentile([3.0], 99) == 3.0
+	assert percentile([], 50) == 0.0
+
+def test_summarize_step_excludes_failures_from_latency():
+	samples = [RequestSample(100.0, 200, {"llm": 80.0}) for _ in range(9)] + [RequestSample(5.0, 503)]
+
+	step = summarize_step(concurrency=4, samples=samples, elapsed=2.0)
+
+	assert step["requests"] == 10
+	assert step["status_counts"] == {"200": 9, "503": 1}
+	assert step["error_rate"] == 0.1
+	assert step["rps"] == 4.5
+	assert step["latency_ms"]["p50"] == 100.0
+	assert step["stages_ms"]["llm"]["p99"] == 80.0
+
+def test_summarize_step_edge_cache_and_response_size():
+	samples = [RequestSample(2.0, 200, edge_cache="HIT", response_bytes=100) for _ in range(3)]
+	samples.append(RequestSample(900.0, 200, edge_cache="MISS", response_bytes=300))
+
+	step = summarize_step(concurrency=4, samples=samples, elapsed=1.0)
+
+	assert step["edge_cache_counts"] == {"HIT": 3, "MISS": 1}
+	assert step["edge_cache_hit_rate"] == 0.75
+	assert step["response_bytes_mean"] == 150.0
+	# nginx 를 거치지 않으면 캐시 항목 없음
+	assert "edge_cache_counts" not in summarize_step(concurrency=4, samples=[RequestSample(1.0, 200)], elapsed=1.0)
+
+def test_summarize_step_tier_counts():
+	samples = [RequestSample(100.0, 200, tier="full") for _ in range(3)]
+	samples.append(RequestSample(20.0, 200, tier="rules_only"))
+	samples.append(RequestSample(5.0, 503, tier="full"))
+
+	step = summarize_step(concurrency=4, samples=samples, elapsed=1.0)
+
+	# 성공 응답만 집계
+	assert step["tier_counts"] == {"full": 3, "rules_only": 1}
+	assert step["degraded_rate"] == 0.25
+	assert "tier_counts" not in summarize_step(concurrency=4, samples=[RequestSample(1.0, 200)], elapsed=1.0)
+
+def _result(p95: float, rps: float, error_rate: float = 0.0) -> dict:
+	return {"steps": [{
+		"concurrency": 4,
+		"rps": rps,
+		"error_rate": error_rate,
+		"latency_ms": {"p95": p95, "p99": p95},
+	}]}
+
+@pytest.mark.parametrize("current, expected", [
+	(_result(p95=1100, rps=9.0), 0),
+	(_result(p95=1300, rps=10.0), 2),
+	(_result(p95=1000, rps=7.0), 1),
+	(_result(p95=1000, rps=10.0, error_rate=0.05), 1),
+])
+def test_compare_results(current, expected):
+	regressions = compare_results(_result(p95=1000, rps=10.0), current, max_regression=0.2)
+	assert len(regressions) == expected
+
+def test_compare_results_matches_worker_counts():
+	baseline = {"steps": [{**_result(p95=1000, rps=10.0)["steps"][0], "workers": 1}, {**_result(p95=1000, rps=40.0)["steps"][0], "workers": 4}]}
+	current = {"steps": [{**_result(p95=1000, rps=10.0)["steps"][0], "workers": 4}]}
+
+	regressions = compare_results(baseline, current, max_regression=0.2)
+
+	assert regressions == ["workers=4 concurrency=4 rps 40.00 -> 10.00"]
+	# 워커 수가 없는 이전 형식 결과는 1 워커와 비교
+	assert compare_results(_result(p95=1000, rps=10.0), baseline, max_regression=0.2) == []
+
+def test_summarize_worker_scaling():
+	def step(workers: int, concurrency: int, rps: float) -> dict:
+		return {"workers": workers, "concurrency": concurrency, "rps": rps, "latency_ms": {"p95": 900.0}}
+
+	scaling = summarize_worker_scaling([
+		step(1, 8, 9.0), step(1, 32, 10.0),
+		step(2, 8, 9.5), step(2, 32, 19.0),
+		step(4, 8, 9.8), step(4, 32, 35.0),
+	])
+
+	assert [row["workers"] for row in scaling] == [1, 2, 4]
+	assert [row["speedup"] for row in scaling] == [1.0, 1.9, 3.5]
+	assert scaling[2]["concurrency"] == 32
@@ -0,0 +1,181 @@
+import json
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+import pytest
+from langchain_core.documents import Document
+
+from app.core.static_data import TARGET_EXPERIENCE_TAGS
+from app.schemas.inference import TalentDataInput
+from app.services.profile_normalizer import NormalizedProfile, normalize_talent_profile
+from app.services.inference_service import (
+	preprocess_talent_data_for_search_query,
+	format_talent_profile_for_llm,
+	format_retrieved_documents_for_llm,
+	postprocess_llm_response,
+)
+
+# 요청마다 이벤트 루프 스레드에서 실행되는 전처리/후처리 함수 마이크로 벤치마크
+# 이 함수들이 실행되는 동안 같은 워커의 다른 요청은 진행되지 않으므로 호출 1회 비용이 워커 당 동시 처리량을 제한합니다.
+#
+# 입력: 경력 50개(설명 약 2,900자), 학력 5개, 기술 100개, 검색 문서 100개(문서 당 1,400자), LLM 응답 40줄
+# 측정값(로컬, 중앙값 / tracemalloc 최대 할당):
+#   normalize_talent_profile                 약 7.0ms / 391KB (키워드 추출 약 5ms, cache_key 해시 약 1ms)
+#   preprocess_talent_data_for_search_query  약 0.04ms / 10KB
+#   format_talent_profile_for_llm            약 0.27ms / 726KB
+#   format_retrieved_documents_for_llm       약 0.19ms / 113KB
+#   postprocess_llm_response                 약 0.15ms / 17KB
+# 시간 예산은 CI 장비 차이를 고려해 측정값의 약 3 ~ 4배, 할당 예산은 약 2배로 설정합니다.
+# 할당량은 장비와 무관하게 결정적이므로 기본 실행에서 검증하고, 실행 시간(wall-clock) 예산은 장비 부하에 따라
+# 흔들리므로 perf 마커로 분리해 RUN_PERF_TESTS=1 일 때만 실행합니다.
+# 느린 장비에서는 PROCESSING_TIME_BUDGET_SCALE 로 시간 예산을 늘리고,
+# PROCESSING_BENCHMARK_OUTPUT 경로를 지정하면 측정값을 JSON 으로 저장합니다 (추이 기록용).
+TIME_BUDGET_SCALE = float(os.getenv("PROCESSING_TIME_BUDGET_SCALE", "1.0"))
+BENCHMARK_OUTPUT = os.getenv("PROCESSING_BENCHMARK_OUTPUT")
+
+ROUNDS = 30
+
+# (시간 예산 ms, 최대 할당 예산 KB)
+BUDGETS = {
+	"normalize_talent_profile": (20.0, 800),
+	"preprocess_talent_data_for_search_query": (0.5, 40),
+	"format_talent_profile_for_llm": (1.0, 1500),
+	"format_retrieved_documents_for_llm": (0.6, 250),
+	"postprocess_llm_response": (0.5, 40),
+}
+# 요청 1건 당 위 함수들의 합계
+PIPELINE_TIME_BUDGET_MS = 25.0
+
+DESCRIPTION = (
+	"대규모 트래픽 서비스 백엔드 개발 및 MSA 전환, 데이터 플랫폼 Lead, 신규 서비스 런칭과 운영 총괄\n"
+	"- Kubernetes 기반 인프라 운영, 시리즈 B 투자 유치 과정에서 기술 실사 대응\n"
+) * 30
+
+
+@pytest.fixture(scope="module")
+def large_talent_data() -> TalentDataInput:
+	return TalentDataInput(
+		skills=[f"skill-{i}" for i in range(100)],
+		summary="AI 서비스 개발과 조직 리딩 경험을 보유한 엔지니어입니다. " * 60,
+		headline="Head of Engineering at 네이버",
+		positions=[
+			{
+				"title": f"Engineer {i}",
+				"companyName": f"회사{i % 7}",
+				"description": DESCRIPTION,
+				"startEndDate": {"start": {"year": 2000 + i % 20, "month": 3}, "end": {"year": 2001 + i % 20, "month": 5}},
+			}
+			for i in range(50)
+		],
+		educations=[
+			{
+				"schoolName": "서울대학교",
+				"degreeName": "석사",
+				"fieldOfStudy": "컴퓨터공학",
+				"originStartEndDate": {"startDateOn": {"year": 2000, "month": 3}, "endDateOn": {"year": 2004, "month": 2}},
+			}
+			for _ in range(5)
+		],
+	)
+
+@pytest.fixture(scope="module")
+def large_profile(large_talent_data) -> NormalizedProfile:
+	return normalize_talent_profile(large_talent_data)
+
+@pytest.fixture(scope="module")
+def retrieved_documents():
+	return [
+		Document(
+			page_content="회사 뉴스 본문입니다. 신규 투자 유치와 조직 확장 소식.\n" * 40,
+			metadata={"source": "company_news", "company_name": f"회사{i % 7}", "news_date": "2021-01-01"},
+		)
+		for i in range(100)
+	]
+
+@pytest.fixture(scope="module")
+def llm_response() -> str:
+	return "\n".join(
+		f"- {TARGET_EXPERIENCE_TAGS[i % len(TARGET_EXPERIENCE_TAGS)]} (회사{i % 7} 재직 중 관련 경험, 근거 {i})"
+		for i in range(40)
+	)
+
+@pytest.fixture(scope="module")
+def workloads(large_talent_data, large_profile, retrieved_documents, llm_response) -> Dict[str, Callable[[], object]]:
+	return {
+		"normalize_talent_profile": lambda: normalize_talent_profile(large_talent_data),
+		"preprocess_talent_data_for_search_query": lambda: preprocess_talent_data_for_search_query(large_profile),
+		"format_talent_profile_for_llm": lambda: format_talent_profile_for_llm(large_profile),
+		"format_retrieved_documents_for_llm": lambda: format_retrieved_documents_for_llm(retrieved_documents),
+		"postprocess_llm_response": lambda: postprocess_llm_response(llm_response, TARGET_EXPERIENCE_TAGS),
+	}
+
+@pytest.fixture(scope="module")
+def benchmark_results():
+	results: Dict[str, Dict[str, float]] = {}
+	yield results
+	if BENCHMARK_OUTPUT:
+		with open(BENCHMARK_OUTPUT, "w", encoding="utf-8") as file:
+			json.dump(results, file, ensure_ascii=False, indent=2)
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+	# 후처리 경고 로그 등 출력 비용은 측정에서 제외
+	logging.disable(logging.CRITICAL)
+	yield
+	logging.disable(logging.NOTSET)
+
+
+def measure_time(func: Callable[[], object]) -> Dict[str, float]:
+	"""warm-up 1회 후 ROUNDS 회 실행 시간 중앙값/최소값(ms)"""
+	func()
+	durations = []
+	for _ in range(ROUNDS):
+		started = time.perf_counter()
+		func()
+		durations.append((time.perf_counter() - started) * 1000)
+	return {"median_ms": statistics.median(durations), "min_ms": min(durations)}
+
+
+def measure_peak(func: Callable[[], object]) -> Dict[str, float]:
+	"""warm-up 1회 후 1회 실행 중 최대 할당량(KB)"""
+	func()
+	tracemalloc.start()
+	try:
+		func()
+		_, peak = tracemalloc.get_traced_memory()
+	finally:
+		tracemalloc.stop()
+	return {"peak_kb": peak / 1024}
+
+
+@pytest.mark.parametrize("name", list(BUDGETS))
+def test_allocation_budget(name, workloads, benchmark_results):
+	result = measure_peak(workloads[name])
+	benchmark_results.setdefault(name, {}).update(result)
+	peak_budget_kb = BUDGETS[name][1]
+
+	assert result["peak_kb"] < peak_budget_kb, f"{name} 최대 할당 {result['peak_kb']:.0f}KB (예산 {peak_budget_kb}KB)"
+
+@pytest.mark.perf
+@pytest.mark.parametrize("name", list(BUDGETS))
+def test_time_budget(name, workloads, benchmark_results):
+	result = measure_time(workloads[name])
+	benchmark_results.setdefault(name, {}).update(result)
+	time_budget_ms = BUDGETS[name][0] * TIME_BUDGET_SCALE
+
+	assert result["median_ms"] < time_budget_ms, f"{name} {result['median_ms']:.3f}ms (예산 {time_budget_ms:.3f}ms)"
+
+@pytest.mark.perf
+def test_event_loop_time_per_request_budget(workloads):
+	def run_pipeline():
+		for func in workloads.values():
+			func()
+
+	result = measure_time(run_pipeline)
+	budget_ms = PIPELINE_TIME_BUDGET_MS * TIME_BUDGET_SCALE
+
+	assert result["median_ms"] < budget_ms, f"요청 당 이벤트 루프 점유 {result['median_ms']:.3f}ms (예산 {budget_ms:.3f}ms)"
@@ -0,0 +1,91 @@
+import asyncio
+import json
+import time
+import pytest
+
+from benchmarks.replay import (
+	ReplayRecord,
+	load_records,
+	schedule_offsets,
+	replay,
+	diff_results,
+)
+
+
+# benchmarks/replay.py 재생 스케줄/비교 테스트
+
+def test_load_records_accepts_recorder_and_raw_payload_lines(tmp_path):
+	path = tmp_path / "records.jsonl"
+	path.write_text(
+		json.dumps({"request_id": "a", "timestamp": 100.0, "payload": {"positions": []}}) + "\n"
+		+ "\n"
+		+ json.dumps({"positions": [{"companyName": "네이버"}]}) + "\n",
+		encoding="utf-8",
+	)
+
+	records = load_records(str(path))
+
+	assert [record.request_id for record in records] == ["a", "line-3"]
+	assert records[0].timestamp == 100.0
+	assert records[1].payload == {"positions": [{"companyName": "네이버"}]}
+	assert len(load_records(str(path), limit=1)) == 1
+
+def test_schedule_offsets_scales_recorded_arrivals():
+	records = [ReplayRecord("a", {}, 100.0), ReplayRecord("b", {}, 101.0), ReplayRecord("c", {}, 104.0)]
+
+	assert schedule_offsets(records, speed=1.0) == [0.0, 1.0, 4.0]
+	assert schedule_offsets(records, speed=2.0) == [0.0, 0.5, 2.0]
+	assert schedule_offsets(records, speed=0) == [0.0, 0.0, 0.0]
+	# timestamp 가 없는 기록이 있으면 최대 속도
+	assert schedule_offsets(records + [ReplayRecord("d", {})], speed=1.0) == [0.0] * 4
+
+@pytest.mark.asyncio
+async def test_replay_limits_concurrency_and_follows_schedule():
+	in_flight = 0
+	max_in_flight = 0
+
+	async def send(payload):
+		nonlocal in_flight, max_in_flight
+		in_flight += 1
+		max_in_flight = max(max_in_flight, in_flight)
+		await asyncio.sleep(0.02)
+		in_flight -= 1
+		return "ok", [payload["tag"]]
+
+	records = [ReplayRecord(str(i), {"tag": str(i)}, 10.0) for i in range(6)] + [ReplayRecord("late", {"tag": "late"}, 10.1)]
+	started = time.perf_counter()
+
+	results = await replay(records, send, concurrency=2, speed=1.0)
+
+	assert max_in_flight == 2
+	assert [result.output for result in results] == [[str(i)] for i in range(6)] + [["late"]]
+	# 동시 요청 제한으로 늦게 보낸 요청은 lag 로 기록
+	assert max(result.lag_ms for result in results[:6]) >= 30
+	assert time.perf_counter() - started >= 0.1
+
+def _entry(request_id: str, latency_ms: float, output=None, outcome: str = "ok") -> dict:
+	return {"request_id": request_id, "outcome": outcome, "output": output or ["상위권대학교"], "latency_ms": latency_ms}
+
+def test_diff_results_reports_changes_and_latency_regression():
+	baseline = {
+		"a": _entry("a", 100, ["상위권대학교", "대규모 회사 경험"]),
+		"b": _entry("b", 100),
+		"c": _entry("c", 100),
+		"d": _entry("d", 100),
+	}
+	candidate = {
+		"a": _entry("a", 150, ["상위권대학교"]),
+		"b": _entry("b", 150),
+		"c": _entry("c", 150, outcome="LLMTimeoutError"),
+		"e": _entry("e", 10),
+	}
+
+	report = diff_results(baseline, candidate, max_regression=0.2)
+
+	assert report["compared"] == 3
+	assert report["only_in_baseline"] == 1 and report["only_in_candidate"] == 1
+	assert report["output_changes"] == [{"request_id": "a", "removed": ["대규모 회사 경험"], "added": [], "reordered": False}]
+	assert report["outcome_changes"] == [{"request_id": "c", "baseline": "ok", "candidate": "LLMTimeoutError"}]
+	# 양쪽 모두 성공한 a, b 만 지연 시간 비교
+	assert report["latency_ms"]["change"]["p50"] == 0.5
+	assert len(report["regressions"]) == 3
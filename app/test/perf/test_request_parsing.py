@@ -0,0 +1,36 @@
+import json
+
+import orjson
+
+from app.schemas.inference import TalentDataInput
+from benchmarks.request_parsing import (
+	build_payload,
+	format_report,
+	run_benchmark,
+	CASE_LEGACY,
+	CASE_ORJSON_LEAN,
+	LegacyTalentDataInput,
+)
+
+
+# benchmarks/request_parsing.py 의 비교 대상이 같은 결과를 내는지, 벤치마크가 실행되는지 확인
+
+def test_orjson_and_stdlib_parsing_produce_same_model():
+	body = json.dumps(build_payload(positions=3, projects=2, recommendations=2), ensure_ascii=False).encode("utf-8")
+
+	assert TalentDataInput.model_validate(orjson.loads(body)) == TalentDataInput.model_validate(json.loads(body))
+	assert TalentDataInput.model_validate_json(body) == TalentDataInput.model_validate(json.loads(body))
+
+def test_legacy_model_keeps_fields_dropped_from_talent_data_input():
+	payload = build_payload(positions=1, projects=2, recommendations=1)
+
+	assert len(LegacyTalentDataInput.model_validate(payload).projects) == 2
+	assert "projects" not in TalentDataInput.model_validate(payload).model_dump()
+
+def test_run_benchmark_reports_all_cases():
+	result = run_benchmark(positions=2, projects=1, recommendations=1, rounds=2)
+
+	assert result["body_bytes"] > 0
+	assert {CASE_LEGACY, CASE_ORJSON_LEAN} <= set(result["cases"])
+	assert all(case["median_ms"] >= 0 for case in result["cases"].values())
+	assert "변경 전 대비" in format_report(result)
@@ -0,0 +1,50 @@
+import argparse
+import json
+import numpy as np
+import pytest
+
+from app.core.vector_snapshot import write_snapshot
+from benchmarks.vector_recall import load_eval_set, run, search_configs
+
+
+# benchmarks/vector_recall.py 설정 조합/평가 쿼리/결과 테스트
+
+def test_search_configs_measures_exact_search_once():
+	configs = search_configs([64, 32], ["none", "binary"], [1, 4], full_dimensions=64)
+
+	assert configs[0] == {"dimensions": 64, "quantization": "none", "rescore_multiplier": 1}
+	assert len(configs) == 1 + 2 + 2 + 2
+	# 스냅샷보다 큰 차원은 전체 차원으로 맞춤
+	assert search_configs([1536], ["none"], [4], full_dimensions=64) == [{"dimensions": 64, "quantization": "none", "rescore_multiplier": 4}]
+
+
+@pytest.mark.asyncio
+async def test_load_eval_set_uses_given_embeddings(tmp_path):
+	path = tmp_path / "eval.jsonl"
+	path.write_text(
+		json.dumps({"embedding": [1.0, 0.0]}) + "\n\n" + json.dumps({"embedding": [0.0, 1.0], "filter": {"source": "news"}}) + "\n",
+		encoding="utf-8",
+	)
+
+	assert await load_eval_set(str(path)) == [([1.0, 0.0], None), ([0.0, 1.0], {"source": "news"})]
+	assert await load_eval_set(str(path), limit=1) == [([1.0, 0.0], None)]
+
+
+@pytest.mark.asyncio
+async def test_run_reports_recall_per_config(tmp_path):
+	vectors = np.random.default_rng(0).normal(size=(300, 64)).astype(np.float32)
+	ids = [str(i) for i in range(300)]
+	write_snapshot(tmp_path / "news", "news", "test-model", vectors, ids, ids, [{} for _ in ids])
+	args = argparse.Namespace(
+		snapshot=tmp_path / "news", eval_set=None, dimensions=[64, 32], quantization=["none", "binary"],
+		rescore_multiplier=[300], queries=20, k=4, noise=0.1, seed=0,
+	)
+
+	result = await run(args)
+
+	assert (result["documents"], result["dimensions"], result["queries"]) == (300, 64, 20)
+	by_config = {(row["dimensions"], row["quantization"]): row for row in result["configs"]}
+	assert by_config[(64, "none")]["search_bytes_per_vector"] == 64 * 4
+	assert by_config[(64, "binary")]["search_bytes_per_vector"] == 8
+	# 후보를 전체 문서로 잡으면 재정렬 결과가 전수 검색과 같음
+	assert all(row["recall_at_k"] == 1.0 for row in result["configs"])
@@ -0,0 +1,25 @@
+import numpy as np
+
+from benchmarks.vector_search import make_queries, overlap_at_k
+
+
+# benchmarks/vector_search.py 쿼리 생성/결과 비교 테스트
+
+def test_make_queries_is_reproducible_and_near_collection_vectors():
+	vectors = np.eye(8, dtype=np.float32)
+
+	queries = make_queries(vectors, count=5, noise=0.1, seed=3)
+
+	assert queries == make_queries(vectors, count=5, noise=0.1, seed=3)
+	assert len(queries) == 5
+	for query in queries:
+		# 노이즈가 작으면 원래 벡터가 가장 가까움
+		assert max(query) > 0.8
+
+
+def test_overlap_at_k():
+	expected = [["a", "b"], ["c", "d"], []]
+	actual = [["b", "a"], ["c", "e"], ["x"]]
+
+	assert overlap_at_k(expected, actual) == 0.75
+	assert overlap_at_k([], []) == 1.0
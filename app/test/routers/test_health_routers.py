@@ -0,0 +1,65 @@
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
+from app.main import app
+from app.core.config import settings
+from app.schemas.health import ReadinessResponse, ComponentStatus
+from app.services.warmup_service import set_readiness
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset_readiness():
+    yield
+    set_readiness(ReadinessResponse(ready=False))
+
+
+def test_liveness():
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+def test_readiness_not_ready_returns_503():
+    # Given: warm-up 실패
+    set_readiness(ReadinessResponse(ready=False, components=[ComponentStatus(name="llm_client", ok=False, detail="오류")]))
+
+    # When
+    response = client.get("/health/ready")
+
+    # Then
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+    assert response.json()["components"][0]["name"] == "llm_client"
+
+def test_readiness_ready_returns_200():
+    set_readiness(ReadinessResponse(ready=True, components=[ComponentStatus(name="llm_client", ok=True)]))
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
+
+def test_lifespan_runs_warm_up(mocker):
+    # Given: lifespan 에서 warm-up 실행
+    mocker.patch.object(settings, "WARMUP_ENABLED", True)
+    mock_warm_up = mocker.patch('app.main.warm_up_application', new_callable=AsyncMock)
+    mocker.patch('app.main.close_relational_pool', new_callable=AsyncMock)
+
+    # When
+    with TestClient(app):
+        pass
+
+    # Then
+    mock_warm_up.assert_called_once()
+
+def test_lifespan_warm_up_disabled_marks_ready(mocker):
+    mocker.patch.object(settings, "WARMUP_ENABLED", False)
+    mock_warm_up = mocker.patch('app.main.warm_up_application', new_callable=AsyncMock)
+    mocker.patch('app.main.close_relational_pool', new_callable=AsyncMock)
+
+    with TestClient(app) as lifespan_client:
+        response = lifespan_client.get("/health/ready")
+
+    assert response.status_code == 200
+    mock_warm_up.assert_not_called()
@@ -1,11 +1,18 @@
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
+from app.core.config import get_settings
+from app.core.llm_services import LLMCircuitOpenError, LLMInvocationError, LLMRateLimitedError, LLMTimeoutError
+from app.core.degradation import mark_degraded, DEGRADED_NEWS_SKIPPED, DEGRADED_RULES_ONLY
+from app.core.admission import AdmissionRejectedError, REJECT_QUEUE_FULL, REJECT_QUEUE_TIMEOUT, REJECT_DEADLINE, remaining_request_time, reset_admission_controller
 from app.schemas.inference import TalentDataInput
+from app.services.inference_service import InferenceResult
 from unittest.mock import patch, AsyncMock 
 
 client = TestClient(app)
 
+CACHE_KEY = "profile-key:gpt-test"
+
 # Fixtures
 @pytest.fixture
 def valid_talent_payload() -> dict:
@@ -51,13 +58,13 @@ def invalid_talent_payload_missing_field() -> dict:
 
 # --- 테스트 케이스 ---
 def test_inference_endpoint_success_with_mock(mocker, valid_talent_payload: dict):
-    # Given: infer_experiences_service가 특정 결과를 반환하도록 Mocking
+    # Given: infer_experiences_with_cache_key가 특정 결과를 반환하도록 Mocking
     mocked_service_result = [
         "태그1 (근거1)",
         "태그2 (근거2)"
     ]
-    # app.routers.inference 모듈 내에서 infer_experiences_service를 호출한다고 가정
-    mock_infer_service = mocker.patch('app.routers.inference.infer_experiences_service', new_callable=AsyncMock, return_value=mocked_service_result)
+    # app.routers.inference 모듈 내에서 infer_experiences_with_cache_key를 호출한다고 가정
+    mock_infer_service = mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock, return_value=InferenceResult(mocked_service_result, CACHE_KEY))
 
     # When
     response = client.post("/api/v1/inference", json=valid_talent_payload)
@@ -73,7 +80,7 @@ def test_inference_endpoint_success_with_mock(mocker, valid_talent_payload: dict
 
 def test_inference_endpoint_service_returns_empty(mocker, valid_talent_payload: dict):
     # Given: 서비스가 빈 리스트 반환
-    mocker.patch('app.routers.inference.infer_experiences_service', new_callable=AsyncMock, return_value=[])
+    mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock, return_value=InferenceResult([], CACHE_KEY))
     
     # When
     response = client.post("/api/v1/inference", json=valid_talent_payload)
@@ -84,7 +91,7 @@ def test_inference_endpoint_service_returns_empty(mocker, valid_talent_payload:
 
 def test_inference_endpoint_service_returns_none_raises_500(mocker, valid_talent_payload: dict):
     # Given: 서비스가 None 반환 (내부 오류 상황 시뮬레이션)
-    mocker.patch('app.routers.inference.infer_experiences_service', new_callable=AsyncMock, return_value=None)
+    mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock, return_value=InferenceResult(None, CACHE_KEY))
     
     # When
     response = client.post("/api/v1/inference", json=valid_talent_payload)
@@ -93,6 +100,24 @@ def test_inference_endpoint_service_returns_none_raises_500(mocker, valid_talent
     assert response.status_code == 500
     assert response.json() == {"detail": "추론 중 내부 서버 오류 발생"} # 라우터의 에러 메시지 확인
 
+@pytest.mark.parametrize("error, status_code", [
+    (LLMTimeoutError("기한 초과"), 504),
+    (LLMCircuitOpenError("차단", retry_after=12.3), 503),
+    (LLMRateLimitedError("한도 초과", retry_after=12.3), 503),
+    (LLMInvocationError("호출 실패"), 502),
+])
+def test_inference_endpoint_llm_failures_are_not_empty_success(mocker, valid_talent_payload: dict, error, status_code):
+    # Given: LLM 호출 실패가 빈 결과(200) 대신 별도 상태 코드로 응답되는지
+    mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock, side_effect=error)
+
+    # When
+    response = client.post("/api/v1/inference", json=valid_talent_payload)
+
+    # Then
+    assert response.status_code == status_code
+    if status_code == 503:
+        assert response.headers["Retry-After"] == "13"
+
 def test_inference_endpoint_invalid_payload_type(invalid_talent_payload_missing_field: dict):
     # Given: 유효하지 않은 타입의 페이로드
     # When
@@ -102,9 +127,146 @@ def test_inference_endpoint_invalid_payload_type(invalid_talent_payload_missing_
     assert response.status_code == 422 
     # response.json()['detail'] 등을 통해 구체적인 오류 메시지 확인 가능
 
+def test_inference_endpoint_out_of_range_month(mocker, valid_talent_payload: dict):
+    # Given: 스키마 타입은 맞지만 날짜로 변환할 수 없는 월
+    mock_infer_service = mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock)
+    payload = {**valid_talent_payload, "positions" : [{"companyName" : "Test Corp", "startEndDate" : {"start" : {"year" : 2020, "month" : 13}}}]}
+
+    # When
+    response = client.post("/api/v1/inference", json=payload)
+
+    # Then: 500 대신 422
+    assert response.status_code == 422
+    mock_infer_service.assert_not_awaited()
+
+def test_inference_endpoint_malformed_json_body():
+    # Given: orjson 으로 파싱할 수 없는 본문
+    # When
+    response = client.post("/api/v1/inference", content=b'{"skills": [', headers={"content-type": "application/json"})
+
+    # Then: 표준 json 파싱과 같은 422 응답
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+
+def test_inference_endpoint_ignores_unused_fields_and_returns_orjson(mocker, valid_talent_payload: dict):
+    # Given: 추론에 사용하지 않는 필드가 포함된 본문
+    mock_infer_service = mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock, return_value=InferenceResult(["리더십 (엘박스 CTO)"], CACHE_KEY))
+    payload = {**valid_talent_payload, "photoUrl" : "https://test.test.test/photo.png", "projects" : [{"name" : "프로젝트"}]}
+
+    # When
+    response = client.post("/api/v1/inference", json=payload)
+
+    # Then
+    assert response.status_code == 200
+    assert response.content == '["리더십 (엘박스 CTO)"]'.encode("utf-8")
+    assert response.headers["content-type"] == "application/json"
+    talent_data = mock_infer_service.call_args[0][0]
+    assert isinstance(talent_data, TalentDataInput)
+    assert not hasattr(talent_data, "projects")
+
+def test_inference_endpoint_edge_cache_headers(mocker, valid_talent_payload: dict):
+    # Given: EDGE_CACHE_TTL 설정 시 성공 응답만 nginx 캐시 허용
+    mocker.patch.object(get_settings(), "EDGE_CACHE_TTL", 300)
+    mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock, return_value=InferenceResult(["리더십 (엘박스 CTO)"], CACHE_KEY))
+
+    # When: 첫 요청(키 없음), 응답의 키를 보낸 재요청, 다른 키를 보낸 요청
+    first = client.post("/api/v1/inference", json=valid_talent_payload)
+    repeated = client.post("/api/v1/inference", json=valid_talent_payload, headers={"X-Inference-Cache-Key": first.headers["x-inference-cache-key"]})
+    mismatched = client.post("/api/v1/inference", json=valid_talent_payload, headers={"X-Inference-Cache-Key": "other-profile:gpt-test"})
+
+    # Then: 서비스가 계산한 결과 캐시 키를 돌려주고, 요청 키가 같을 때만 nginx 저장 허용
+    assert first.headers["x-inference-cache-key"] == CACHE_KEY
+    assert "cache-control" not in first.headers
+    assert repeated.headers["cache-control"] == "public, max-age=300"
+    assert "cache-control" not in mismatched.headers
+
+def test_inference_endpoint_no_edge_cache_headers_by_default_or_on_error(mocker, valid_talent_payload: dict):
+    mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock, return_value=InferenceResult(["리더십 (엘박스 CTO)"], CACHE_KEY))
+    response = client.post("/api/v1/inference", json=valid_talent_payload)
+    assert "cache-control" not in response.headers
+
+    mocker.patch.object(get_settings(), "EDGE_CACHE_TTL", 300)
+    mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock, side_effect=LLMTimeoutError("기한 초과"))
+    response = client.post("/api/v1/inference", json=valid_talent_payload, headers={"X-Inference-Cache-Key": CACHE_KEY})
+    assert response.status_code == 504
+    assert "cache-control" not in response.headers
+    assert "x-inference-cache-key" not in response.headers
+
+def test_inference_endpoint_reports_full_tier(mocker, valid_talent_payload: dict):
+    mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock, return_value=InferenceResult(["리더십 (엘박스 CTO)"], CACHE_KEY))
+
+    response = client.post("/api/v1/inference", json=valid_talent_payload)
+
+    assert response.status_code == 200
+    assert response.headers["x-inference-tier"] == "full"
+    assert "x-inference-degraded" not in response.headers
+
+def test_inference_endpoint_reports_degraded_tier_without_edge_cache(mocker, valid_talent_payload: dict):
+    # Given: 뉴스 검색을 생략하고 LLM 실패로 규칙 결과만 반환
+    mocker.patch.object(get_settings(), "EDGE_CACHE_TTL", 300)
+
+    async def degraded_infer(talent_data):
+        mark_degraded(DEGRADED_NEWS_SKIPPED)
+        mark_degraded(DEGRADED_RULES_ONLY)
+        return InferenceResult(["대규모 회사 경험 (Test Corp 직원 수 4,720명)"], CACHE_KEY)
+
+    mocker.patch('app.routers.inference.infer_experiences_with_cache_key', side_effect=degraded_infer)
+
+    response = client.post("/api/v1/inference", json=valid_talent_payload, headers={"X-Inference-Cache-Key": CACHE_KEY})
+
+    # Then: 등급과 사유를 헤더로 알리고 nginx 캐시 대상에서 제외
+    assert response.status_code == 200
+    assert response.json() == ["대규모 회사 경험 (Test Corp 직원 수 4,720명)"]
+    assert response.headers["x-inference-tier"] == "rules_only"
+    assert response.headers["x-inference-degraded"] == "news_skipped,rules_only"
+    assert "cache-control" not in response.headers
+
+@pytest.mark.parametrize("reason, status_code, retry_after", [
+    (REJECT_QUEUE_FULL, 429, "3"),
+    (REJECT_QUEUE_TIMEOUT, 503, "3"),
+    (REJECT_DEADLINE, 504, None),
+])
+def test_inference_endpoint_admission_rejections(mocker, valid_talent_payload: dict, reason, status_code, retry_after):
+    # Given: admission control 이 요청을 거부
+    controller = mocker.MagicMock()
+    controller.admit.side_effect = AdmissionRejectedError("거부", reason, retry_after=2.5)
+    mocker.patch('app.routers.inference.get_admission_controller', return_value=controller)
+    mock_infer_service = mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock)
+
+    response = client.post("/api/v1/inference", json=valid_talent_payload, headers={"X-Request-Timeout": "1.5"})
+
+    # Then: LLM 호출 없이 바로 거부
+    assert response.status_code == status_code
+    assert response.headers.get("retry-after") == retry_after
+    controller.admit.assert_called_once_with(1.5)
+    mock_infer_service.assert_not_awaited()
+
+def test_inference_endpoint_admission_propagates_request_timeout(mocker, valid_talent_payload: dict):
+    # Given: admission control 활성화
+    mocker.patch.object(get_settings(), "ADMISSION_CONTROL_ENABLED", True)
+    reset_admission_controller()
+    remaining = []
+
+    async def infer(talent_data):
+        remaining.append(remaining_request_time())
+        return InferenceResult(["리더십 (엘박스 CTO)"], CACHE_KEY)
+
+    mocker.patch('app.routers.inference.infer_experiences_with_cache_key', side_effect=infer)
+
+    try:
+        response = client.post("/api/v1/inference", json=valid_talent_payload, headers={"X-Request-Timeout": "3"})
+        assert response.status_code == 200
+        assert 0 < remaining[0] <= 3
+
+        response = client.post("/api/v1/inference", json=valid_talent_payload)
+        assert response.status_code == 200
+        assert remaining[1] is None
+    finally:
+        reset_admission_controller()
+
 def test_inference_endpoint_service_raises_value_error(mocker, valid_talent_payload: dict):
     # Given: 서비스 내부에서 ValueError 발생 시뮬레이션
-    mocker.patch('app.routers.inference.infer_experiences_service', new_callable=AsyncMock, side_effect=ValueError("테스트용 값 오류"))
+    mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock, side_effect=ValueError("테스트용 값 오류"))
 
     # When
     response = client.post("/api/v1/inference", json=valid_talent_payload)
@@ -115,7 +277,7 @@ def test_inference_endpoint_service_raises_value_error(mocker, valid_talent_payl
 
 def test_inference_endpoint_service_raises_generic_exception(mocker, valid_talent_payload: dict):
     # Given: 서비스 내부에서 일반 Exception 발생 시뮬레이션
-    mocker.patch('app.routers.inference.infer_experiences_service', new_callable=AsyncMock, side_effect=Exception("일반 서버 오류"))
+    mocker.patch('app.routers.inference.infer_experiences_with_cache_key', new_callable=AsyncMock, side_effect=Exception("일반 서버 오류"))
 
     # When
     response = client.post("/api/v1/inference", json=valid_talent_payload)
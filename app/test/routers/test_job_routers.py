@@ -0,0 +1,97 @@
+import pytest
+from datetime import datetime, timezone
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, MagicMock
+from app.main import app
+from app.core.config import get_settings
+from app.core.job_queue import JobQueueFullError
+from app.schemas.job import JobStatusResponse
+
+client = TestClient(app)
+
+JOB_ID = "0f8fad5b-d9cb-469f-a165-70867728950e"
+
+# Fixtures
+@pytest.fixture
+def job_payload() -> dict:
+    return {
+        "talent_data": {
+            "headline": "테스트 잘하는 직업",
+            "positions": [{"companyName": "Test Corp"}],
+        },
+        "priority": "high",
+    }
+
+@pytest.fixture
+def mock_job_queue(mocker) -> MagicMock:
+    settings = get_settings()
+    mocker.patch.object(settings, "JOB_QUEUE_ENABLED", True)
+    mocker.patch.object(settings, "JOB_CALLBACK_ALLOWED_HOSTS", "callback.test")
+    queue = MagicMock()
+    queue.enqueue = AsyncMock(return_value=JOB_ID)
+    queue.get = AsyncMock(return_value=None)
+    mocker.patch("app.routers.jobs.get_job_queue", return_value=queue)
+    return queue
+
+
+def test_job_api_disabled_by_default(job_payload):
+    response = client.post("/api/v1/inference/jobs", json=job_payload)
+
+    assert response.status_code == 404
+    assert client.get(f"/api/v1/inference/jobs/{JOB_ID}").status_code == 404
+
+def test_submit_job(mock_job_queue, job_payload):
+    job_payload["callback_url"] = "https://callback.test/jobs"
+    response = client.post("/api/v1/inference/jobs", json=job_payload)
+
+    assert response.status_code == 202
+    assert response.json() == {"job_id": JOB_ID, "status": "queued", "priority": "high"}
+    assert response.headers["location"] == f"/api/v1/inference/jobs/{JOB_ID}"
+    talent_data, priority, callback_url = mock_job_queue.enqueue.await_args.args
+    assert talent_data.headline == "테스트 잘하는 직업"
+    assert priority == "high"
+    assert callback_url == "https://callback.test/jobs"
+
+def test_submit_job_rejects_disallowed_callback(mock_job_queue, job_payload):
+    job_payload["callback_url"] = "http://169.254.169.254/latest/meta-data"
+    response = client.post("/api/v1/inference/jobs", json=job_payload)
+
+    assert response.status_code == 422
+    mock_job_queue.enqueue.assert_not_awaited()
+
+def test_submit_job_invalid_priority(mock_job_queue, job_payload):
+    job_payload["priority"] = "urgent"
+    response = client.post("/api/v1/inference/jobs", json=job_payload)
+
+    assert response.status_code == 422
+
+def test_submit_job_queue_full(mock_job_queue, job_payload):
+    mock_job_queue.enqueue.side_effect = JobQueueFullError("low", 50, retry_after=7.2)
+    job_payload["priority"] = "low"
+    response = client.post("/api/v1/inference/jobs", json=job_payload)
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "8"
+
+def test_get_job(mock_job_queue):
+    mock_job_queue.get.return_value = JobStatusResponse(
+        job_id=JOB_ID,
+        status="succeeded",
+        priority="normal",
+        result=["리더십 (Test Corp)"],
+        attempts=1,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        finished_at=datetime(2025, 1, 1, 0, 0, 5, tzinfo=timezone.utc),
+    )
+    response = client.get(f"/api/v1/inference/jobs/{JOB_ID}")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "succeeded"
+    assert body["result"] == ["리더십 (Test Corp)"]
+    mock_job_queue.get.assert_awaited_once_with(JOB_ID)
+
+def test_get_job_not_found(mock_job_queue):
+    response = client.get("/api/v1/inference/jobs/unknown")
+
+    assert response.status_code == 404
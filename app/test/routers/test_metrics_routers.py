@@ -0,0 +1,49 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.config import settings
+from app.core.metrics import track_stage, STAGE_LLM, STAGE_TOTAL
+from app.services.inference_service import InferenceResult
+
+client = TestClient(app)
+
+
+def test_metrics_endpoint_exposes_stage_histograms():
+    with track_stage(STAGE_LLM):
+        pass
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'inference_stage_duration_seconds_bucket{le="0.005",stage="llm"}' in response.text
+
+
+# Server-Timing 헤더 테스트
+async def fake_infer_with_stages(talent_data):
+    with track_stage(STAGE_TOTAL):
+        with track_stage(STAGE_LLM):
+            pass
+        with track_stage(STAGE_LLM):
+            pass
+    return InferenceResult(["대규모 회사 경험"], "profile-key:gpt-test")
+
+
+def test_server_timing_header_when_enabled(mocker):
+    mocker.patch.object(settings, "SERVER_TIMING_ENABLED", True)
+    mocker.patch("app.routers.inference.infer_experiences_with_cache_key", side_effect=fake_infer_with_stages)
+
+    response = client.post("/api/v1/inference", json={"positions": [], "educations": []})
+
+    assert response.status_code == 200
+    timings = dict(entry.strip().split(";dur=") for entry in response.headers["server-timing"].split(","))
+    assert set(timings) == {STAGE_TOTAL, STAGE_LLM}
+    assert float(timings[STAGE_TOTAL]) >= float(timings[STAGE_LLM]) >= 0
+
+
+def test_server_timing_header_disabled_by_default(mocker):
+    mocker.patch("app.routers.inference.infer_experiences_with_cache_key", side_effect=fake_infer_with_stages)
+
+    response = client.post("/api/v1/inference", json={"positions": [], "educations": []})
+
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
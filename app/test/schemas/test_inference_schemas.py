@@ -23,6 +23,12 @@ def test_year_month_invalid_type():
         YearMonth(year="not_int")
     with pytest.raises(ValidationError):
         YearMonth(month="not_int")
+
+def test_year_month_out_of_range():
+    # date 로 변환할 수 없는 값은 검증 단계에서 거부
+    for invalid in ({"month": 13}, {"month": 0}, {"year": 0}, {"year": 10000}):
+        with pytest.raises(ValidationError):
+            YearMonth(**invalid)
     
 #StartEndDate 모델 테스트
 def test_start_end_date_valid_creation():
@@ -87,7 +93,6 @@ def test_position_minimal_data():
     assert pos.title == "Tester"
     assert pos.description is None
     assert pos.startEndDate is None
-    assert pos.companyLocation is None
 
 # TalentDataInput 모델 테스트
 @pytest.fixture
@@ -135,3 +140,18 @@ def test_talend_data_input_valid_payload(sample_talent_payload_dict: dict):
     assert isinstance(talent_data.educations[0].originStartEndDate, EducationStartEndDate)
     assert talent_data.educations[0].originStartEndDate.startDateOn.year == 2010
     assert talent_data.educations[0].originStartEndDate.endDateOn.year == 2012
+
+def test_talent_data_input_ignores_unused_fields(sample_talent_payload_dict: dict):
+    payload = {
+        **sample_talent_payload_dict,
+        "firstName" : "길동",
+        "photoUrl" : "https://test.test.test/photo.png",
+        "website" : ["https://test.test.test"],
+        "projects" : [{"name" : "프로젝트", "members" : [{"name" : "a"}]}],
+        "recommendations" : [{"text" : "추천합니다"}],
+    }
+    payload["positions"][0]["companyLocation"] = "서울"
+
+    talent_data = TalentDataInput(**payload)
+    assert set(talent_data.model_dump()) == {"skills", "summary", "headline", "positions", "educations"}
+    assert "companyLocation" not in talent_data.positions[0].model_dump()
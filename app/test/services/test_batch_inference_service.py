@@ -0,0 +1,224 @@
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.config import settings
+from app.schemas.inference import TalentDataInput
+from app.services.batch_inference_service import (
+	run_batch_job,
+	get_batch_client,
+	load_talent_inputs,
+	load_state,
+	parse_batch_output_line,
+	BatchJobError,
+	UPSERT_RESULT_SQL,
+)
+from app.services.inference_service import ExperiencePrompt
+from app.services.rule_engine import RuleEngineResult, TagDecision
+from benchmarks.fake_openai import FakeOpenAIServer
+
+
+# Fixtures
+@pytest.fixture
+def fake_batch_server(mocker):
+	server = FakeOpenAIServer(content="- 리더십 (팀장 경험)\n- 없는 태그 (무시됨)", batch_polls=2).start()
+	mocker.patch.object(settings, "OPENAI_BASE_URL", server.base_url)
+	mocker.patch.object(settings, "OPENAI_MODEL_NAME", "gpt-fake")
+	mocker.patch.object(settings, "LLM_REQUEST_TIMEOUT", 5.0)
+	yield server
+	server.stop()
+
+@pytest.fixture
+def mock_pool(mocker):
+	pool = MagicMock()
+	pool.execute = AsyncMock()
+	pool.executemany = AsyncMock()
+	mocker.patch('app.services.batch_inference_service.get_relational_pool', new_callable=AsyncMock, return_value=pool)
+	return pool
+
+@pytest.fixture
+def mock_prepare(mocker):
+	# talent_id 가 headline 에 들어있는 인재, "rule-only" 는 모든 태그가 규칙으로 결정됨
+	async def prepare(talent: TalentDataInput) -> ExperiencePrompt:
+		rule_result = RuleEngineResult({"상위권 대학교": TagDecision("상위권 대학교", True, "서울대학교, 대학 순위 1위")})
+		if talent.headline == "rule-only":
+			return ExperiencePrompt("", [], rule_result)
+		return ExperiencePrompt(f"prompt for {talent.headline}", ["리더십"], rule_result)
+
+	return mocker.patch('app.services.batch_inference_service.prepare_experience_prompt', side_effect=prepare)
+
+@pytest.fixture
+def talents():
+	return [(name, TalentDataInput(headline=name)) for name in ("talent-1", "talent-2", "rule-only")]
+
+def stored_rows(mock_pool) -> dict:
+	rows = {}
+	for call in mock_pool.executemany.call_args_list:
+		assert call.args[0] == UPSERT_RESULT_SQL
+		for talent_id, tags, batch_id in call.args[1]:
+			rows[talent_id] = json.loads(tags)
+	return rows
+
+
+# load_talent_inputs 테스트
+def test_load_talent_inputs_json_and_jsonl(tmp_path):
+	(tmp_path / "talent_ex1.json").write_text(json.dumps({"headline": "a"}), encoding="utf-8")
+	(tmp_path / "pool.jsonl").write_text(
+		json.dumps({"talent_id": "t-100", "headline": "b"}) + "\n\n" + json.dumps({"headline": "c"}) + "\n",
+		encoding="utf-8",
+	)
+
+	talents = load_talent_inputs([tmp_path / "talent_ex1.json", tmp_path / "pool.jsonl"])
+
+	assert [(talent_id, talent.headline) for talent_id, talent in talents] == [("talent_ex1", "a"), ("t-100", "b"), ("pool-3", "c")]
+
+
+# parse_batch_output_line 테스트
+def test_parse_batch_output_line():
+	ok = {"custom_id": "t1", "response": {"status_code": 200, "body": {"choices": [{"message": {"content": "- 리더십 (팀장)"}}]}}, "error": None}
+	failed = {"custom_id": "t2", "response": {"status_code": 429, "body": {}}, "error": None}
+	error = {"custom_id": "t3", "response": None, "error": {"code": "batch_expired", "message": "expired"}}
+
+	assert parse_batch_output_line(json.dumps(ok)) == ("t1", "- 리더십 (팀장)", None)
+	assert parse_batch_output_line(json.dumps(failed)) == ("t2", None, "status_code 429")
+	assert parse_batch_output_line(json.dumps(error)) == ("t3", None, "expired")
+
+
+# run_batch_job 테스트 (fake Batch API)
+@pytest.mark.asyncio
+async def test_run_batch_job_end_to_end(tmp_path, fake_batch_server, mock_pool, mock_prepare, talents):
+	state = await run_batch_job(talents, tmp_path / "state.json", poll_interval=0.01)
+
+	assert state.stage == "stored"
+	assert sorted(state.stored_ids) == ["rule-only", "talent-1", "talent-2"]
+	assert state.failed_ids == {}
+
+	# 규칙으로 결정된 인재는 Batch 요청에서 제외
+	lines = [json.loads(line) for line in (tmp_path / "state.input.jsonl").read_text(encoding="utf-8").splitlines()]
+	assert sorted(line["custom_id"] for line in lines) == ["talent-1", "talent-2"]
+	assert lines[0]["url"] == "/v1/chat/completions"
+	assert lines[0]["body"]["model"] == "gpt-fake"
+
+	# postprocess_llm_response 로 대상 태그만 남기고 규칙 태그와 합쳐 저장
+	assert stored_rows(mock_pool) == {
+		"talent-1": ["상위권 대학교 (서울대학교, 대학 순위 1위)", "리더십 (팀장 경험)"],
+		"talent-2": ["상위권 대학교 (서울대학교, 대학 순위 1위)", "리더십 (팀장 경험)"],
+		"rule-only": ["상위권 대학교 (서울대학교, 대학 순위 1위)"],
+	}
+	assert len(fake_batch_server.batches) == 1
+
+@pytest.mark.asyncio
+async def test_run_batch_job_resumes_from_state_file(tmp_path, fake_batch_server, mock_pool, mock_prepare, talents):
+	fake_batch_server.batch_polls = 3
+	state_path = tmp_path / "state.json"
+
+	state = await run_batch_job(talents, state_path, wait=False)
+	assert state.stage == "submitted"
+	assert state.batch_status == "in_progress"
+	mock_pool.executemany.assert_not_called()
+
+	# 재실행 시 프롬프트 생성, 업로드, 제출 없이 조회부터 이어서 실행
+	state = await run_batch_job(talents, state_path, poll_interval=0.01)
+
+	assert state.stage == "stored"
+	assert mock_prepare.call_count == 3
+	assert len(fake_batch_server.batches) == 1
+	assert len(fake_batch_server.files) == 2  # 입력 + 결과
+	assert load_state(state_path).stage == "stored"
+
+	# 완료된 작업은 다시 실행하지 않음
+	await run_batch_job(talents, state_path)
+	assert mock_pool.executemany.call_count == 1
+
+@pytest.mark.asyncio
+async def test_run_batch_job_does_not_resubmit_after_interrupted_create(tmp_path, fake_batch_server, mock_pool, mock_prepare, talents):
+	state_path = tmp_path / "state.json"
+	client = get_batch_client()
+	create = client.batches.create
+
+	# Batch 는 생성되었지만 응답을 저장하기 전에 중단
+	async def create_then_crash(**kwargs):
+		await create(**kwargs)
+		raise ConnectionError("중단")
+
+	client.batches.create = AsyncMock(side_effect=create_then_crash)
+	with pytest.raises(ConnectionError):
+		await run_batch_job(talents, state_path, client=client)
+	assert load_state(state_path).stage == "submitting"
+
+	# 재실행 시 같은 입력 파일의 Batch 를 찾아 이어서 사용
+	client.batches.create = AsyncMock(side_effect=create)
+	state = await run_batch_job(talents, state_path, client=client, poll_interval=0.01)
+
+	assert state.stage == "stored"
+	assert state.batch_id == "batch-fake-1"
+	assert len(fake_batch_server.batches) == 1
+	client.batches.create.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_run_batch_job_creates_batch_when_interrupted_before_create(tmp_path, fake_batch_server, mock_pool, mock_prepare, talents):
+	state_path = tmp_path / "state.json"
+	client = get_batch_client()
+	create = client.batches.create
+
+	# 생성 요청이 서버에 도달하기 전에 중단
+	client.batches.create = AsyncMock(side_effect=ConnectionError("중단"))
+	with pytest.raises(ConnectionError):
+		await run_batch_job(talents, state_path, client=client)
+
+	client.batches.create = AsyncMock(side_effect=create)
+	state = await run_batch_job(talents, state_path, client=client, poll_interval=0.01)
+
+	assert state.stage == "stored"
+	client.batches.create.assert_called_once()
+	assert len(fake_batch_server.batches) == 1
+
+@pytest.mark.asyncio
+async def test_run_batch_job_resumes_interrupted_preparation(tmp_path, fake_batch_server, mock_pool, mock_prepare, talents):
+	state_path = tmp_path / "state.json"
+	original = mock_prepare.side_effect
+
+	async def fail_on_second(talent):
+		if talent.headline == "talent-2":
+			raise RuntimeError("중단")
+		return await original(talent)
+
+	mock_prepare.side_effect = fail_on_second
+	with pytest.raises(RuntimeError):
+		await run_batch_job(talents, state_path)
+	assert sorted(load_state(state_path).items) == ["rule-only", "talent-1"]
+
+	mock_prepare.side_effect = original
+	state = await run_batch_job(talents, state_path, poll_interval=0.01)
+
+	assert state.stage == "stored"
+	assert mock_prepare.call_count == 4
+	assert mock_prepare.call_args.args[0].headline == "talent-2"
+	assert sorted(stored_rows(mock_pool)) == ["rule-only", "talent-1", "talent-2"]
+
+@pytest.mark.asyncio
+async def test_run_batch_job_records_failed_requests(tmp_path, fake_batch_server, mock_pool, mock_prepare, talents):
+	fake_batch_server.enqueue(status=500)
+
+	state = await run_batch_job(talents, tmp_path / "state.json", poll_interval=0.01)
+
+	assert len(state.failed_ids) == 1
+	failed_id = next(iter(state.failed_ids))
+	assert state.failed_ids[failed_id] == "status_code 500"
+	assert failed_id not in stored_rows(mock_pool)
+	assert len(stored_rows(mock_pool)) == 2
+
+@pytest.mark.asyncio
+async def test_run_batch_job_failed_batch_raises(tmp_path, mocker, mock_pool, mock_prepare, talents):
+	client = MagicMock()
+	client.files.create = AsyncMock(return_value=MagicMock(id="file-1"))
+	client.batches.create = AsyncMock(return_value=MagicMock(id="batch-1", status="validating"))
+	client.batches.retrieve = AsyncMock(return_value=MagicMock(id="batch-1", status="failed", output_file_id=None, error_file_id=None, errors="invalid model"))
+
+	with pytest.raises(BatchJobError):
+		await run_batch_job(talents, tmp_path / "state.json", client=client, poll_interval=0.01)
+
+	state = load_state(tmp_path / "state.json")
+	assert state.stage == "submitted"
+	assert state.batch_status == "failed"
+	mock_pool.executemany.assert_not_called()
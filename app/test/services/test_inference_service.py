@@ -1,18 +1,30 @@
 import pytest
+from datetime import date
 from unittest.mock import patch, AsyncMock
 from typing import List
 from langchain_core.documents import Document
+from prometheus_client import REGISTRY
 
 from app.schemas.inference import TalentDataInput, Position, Education, StartEndDate, YearMonth, EducationStartEndDate
+from app.schemas.company import CompanyFacts, CompanyNewsItem, CompanyTenureContext
+from app.core.config import get_settings
+from app.core.shared_cache import SharedCache, CACHE_INFERENCE, CACHE_INFERENCE_STALE
+from app.core.degradation import collect_degradations, DEGRADED_RULES_ONLY, DEGRADED_STALE_CACHE, DEGRADED_RETRIEVAL_FAILED
+from app.core.llm_services import CascadeResult, CASCADE_TIER_FAST, LLMTimeoutError
+from app.services.rule_engine import RuleEngineResult, TagDecision
+from app.services.profile_normalizer import normalize_talent_profile
+from app.services import inference_service
 from app.services.inference_service import (
-	extract_keywords_from_text,
 	preprocess_talent_data_for_search_query,
 	format_talent_profile_for_llm,
 	format_retrieved_documents_for_llm,
 	postprocess_llm_response,
+	format_company_tenure_context_for_llm,
 	infer_experiences_service,
-	#상수
-	KEYWORDS,
+	infer_experiences_with_cache_key,
+	assess_llm_response_confidence,
+	build_experience_prompt,
+	inference_cache_key,
 )
 
 # Fixture
@@ -56,23 +68,9 @@ DESIRED_TAG_ORDER_FOR_TEST = [
 	]
 
 
-# extract_keywords_from_text 테스트
-def test_extract_keywords_found_and_not_found():
-	text = "이 프로젝트는 IPO를 준비하고, M&A를 고려하며, 데이터 분석 및 AI 전략을 통해 성장했습니다. 리더십이 중요합니다."
-
-	result = extract_keywords_from_text(text, KEYWORDS)
-	assert "IPO" in result
-	assert "M&A" in result
-	assert "AI" in result
-
-def test_extract_keywords_empty_inputs():
-	assert extract_keywords_from_text("", KEYWORDS) == []
-	assert extract_keywords_from_text("Some text", []) == []
-
-
 #preprocess_talent_data_for_search_query 테스트
 def test_preprocess_query_includes_career_skills_summary(sample_talent_data_for_service: TalentDataInput):
-	query = preprocess_talent_data_for_search_query(sample_talent_data_for_service)
+	query = preprocess_talent_data_for_search_query(normalize_talent_profile(sample_talent_data_for_service))
 	assert "테스트 잘하는 책임자" in query
 	assert "테스트를 잘해보는 팀에 리드입니다" in query
 	assert "AI" in query
@@ -84,13 +82,13 @@ def test_preprocess_query_includes_career_skills_summary(sample_talent_data_for_
 
 def test_preprocess_query_empty_talent_data():
 	empty_talent = TalentDataInput()
-	query = preprocess_talent_data_for_search_query(empty_talent)
+	query = preprocess_talent_data_for_search_query(normalize_talent_profile(empty_talent))
 	assert query == ""
 
 
 # format_talent_profile_for_llm 테스트
 def test_format_talent_profile_includes_all_sections(sample_talent_data_for_service: TalentDataInput):
-	profile_str = format_talent_profile_for_llm(sample_talent_data_for_service)
+	profile_str = format_talent_profile_for_llm(normalize_talent_profile(sample_talent_data_for_service))
 
 	assert "### 학력 사항" in profile_str
 	assert "(학력 정보 없음)" in profile_str
@@ -115,6 +113,36 @@ def test_format_retrieved_docs_structure_and_content(sample_retrieved_docs: List
 def test_format_retrieved_docs_empty_list():
 	assert format_retrieved_documents_for_llm([]) == "검색된 결과가 없습니다."
 
+
+# format_company_tenure_context_for_llm 테스트
+def test_format_company_tenure_context():
+	context = CompanyTenureContext(
+		company_name = "Test Corp",
+		start_date = date(2020, 8, 1),
+		end_date = None,
+		facts = CompanyFacts(
+			company_id = 1,
+			name = "Test Corp",
+			seed_corp = {"corpStockCdKr": "코스닥", "listingDate": "2021-05-01"},
+			organization = [{"value": 1500, "referenceMonth": "2024-01"}, {"value": 900, "referenceMonth": "2021-01"}],
+			investment = [{"level": "IPO", "investAt": "2021-05-01"}, {"level": "series A", "investAt": "2015-01-01"}],
+		),
+		news = [CompanyNewsItem(title="Test Corp 상장", news_date=date(2021, 5, 1))],
+	)
+	formatted_str = format_company_tenure_context_for_llm([context])
+
+	assert "---재직 기간 회사 정보 시작---" in formatted_str
+	assert "회사 1: Test Corp (재직 2020.08 ~ 현재)" in formatted_str
+	assert "상장 여부: 코스닥 (상장일: 2021-05-01)" in formatted_str
+	assert "직원 수: 1,500명 (2024-01 기준)" in formatted_str
+	assert "재직 기간 투자/M&A: 2021-05-01 IPO" in formatted_str
+	assert "series A" not in formatted_str
+	assert "재직 기간 뉴스 (2021-05-01): Test Corp 상장" in formatted_str
+
+def test_format_company_tenure_context_empty():
+	assert format_company_tenure_context_for_llm([]) == ""
+
+
 # postprocess_llm_response 테스트
 def test_postprocess_llm_response_valid_tags(sample_talent_data_for_service):
 	llm_output = """
@@ -147,6 +175,78 @@ def test_postprocess_llm_response_empty():
 	result = postprocess_llm_response(llm_output, TARGET_EXPERIENCE_TAGS_FOR_TEST)
 	assert len(result) == 0
 
+# cascade 신뢰도 평가 테스트
+def test_assess_llm_response_confidence():
+	confident = "- 상위권 대학교 (서울대학교, 국내 1위)\n- 리더십 (엘박스 CTO)"
+	guessed = "- 리더십 (추정 근거: 팀장 직함)\n- 알수없는태그 (무언가)"
+
+	assert assess_llm_response_confidence(confident, TARGET_EXPERIENCE_TAGS_FOR_TEST, {"상위권 대학교"}) == 1.0
+	# 구조화된 데이터로 확정된 태그가 빠지면 불일치
+	assert assess_llm_response_confidence("- 리더십 (엘박스 CTO)", TARGET_EXPERIENCE_TAGS_FOR_TEST, {"상위권 대학교"}) == 0.0
+	# 추정 근거는 절반, 목록에 없는 태그는 0
+	assert assess_llm_response_confidence(guessed, TARGET_EXPERIENCE_TAGS_FOR_TEST) == 0.25
+	assert assess_llm_response_confidence("", TARGET_EXPERIENCE_TAGS_FOR_TEST) == 0.0
+	# 규칙으로 미부여 확정된 태그가 응답에 있으면 불일치
+	assert assess_llm_response_confidence(confident, TARGET_EXPERIENCE_TAGS_FOR_TEST, rejected_tags={"리더십"}) == 0.0
+
+@pytest.mark.asyncio
+async def test_infer_experiences_service_cascade_mode(mocker, sample_talent_data_for_service: TalentDataInput):
+	mocker.patch.object(get_settings(), "LLM_CASCADE_ENABLED", True)
+	mocker.patch('app.services.inference_service.retrieve_documents_from_sources', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.fetch_company_tenure_contexts', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.evaluate_rules', return_value=RuleEngineResult({"IPO": TagDecision("IPO", False)}))
+	mock_cascade = mocker.patch(
+		'app.services.inference_service.invoke_llm_cascade',
+		new_callable=AsyncMock,
+		return_value=CascadeResult("- 리더십 (엘박스 CTO)", CASCADE_TIER_FAST, 1.0),
+	)
+
+	result = await infer_experiences_service(sample_talent_data_for_service)
+
+	assert result == ["리더십 (엘박스 CTO)"]
+	assess = mock_cascade.call_args.kwargs["assess"]
+	assert assess("- 리더십 (엘박스 CTO)") == 1.0
+	# 규칙으로 미부여 확정된 태그를 작은 모델이 부여하면 escalate
+	assert assess("- IPO (상장)") == 0.0
+
+
+# build_experience_prompt 테스트
+def test_build_experience_prompt_excludes_decided_tags():
+	full_prompt = build_experience_prompt("프로필", "참고자료", "회사정보", TARGET_EXPERIENCE_TAGS_FOR_TEST)
+	short_prompt = build_experience_prompt(
+		"프로필", "참고자료", "회사정보",
+		[tag for tag in TARGET_EXPERIENCE_TAGS_FOR_TEST if tag not in ("상위권 대학교", "IPO")],
+		decided_tag_strings = ["상위권 대학교 (서울대학교, 대학 순위 1위)"],
+	)
+
+	assert "상위권대학교\" 태그 생성 규칙" in full_prompt
+	assert "상위권대학교\" 태그 생성 규칙" not in short_prompt
+	assert "- IPO (밀리의서재" not in short_prompt
+	assert "- 상위권 대학교 (서울대학교, 대학 순위 1위)" in short_prompt
+	assert len(short_prompt) < len(full_prompt)
+
+@pytest.mark.asyncio
+async def test_infer_experiences_service_merges_rule_tags(mocker, sample_talent_data_for_service: TalentDataInput):
+	mocker.patch('app.services.inference_service.retrieve_documents_from_sources', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.fetch_company_tenure_contexts', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.evaluate_rules', return_value=RuleEngineResult({
+		"대규모 회사 경험": TagDecision("대규모 회사 경험", True, "네이버 재직 2020.08~2023.02, 직원 수 4,720명"),
+		"IPO": TagDecision("IPO", False),
+	}))
+	# LLM 이 규칙으로 결정된 태그를 다시 출력해도 무시
+	mock_invoke_llm = mocker.patch(
+		'app.services.inference_service.invoke_llm_for_experience',
+		new_callable=AsyncMock,
+		return_value="- IPO (상장 추정)\n- 대규모 회사 경험 (다른 근거)\n- 리더십 (팀 리드)",
+	)
+
+	result = await infer_experiences_service(sample_talent_data_for_service)
+
+	assert result == ["대규모 회사 경험 (네이버 재직 2020.08~2023.02, 직원 수 4,720명)", "리더십 (팀 리드)"]
+	prompt = mock_invoke_llm.call_args[0][0]
+	assert "경험 태그 목록: " in prompt
+	assert "IPO" not in prompt.split("경험 태그 목록: ")[1].split("\n")[0]
+
 # infer_experiences_service 테스트
 @pytest.mark.asyncio
 async def test_infer_experiences_service_end_to_end_mocked(mocker, sample_talent_data_for_service: TalentDataInput, sample_retrieved_docs: List[Document]):
@@ -158,6 +258,8 @@ async def test_infer_experiences_service_end_to_end_mocked(mocker, sample_talent
 
 	mock_format_profile = mocker.patch('app.services.inference_service.format_talent_profile_for_llm', return_value="포매팅 인재 프로필")
 	mock_format_context = mocker.patch('app.services.inference_service.format_retrieved_documents_for_llm', return_value="포매팅 참고자료")
+	mock_fetch_tenures = mocker.patch('app.services.inference_service.fetch_company_tenure_contexts', new_callable=AsyncMock, return_value=[])
+	mock_evaluate_rules = mocker.patch('app.services.inference_service.evaluate_rules', return_value=RuleEngineResult())
 
 	mocked_llm_raw_output = """
     - 상위권 대학교 (서울대학교, 중앙일보 평가 1위)
@@ -167,9 +269,18 @@ async def test_infer_experiences_service_end_to_end_mocked(mocker, sample_talent
 
 	mock_invoke_llm = mocker.patch('app.services.inference_service.invoke_llm_for_experience', new_callable=AsyncMock, return_value=mocked_llm_raw_output)
 
+	stages = ["total", "preprocess", "relational", "format_context", "rules", "prompt", "llm", "postprocess"]
+	stage_counts_before = {stage: REGISTRY.get_sample_value("inference_stage_duration_seconds_count", {"stage": stage}) or 0.0 for stage in stages}
+
 	result = await infer_experiences_service(sample_talent_data_for_service)
 
-	mock_preprocess_query.assert_called_once_with(sample_talent_data_for_service)
+	# 단계 별 소요 시간 기록
+	for stage in stages:
+		assert REGISTRY.get_sample_value("inference_stage_duration_seconds_count", {"stage": stage}) == stage_counts_before[stage] + 1
+
+	# 전처리, 프로필 포매팅, 규칙 평가가 같은 정규화 프로필을 사용
+	profile = normalize_talent_profile(sample_talent_data_for_service)
+	mock_preprocess_query.assert_called_once_with(profile)
 
 	mock_retrieve_docs.assert_called_once_with(
 		query = "생성된 일반 쿼리",
@@ -178,8 +289,10 @@ async def test_infer_experiences_service_end_to_end_mocked(mocker, sample_talent
 		top_k_university=1
 	)
 
-	mock_format_profile.assert_called_once_with(sample_talent_data_for_service)
+	mock_format_profile.assert_called_once_with(profile)
+	mock_evaluate_rules.assert_called_once_with(profile, [])
 	mock_format_context.assert_called_once_with(sample_retrieved_docs)
+	mock_fetch_tenures.assert_called_once_with([("Test Corp", date(2020, 8, 1), date(2023, 2, 28))])
 
 	mock_invoke_llm.assert_called_once()
 
@@ -187,3 +300,122 @@ async def test_infer_experiences_service_end_to_end_mocked(mocker, sample_talent
 	assert "상위권 대학교 (서울대학교, 중앙일보 평가 1위)" in result
 	assert "리더십 (엘박스 CTO)" in result
 	assert "신규 투자 유치 경험 (엘박스 시리즈 B)" in result
+
+@pytest.mark.asyncio
+async def test_infer_experiences_service_records_failed_request(mocker, sample_talent_data_for_service: TalentDataInput):
+	mocker.patch('app.services.inference_service.retrieve_documents_from_sources', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.fetch_company_tenure_contexts', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.invoke_llm_for_experience', new_callable=AsyncMock, side_effect=LLMTimeoutError("기한 초과"))
+	mock_record = mocker.patch('app.services.inference_service.record_request')
+
+	with pytest.raises(LLMTimeoutError):
+		await infer_experiences_service(sample_talent_data_for_service)
+
+	talent_data, output, latency, outcome = mock_record.call_args[0]
+	assert talent_data is sample_talent_data_for_service
+	assert output is None
+	assert latency >= 0
+	assert outcome == "LLMTimeoutError"
+
+@pytest.mark.asyncio
+async def test_infer_experiences_service_uses_inference_cache(mocker, sample_talent_data_for_service: TalentDataInput):
+	cache = SharedCache(CACHE_INFERENCE, ttl=60)
+	mocker.patch('app.services.inference_service.get_shared_cache', return_value=cache)
+	mocker.patch('app.services.inference_service.retrieve_documents_from_sources', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.fetch_company_tenure_contexts', new_callable=AsyncMock, return_value=[])
+	mock_invoke_llm = mocker.patch('app.services.inference_service.invoke_llm_for_experience', new_callable=AsyncMock, side_effect=[
+		LLMTimeoutError("기한 초과"),
+		"- 리더십 (엘박스 CTO)",
+	])
+
+	# 실패한 추론은 캐시하지 않음
+	with pytest.raises(LLMTimeoutError):
+		await infer_experiences_service(sample_talent_data_for_service)
+	first = await infer_experiences_service(sample_talent_data_for_service)
+	# 정규화 결과가 같은 요청(앞뒤 공백만 다름)은 캐시 hit
+	second = await infer_experiences_service(sample_talent_data_for_service.model_copy(update={"headline": "  테스트 잘하는 책임자 "}))
+
+	assert first == second == ["리더십 (엘박스 CTO)"]
+	assert mock_invoke_llm.await_count == 2
+	profile = normalize_talent_profile(sample_talent_data_for_service)
+	assert await cache.get(inference_cache_key(profile)) == first
+
+@pytest.mark.asyncio
+async def test_infer_experiences_with_cache_key_normalizes_profile_once(mocker, sample_talent_data_for_service: TalentDataInput):
+	cache = SharedCache(CACHE_INFERENCE, ttl=60)
+	mocker.patch('app.services.inference_service.get_shared_cache', return_value=cache)
+	mocker.patch('app.services.inference_service.retrieve_documents_from_sources', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.fetch_company_tenure_contexts', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.invoke_llm_for_experience', new_callable=AsyncMock, return_value="- 리더십 (엘박스 CTO)")
+	normalize = mocker.spy(inference_service, "normalize_talent_profile")
+
+	result = await infer_experiences_with_cache_key(sample_talent_data_for_service)
+	# 추론에 사용하지 않는 필드만 다른 요청은 같은 키
+	renamed = await infer_experiences_with_cache_key(sample_talent_data_for_service.model_copy(update={"firstName": "길동"}))
+
+	assert result.tags == ["리더십 (엘박스 CTO)"]
+	assert result.cache_key == renamed.cache_key == inference_cache_key(normalize_talent_profile(sample_talent_data_for_service))
+	assert normalize.call_count == 2
+
+@pytest.mark.asyncio
+async def test_infer_experiences_service_rules_only_on_llm_failure(mocker, sample_talent_data_for_service: TalentDataInput):
+	mocker.patch.object(get_settings(), "DEGRADE_RULES_ONLY_ON_LLM_FAILURE", True)
+	mocker.patch('app.services.inference_service.retrieve_documents_from_sources', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.fetch_company_tenure_contexts', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.evaluate_rules', return_value=RuleEngineResult({
+		"대규모 회사 경험": TagDecision("대규모 회사 경험", True, "Test Corp 직원 수 4,720명"),
+		"IPO": TagDecision("IPO", False),
+	}))
+	mocker.patch('app.services.inference_service.invoke_llm_for_experience', new_callable=AsyncMock, side_effect=LLMTimeoutError("기한 초과"))
+
+	with collect_degradations() as degradations:
+		result = await infer_experiences_service(sample_talent_data_for_service)
+
+	# LLM 기한 초과 시 오류 대신 규칙으로 결정된 태그만 반환
+	assert result == ["대규모 회사 경험 (Test Corp 직원 수 4,720명)"]
+	assert degradations == [DEGRADED_RULES_ONLY]
+
+@pytest.mark.asyncio
+async def test_infer_experiences_service_serves_stale_result_and_skips_caching_degraded(mocker, sample_talent_data_for_service: TalentDataInput):
+	mocker.patch.object(get_settings(), "DEGRADE_RULES_ONLY_ON_LLM_FAILURE", True)
+	caches = {
+		CACHE_INFERENCE: SharedCache(CACHE_INFERENCE, ttl=0),
+		CACHE_INFERENCE_STALE: SharedCache(CACHE_INFERENCE_STALE, ttl=600),
+	}
+	mocker.patch('app.services.inference_service.get_shared_cache', side_effect=caches.get)
+	mock_retrieve = mocker.patch('app.services.inference_service.retrieve_documents_from_sources', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.fetch_company_tenure_contexts', new_callable=AsyncMock, return_value=[])
+	mocker.patch('app.services.inference_service.invoke_llm_for_experience', new_callable=AsyncMock, side_effect=[
+		"- 리더십 (엘박스 CTO)",
+		LLMTimeoutError("기한 초과"),
+	])
+	profile = normalize_talent_profile(sample_talent_data_for_service)
+
+	# 정상 추론 결과는 stale 캐시에 보관
+	with collect_degradations() as degradations:
+		first = await infer_experiences_service(sample_talent_data_for_service)
+	assert degradations == []
+	assert await caches[CACHE_INFERENCE_STALE].get(inference_cache_key(profile)) == first
+
+	# LLM 실패 시 규칙 결과보다 최근 정상 결과를 먼저 반환
+	with collect_degradations() as degradations:
+		second = await infer_experiences_service(sample_talent_data_for_service)
+	assert second == first == ["리더십 (엘박스 CTO)"]
+	assert degradations == [DEGRADED_STALE_CACHE]
+
+	# 등급을 낮춘 결과는 캐시하지 않음
+	other = sample_talent_data_for_service.model_copy(update={"headline": "다른 헤드라인"})
+	mock_retrieve.side_effect = RuntimeError("검색 실패")
+	mocker.patch('app.services.inference_service.invoke_llm_for_experience', new_callable=AsyncMock, return_value="- 리더십 (엘박스 CTO)")
+	with collect_degradations() as degradations:
+		await infer_experiences_service(other)
+	assert degradations == [DEGRADED_RETRIEVAL_FAILED]
+	assert await caches[CACHE_INFERENCE_STALE].get(inference_cache_key(normalize_talent_profile(other))) is None
+
+def test_inference_cache_key_includes_model_settings(mocker, sample_talent_data_for_service: TalentDataInput):
+	profile = normalize_talent_profile(sample_talent_data_for_service)
+	key = inference_cache_key(profile)
+
+	mocker.patch.object(get_settings(), "LLM_CASCADE_ENABLED", True)
+	assert inference_cache_key(profile) != key
+	assert inference_cache_key(profile).startswith(profile.cache_key)
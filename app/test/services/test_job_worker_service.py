@@ -0,0 +1,172 @@
+import asyncio
+import pytest
+import httpx
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.config import get_settings
+from app.core.job_queue import ClaimedJob
+from app.core.llm_services import LLMCircuitOpenError, LLMRateLimitedError, LLMTimeoutError
+from app.schemas.inference import TalentDataInput
+from app.schemas.job import JobStatusResponse
+from app.services.job_worker_service import JobWorkerPool, is_callback_allowed, deliver_callback, TRANSIENT_RETRY_DELAY
+
+TALENT = TalentDataInput(headline="Engineer")
+
+
+def make_job(attempts: int = 1, callback_url: str = "https://callback.test/jobs") -> ClaimedJob:
+	return ClaimedJob(job_id="job-1", priority="normal", talent_data=TALENT, callback_url=callback_url, attempts=attempts)
+
+
+def make_status(status: str = "succeeded", **kwargs) -> JobStatusResponse:
+	return JobStatusResponse(job_id="job-1", status=status, priority="normal", created_at=datetime.now(timezone.utc), **kwargs)
+
+
+# Fixtures
+@pytest.fixture
+def fake_queue() -> MagicMock:
+	queue = MagicMock()
+	queue.claim = AsyncMock(return_value=make_job())
+	queue.complete = AsyncMock(return_value=make_status(result=["리더십"]))
+	queue.fail = AsyncMock(return_value=make_status("failed", error="오류"))
+	queue.retry = AsyncMock()
+	queue.requeue_stale = AsyncMock(return_value=0)
+	queue.purge_finished = AsyncMock(return_value=0)
+	return queue
+
+@pytest.fixture
+def job_settings(mocker):
+	settings = get_settings()
+	mocker.patch.object(settings, "JOB_MAX_ATTEMPTS", 3)
+	mocker.patch.object(settings, "JOB_CALLBACK_ALLOWED_HOSTS", "callback.test, Hooks.Example.com")
+	mocker.patch.object(settings, "JOB_CALLBACK_MAX_ATTEMPTS", 3)
+	return settings
+
+
+@pytest.mark.asyncio
+async def test_run_once_completes_job_and_delivers_callback(fake_queue, job_settings):
+	infer = AsyncMock(return_value=["리더십"])
+	deliver = AsyncMock(return_value=True)
+	pool = JobWorkerPool(queue=fake_queue, concurrency=1, infer=infer, deliver=deliver)
+
+	assert await pool.run_once() is True
+
+	infer.assert_awaited_once_with(TALENT)
+	fake_queue.complete.assert_awaited_once_with("job-1", ["리더십"])
+	deliver.assert_awaited_once_with("https://callback.test/jobs", fake_queue.complete.return_value)
+
+@pytest.mark.asyncio
+async def test_run_once_returns_false_when_queue_empty(fake_queue, job_settings):
+	fake_queue.claim.return_value = None
+	infer = AsyncMock()
+	pool = JobWorkerPool(queue=fake_queue, concurrency=1, infer=infer, deliver=AsyncMock())
+
+	assert await pool.run_once() is False
+	infer.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_transient_error_is_retried_after_retry_after(fake_queue, job_settings):
+	deliver = AsyncMock()
+	infer = AsyncMock(side_effect=LLMRateLimitedError("한도 초과", retry_after=12.0))
+	pool = JobWorkerPool(queue=fake_queue, concurrency=1, infer=infer, deliver=deliver)
+
+	await pool.run_once()
+
+	fake_queue.retry.assert_awaited_once()
+	assert fake_queue.retry.await_args.args[2] == 12.0
+	fake_queue.fail.assert_not_awaited()
+	deliver.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_transient_error_without_retry_after_uses_default_delay(fake_queue, job_settings):
+	pool = JobWorkerPool(queue=fake_queue, concurrency=1, infer=AsyncMock(side_effect=LLMTimeoutError("시간 초과")), deliver=AsyncMock())
+
+	await pool.run_once()
+
+	assert fake_queue.retry.await_args.args[2] == TRANSIENT_RETRY_DELAY
+
+@pytest.mark.asyncio
+async def test_half_open_circuit_retry_waits_at_least_default_delay(fake_queue, job_settings):
+	# half-open 상태 거부는 retry_after=0 이므로 바로 재시도하면 시도 횟수만 소진
+	infer = AsyncMock(side_effect=LLMCircuitOpenError("차단", retry_after=0.0))
+	pool = JobWorkerPool(queue=fake_queue, concurrency=1, infer=infer, deliver=AsyncMock())
+
+	await pool.run_once()
+
+	assert fake_queue.retry.await_args.args[2] == TRANSIENT_RETRY_DELAY
+
+@pytest.mark.asyncio
+async def test_transient_error_fails_after_max_attempts(fake_queue, job_settings):
+	fake_queue.claim.return_value = make_job(attempts=3)
+	deliver = AsyncMock()
+	pool = JobWorkerPool(queue=fake_queue, concurrency=1, infer=AsyncMock(side_effect=LLMTimeoutError("시간 초과")), deliver=deliver)
+
+	await pool.run_once()
+
+	fake_queue.retry.assert_not_awaited()
+	assert fake_queue.fail.await_args.args[1] == "LLMTimeoutError: 시간 초과"
+	deliver.assert_awaited_once_with("https://callback.test/jobs", fake_queue.fail.return_value)
+
+@pytest.mark.asyncio
+async def test_unexpected_error_fails_without_retry(fake_queue, job_settings):
+	fake_queue.claim.return_value = make_job(callback_url=None)
+	deliver = AsyncMock()
+	pool = JobWorkerPool(queue=fake_queue, concurrency=1, infer=AsyncMock(side_effect=ValueError("잘못된 응답")), deliver=deliver)
+
+	await pool.run_once()
+
+	fake_queue.retry.assert_not_awaited()
+	assert fake_queue.fail.await_args.args[1] == "ValueError: 잘못된 응답"
+	deliver.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_start_and_stop_drain_queue(fake_queue, job_settings):
+	fake_queue.claim.side_effect = [make_job(callback_url=None), make_job(callback_url=None)] + [None] * 100
+	infer = AsyncMock(return_value=["리더십"])
+	pool = JobWorkerPool(queue=fake_queue, concurrency=2, infer=infer, deliver=AsyncMock(), poll_interval=0.01)
+
+	pool.start()
+	await asyncio.sleep(0.05)
+	await pool.stop(timeout=1.0)
+
+	assert infer.await_count == 2
+	fake_queue.requeue_stale.assert_awaited()
+	fake_queue.purge_finished.assert_awaited()
+
+
+def test_is_callback_allowed(job_settings):
+	assert is_callback_allowed("https://callback.test/jobs")
+	assert is_callback_allowed("http://hooks.example.com:8080/done")
+	assert not is_callback_allowed("https://169.254.169.254/latest/meta-data")
+	assert not is_callback_allowed("ftp://callback.test/jobs")
+	assert not is_callback_allowed("callback.test/jobs")
+
+def test_callbacks_disabled_without_allowlist(mocker):
+	mocker.patch.object(get_settings(), "JOB_CALLBACK_ALLOWED_HOSTS", "")
+
+	assert not is_callback_allowed("https://callback.test/jobs")
+
+
+@pytest.mark.asyncio
+async def test_deliver_callback_retries_server_errors(mocker, job_settings):
+	mocker.patch("app.services.job_worker_service.jittered_backoff", return_value=0)
+	request = httpx.Request("POST", "https://callback.test/jobs")
+	post = mocker.patch(
+		"httpx.AsyncClient.post",
+		new_callable=AsyncMock,
+		side_effect=[httpx.ConnectError("연결 실패", request=request), httpx.Response(503, request=request), httpx.Response(200, request=request)],
+	)
+
+	assert await deliver_callback("https://callback.test/jobs", make_status(result=["리더십"])) is True
+
+	assert post.await_count == 3
+	assert post.await_args.kwargs["headers"] == {"X-Job-Id": "job-1"}
+	assert post.await_args.kwargs["json"]["result"] == ["리더십"]
+
+@pytest.mark.asyncio
+async def test_deliver_callback_does_not_retry_client_errors(mocker, job_settings):
+	request = httpx.Request("POST", "https://callback.test/jobs")
+	post = mocker.patch("httpx.AsyncClient.post", new_callable=AsyncMock, return_value=httpx.Response(404, request=request))
+
+	assert await deliver_callback("https://callback.test/jobs", make_status()) is False
+	assert post.await_count == 1
@@ -0,0 +1,145 @@
+import dataclasses
+import pytest
+from datetime import date
+
+from app.schemas.inference import TalentDataInput, Position, Education, StartEndDate, YearMonth, EducationStartEndDate
+from app.services.profile_normalizer import (
+	extract_keywords_from_text,
+	year_month_to_date,
+	format_year_month,
+	normalize_talent_profile,
+	KEYWORDS,
+)
+
+
+@pytest.fixture
+def talent_data() -> TalentDataInput:
+	return TalentDataInput(
+		firstName = "길동",
+		headline = "  Head of Engineering  ",
+		summary = "데이터 플랫폼 리드",
+		skills = ["Python", "AI"],
+		positions = [
+			Position(
+				companyName = " 네이버 ",
+				title = "Engineer",
+				description = "\n검색 서비스 운영 및 성장 총괄\n- AI 검색 도입",
+				startEndDate = StartEndDate(start=YearMonth(year=2020, month=8), end=YearMonth(year=2023, month=2)),
+			),
+			Position(companyName="엘박스", title="CTO", startEndDate=StartEndDate(start=YearMonth(year=2023, month=3))),
+			Position(companyName="   ", description="운영 투자 유치"),
+		],
+		educations = [
+			Education(schoolName=" 서울대학교", degreeName="학사", fieldOfStudy="컴퓨터공학", startEndDate="2010 - 2014"),
+			Education(
+				schoolName = "KAIST",
+				degreeName = "석사",
+				originStartEndDate = EducationStartEndDate(startDateOn=YearMonth(year=2014, month=3)),
+				startEndDate = EducationStartEndDate(startDateOn=YearMonth(year=2000), endDateOn=YearMonth(year=2001)),
+			),
+			Education(schoolName=""),
+		],
+	)
+
+
+# extract_keywords_from_text 테스트
+def test_extract_keywords_found_and_not_found():
+	text = "이 프로젝트는 IPO를 준비하고, M&A를 고려하며, 데이터 분석 및 AI 전략을 통해 성장했습니다. 리더십이 중요합니다."
+
+	result = extract_keywords_from_text(text, KEYWORDS)
+	assert "IPO" in result
+	assert "M&A" in result
+	assert "AI" in result
+	# 키워드 목록 순서 유지
+	assert result == [kw for kw in KEYWORDS if kw in result]
+
+def test_extract_keywords_empty_inputs():
+	assert extract_keywords_from_text("", KEYWORDS) == []
+	assert extract_keywords_from_text("Some text", []) == []
+
+
+# 날짜 변환 테스트
+def test_year_month_to_date_start_and_end():
+	assert year_month_to_date(YearMonth(year=2020, month=2)) == date(2020, 2, 1)
+	assert year_month_to_date(YearMonth(year=2020, month=2), is_end=True) == date(2020, 2, 29)
+	assert year_month_to_date(YearMonth(year=2020), is_end=True) == date(2020, 12, 31)
+	assert year_month_to_date(None) is None
+
+def test_format_year_month():
+	assert format_year_month(YearMonth(year=2020, month=2)) == "2020.02"
+	assert format_year_month(YearMonth(year=2020)) == "2020"
+	assert format_year_month(YearMonth(month=2)) == ""
+	assert format_year_month(None) == ""
+
+
+# normalize_talent_profile 테스트
+def test_normalize_positions(talent_data: TalentDataInput):
+	profile = normalize_talent_profile(talent_data)
+	naver, elbox, unnamed = profile.positions
+
+	assert naver.company_name == "네이버"
+	assert naver.description == "검색 서비스 운영 및 성장 총괄\n- AI 검색 도입"
+	assert naver.first_line == "검색 서비스 운영 및 성장 총괄"
+	assert naver.keywords == ("총괄", "성장", "운영", "AI")
+	assert (naver.start_date, naver.end_date) == (date(2020, 8, 1), date(2023, 2, 28))
+	assert naver.period_label == "2020.08 ~ 2023.02"
+	assert naver.tenure_months == 31
+
+	# 재직 중
+	assert elbox.end_date is None
+	assert elbox.period_label == "2023.03 ~ 현재"
+	assert elbox.tenure_months is None
+	assert elbox.keywords == ()
+
+	assert unnamed.company_name is None
+	assert unnamed.period_label == "시작일 정보 없음 ~ 현재"
+
+def test_normalize_derived_fields(talent_data: TalentDataInput):
+	profile = normalize_talent_profile(talent_data)
+
+	assert profile.headline == "Head of Engineering"
+	assert profile.company_names == ("네이버", "엘박스")
+	assert profile.school_names == ("서울대학교", "KAIST")
+	assert profile.university_query == "서울대학교"
+	assert profile.keywords == ("총괄", "성장", "운영", "AI", "투자", "유치")
+	assert profile.tenures == [("네이버", date(2020, 8, 1), date(2023, 2, 28)), ("엘박스", date(2023, 3, 1), None)]
+
+def test_normalize_education_period(talent_data: TalentDataInput):
+	educations = normalize_talent_profile(talent_data).educations
+
+	assert educations[0].period_label == "2010 - 2014"
+	assert educations[0].degree_field == "학사 컴퓨터공학"
+	# originStartEndDate 우선
+	assert educations[1].period_label == "2014.03 ~ 현재"
+	assert educations[2].period_label == "기간 정보 없음"
+	assert educations[2].degree_field == ""
+
+def test_normalize_empty_talent_data():
+	profile = normalize_talent_profile(TalentDataInput())
+
+	assert profile.positions == () and profile.educations == ()
+	assert profile.tenures == []
+	assert profile.university_query is None
+
+def test_normalized_profile_is_immutable(talent_data: TalentDataInput):
+	profile = normalize_talent_profile(talent_data)
+
+	with pytest.raises(dataclasses.FrozenInstanceError):
+		profile.headline = "변경"
+	assert not hasattr(profile, "__dict__")
+
+
+# cache_key 테스트
+def test_cache_key_ignores_identity_fields(talent_data: TalentDataInput):
+	key = normalize_talent_profile(talent_data).cache_key
+	other_person = talent_data.model_copy(update={"firstName": "철수", "photoUrl": "https://example.com/a.png"})
+
+	assert normalize_talent_profile(talent_data).cache_key == key
+	assert normalize_talent_profile(other_person).cache_key == key
+	assert len(key) == 64
+
+def test_cache_key_changes_with_inference_inputs(talent_data: TalentDataInput):
+	key = normalize_talent_profile(talent_data).cache_key
+
+	assert normalize_talent_profile(talent_data.model_copy(update={"skills": ["Python"]})).cache_key != key
+	assert normalize_talent_profile(talent_data.model_copy(update={"summary": "다른 요약"})).cache_key != key
@@ -0,0 +1,157 @@
+import pytest
+from datetime import date
+
+from app.core.static_data import UniversityRank
+from app.schemas.company import CompanyFacts, CompanyNewsItem, CompanyTenureContext
+from app.schemas.inference import TalentDataInput, Position, Education
+from app.services.profile_normalizer import NormalizedProfile, normalize_talent_profile
+from app.services.rule_engine import (
+	evaluate_rules,
+	rule_top_university,
+	rule_large_company,
+	rule_ipo,
+	rule_mna,
+	RuleInput,
+	TagDecision,
+	LARGE_COMPANY_MIN_HEADCOUNT,
+)
+
+
+# Fixtures
+@pytest.fixture(autouse=True)
+def mock_university_ranks(mocker):
+	ranks = {"서울대학교": 1, "한양대학교": 25}
+	mocker.patch(
+		'app.services.rule_engine.find_university_rank',
+		side_effect=lambda name: UniversityRank(name=name, rank=ranks[name]) if name in ranks else None,
+	)
+
+def make_context(
+	company_name: str,
+	start_date: date,
+	end_date=None,
+	headcount: int = 100,
+	listing_date=None,
+	investment=None,
+	news=None,
+	news_complete: bool = True,
+	) -> CompanyTenureContext:
+	return CompanyTenureContext(
+		company_name = company_name,
+		start_date = start_date,
+		end_date = end_date,
+		facts = CompanyFacts(
+			company_id = 1,
+			name = company_name,
+			seed_corp = {"corpStockCdKr": "KOSDAQ" if listing_date else "비상장", "listingDate": listing_date},
+			organization = [
+				{"value": headcount, "referenceMonth": "2023-01"},
+				{"value": headcount // 2, "referenceMonth": "2022-02"},
+			],
+			investment = investment or [],
+		),
+		news = news or [],
+		news_complete = news_complete,
+	)
+
+def make_profile(*company_names: str, schools=()) -> NormalizedProfile:
+	return normalize_talent_profile(TalentDataInput(
+		positions = [Position(companyName=name) for name in company_names],
+		educations = [Education(schoolName=school) for school in schools],
+	))
+
+
+# 상위권 대학교 규칙
+def test_rule_top_university():
+	assert rule_top_university(RuleInput(make_profile(schools=["한양대학교", "서울대학교"]))) == TagDecision("상위권 대학교", True, "서울대학교, 대학 순위 1위")
+	assert rule_top_university(RuleInput(make_profile(schools=["한양대학교"]))) == TagDecision("상위권 대학교", False)
+	assert rule_top_university(RuleInput(make_profile())) == TagDecision("상위권 대학교", False)
+	# 순위 데이터에 없는 학교는 LLM 판단
+	assert rule_top_university(RuleInput(make_profile(schools=["MIT"]))) is None
+
+
+# 대규모 회사 경험 규칙
+def test_rule_large_company_uses_headcount_within_tenure():
+	context = make_context("네이버", date(2022, 1, 1), date(2023, 12, 31), headcount=LARGE_COMPANY_MIN_HEADCOUNT * 4)
+	decision = rule_large_company(RuleInput(make_profile("네이버"), [context]))
+
+	assert decision.matched
+	assert decision.evidence == "네이버 재직 2022.01~2023.12, 직원 수 4,000명"
+
+def test_rule_large_company_small_or_unknown():
+	small = make_context("엘박스", date(2022, 1, 1), headcount=50)
+	assert rule_large_company(RuleInput(make_profile("엘박스"), [small])) == TagDecision("대규모 회사 경험", False)
+	# DB에 없는 회사가 있으면 미부여 확정 불가
+	assert rule_large_company(RuleInput(make_profile("엘박스", "없는회사"), [small])) is None
+	# 재직 기간과 겹치는 직원 수 데이터가 없으면 판단 불가
+	old = make_context("엘박스", date(2015, 1, 1), date(2016, 12, 31), headcount=50)
+	assert rule_large_company(RuleInput(make_profile("엘박스"), [old])) is None
+
+
+# IPO / M&A 규칙
+def test_rule_ipo_listing_date_within_tenure():
+	context = make_context("리디", date(2021, 1, 1), listing_date="2023-09-27")
+	decision = rule_ipo(RuleInput(make_profile("리디"), [context]))
+
+	assert decision == TagDecision("IPO", True, "리디 재직 2021.01~현재, 2023-09-27 KOSDAQ 상장")
+
+def test_rule_ipo_listed_before_tenure_is_not_ipo():
+	context = make_context("네이버", date(2020, 1, 1), listing_date="2002-10-29")
+	assert rule_ipo(RuleInput(make_profile("네이버"), [context])) == TagDecision("IPO", False)
+
+def test_rule_mna_from_investment():
+	by_investment = make_context("카사코리아", date(2022, 1, 1), investment=[{"level": "M&A", "investAt": "2023-03-14"}])
+	assert rule_mna(RuleInput(make_profile("카사코리아"), [by_investment])).evidence == "카사코리아 재직 2022.01~현재, 2023-03-14 M&A"
+
+	before_tenure = make_context("카사코리아", date(2024, 1, 1), investment=[{"level": "M&A", "investAt": "2023-03-14"}])
+	assert rule_mna(RuleInput(make_profile("카사코리아"), [before_tenure])) == TagDecision("M&A 경험", False)
+
+def test_rule_ipo_mna_undecided_when_news_truncated():
+	# 최신 뉴스만 조회된 경우 재직 초기 이벤트 뉴스가 빠졌을 수 있음
+	news = [CompanyNewsItem(title="네이버 신규 서비스 출시", news_date=date(2024, 1, 1))]
+	truncated = make_context("네이버", date(2015, 1, 1), news=news, news_complete=False)
+	complete = make_context("네이버", date(2015, 1, 1), news=news)
+
+	assert rule_ipo(RuleInput(make_profile("네이버"), [truncated])) is None
+	assert rule_mna(RuleInput(make_profile("네이버"), [truncated])) is None
+	assert rule_mna(RuleInput(make_profile("네이버"), [complete])) == TagDecision("M&A 경험", False)
+
+
+def test_rule_ipo_mna_event_news_left_to_llm():
+	# 상장 추진/연기, 다른 회사 인수 기사처럼 키워드만 포함된 뉴스로는 부여/미부여를 확정하지 않음
+	ipo_news = [CompanyNewsItem(title="야놀자 나스닥 상장 내년으로 미룬다", news_date=date(2024, 9, 8))]
+	postponed = make_context("야놀자", date(2022, 1, 1), end_date=date(2024, 12, 31), news=ipo_news)
+	assert rule_ipo(RuleInput(make_profile("야놀자"), [postponed])) is None
+
+	mna_news = [CompanyNewsItem(title="네이버, 포시마크 인수완료", news_date=date(2023, 1, 6))]
+	acquisition = make_context("네이버", date(2022, 1, 1), news=mna_news)
+	assert rule_mna(RuleInput(make_profile("네이버"), [acquisition])) is None
+
+	# 재직 기간 밖의 뉴스는 판단에 영향 없음
+	after_tenure = make_context("야놀자", date(2020, 1, 1), end_date=date(2021, 12, 31), news=ipo_news)
+	assert rule_ipo(RuleInput(make_profile("야놀자"), [after_tenure])) == TagDecision("IPO", False)
+
+
+# evaluate_rules 테스트
+def test_evaluate_rules_collects_decisions():
+	profile = make_profile("네이버", schools=["서울대학교"])
+	context = make_context("네이버", date(2022, 1, 1), headcount=4720, listing_date="2002-10-29")
+
+	result = evaluate_rules(profile, [context])
+
+	assert [decision.tag for decision in result.matched] == ["상위권 대학교", "대규모 회사 경험"]
+	assert result.tag_strings()[0] == "상위권 대학교 (서울대학교, 대학 순위 1위)"
+	assert result.undecided_tags(["상위권 대학교", "IPO", "M&A 경험", "리더십"]) == ["리더십"]
+
+def test_evaluate_rules_without_company_facts_leaves_company_tags_undecided():
+	result = evaluate_rules(make_profile("없는회사", schools=["서울대학교"]), [])
+
+	assert result.undecided_tags(["상위권 대학교", "대규모 회사 경험", "IPO", "M&A 경험"]) == ["대규모 회사 경험", "IPO", "M&A 경험"]
+
+def test_evaluate_rules_skips_failing_rule():
+	def broken_rule(rule_input):
+		raise RuntimeError("규칙 오류")
+
+	result = evaluate_rules(make_profile(schools=["서울대학교"]), rules=[broken_rule, rule_top_university])
+
+	assert list(result.decisions) == ["상위권 대학교"]
@@ -0,0 +1,107 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.config import settings
+from app.services.warmup_service import retry_warm_up_until_ready, warm_up_application, get_readiness, set_readiness
+from app.schemas.health import ReadinessResponse
+
+
+# Fixtures
+@pytest.fixture
+def mock_components(mocker):
+	mocker.patch.object(settings, "RELATIONAL_DB_ENABLED", True)
+	mocker.patch.object(settings, "LLM_CASCADE_ENABLED", False)
+	mocks = {
+		"llm_client": mocker.patch('app.services.warmup_service.get_llm_instance', return_value=MagicMock()),
+		"company_vectorstore": mocker.patch('app.services.warmup_service.get_company_vectorstore', return_value=MagicMock()),
+		"news_vectorstore": mocker.patch('app.services.warmup_service.get_news_vectorstore', return_value=MagicMock()),
+		"university_vectorstore": mocker.patch('app.services.warmup_service.get_university_vectorstore', return_value=MagicMock()),
+		"static_indexes": mocker.patch('app.services.warmup_service.preload_static_indexes', return_value={"university_ranks": 20}),
+		"relational_pool": mocker.patch('app.services.warmup_service.get_relational_pool', new_callable=AsyncMock),
+	}
+	yield mocks
+	set_readiness(ReadinessResponse(ready=False))
+
+
+# warm_up_application 테스트
+@pytest.mark.asyncio
+async def test_warm_up_all_components_ready(mock_components):
+	readiness = await warm_up_application(run_synthetic_request=False)
+
+	assert readiness.ready is True
+	assert get_readiness() is readiness
+	assert {c.name for c in readiness.components} == set(mock_components)
+	for mock in mock_components.values():
+		mock.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_warm_up_component_failure_not_ready(mock_components):
+	mock_components["news_vectorstore"].side_effect = Exception("DB 연결 실패")
+
+	readiness = await warm_up_application(run_synthetic_request=False)
+
+	assert readiness.ready is False
+	failed = [c for c in readiness.components if not c.ok]
+	assert len(failed) == 1
+	assert failed[0].name == "news_vectorstore"
+	assert "DB 연결 실패" in failed[0].detail
+
+@pytest.mark.asyncio
+async def test_warm_up_skips_relational_pool_when_disabled(mocker, mock_components):
+	mocker.patch.object(settings, "RELATIONAL_DB_ENABLED", False)
+
+	readiness = await warm_up_application(run_synthetic_request=False)
+
+	assert readiness.ready is True
+	mock_components["relational_pool"].assert_not_called()
+
+@pytest.mark.asyncio
+async def test_warm_up_runs_synthetic_request(mocker, mock_components):
+	mock_infer = mocker.patch('app.services.inference_service.infer_experiences_service', new_callable=AsyncMock, return_value=["태그 (근거)"])
+
+	readiness = await warm_up_application(run_synthetic_request=True)
+
+	assert readiness.ready is True
+	mock_infer.assert_called_once()
+	assert readiness.components[-1].name == "synthetic_request"
+
+@pytest.mark.asyncio
+async def test_warm_up_synthetic_request_failure_not_ready(mocker, mock_components):
+	mocker.patch('app.services.inference_service.infer_experiences_service', new_callable=AsyncMock, side_effect=Exception("LLM 오류"))
+
+	readiness = await warm_up_application(run_synthetic_request=True)
+
+	assert readiness.ready is False
+
+
+# retry_warm_up_until_ready 테스트
+@pytest.mark.asyncio
+async def test_retry_warm_up_until_components_recover(mocker, mock_components):
+	mocker.patch.object(settings, "WARMUP_RETRY_BASE_DELAY", 0.0)
+	sleep = mocker.patch("app.services.warmup_service.asyncio.sleep", new_callable=AsyncMock)
+	# DB 가 잠시 연결되지 않다가 두 번째 재시도에서 복구
+	mock_components["news_vectorstore"].side_effect = [Exception("DB 연결 실패"), Exception("DB 연결 실패"), MagicMock()]
+
+	assert (await warm_up_application(run_synthetic_request=False)).ready is False
+	readiness = await retry_warm_up_until_ready(run_synthetic_request=False)
+
+	assert readiness.ready is True
+	assert get_readiness() is readiness
+	assert mock_components["news_vectorstore"].call_count == 3
+	assert sleep.await_count == 2
+
+@pytest.mark.asyncio
+async def test_retry_keeps_failed_components_visible(mocker, mock_components):
+	mock_components["static_indexes"].side_effect = Exception("CSV 없음")
+	await warm_up_application(run_synthetic_request=False)
+
+	statuses = []
+
+	async def record_readiness(delay):
+		statuses.append(get_readiness())
+		mock_components["static_indexes"].side_effect = None
+
+	mocker.patch("app.services.warmup_service.asyncio.sleep", side_effect=record_readiness)
+	await retry_warm_up_until_ready(run_synthetic_request=False)
+
+	assert [c.name for c in statuses[0].components if not c.ok] == ["static_indexes"]
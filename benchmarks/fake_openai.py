@@ -0,0 +1,386 @@
+"""
+OpenAI 호환 Chat Completions fake 서버
+
+테스트와 부하 테스트에서 실제 OpenAI API 대신 사용합니다.
+응답 지연, 오류 상태 코드(429, 5xx 등)를 스크립트로 지정하거나 무작위로 발생시킬 수 있습니다.
+Batch API(/v1/files, /v1/batches)도 지원하며, Batch 는 batch_polls 번 조회된 뒤 완료되고
+각 요청은 Chat Completions 와 같은 스크립트/기본 응답으로 처리됩니다.
+Embeddings(/v1/embeddings)는 입력 별로 고정된(해시 기반) 정규화 벡터를 반환해 pgvector 시드와 검색에 사용합니다.
+
+    python benchmarks/fake_openai.py --port 8001 --latency-ms 800 --error-rate 0.05
+    # 응답 토큰 수와 토큰 당 생성 시간으로 LLM 디코딩 지연 재현 (800ms + 300 * 20ms)
+    python benchmarks/fake_openai.py --latency-ms 800 --completion-tokens 300 --ms-per-token 20
+    OPENAI_BASE_URL=http://127.0.0.1:8001/v1 uvicorn app.main:app
+"""
+
+import argparse
+import base64
+import email.parser
+import email.policy
+import hashlib
+import json
+import math
+import random
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional
+
+DEFAULT_CONTENT = "- 대규모 회사 경험 (네이버 재직)\n- 상위권대학교 (서울대학교)"
+# text-embedding-3-small 차원 (pgvector 컬럼 차원과 일치해야 함)
+DEFAULT_EMBEDDING_DIMENSIONS = 1536
+
+
+@dataclass
+class FakeResponse:
+    """스크립트로 지정하는 응답 1건"""
+    status: int = 200
+    delay: float = 0.0
+    content: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class FakeOpenAIServer:
+    """
+    백그라운드 스레드에서 실행되는 fake 서버
+    enqueue 로 넣은 응답을 순서대로 사용하고, 비어있으면 기본 응답(latency, error_rate)을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        content: str = DEFAULT_CONTENT,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        batch_polls: int = 1,
+        completion_tokens: Optional[int] = None,
+        token_latency: float = 0.0,
+        embedding_latency: float = 0.0,
+        embedding_dimensions: int = DEFAULT_EMBEDDING_DIMENSIONS,
+    ):
+        self.content = content
+        self.latency = latency
+        self.error_rate = error_rate
+        self.batch_polls = batch_polls
+        # 응답 토큰 수 (usage 에 보고, None 이면 본문 길이로 추정)와 토큰 당 생성 시간(초)
+        self.completion_tokens = completion_tokens
+        self.token_latency = token_latency
+        self.embedding_latency = embedding_latency
+        self.embedding_dimensions = embedding_dimensions
+        self.embedding_requests = 0
+        self.requests: List[dict] = []
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, dict] = {}
+        self._script: Deque[FakeResponse] = deque()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def request_count(self) -> int:
+        with self._lock:
+            return len(self.requests)
+
+    def enqueue(self, status: int = 200, delay: float = 0.0, content: Optional[str] = None, headers: Optional[Dict[str, str]] = None) -> None:
+        with self._lock:
+            self._script.append(FakeResponse(status, delay, content, headers or {}))
+
+    def _next_response(self, body: dict) -> FakeResponse:
+        with self._lock:
+            self.requests.append(body)
+            if self._script:
+                return self._script.popleft()
+        if self.error_rate and random.random() < self.error_rate:
+            return FakeResponse(status=random.choice([429, 500, 503]), delay=self.latency)
+        return FakeResponse(delay=self.latency)
+
+    def _completion_tokens(self, content: str) -> int:
+        return self.completion_tokens if self.completion_tokens is not None else len(content) // 4
+
+    def _generation_delay(self, content: str) -> float:
+        return self._completion_tokens(content) * self.token_latency
+
+    def _completion(self, body: dict, content: str) -> dict:
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in body.get("messages", [])) // 4
+        completion_tokens = self._completion_tokens(content)
+        return {
+            "id": f"chatcmpl-fake-{self.request_count}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def _embedding(self, text: str) -> List[float]:
+        """입력 별로 고정된 단위 벡터 (같은 입력은 항상 같은 벡터)"""
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+        rng = random.Random(seed)
+        vector = [rng.gauss(0.0, 1.0) for _ in range(self.embedding_dimensions)]
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+    def _embeddings(self, body: dict) -> dict:
+        inputs = body.get("input", [])
+        # 문자열, 문자열 목록, 토큰 id 목록(langchain 길이 검사 사용 시) 모두 허용
+        if isinstance(inputs, str) or (inputs and isinstance(inputs[0], int)):
+            inputs = [inputs]
+        with self._lock:
+            self.embedding_requests += 1
+        data = []
+        for i, item in enumerate(inputs):
+            vector = self._embedding(json.dumps(item, ensure_ascii=False))
+            # openai 클라이언트는 기본으로 base64(float32) 응답을 요청
+            if body.get("encoding_format") == "base64":
+                vector = base64.b64encode(struct.pack(f"<{len(vector)}f", *vector)).decode("ascii")
+            data.append({"object": "embedding", "index": i, "embedding": vector})
+        tokens = sum(len(item) if isinstance(item, list) else len(item) // 4 for item in inputs)
+        return {
+            "object": "list",
+            "data": data,
+            "model": body.get("model", "fake-embedding"),
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        }
+
+    def _add_file(self, filename: str, data: bytes, purpose: str) -> dict:
+        with self._lock:
+            file_id = f"file-fake-{len(self.files) + 1}"
+            self.files[file_id] = data
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(data),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+        }
+
+    def _create_batch(self, body: dict) -> dict:
+        with self._lock:
+            batch_id = f"batch-fake-{len(self.batches) + 1}"
+            batch = {
+                "id": batch_id,
+                "object": "batch",
+                "endpoint": body.get("endpoint"),
+                "input_file_id": body.get("input_file_id"),
+                "completion_window": body.get("completion_window", "24h"),
+                "status": "validating",
+                "created_at": int(time.time()),
+                "metadata": body.get("metadata"),
+                "request_counts": {"total": 0, "completed": 0, "failed": 0},
+                "_polls": 0,
+            }
+            self.batches[batch_id] = batch
+        return batch
+
+    def _run_batch(self, batch: dict) -> None:
+        """입력 파일의 요청을 처리해 결과/오류 파일 생성"""
+        outputs, errors = [], []
+        for i, line in enumerate(self.files.get(batch["input_file_id"], b"").decode("utf-8").splitlines()):
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            scripted = self._next_response(request["body"])
+            if scripted.status != 200:
+                response = {"status_code": scripted.status, "body": {"error": {"message": f"fake error {scripted.status}"}}}
+                target = errors
+            else:
+                content = scripted.content if scripted.content is not None else self.content
+                response = {"status_code": 200, "body": self._completion(request["body"], content)}
+                target = outputs
+            target.append(json.dumps({
+                "id": f"batch_req_{i}",
+                "custom_id": request["custom_id"],
+                "response": response,
+                "error": None,
+            }, ensure_ascii=False))
+
+        batch["request_counts"] = {"total": len(outputs) + len(errors), "completed": len(outputs), "failed": len(errors)}
+        batch["output_file_id"] = self._add_file("output.jsonl", "\n".join(outputs).encode("utf-8"), "batch_output")["id"] if outputs else None
+        batch["error_file_id"] = self._add_file("errors.jsonl", "\n".join(errors).encode("utf-8"), "batch_output")["id"] if errors else None
+        batch["status"] = "completed"
+        batch["completed_at"] = int(time.time())
+
+    def _poll_batch(self, batch_id: str) -> Optional[dict]:
+        batch = self.batches.get(batch_id)
+        if batch is None:
+            return None
+        batch["_polls"] += 1
+        if batch["status"] != "completed":
+            if batch["_polls"] >= self.batch_polls:
+                self._run_batch(batch)
+            else:
+                batch["status"] = "in_progress"
+        return {key: value for key, value in batch.items() if not key.startswith("_")}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, payload: dict, headers: Dict[str, str]) -> None:
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    for key, value in headers.items():
+                        self.send_header(key, value)
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    # 헤징/기한 초과로 클라이언트가 먼저 연결을 끊은 경우
+                    self.close_connection = True
+
+            def _not_found(self):
+                self._send_json(404, {"error": {"message": f"unknown path {self.path}", "type": "invalid_request_error"}}, {})
+
+            def _upload_file(self, raw: bytes) -> None:
+                # multipart/form-data 업로드 (file, purpose 필드)
+                header = f"Content-Type: {self.headers.get('Content-Type')}\r\n\r\n".encode("utf-8")
+                message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(header + raw)
+                fields = {part.get_param("name", header="content-disposition"): part for part in message.iter_parts()}
+                file_part = fields["file"]
+                purpose = fields["purpose"].get_payload(decode=True).decode("utf-8") if "purpose" in fields else "batch"
+                self._send_json(200, server._add_file(file_part.get_filename() or "upload.jsonl", file_part.get_payload(decode=True), purpose), {})
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                parts = path.rstrip("/").split("/")
+                if path.rstrip("/").endswith("/batches"):
+                    # 최신 Batch 부터 (페이지 1개)
+                    batches = [{key: value for key, value in batch.items() if not key.startswith("_")} for batch in reversed(list(server.batches.values()))]
+                    self._send_json(200, {"object": "list", "data": batches, "has_more": False}, {})
+                    return
+                if len(parts) >= 4 and parts[-2] == "batches":
+                    batch = server._poll_batch(parts[-1])
+                    if batch is not None:
+                        self._send_json(200, batch, {})
+                        return
+                elif len(parts) >= 4 and parts[-1] == "content" and parts[-2] in server.files:
+                    data = server.files[parts[-2]]
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/octet-stream")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+                self._not_found()
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length)
+
+                if self.path.endswith("/files"):
+                    self._upload_file(raw)
+                    return
+                body = json.loads(raw or b"{}")
+                if self.path.endswith("/batches"):
+                    batch = server._create_batch(body)
+                    self._send_json(200, {key: value for key, value in batch.items() if not key.startswith("_")}, {})
+                    return
+                if self.path.endswith("/embeddings"):
+                    if server.embedding_latency:
+                        time.sleep(server.embedding_latency)
+                    self._send_json(200, server._embeddings(body), {})
+                    return
+                if not self.path.endswith("/chat/completions"):
+                    self._not_found()
+                    return
+
+                scripted = server._next_response(body)
+                if scripted.delay:
+                    time.sleep(scripted.delay)
+
+                if scripted.status != 200:
+                    error = {"message": f"fake error {scripted.status}", "type": "server_error", "code": None}
+                    self._send_json(scripted.status, {"error": error}, scripted.headers)
+                    return
+
+                content = scripted.content if scripted.content is not None else server.content
+                if server.token_latency:
+                    time.sleep(server._generation_delay(content))
+                self._send_json(200, server._completion(body, content), scripted.headers)
+
+        return Handler
+
+    def start(self) -> "FakeOpenAIServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 fake 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="기본 응답 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="429/5xx 응답 비율 (0 ~ 1)")
+    parser.add_argument("--content", default=DEFAULT_CONTENT, help="응답 본문")
+    parser.add_argument("--batch-polls", type=int, default=1, help="Batch 완료까지 필요한 상태 조회 횟수")
+    parser.add_argument("--completion-tokens", type=int, default=None, help="응답 토큰 수 (기본: 본문 길이로 추정)")
+    parser.add_argument("--ms-per-token", type=float, default=0.0, help="응답 토큰 당 생성 시간 (ms)")
+    parser.add_argument("--embedding-latency-ms", type=float, default=0.0, help="Embeddings 응답 지연 (ms)")
+    parser.add_argument("--embedding-dimensions", type=int, default=DEFAULT_EMBEDDING_DIMENSIONS)
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(
+        args.host,
+        args.port,
+        args.content,
+        args.latency_ms / 1000,
+        args.error_rate,
+        args.batch_polls,
+        completion_tokens=args.completion_tokens,
+        token_latency=args.ms_per_token / 1000,
+        embedding_latency=args.embedding_latency_ms / 1000,
+        embedding_dimensions=args.embedding_dimensions,
+    )
+    print(f"fake OpenAI 서버 실행 중: {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""
+/api/v1/inference 부하 테스트
+
+동시 요청 수를 단계적으로 늘리며(closed-loop) 요청 별 지연 시간과 처리량을 측정하고,
+앱이 SERVER_TIMING_ENABLED=true 로 실행 중이면 Server-Timing 헤더로 단계 별 지연 시간도 집계합니다.
+결과는 JSON 으로 저장하며 --baseline 과 비교해 p95 지연/처리량이 허용치 이상 나빠지면 종료 코드 1 을 반환합니다.
+
+    # 1) pgvector 시드 (fake 임베딩)
+    python benchmarks/seed_pgvector.py
+    # 2) fake OpenAI 서버와 앱(uvicorn)을 직접 띄워 측정
+    python benchmarks/load_test.py --spawn --concurrency 1,4,16 --duration 15 --output load_result.json
+    # 워커 수 별 확장성 (워커 수 마다 앱을 다시 실행, 워커 간 캐시는 postgres 공유 캐시 사용)
+    python benchmarks/load_test.py --spawn --server gunicorn --workers 1,2,4,8 --concurrency 8,32,64 \
+        --app-env CACHE_BACKEND=postgres --app-env EMBEDDING_CACHE_TTL=3600 --output workers_result.json
+    # nginx 경유 (EDGE_CACHE_TTL 설정 앱) 측정, 응답의 X-Cache-Status 로 캐시 hit 비율 집계
+    python benchmarks/load_test.py --url http://127.0.0.1 --concurrency 16 --output edge_result.json
+    # 이미 실행 중인 앱 측정, 이전 결과와 비교 (회귀 게이트)
+    python benchmarks/load_test.py --url http://127.0.0.1:8000 --baseline load_baseline.json --max-regression 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.fake_openai import FakeOpenAIServer  # noqa: E402
+
+INFERENCE_PATH = "/api/v1/inference"
+READY_PATH = "/health/ready"
+DEFAULT_PAYLOADS = sorted(str(path) for path in (PROJECT_ROOT / "example_datas").glob("talent_ex*.json"))
+
+
+@dataclass
+class RequestSample:
+    latency_ms: float
+    status: int
+    stages: Dict[str, float] = field(default_factory=dict)
+    # nginx X-Cache-Status (HIT, MISS, BYPASS 등, nginx 를 거치지 않으면 None)
+    edge_cache: Optional[str] = None
+    # 압축 해제 전 응답 본문 크기
+    response_bytes: int = 0
+    # X-Inference-Tier (full, reduced_context, rules_only, stale_cache)
+    tier: Optional[str] = None
+
+
+def parse_server_timing(header: Optional[str]) -> Dict[str, float]:
+    """Server-Timing 헤더 값을 {단계: ms} 로 변환 (예: "llm;dur=812.3, total;dur=840.1")"""
+    timings: Dict[str, float] = {}
+    if not header:
+        return timings
+    for entry in header.split(","):
+        name, *params = [part.strip() for part in entry.split(";")]
+        for param in params:
+            key, _, value = param.partition("=")
+            if key == "dur" and name:
+                timings[name] = float(value)
+    return timings
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """nearest-rank 백분위 (values 는 정렬되지 않아도 됨)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def latency_summary(values: Sequence[float]) -> Dict[str, float]:
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0, "max": 0.0}
+    return {
+        "p50": round(percentile(values, 50), 2),
+        "p95": round(percentile(values, 95), 2),
+        "p99": round(percentile(values, 99), 2),
+        "mean": round(sum(values) / len(values), 2),
+        "max": round(max(values), 2),
+    }
+
+
+def summarize_step(concurrency: int, samples: List[RequestSample], elapsed: float) -> dict:
+    """동시 요청 수 1단계 결과 (성공 요청 기준 지연 시간, 단계 별 지연 시간)"""
+    succeeded = [sample for sample in samples if sample.status == 200]
+    stages: Dict[str, List[float]] = defaultdict(list)
+    for sample in succeeded:
+        for stage, duration in sample.stages.items():
+            stages[stage].append(duration)
+
+    edge_cache = Counter(sample.edge_cache for sample in samples if sample.edge_cache)
+    tiers = Counter(sample.tier for sample in succeeded if sample.tier)
+
+    step = {
+        "concurrency": concurrency,
+        "requests": len(samples),
+        "succeeded": len(succeeded),
+        "status_counts": {str(status): count for status, count in sorted(Counter(s.status for s in samples).items())},
+        "error_rate": round(1 - len(succeeded) / len(samples), 4) if samples else 0.0,
+        "duration_s": round(elapsed, 2),
+        "rps": round(len(succeeded) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": latency_summary([sample.latency_ms for sample in succeeded]),
+        "stages_ms": {stage: latency_summary(values) for stage, values in sorted(stages.items())},
+        "response_bytes_mean": round(sum(s.response_bytes for s in succeeded) / len(succeeded), 1) if succeeded else 0.0,
+    }
+    if edge_cache:
+        step["edge_cache_counts"] = dict(sorted(edge_cache.items()))
+        step["edge_cache_hit_rate"] = round(edge_cache["HIT"] / sum(edge_cache.values()), 4)
+    if tiers:
+        # 성공 응답 중 등급을 낮춘 응답 비율 (부분 장애 시 지연 시간 목표를 지키는 대신 줄어든 결과)
+        step["tier_counts"] = dict(sorted(tiers.items()))
+        step["degraded_rate"] = round(1 - tiers["full"] / sum(tiers.values()), 4)
+    return step
+
+
+def _step_key(step: dict) -> tuple:
+    # 워커 수 정보가 없는 결과(--url 측정, 이전 형식)는 1 워커로 간주
+    return (step.get("workers") or 1, step["concurrency"])
+
+
+def compare_results(baseline: dict, current: dict, max_regression: float, max_error_rate_increase: float = 0.01) -> List[str]:
+    """
+    같은 (워커 수, 동시 요청 수) 단계끼리 비교해 회귀 목록 반환
+    p95/p99 지연이 (1 + max_regression) 배를 넘거나 처리량이 (1 - max_regression) 배 미만,
+    오류율이 max_error_rate_increase 이상 늘어나면 회귀로 봅니다.
+    """
+    regressions = []
+    baseline_steps = {_step_key(step): step for step in baseline.get("steps", [])}
+    for step in current.get("steps", []):
+        before = baseline_steps.get(_step_key(step))
+        if before is None:
+            continue
+        label = f"concurrency={step['concurrency']}"
+        if step.get("workers"):
+            label = f"workers={step['workers']} {label}"
+        for key in ("p95", "p99"):
+            old, new = before["latency_ms"][key], step["latency_ms"][key]
+            if old and new > old * (1 + max_regression):
+                regressions.append(f"{label} latency {key} {old:.1f}ms -> {new:.1f}ms")
+        if before["rps"] and step["rps"] < before["rps"] * (1 - max_regression):
+            regressions.append(f"{label} rps {before['rps']:.2f} -> {step['rps']:.2f}")
+        if step["error_rate"] > before["error_rate"] + max_error_rate_increase:
+            regressions.append(f"{label} error_rate {before['error_rate']:.2%} -> {step['error_rate']:.2%}")
+    return regressions
+
+
+def summarize_worker_scaling(steps: List[dict]) -> List[dict]:
+    """
+    워커 수 별 최대 처리량과 가장 적은 워커 수 대비 배율
+    (같은 동시 요청 수 목록으로 측정한 단계 중 처리량이 가장 높은 단계 기준)
+    """
+    best: Dict[int, dict] = {}
+    for step in steps:
+        workers = step.get("workers") or 1
+        if workers not in best or step["rps"] > best[workers]["rps"]:
+            best[workers] = step
+
+    scaling = []
+    base_rps = None
+    for workers in sorted(best):
+        step = best[workers]
+        if base_rps is None:
+            base_rps = step["rps"]
+        scaling.append({
+            "workers": workers,
+            "concurrency": step["concurrency"],
+            "rps": step["rps"],
+            "p95_ms": step["latency_ms"]["p95"],
+            "speedup": round(step["rps"] / base_rps, 2) if base_rps else 0.0,
+        })
+    return scaling
+
+
+async def _send(client: httpx.AsyncClient, payload: dict) -> RequestSample:
+    started = time.perf_counter()
+    try:
+        response = await client.post(INFERENCE_PATH, json=payload)
+    except httpx.HTTPError:
+        # 연결 실패/타임아웃은 상태 코드 0 으로 기록
+        return RequestSample((time.perf_counter() - started) * 1000, 0)
+    return RequestSample(
+        (time.perf_counter() - started) * 1000,
+        response.status_code,
+        parse_server_timing(response.headers.get("server-timing")),
+        edge_cache=response.headers.get("x-cache-status"),
+        response_bytes=response.num_bytes_downloaded,
+        tier=response.headers.get("x-inference-tier"),
+    )
+
+
+async def run_step(client: httpx.AsyncClient, payloads: List[dict], concurrency: int, duration: float, warmup: float) -> dict:
+    """concurrency 개 워커가 duration 초 동안 응답을 받는 즉시 다음 요청을 전송 (warmup 구간은 집계 제외)"""
+    samples: List[RequestSample] = []
+    started = time.perf_counter()
+    measure_from = started + warmup
+    deadline = measure_from + duration
+
+    async def worker(offset: int):
+        i = offset
+        while time.perf_counter() < deadline:
+            request_started = time.perf_counter()
+            sample = await _send(client, payloads[i % len(payloads)])
+            if request_started >= measure_from:
+                samples.append(sample)
+            i += concurrency
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return summarize_step(concurrency, samples, time.perf_counter() - measure_from)
+
+
+async def run_load_test(
+    url: str,
+    payloads: List[dict],
+    concurrency_levels: List[int],
+    duration: float,
+    warmup: float,
+    timeout: float,
+    keepalive: bool = True,
+    ) -> List[dict]:
+    # keepalive=False 면 요청 마다 새 연결 (연결 재사용 효과 비교)
+    max_connections = max(concurrency_levels)
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections if keepalive else 0)
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+        steps = []
+        for concurrency in concurrency_levels:
+            step = await run_step(client, payloads, concurrency, duration, warmup)
+            print(
+                f"concurrency={concurrency:<4} rps={step['rps']:<8} "
+                f"p50={step['latency_ms']['p50']}ms p95={step['latency_ms']['p95']}ms p99={step['latency_ms']['p99']}ms "
+                f"errors={step['error_rate']:.2%}"
+                + (f" edge_cache_hit={step['edge_cache_hit_rate']:.2%}" if "edge_cache_hit_rate" in step else "")
+                + (f" degraded={step['degraded_rate']:.2%}" if "degraded_rate" in step else ""),
+                file=sys.stderr,
+            )
+            steps.append(step)
+        return steps
+
+
+def wait_until_ready(url: str, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    last_response = ""
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"앱 프로세스가 종료되었습니다 (exit code {process.returncode})")
+        try:
+            response = httpx.get(url + READY_PATH, timeout=1.0)
+            if response.status_code == 200:
+                return
+            last_response = response.text
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"{timeout}초 안에 앱이 준비되지 않았습니다: {url} {last_response}")
+
+
+def spawn_app(port: int, openai_base_url: str, workers: int, extra_env: Dict[str, str], server: str = "uvicorn") -> subprocess.Popen:
+    """fake OpenAI 서버를 사용하는 앱 실행 (Server-Timing 활성화, server=gunicorn 이면 gunicorn.conf.py 사용)"""
+    env = {
+        **os.environ,
+        "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "benchmark"),
+        "OPENAI_BASE_URL": openai_base_url,
+        "SERVER_TIMING_ENABLED": "true",
+        "LOG_LEVEL": os.environ.get("LOG_LEVEL", "WARNING"),
+        **extra_env,
+    }
+    if server == "gunicorn":
+        env.update({"WEB_CONCURRENCY": str(workers), "GUNICORN_BIND": f"127.0.0.1:{port}"})
+        command = [sys.executable, "-m", "gunicorn", "-c", str(PROJECT_ROOT / "gunicorn.conf.py"), "app.main:app"]
+    else:
+        command = [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--workers", str(workers), "--no-access-log"]
+    return subprocess.Popen(command, cwd=PROJECT_ROOT, env=env)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/api/v1/inference 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="측정할 앱 주소 (--spawn 이면 무시)")
+    parser.add_argument("--concurrency", default="1,4,16", help="동시 요청 수 목록 (쉼표 구분)")
+    parser.add_argument("--duration", type=float, default=15.0, help="단계 별 측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="단계 별 집계 제외 시간 (초)")
+    parser.add_argument("--timeout", type=float, default=90.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--payload", action="append", default=None, help="요청 본문 JSON 파일 (여러 번 지정 가능, 기본: example_datas/talent_ex*.json)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: stdout)")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="허용 회귀 비율 (0.2 = 20%%)")
+    parser.add_argument("--no-keepalive", action="store_true", help="요청 마다 새 연결 사용")
+
+    spawn = parser.add_argument_group("--spawn: fake OpenAI 서버와 앱을 직접 실행")
+    spawn.add_argument("--spawn", action="store_true")
+    spawn.add_argument("--port", type=int, default=8010)
+    spawn.add_argument("--workers", default="1", help="앱 워커 수 목록 (쉼표 구분, 워커 수 마다 앱을 다시 실행)")
+    spawn.add_argument("--server", choices=["uvicorn", "gunicorn"], default="uvicorn", help="앱 실행 방식")
+    spawn.add_argument("--llm-latency-ms", type=float, default=800.0, help="fake LLM 기본 응답 지연 (ms)")
+    spawn.add_argument("--completion-tokens", type=int, default=None, help="fake LLM 응답 토큰 수")
+    spawn.add_argument("--ms-per-token", type=float, default=0.0, help="fake LLM 토큰 당 생성 시간 (ms)")
+    spawn.add_argument("--embedding-latency-ms", type=float, default=30.0, help="fake 임베딩 응답 지연 (ms)")
+    spawn.add_argument("--error-rate", type=float, default=0.0, help="fake LLM 429/5xx 비율")
+    spawn.add_argument("--app-env", action="append", default=[], help="앱 환경변수 KEY=VALUE (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    concurrency_levels = [int(value) for value in args.concurrency.split(",") if value.strip()]
+    worker_counts = [int(value) for value in args.workers.split(",") if value.strip()]
+    payloads = [json.loads(Path(path).read_text(encoding="utf-8")) for path in (args.payload or DEFAULT_PAYLOADS)]
+
+    url = args.url
+    steps: List[dict] = []
+    if args.spawn:
+        url = f"http://127.0.0.1:{args.port}"
+        fake_server = FakeOpenAIServer(
+            latency=args.llm_latency_ms / 1000,
+            error_rate=args.error_rate,
+            completion_tokens=args.completion_tokens,
+            token_latency=args.ms_per_token / 1000,
+            embedding_latency=args.embedding_latency_ms / 1000,
+        ).start()
+        extra_env = dict(item.split("=", 1) for item in args.app_env)
+        try:
+            for workers in worker_counts:
+                print(f"--- workers={workers} ({args.server})", file=sys.stderr)
+                app_process = spawn_app(args.port, fake_server.base_url, workers, extra_env, args.server)
+                try:
+                    wait_until_ready(url, app_process)
+                    worker_steps = asyncio.run(run_load_test(url, payloads, concurrency_levels, args.duration, args.warmup, args.timeout, not args.no_keepalive))
+                finally:
+                    app_process.terminate()
+                    app_process.wait(timeout=30)
+                steps.extend({"workers": workers, **step} for step in worker_steps)
+        finally:
+            fake_server.stop()
+    else:
+        steps = asyncio.run(run_load_test(url, payloads, concurrency_levels, args.duration, args.warmup, args.timeout, not args.no_keepalive))
+
+    result = {
+        "meta": {
+            "url": url,
+            "spawned": args.spawn,
+            "workers": worker_counts if args.spawn else None,
+            "server": args.server if args.spawn else None,
+            "llm_latency_ms": args.llm_latency_ms if args.spawn else None,
+            "completion_tokens": args.completion_tokens if args.spawn else None,
+            "ms_per_token": args.ms_per_token if args.spawn else None,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "payloads": len(payloads),
+            "keepalive": not args.no_keepalive,
+            "python": platform.python_version(),
+            "timestamp": int(time.time()),
+        },
+        "steps": steps,
+    }
+    if len(worker_counts) > 1 and args.spawn:
+        result["worker_scaling"] = summarize_worker_scaling(steps)
+        for row in result["worker_scaling"]:
+            print(f"workers={row['workers']:<3} rps={row['rps']:<8} (x{row['speedup']}) p95={row['p95_ms']}ms @ concurrency={row['concurrency']}", file=sys.stderr)
+
+    output = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare_results(baseline, result, args.max_regression)
+        for regression in regressions:
+            print(f"[regression] {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
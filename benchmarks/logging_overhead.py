@@ -0,0 +1,132 @@
+"""
+요청 처리 경로의 로그 호출 비용 비교
+
+수 KB 한글 본문(프롬프트, LLM 응답)을 요청마다 기록할 때 로그 호출 1회가 요청 처리 스레드를 점유하는 시간을 측정합니다.
+
+    sync      : StreamHandler 로 바로 출력 (기존 logging.basicConfig 방식)
+    queue     : QueueHandler 로 큐에 넣고 QueueListener 스레드에서 출력
+    payload   : log_payload (LOG_PAYLOAD_SAMPLE_RATE=0, INFO 레벨이라 기록하지 않음)
+
+    python benchmarks/logging_overhead.py --iterations 20000 --payload-chars 4000
+    # stderr 파이프가 막히는 상황(컨테이너 로그 드라이버 등)을 쓰기 지연으로 재현
+    python benchmarks/logging_overhead.py --iterations 2000 --sink-latency-us 200
+"""
+
+import argparse
+import logging
+import os
+import queue
+import statistics
+import sys
+import tempfile
+import time
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# log_payload 가 설정을 읽으므로 벤치마크에 필요 없는 필수 설정은 임의 값으로 채움
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "postgresql://benchmark")
+os.environ.setdefault("LOG_PAYLOAD_SAMPLE_RATE", "0")
+
+from app.core.logging_config import TEXT_FORMAT, log_payload  # noqa: E402
+
+
+def make_payload(chars: int) -> str:
+    line = "네이버 Tech Lead - Clova X, 대규모 언어 모델 서비스 개발 총괄 및 팀 리딩\n"
+    return (line * (chars // len(line) + 1))[:chars]
+
+
+class SlowStream:
+    """쓰기마다 지연이 생기는 출력 (느린 stderr 파이프 재현)"""
+
+    def __init__(self, path: Path, latency: float):
+        self._file = path.open("w", encoding="utf-8")
+        self._latency = latency
+
+    def write(self, data: str) -> int:
+        if self._latency:
+            time.sleep(self._latency)
+        return self._file.write(data)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def measure(name: str, log_call: Callable[[], None], iterations: int) -> Dict[str, float]:
+    samples: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter_ns()
+        log_call()
+        samples.append((time.perf_counter_ns() - started) / 1000)
+    samples.sort()
+    return {
+        "name": name,
+        "mean_us": statistics.fmean(samples),
+        "p50_us": samples[len(samples) // 2],
+        "p99_us": samples[int(len(samples) * 0.99) - 1],
+    }
+
+
+def run(iterations: int, payload_chars: int, sink_latency: float = 0.0) -> List[Dict[str, float]]:
+    payload = make_payload(payload_chars)
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        formatter = logging.Formatter(TEXT_FORMAT)
+
+        # 동기 출력
+        sync_logger = logging.getLogger("benchmark.sync")
+        sync_logger.setLevel(logging.INFO)
+        sync_logger.propagate = False
+        sync_stream = SlowStream(Path(tmp_dir) / "sync.log", sink_latency)
+        sync_handler = logging.StreamHandler(sync_stream)
+        sync_handler.setFormatter(formatter)
+        sync_logger.addHandler(sync_handler)
+        results.append(measure("sync", lambda: sync_logger.info(f"LLM 원본 응답 수신 : {payload}"), iterations))
+        sync_stream.close()
+
+        # QueueHandler + QueueListener
+        queue_logger = logging.getLogger("benchmark.queue")
+        queue_logger.setLevel(logging.INFO)
+        queue_logger.propagate = False
+        queue_stream = SlowStream(Path(tmp_dir) / "queue.log", sink_latency)
+        stream_handler = logging.StreamHandler(queue_stream)
+        stream_handler.setFormatter(formatter)
+        log_queue = queue.SimpleQueue()
+        queue_logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, stream_handler)
+        listener.start()
+        results.append(measure("queue", lambda: queue_logger.info("LLM 원본 응답 수신 : %s", payload), iterations))
+        listener.stop()
+        queue_stream.close()
+
+        # 샘플링으로 기록하지 않는 본문 로그
+        payload_logger = logging.getLogger("benchmark.payload")
+        payload_logger.setLevel(logging.INFO)
+        payload_logger.propagate = False
+        results.append(measure("payload", lambda: log_payload(payload_logger, "LLM 원본 응답 수신", payload), iterations))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그 호출 비용 비교")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--payload-chars", type=int, default=4000, help="본문 길이 (글자 수)")
+    parser.add_argument("--sink-latency-us", type=float, default=0.0, help="로그 출력 1회 당 쓰기 지연 (us)")
+    args = parser.parse_args()
+
+    print(f"본문 {args.payload_chars}자, {args.iterations}회, 쓰기 지연 {args.sink_latency_us}us")
+    print(f"{'방식':<10}{'평균(us)':>12}{'p50(us)':>12}{'p99(us)':>12}")
+    for result in run(args.iterations, args.payload_chars, args.sink_latency_us / 1_000_000):
+        print(f"{result['name']:<10}{result['mean_us']:>12.2f}{result['p50_us']:>12.2f}{result['p99_us']:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+기록된 추론 요청(JSONL) 재생과 빌드 간 결과/지연 시간 비교
+
+REQUEST_RECORD_PATH 로 기록한 운영 요청 샘플(app/core/request_recorder.py)이나 한 줄에 인재 데이터 JSON 1건인 파일을 읽어
+기록된 도착 간격(--speed 배속) 또는 최대 속도(--speed 0)로 재생합니다.
+HTTP(--target) 로 실행 중인 앱을 호출하거나 --direct 로 infer_experiences_service 를 직접 호출하며,
+--fake-openai 를 지정하면 LLM/임베딩 호출을 fake 서버(benchmarks/fake_openai.py)로 대체합니다.
+
+    # 빌드 A, B 를 각각 재생 (2배속, 최대 동시 요청 16)
+    python benchmarks/replay.py run records.jsonl --target http://127.0.0.1:8000 --speed 2 --concurrency 16 --output build_a.jsonl
+    python benchmarks/replay.py run records.jsonl --direct --fake-openai --speed 0 --output build_b.jsonl
+    # 결과 태그 변경과 지연 시간 비교 (p95 가 20% 이상 늘거나 결과가 달라지면 종료 코드 1)
+    python benchmarks/replay.py diff build_a.jsonl build_b.jsonl --max-regression 0.2 --fail-on-output-diff
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.fake_openai import FakeOpenAIServer  # noqa: E402
+from benchmarks.load_test import INFERENCE_PATH, latency_summary  # noqa: E402
+
+OUTCOME_OK = "ok"
+
+# payload -> (outcome, output)
+SendFunction = Callable[[Dict[str, Any]], Awaitable[Tuple[str, Optional[List[str]]]]]
+
+
+@dataclass
+class ReplayRecord:
+    request_id: str
+    payload: Dict[str, Any]
+    timestamp: Optional[float] = None
+
+
+@dataclass
+class ReplayResult:
+    request_id: str
+    outcome: str
+    output: Optional[List[str]]
+    latency_ms: float
+    # 예정된 전송 시각보다 늦게 보낸 시간 (동시 요청 제한에 걸린 대기 포함)
+    lag_ms: float = 0.0
+
+
+def load_records(path: str, limit: Optional[int] = None) -> List[ReplayRecord]:
+    """request_recorder 형식({"request_id", "timestamp", "payload", ...}) 또는 인재 데이터 JSON 한 줄씩"""
+    records = []
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if "payload" in entry:
+                records.append(ReplayRecord(str(entry.get("request_id") or f"line-{line_number}"), entry["payload"], entry.get("timestamp")))
+            else:
+                records.append(ReplayRecord(f"line-{line_number}", entry))
+            if limit and len(records) >= limit:
+                break
+    return records
+
+
+def schedule_offsets(records: List[ReplayRecord], speed: float) -> List[float]:
+    """
+    요청 별 전송 시각 (재생 시작 기준, 초)
+    speed > 0 이고 모든 기록에 timestamp 가 있으면 기록된 도착 간격을 speed 배 빠르게, 아니면 모두 0 (최대 속도)
+    """
+    if speed <= 0 or not records or any(record.timestamp is None for record in records):
+        return [0.0] * len(records)
+    first = min(record.timestamp for record in records)
+    return [(record.timestamp - first) / speed for record in records]
+
+
+async def replay(records: List[ReplayRecord], send: SendFunction, concurrency: int, speed: float) -> List[ReplayResult]:
+    """예정 시각에 요청을 보내되 동시 요청은 concurrency 개로 제한 (open-loop)"""
+    semaphore = asyncio.Semaphore(concurrency)
+    offsets = schedule_offsets(records, speed)
+    started = time.perf_counter()
+
+    async def run_one(record: ReplayRecord, offset: float) -> ReplayResult:
+        delay = started + offset - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        async with semaphore:
+            sent = time.perf_counter()
+            outcome, output = await send(record.payload)
+            latency = time.perf_counter() - sent
+        return ReplayResult(record.request_id, outcome, output, round(latency * 1000, 2), round(max(0.0, sent - started - offset) * 1000, 2))
+
+    return list(await asyncio.gather(*(run_one(record, offset) for record, offset in zip(records, offsets))))
+
+
+def summarize_results(results: List[ReplayResult]) -> dict:
+    return {
+        "requests": len(results),
+        "outcomes": dict(Counter(result.outcome for result in results)),
+        "latency_ms": latency_summary([result.latency_ms for result in results if result.outcome == OUTCOME_OK]),
+        "lag_ms": latency_summary([result.lag_ms for result in results]),
+    }
+
+
+def load_results(path: str) -> Dict[str, dict]:
+    with open(path, encoding="utf-8") as file:
+        return {entry["request_id"]: entry for entry in map(json.loads, filter(str.strip, file))}
+
+
+def diff_results(baseline: Dict[str, dict], candidate: Dict[str, dict], max_regression: float = 0.2) -> dict:
+    """
+    같은 request_id 끼리 결과 태그/상태 변경과 지연 시간 비교
+    성공 요청 지연 시간의 p50/p95/p99 가 (1 + max_regression) 배를 넘으면 regressions 에 기록합니다.
+    """
+    common = sorted(set(baseline) & set(candidate))
+    output_changes, outcome_changes = [], []
+    for request_id in common:
+        before, after = baseline[request_id], candidate[request_id]
+        if before["outcome"] != after["outcome"]:
+            outcome_changes.append({"request_id": request_id, "baseline": before["outcome"], "candidate": after["outcome"]})
+        elif before["output"] != after["output"]:
+            before_tags, after_tags = set(before["output"] or []), set(after["output"] or [])
+            output_changes.append({
+                "request_id": request_id,
+                "removed": sorted(before_tags - after_tags),
+                "added": sorted(after_tags - before_tags),
+                "reordered": before_tags == after_tags,
+            })
+
+    both_ok = [request_id for request_id in common if baseline[request_id]["outcome"] == candidate[request_id]["outcome"] == OUTCOME_OK]
+    baseline_latency = latency_summary([baseline[request_id]["latency_ms"] for request_id in both_ok])
+    candidate_latency = latency_summary([candidate[request_id]["latency_ms"] for request_id in both_ok])
+
+    regressions = []
+    for key in ("p50", "p95", "p99"):
+        old, new = baseline_latency[key], candidate_latency[key]
+        if old and new > old * (1 + max_regression):
+            regressions.append(f"latency {key} {old:.1f}ms -> {new:.1f}ms")
+
+    return {
+        "compared": len(common),
+        "only_in_baseline": len(set(baseline) - set(candidate)),
+        "only_in_candidate": len(set(candidate) - set(baseline)),
+        "latency_ms": {
+            "baseline": baseline_latency,
+            "candidate": candidate_latency,
+            "change": {
+                key: round(candidate_latency[key] / baseline_latency[key] - 1, 4) if baseline_latency[key] else None
+                for key in ("p50", "p95", "p99", "mean")
+            },
+        },
+        "outcome_changes": outcome_changes,
+        "output_changes": output_changes,
+        "regressions": regressions,
+    }
+
+
+def make_http_sender(client: Any) -> SendFunction:
+    import httpx
+
+    async def send(payload: Dict[str, Any]) -> Tuple[str, Optional[List[str]]]:
+        try:
+            response = await client.post(INFERENCE_PATH, json=payload)
+        except httpx.HTTPError as e:
+            return type(e).__name__, None
+        if response.status_code != 200:
+            return f"http_{response.status_code}", None
+        return OUTCOME_OK, response.json()
+
+    return send
+
+
+def make_direct_sender() -> SendFunction:
+    """infer_experiences_service 직접 호출 (환경변수 설정 이후 import)"""
+    from app.schemas.inference import TalentDataInput
+    from app.services.inference_service import infer_experiences_service
+
+    async def send(payload: Dict[str, Any]) -> Tuple[str, Optional[List[str]]]:
+        try:
+            return OUTCOME_OK, await infer_experiences_service(TalentDataInput(**payload))
+        except Exception as e:
+            return type(e).__name__, None
+
+    return send
+
+
+async def run_replay(args: argparse.Namespace, records: List[ReplayRecord]) -> List[ReplayResult]:
+    if args.direct:
+        from app.core.relational_db import close_relational_pool
+
+        try:
+            return await replay(records, make_direct_sender(), args.concurrency, args.speed)
+        finally:
+            await close_relational_pool()
+
+    import httpx
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.target, timeout=args.timeout, limits=limits) as client:
+        return await replay(records, make_http_sender(client), args.concurrency, args.speed)
+
+
+def command_run(args: argparse.Namespace) -> int:
+    records = load_records(args.records, args.limit)
+    fake_server: Optional[FakeOpenAIServer] = None
+    if args.direct:
+        # 재생 중 요청이 다시 기록되지 않도록 함
+        os.environ["REQUEST_RECORD_SAMPLE_RATE"] = "0"
+        if args.fake_openai:
+            fake_server = FakeOpenAIServer(latency=args.llm_latency_ms / 1000, embedding_latency=args.embedding_latency_ms / 1000).start()
+            os.environ["OPENAI_BASE_URL"] = fake_server.base_url
+            os.environ.setdefault("OPENAI_API_KEY", "replay")
+
+    try:
+        results = asyncio.run(run_replay(args, records))
+    finally:
+        if fake_server is not None:
+            fake_server.stop()
+
+    lines = "".join(json.dumps(asdict(result), ensure_ascii=False) + "\n" for result in results)
+    if args.output:
+        Path(args.output).write_text(lines, encoding="utf-8")
+    else:
+        sys.stdout.write(lines)
+    print(json.dumps(summarize_results(results), ensure_ascii=False), file=sys.stderr)
+    return 0
+
+
+def command_diff(args: argparse.Namespace) -> int:
+    report = diff_results(load_results(args.baseline), load_results(args.candidate), args.max_regression)
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+    print(
+        f"compared={report['compared']} output_changes={len(report['output_changes'])} "
+        f"outcome_changes={len(report['outcome_changes'])} regressions={report['regressions']}",
+        file=sys.stderr,
+    )
+    failed = bool(report["regressions"]) or (args.fail_on_output_diff and (report["output_changes"] or report["outcome_changes"]))
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록된 추론 요청 재생, 빌드 간 비교")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="JSONL 요청 재생")
+    run_parser.add_argument("records", help="요청 기록 JSONL")
+    target = run_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--target", help="앱 주소 (예: http://127.0.0.1:8000)")
+    target.add_argument("--direct", action="store_true", help="infer_experiences_service 직접 호출")
+    run_parser.add_argument("--speed", type=float, default=1.0, help="기록된 도착 간격 대비 배속 (0: 최대 속도)")
+    run_parser.add_argument("--concurrency", type=int, default=8, help="최대 동시 요청 수")
+    run_parser.add_argument("--limit", type=int, default=None, help="재생할 최대 요청 수")
+    run_parser.add_argument("--timeout", type=float, default=90.0, help="HTTP 요청 타임아웃 (초)")
+    run_parser.add_argument("--fake-openai", action="store_true", help="--direct 에서 LLM/임베딩을 fake 서버로 대체")
+    run_parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="fake LLM 응답 지연 (ms)")
+    run_parser.add_argument("--embedding-latency-ms", type=float, default=0.0, help="fake 임베딩 응답 지연 (ms)")
+    run_parser.add_argument("--output", default=None, help="결과 JSONL 경로 (기본: stdout)")
+    run_parser.set_defaults(handler=command_run)
+
+    diff_parser = subparsers.add_parser("diff", help="두 재생 결과 비교")
+    diff_parser.add_argument("baseline")
+    diff_parser.add_argument("candidate")
+    diff_parser.add_argument("--max-regression", type=float, default=0.2, help="허용 지연 증가 비율 (0.2 = 20%%)")
+    diff_parser.add_argument("--fail-on-output-diff", action="store_true", help="결과 태그/상태가 달라지면 종료 코드 1")
+    diff_parser.add_argument("--output", default=None, help="비교 결과 JSON 경로 (기본: stdout)")
+    diff_parser.set_defaults(handler=command_diff)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+/api/v1/inference 요청 본문 파싱/검증과 응답 직렬화 비용 비교
+
+talent_ex*.json 형식에 추론에서 사용하지 않는 큰 필드(projects, recommendations 등)를 채운 본문으로
+변경 전 경로(표준 json + 전체 필드 모델)와 현재 경로(orjson + 추론 필드만 선언한 TalentDataInput)를 비교합니다.
+
+    python benchmarks/request_parsing.py
+    python benchmarks/request_parsing.py --positions 100 --projects 50 --rounds 200 --output request_parsing.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.schemas.inference import TalentDataInput  # noqa: E402
+
+DESCRIPTION = (
+    "대규모 트래픽 서비스 백엔드 개발 및 MSA 전환, 데이터 플랫폼 Lead, 신규 서비스 런칭과 운영 총괄\n"
+    "- Kubernetes 기반 인프라 운영, 시리즈 B 투자 유치 과정에서 기술 실사 대응\n"
+) * 20
+
+CASE_LEGACY = "json + 전체 필드 모델 (변경 전)"
+CASE_STDLIB_LEAN = "json + TalentDataInput"
+CASE_ORJSON_LEAN = "orjson + TalentDataInput (현재)"
+CASE_VALIDATE_JSON = "TalentDataInput.model_validate_json"
+CASE_RESPONSE_JSON = "응답 JSONResponse"
+CASE_RESPONSE_ORJSON = "응답 ORJSONResponse (현재)"
+
+
+class LegacyTalentDataInput(TalentDataInput):
+    """추론에서 사용하지 않는 필드까지 검증하던 변경 전 요청 모델"""
+    website: Optional[List[str]] = None
+    lastName: Optional[str] = None
+    photoUrl: Optional[str] = None
+    projects: Optional[List[Any]] = None
+    firstName: Optional[str] = None
+    linkedinUrl: Optional[str] = None
+    industryName: Optional[str] = None
+    recommendations: Optional[List[Any]] = None
+
+
+def build_payload(positions: int = 50, projects: int = 30, recommendations: int = 30) -> Dict[str, Any]:
+    return {
+        "firstName": "길동",
+        "lastName": "홍",
+        "photoUrl": "https://example.com/photo.png",
+        "linkedinUrl": "https://linkedin.example/hong",
+        "website": [f"https://example.com/{i}" for i in range(5)],
+        "industryName": "Software",
+        "headline": "Head of Engineering at 네이버",
+        "summary": "AI 서비스 개발과 조직 리딩 경험을 보유한 엔지니어입니다. " * 30,
+        "skills": [f"skill-{i}" for i in range(100)],
+        "positions": [
+            {
+                "title": f"Engineer {i}",
+                "companyName": f"회사{i % 7}",
+                "companyLogo": "https://example.com/logo.png",
+                "companyLocation": "서울",
+                "description": DESCRIPTION,
+                "startEndDate": {"start": {"year": 2000 + i % 20, "month": 3}, "end": {"year": 2001 + i % 20, "month": 5}},
+            }
+            for i in range(positions)
+        ],
+        "educations": [
+            {
+                "schoolName": "서울대학교",
+                "degreeName": "석사",
+                "fieldOfStudy": "컴퓨터공학",
+                "grade": "",
+                "description": "",
+                "startEndDate": "2000 - 2004",
+                "originStartEndDate": {"startDateOn": {"year": 2000, "month": 3}, "endDateOn": {"year": 2004, "month": 2}},
+            }
+            for _ in range(3)
+        ],
+        "projects": [
+            {"name": f"프로젝트 {i}", "description": DESCRIPTION, "members": [{"name": f"member-{j}", "role": "개발"} for j in range(10)]}
+            for i in range(projects)
+        ],
+        "recommendations": [
+            {"text": DESCRIPTION, "author": {"name": f"추천인 {i}", "title": "CTO"}}
+            for i in range(recommendations)
+        ],
+    }
+
+
+def build_cases(body: bytes, response_content: List[str]) -> Dict[str, Callable[[], object]]:
+    return {
+        CASE_LEGACY: lambda: LegacyTalentDataInput.model_validate(json.loads(body)),
+        CASE_STDLIB_LEAN: lambda: TalentDataInput.model_validate(json.loads(body)),
+        CASE_ORJSON_LEAN: lambda: TalentDataInput.model_validate(orjson.loads(body)),
+        CASE_VALIDATE_JSON: lambda: TalentDataInput.model_validate_json(body),
+        CASE_RESPONSE_JSON: lambda: JSONResponse(response_content),
+        CASE_RESPONSE_ORJSON: lambda: ORJSONResponse(response_content),
+    }
+
+
+def measure(func: Callable[[], object], rounds: int) -> Dict[str, float]:
+    """warm-up 1회 후 rounds 회 실행 시간 중앙값(ms)과 1회 실행 중 최대 할당량(KB)"""
+    func()
+    durations = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"median_ms": statistics.median(durations), "min_ms": min(durations), "peak_kb": peak / 1024}
+
+
+def run_benchmark(positions: int = 50, projects: int = 30, recommendations: int = 30, rounds: int = 100) -> Dict[str, Any]:
+    body = json.dumps(build_payload(positions, projects, recommendations), ensure_ascii=False).encode("utf-8")
+    response_content = [f"태그 {i} (근거 {i}, 회사{i % 7} 재직 중 관련 경험)" for i in range(15)]
+    return {
+        "body_bytes": len(body),
+        "cases": {name: measure(func, rounds) for name, func in build_cases(body, response_content).items()},
+    }
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    lines = [f"요청 본문 {result['body_bytes'] / 1024:.0f}KB"]
+    baseline = result["cases"][CASE_LEGACY]["median_ms"]
+    for name, case in result["cases"].items():
+        line = f"  {name:<40} {case['median_ms']:8.3f}ms  {case['peak_kb']:8.0f}KB"
+        if not name.startswith("응답"):
+            line += f"  (변경 전 대비 {case['median_ms'] / baseline:.2f}x)"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요청 파싱/응답 직렬화 비용 비교")
+    parser.add_argument("--positions", type=int, default=50)
+    parser.add_argument("--projects", type=int, default=30)
+    parser.add_argument("--recommendations", type=int, default=30)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--output", default=None, help="측정값을 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.positions, args.projects, args.recommendations, args.rounds)
+    print(format_report(result))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(result, file, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+차원 축소(Matryoshka)/binary 양자화 설정 별 검색 recall, 지연 시간 비교
+
+컬렉션 스냅샷(app/core/vector_snapshot.py)을 로컬 벡터 인덱스로 로드해 전체 차원 전수 검색 결과를 기준으로
+VECTOR_DIMENSIONS, VECTOR_QUANTIZATION, VECTOR_RESCORE_MULTIPLIER 조합 별 recall@k 와 지연 시간(p50/p95/p99),
+후보 선택에 쓰는 벡터 1개 크기(bytes)를 측정합니다.
+
+평가 쿼리(--eval-set)는 한 줄에 하나의 JSON 입니다. embedding 이 있으면 그대로 사용하고, query 만 있으면 임베딩 API 로 변환합니다.
+평가 쿼리를 지정하지 않으면 컬렉션 벡터에 노이즈를 더한 쿼리를 사용합니다 (benchmarks/vector_search.py 와 같음).
+
+    {"query": "네이버 신규 서비스 출시"}
+    {"embedding": [0.01, -0.02, ...], "filter": {"company_name": "네이버"}}
+
+    python -m app.core.vector_snapshot export --collection company_news_collection --output-dir snapshots
+    python benchmarks/vector_recall.py snapshots/company_news_collection --eval-set eval_queries.jsonl --k 4
+    python benchmarks/vector_recall.py snapshots/company_news_collection --dimensions 1536,512,256 \\
+        --quantization none,binary --rescore-multiplier 1,4,10 --output vector_recall.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# 앱 설정 로드에 필요한 값 (평가 쿼리에 query 가 있을 때만 임베딩 API 호출)
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from benchmarks.load_test import latency_summary  # noqa: E402
+from benchmarks.vector_search import make_queries, overlap_at_k  # noqa: E402
+
+EvalQuery = Tuple[List[float], Optional[Dict[str, Any]]]
+
+
+def parse_list(value: str, cast=str) -> List[Any]:
+    """쉼표로 구분한 값 목록"""
+    return [cast(item.strip()) for item in value.split(",") if item.strip()]
+
+
+def search_configs(dimensions: Sequence[int], quantizations: Sequence[str], multipliers: Sequence[int], full_dimensions: int) -> List[Dict[str, Any]]:
+    """측정할 설정 조합, 전체 차원 양자화 없음(전수 검색 기준)은 재정렬 배수와 무관하므로 한 번만 측정"""
+    configs: List[Dict[str, Any]] = []
+    for dimension in dimensions:
+        dimension = min(dimension, full_dimensions)
+        for quantization in quantizations:
+            exact = dimension == full_dimensions and quantization == "none"
+            for multiplier in multipliers[:1] if exact else multipliers:
+                config = {"dimensions": dimension, "quantization": quantization, "rescore_multiplier": multiplier}
+                if config not in configs:
+                    configs.append(config)
+    return configs
+
+
+async def load_eval_set(path: str, limit: Optional[int] = None) -> List[EvalQuery]:
+    """평가 쿼리 (임베딩, 메타데이터 필터), query 만 있는 줄은 임베딩 API 로 한 번에 변환"""
+    entries = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                entries.append(json.loads(line))
+    entries = entries[:limit] if limit else entries
+
+    texts = [entry["query"] for entry in entries if "embedding" not in entry]
+    embedded: List[List[float]] = []
+    if texts:
+        from app.core.vector_db import get_embeddings_model
+
+        embedded = await get_embeddings_model().aembed_documents(texts)
+    embedded_iter = iter(embedded)
+    return [(entry["embedding"] if "embedding" in entry else next(embedded_iter), entry.get("filter")) for entry in entries]
+
+
+def measure(index: Any, queries: Sequence[EvalQuery], k: int, warmup: int = 5) -> Dict[str, Any]:
+    """순차 검색 지연 시간(ms)과 쿼리 별 결과 문서 id"""
+    for embedding, filter in queries[:warmup]:
+        index.similarity_search_by_vector(embedding, k=k, filter=filter)
+
+    latencies: List[float] = []
+    results: List[List[str]] = []
+    for embedding, filter in queries:
+        started = time.perf_counter()
+        docs = index.similarity_search_by_vector(embedding, k=k, filter=filter)
+        latencies.append((time.perf_counter() - started) * 1000)
+        results.append([doc.id for doc in docs])
+    return {"latency_ms": latency_summary(latencies), "results": results}
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.core.vector_index import LocalVectorIndex
+
+    exact = LocalVectorIndex.from_snapshot(args.snapshot)
+    if args.eval_set:
+        queries = await load_eval_set(args.eval_set, args.queries)
+    else:
+        queries = [(query, None) for query in make_queries(exact.vectors, args.queries, args.noise, args.seed)]
+
+    baseline = measure(exact, queries, args.k)
+    rows = []
+    for config in search_configs(args.dimensions, args.quantization, args.rescore_multiplier, exact.dimensions):
+        started = time.perf_counter()
+        index = LocalVectorIndex.from_snapshot(args.snapshot, **config)
+        build_ms = (time.perf_counter() - started) * 1000
+        result = measure(index, queries, args.k)
+        rows.append({
+            **config,
+            "recall_at_k": overlap_at_k(baseline["results"], result["results"]),
+            "latency_ms": result["latency_ms"],
+            # 후보 선택에 쓰는 벡터 크기, 재정렬용 원본 벡터는 memory map 으로 후보 행만 읽음
+            "search_bytes_per_vector": index.search_bytes_per_vector,
+            "build_ms": round(build_ms, 2),
+        })
+
+    return {
+        "collection": exact.collection_name,
+        "documents": len(exact),
+        "dimensions": exact.dimensions,
+        "queries": len(queries),
+        "query_source": args.eval_set or f"synthetic(noise={args.noise})",
+        "k": args.k,
+        "exact_ms": baseline["latency_ms"],
+        "configs": rows,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="차원 축소/binary 양자화 설정 별 검색 recall, 지연 시간 비교")
+    parser.add_argument("snapshot", type=Path, help="컬렉션 스냅샷 디렉터리")
+    parser.add_argument("--eval-set", default=None, help="평가 쿼리 JSONL (query 또는 embedding, 선택 filter)")
+    parser.add_argument("--dimensions", type=lambda value: parse_list(value, int), default=[1536, 1024, 512, 256])
+    parser.add_argument("--quantization", type=parse_list, default=["none", "binary"])
+    parser.add_argument("--rescore-multiplier", type=lambda value: parse_list(value, int), default=[1, 4, 10])
+    parser.add_argument("--queries", type=int, default=200, help="평가 쿼리 수 (--eval-set 은 앞에서부터)")
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--noise", type=float, default=0.3, help="--eval-set 이 없을 때 쿼리 벡터 노이즈 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+PGVector 와 로컬 벡터 인덱스(VECTOR_BACKEND=local) 검색 비교
+
+같은 컬렉션, 같은 쿼리 벡터로 두 백엔드의 asimilarity_search_by_vector(앱의 검색 경로)를 순차 호출해
+지연 시간(p50/p95/p99)과 상위 k 개 결과 일치율(overlap@k, PGVector 결과 기준)을 측정합니다.
+쿼리 벡터는 컬렉션 벡터에 작은 노이즈를 더해 만들므로 임베딩 API 를 호출하지 않습니다.
+로컬 인덱스는 PGVector 컬렉션을 스냅샷(app/core/vector_snapshot.py)으로 저장한 뒤 memory map 으로 로드합니다.
+
+    # seed_pgvector.py 로 적재한 컬렉션 비교
+    python benchmarks/vector_search.py --collection company_news_collection --queries 200 --k 4
+    # 메타데이터 필터 포함
+    python benchmarks/vector_search.py --collection company_news_collection --filter '{"company_name": "네이버"}'
+    # 임의 벡터 컬렉션(문서 5,000건, 1536차원)을 만들어 비교하고 삭제
+    python benchmarks/vector_search.py --synthetic 5000 --dimensions 1536 --output vector_search.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# 앱 설정 로드에 필요한 값 (임베딩 API 는 호출하지 않음)
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from benchmarks.load_test import latency_summary  # noqa: E402
+
+SYNTHETIC_COLLECTION = "benchmark_vector_search_collection"
+
+
+def make_queries(vectors: np.ndarray, count: int, noise: float, seed: int = 0) -> List[List[float]]:
+    """컬렉션 벡터 중 임의로 고른 벡터에 정규분포 노이즈(벡터 길이 대비 noise 비율)를 더한 쿼리"""
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, len(vectors), size=count)
+    base = np.asarray(vectors[rows], dtype=np.float32)
+    scale = noise / np.sqrt(base.shape[1])
+    return (base + rng.normal(0.0, scale, size=base.shape).astype(np.float32)).tolist()
+
+
+def overlap_at_k(expected: Sequence[Sequence[str]], actual: Sequence[Sequence[str]]) -> float:
+    """쿼리 별 |기준 결과 ∩ 비교 결과| / |기준 결과| 의 평균 (기준 결과가 없는 쿼리는 제외)"""
+    ratios = [len(set(e) & set(a)) / len(e) for e, a in zip(expected, actual) if e]
+    return round(sum(ratios) / len(ratios), 4) if ratios else 1.0
+
+
+def create_synthetic_collection(database_url: str, count: int, dimensions: int, seed: int = 0) -> Any:
+    """임의 단위 벡터와 메타데이터(company_name 50종, source 2종)로 PGVector 컬렉션 생성"""
+    from langchain_community.vectorstores import PGVector
+    from langchain_core.embeddings import FakeEmbeddings
+
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(count, dimensions)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    store = PGVector(
+        collection_name = SYNTHETIC_COLLECTION,
+        connection_string = database_url,
+        embedding_function = FakeEmbeddings(size=dimensions),
+        use_jsonb = True,
+        pre_delete_collection = True,
+    )
+    batch = 1000
+    for start in range(0, count, batch):
+        end = min(count, start + batch)
+        store.add_embeddings(
+            texts = [f"문서 {i}" for i in range(start, end)],
+            embeddings = vectors[start:end].tolist(),
+            metadatas = [{"company_name": f"회사 {i % 50}", "source": "news" if i % 2 else "company"} for i in range(start, end)],
+            ids = [f"doc-{i}" for i in range(start, end)],
+        )
+    return store
+
+
+async def measure(store: Any, queries: Sequence[List[float]], k: int, filter: Optional[Dict[str, Any]], warmup: int = 5) -> Dict[str, Any]:
+    """순차 검색 지연 시간(ms)과 쿼리 별 결과 문서"""
+    for query in queries[:warmup]:
+        await store.asimilarity_search_by_vector(query, k=k, filter=filter)
+
+    latencies: List[float] = []
+    results: List[List[str]] = []
+    for query in queries:
+        started = time.perf_counter()
+        docs = await store.asimilarity_search_by_vector(query, k=k, filter=filter)
+        latencies.append((time.perf_counter() - started) * 1000)
+        # PGVector 결과에는 id 가 없으므로 본문으로 비교 (검색 결과 중복 제거 기준과 같음)
+        results.append([doc.page_content for doc in docs])
+    return {"latency_ms": latency_summary(latencies), "results": results}
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.core.config import get_settings
+    from app.core.relational_db import close_relational_pool
+    from app.core.vector_db import EMBEDDING_MODEL_NAME, _create_vectorstore
+    from app.core.vector_index import LocalVectorIndex
+    from app.core.vector_snapshot import export_collection
+
+    settings = get_settings()
+    if args.database_url:
+        settings.DATABASE_URL = args.database_url
+
+    collection = args.collection
+    synthetic_store = None
+    if args.synthetic:
+        collection = SYNTHETIC_COLLECTION
+        synthetic_store = create_synthetic_collection(settings.DATABASE_URL, args.synthetic, args.dimensions, args.seed)
+
+    filter = json.loads(args.filter) if args.filter else None
+    try:
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            directory = Path(snapshot_dir) / collection
+            started = time.perf_counter()
+            manifest = await export_collection(collection, directory, embedding_model=EMBEDDING_MODEL_NAME)
+            export_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            local = LocalVectorIndex.from_snapshot(directory)
+            load_ms = (time.perf_counter() - started) * 1000
+
+            settings.VECTOR_BACKEND = "pgvector"
+            pgvector = synthetic_store or _create_vectorstore(collection)
+
+            queries = make_queries(local.vectors, args.queries, args.noise, args.seed)
+            pgvector_result = await measure(pgvector, queries, args.k, filter)
+            local_result = await measure(local, queries, args.k, filter)
+    finally:
+        if synthetic_store is not None:
+            synthetic_store.delete_collection()
+        await close_relational_pool()
+
+    pgvector_p50 = pgvector_result["latency_ms"]["p50"]
+    local_p50 = local_result["latency_ms"]["p50"]
+    return {
+        "collection": collection,
+        "documents": manifest["count"],
+        "dimensions": manifest["dimensions"],
+        "queries": len(queries),
+        "k": args.k,
+        "filter": filter,
+        "snapshot_export_ms": round(export_ms, 2),
+        "local_load_ms": round(load_ms, 2),
+        "pgvector_ms": pgvector_result["latency_ms"],
+        "local_ms": local_result["latency_ms"],
+        "speedup_p50": round(pgvector_p50 / local_p50, 1) if local_p50 else None,
+        # PGVector 가 인덱스 없이 전수 검색하면 1.0, HNSW/IVFFlat 인덱스가 있으면 근사 검색 차이만큼 낮아짐
+        "overlap_at_k": overlap_at_k(pgvector_result["results"], local_result["results"]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PGVector, 로컬 벡터 인덱스 검색 지연 시간/결과 비교")
+    parser.add_argument("--database-url", default=None, help="기본값 DATABASE_URL")
+    parser.add_argument("--collection", default="company_news_collection")
+    parser.add_argument("--synthetic", type=int, default=0, help="지정한 문서 수의 임의 벡터 컬렉션을 만들어 비교")
+    parser.add_argument("--dimensions", type=int, default=1536, help="--synthetic 벡터 차원")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--filter", default=None, help='메타데이터 필터 JSON (예: {"company_name": "네이버"})')
+    parser.add_argument("--noise", type=float, default=0.3, help="쿼리 벡터 노이즈 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
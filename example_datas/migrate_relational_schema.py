@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+"""
+company / company_news 관계형 테이블 스키마 마이그레이션
+
+setup_company_data.py, setup_company_news_data.py 실행 시 자동으로 적용되며,
+이미 데이터가 적재된 환경에서는 단독으로 실행할 수 있습니다.
+
+    poetry run python migrate_relational_schema.py
+"""
+import logging
+from typing import List, NamedTuple, Optional
+
+import psycopg2
+
+from loader_db import close_connection_pool, pooled_connection, transaction
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+# 인덱스 이름 (쿼리 플랜 테스트, ON CONFLICT 대상과 일치해야 합니다)
+COMPANY_NAME_INDEX = "company_name_key"
+COMPANY_NEWS_COMPANY_DATE_INDEX = "company_news_company_id_news_date_idx"
+COMPANY_NEWS_DEDUP_INDEX = "company_news_dedup_key"
+
+# company_news 중복 판단 키, 제목은 btree 행 크기 제한을 넘을 수 있어 md5로 인덱싱
+COMPANY_NEWS_DEDUP_COLUMNS = "(company_id, md5(title), news_date)"
+
+
+class Migration(NamedTuple):
+    version: str
+    table: str  # 마이그레이션 대상 테이블, 아직 없으면 다음 실행으로 미룹니다.
+    statements: List[str]
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        version="0001_company_name_unique",
+        table="company",
+        statements=[
+            # 중복 회사의 뉴스를 남길 행(가장 먼저 적재된 행)으로 이동, 삭제 시 CASCADE 로 함께 지워지지 않도록
+            # 이동 후 겹치는 뉴스는 0003 에서 정리 (company_news 가 아직 없으면 건너뜀)
+            """
+            DO $$
+            BEGIN
+                IF to_regclass('company_news') IS NOT NULL THEN
+                    UPDATE company_news n
+                    SET company_id = keep.id
+                    FROM company dup
+                    JOIN LATERAL (
+                        SELECT min(c.id) AS id FROM company c WHERE c.name = dup.name
+                    ) keep ON true
+                    WHERE n.company_id = dup.id AND dup.id <> keep.id;
+                END IF;
+            END
+            $$
+            """,
+            # 이름 중복 행 정리 (가장 먼저 적재된 행 유지)
+            """
+            DELETE FROM company a USING company b
+            WHERE a.name = b.name AND a.id > b.id
+            """,
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {COMPANY_NAME_INDEX} ON company (name)",
+        ],
+    ),
+    Migration(
+        version="0002_company_news_company_date",
+        table="company_news",
+        statements=[
+            f"""
+            CREATE INDEX IF NOT EXISTS {COMPANY_NEWS_COMPANY_DATE_INDEX}
+            ON company_news (company_id, news_date)
+            """,
+        ],
+    ),
+    Migration(
+        version="0003_company_news_dedup_key",
+        table="company_news",
+        statements=[
+            # 중복 뉴스 정리 (가장 먼저 적재된 행 유지)
+            """
+            DELETE FROM company_news a USING company_news b
+            WHERE a.company_id = b.company_id
+              AND a.news_date = b.news_date
+              AND a.title = b.title
+              AND a.id > b.id
+            """,
+            f"""
+            CREATE UNIQUE INDEX IF NOT EXISTS {COMPANY_NEWS_DEDUP_INDEX}
+            ON company_news {COMPANY_NEWS_DEDUP_COLUMNS}
+            """,
+        ],
+    ),
+]
+
+
+def create_migrations_table(cursor):
+    """적용된 마이그레이션 기록 테이블 생성"""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version VARCHAR(255) PRIMARY KEY,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+    """
+    )
+
+
+def table_exists(cursor, table_name: str) -> bool:
+    """현재 search_path 기준 테이블 존재 여부"""
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (table_name,))
+    return cursor.fetchone()[0]
+
+
+def apply_migrations(cursor, migrations: Optional[List[Migration]] = None) -> List[str]:
+    """
+    아직 적용되지 않은 마이그레이션을 순서대로 적용하고 적용된 버전 목록을 반환
+    대상 테이블이 아직 없는 마이그레이션은 건너뛰고 이후 실행에서 적용합니다.
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+
+    try:
+        create_migrations_table(cursor)
+        cursor.execute("SELECT version FROM schema_migrations")
+        applied = {row[0] for row in cursor.fetchall()}
+
+        newly_applied = []
+        for migration in migrations:
+            if migration.version in applied:
+                continue
+            if not table_exists(cursor, migration.table):
+                logger.info(
+                    f"마이그레이션 '{migration.version}' 대상 테이블 '{migration.table}'이 없어 건너뜁니다."
+                )
+                continue
+
+            for statement in migration.statements:
+                cursor.execute(statement)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version) VALUES (%s)",
+                (migration.version,),
+            )
+            newly_applied.append(migration.version)
+            logger.info(f"마이그레이션 '{migration.version}' 적용 완료")
+
+        return newly_applied
+    except psycopg2.Error as e:
+        logger.error(f"마이그레이션 적용 오류: {e}")
+        raise
+
+
+def main():
+    """메인 함수"""
+    try:
+        with pooled_connection() as conn:
+            with transaction(conn) as cursor:
+                applied = apply_migrations(cursor)
+        logger.info(f"총 {len(applied)}개의 마이그레이션이 적용되었습니다.")
+    except Exception as e:
+        logger.error(f"예상치 못한 오류가 발생했습니다: {e}")
+    finally:
+        close_connection_pool()
+
+
+if __name__ == "__main__":
+    main()
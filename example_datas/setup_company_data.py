@@ -5,7 +5,17 @@ import glob
 import logging
 
 import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+from loader_db import (
+    close_connection_pool,
+    pooled_connection,
+    run_parallel_by_company,
+    transaction,
+)
+from migrate_relational_schema import (
+    apply_migrations,
+    table_exists as table_exists_in_schema,
+)
 
 
 logging.basicConfig(
@@ -15,67 +25,30 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# 데이터베이스 연결 정보
-DB_CONFIG = {
-    "host": "localhost",
-    "port": 5432,
-    "user": os.getenv("POSTGRES_USER", "searchright"),
-    "password": os.getenv("POSTGRES_PASSWORD", "searchright"),
-    "database": os.getenv("POSTGRES_DB", "searchright"),
-}
-
-
-def connect_to_db():
-    """데이터베이스에 연결"""
-    try:
-        conn = psycopg2.connect(
-            host=DB_CONFIG["host"],
-            port=DB_CONFIG["port"],
-            user=DB_CONFIG["user"],
-            password=DB_CONFIG["password"],
-            database=DB_CONFIG["database"],
-        )
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-        logger.info(f"성공적으로 {DB_CONFIG['database']} 데이터베이스에 연결했습니다.")
-        return conn
-    except psycopg2.Error as e:
-        logger.error(f"데이터베이스 연결 오류: {e}")
-        raise
-
-
-def create_company_table(conn):
+def create_company_table(cursor):
     """company 테이블 생성 (존재하지 않을 경우)"""
     try:
-        with conn.cursor() as cursor:
-            # 테이블이 존재하는지 확인
+        # 테이블이 존재하는지 확인
+        table_exists = table_exists_in_schema(cursor, "company")
+
+        if not table_exists:
+            logger.info(
+                "company 테이블이 존재하지 않습니다. 새로운 테이블을 생성합니다."
+            )
             cursor.execute(
                 """
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = 'company'
+                CREATE TABLE company (
+                    id SERIAL PRIMARY KEY,
+                    name VARCHAR(255) NOT NULL,
+                    data JSONB NOT NULL
                 );
             """
             )
-            table_exists = cursor.fetchone()[0]
-
-            if not table_exists:
-                logger.info(
-                    "company 테이블이 존재하지 않습니다. 새로운 테이블을 생성합니다."
-                )
-                cursor.execute(
-                    """
-                    CREATE TABLE company (
-                        id SERIAL PRIMARY KEY,
-                        name VARCHAR(255) NOT NULL,
-                        data JSONB NOT NULL
-                    );
-                """
-                )
-                logger.info("company 테이블이 성공적으로 생성되었습니다.")
-            else:
-                logger.info(
-                    "company 테이블이 이미 존재합니다. 테이블 생성을 건너뜁니다."
-                )
+            logger.info("company 테이블이 성공적으로 생성되었습니다.")
+        else:
+            logger.info(
+                "company 테이블이 이미 존재합니다. 테이블 생성을 건너뜁니다."
+            )
     except psycopg2.Error as e:
         logger.error(f"테이블 생성 오류: {e}")
         raise
@@ -94,62 +67,57 @@ def load_company_data(file_path):
         return None, None
 
 
-def insert_company_data(conn, name, data):
-    """회사 데이터를 데이터베이스에 삽입"""
-    try:
-        with conn.cursor() as cursor:
-            # 이미 존재하는지 확인
-            cursor.execute("SELECT COUNT(*) FROM company WHERE name = %s", (name,))
-            count = cursor.fetchone()[0]
-
-            if count > 0:
-                logger.info(
-                    f"회사 '{name}'의 데이터가 이미 존재합니다. 삽입을 건너뜁니다."
-                )
-                return False
-
-            # 데이터 삽입
-            cursor.execute(
-                "INSERT INTO company (name, data) VALUES (%s, %s)",
-                (name, json.dumps(data)),
-            )
-            logger.info(f"회사 '{name}'의 데이터가 성공적으로 삽입되었습니다.")
-            return True
-    except psycopg2.Error as e:
-        logger.error(f"데이터 삽입 오류: {e}")
-        conn.rollback()
-        return False
+def insert_company_data(cursor, name, data):
+    """
+    회사 데이터를 데이터베이스에 삽입
+    run_parallel_by_company의 worker로 사용되며, 회사 하나가 하나의 트랜잭션입니다.
+    """
+    # 이미 존재하는 회사는 company_name_key 유니크 인덱스로 건너뜀
+    cursor.execute(
+        "INSERT INTO company (name, data) VALUES (%s, %s) ON CONFLICT (name) DO NOTHING RETURNING id",
+        (name, json.dumps(data)),
+    )
+
+    if cursor.fetchone() is None:
+        logger.info(
+            f"회사 '{name}'의 데이터가 이미 존재합니다. 삽입을 건너뜁니다."
+        )
+        return 0
+
+    logger.info(f"회사 '{name}'의 데이터가 성공적으로 삽입되었습니다.")
+    return 1
 
 
 def main():
     """메인 함수"""
     try:
-        # 데이터베이스 연결
-        conn = connect_to_db()
-
         # company 테이블 생성
-        create_company_table(conn)
+        with pooled_connection() as conn:
+            with transaction(conn) as cursor:
+                create_company_table(cursor)
+                apply_migrations(cursor)
 
         # 회사 데이터 파일 찾기
         company_files = glob.glob(os.path.join("company_ex*.json"))
         logger.info(f"{len(company_files)}개의 회사 데이터 파일을 찾았습니다.")
 
-        # 데이터 처리 및 삽입
-        success_count = 0
+        # 회사 단위로 데이터 묶기
+        company_groups = {}
         for file_path in sorted(company_files):
             company_name, company_data = load_company_data(file_path)
             if company_name and company_data:
-                if insert_company_data(conn, company_name, company_data):
-                    success_count += 1
+                company_groups[company_name] = company_data
+
+        # 회사 단위 병렬 삽입
+        results = run_parallel_by_company(company_groups, insert_company_data)
+        success_count = sum(results.values())
 
         logger.info(f"총 {success_count}개의 회사 데이터가 성공적으로 삽입되었습니다.")
 
     except Exception as e:
         logger.error(f"예상치 못한 오류가 발생했습니다: {e}")
     finally:
-        if "conn" in locals() and conn:
-            conn.close()
-            logger.info("데이터베이스 연결이 닫혔습니다.")
+        close_connection_pool()
 
 
 if __name__ == "__main__":
@@ -5,7 +5,19 @@ import logging
 from datetime import datetime
 
 import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+from loader_db import (
+    batch_insert,
+    close_connection_pool,
+    pooled_connection,
+    run_parallel_by_company,
+    transaction,
+)
+from migrate_relational_schema import (
+    COMPANY_NEWS_DEDUP_COLUMNS,
+    apply_migrations,
+    table_exists as table_exists_in_schema,
+)
 
 
 logging.basicConfig(
@@ -15,70 +27,33 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# 데이터베이스 연결 정보
-DB_CONFIG = {
-    "host": "localhost",
-    "port": 5432,
-    "user": os.getenv("POSTGRES_USER", "searchright"),
-    "password": os.getenv("POSTGRES_PASSWORD", "searchright"),
-    "database": os.getenv("POSTGRES_DB", "searchright"),
-}
-
-
-def connect_to_db():
-    """데이터베이스에 연결"""
-    try:
-        conn = psycopg2.connect(
-            host=DB_CONFIG["host"],
-            port=DB_CONFIG["port"],
-            user=DB_CONFIG["user"],
-            password=DB_CONFIG["password"],
-            database=DB_CONFIG["database"],
-        )
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-        logger.info(f"성공적으로 {DB_CONFIG['database']} 데이터베이스에 연결했습니다.")
-        return conn
-    except psycopg2.Error as e:
-        logger.error(f"데이터베이스 연결 오류: {e}")
-        raise
-
-
-def create_company_news_table(conn):
+def create_company_news_table(cursor):
     """company_news 테이블 생성 (존재하지 않을 경우)"""
     try:
-        with conn.cursor() as cursor:
-            # 테이블이 존재하는지 확인
+        # 테이블이 존재하는지 확인
+        table_exists = table_exists_in_schema(cursor, "company_news")
+
+        if not table_exists:
+            logger.info(
+                "company_news 테이블이 존재하지 않습니다. 새로운 테이블을 생성합니다."
+            )
             cursor.execute(
                 """
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = 'company_news'
+                CREATE TABLE company_news (
+                    id SERIAL PRIMARY KEY,
+                    company_id INTEGER NOT NULL,
+                    title VARCHAR(1000) NOT NULL,
+                    original_link TEXT,
+                    news_date DATE NOT NULL,
+                    FOREIGN KEY (company_id) REFERENCES company(id) ON DELETE CASCADE
                 );
             """
             )
-            table_exists = cursor.fetchone()[0]
-
-            if not table_exists:
-                logger.info(
-                    "company_news 테이블이 존재하지 않습니다. 새로운 테이블을 생성합니다."
-                )
-                cursor.execute(
-                    """
-                    CREATE TABLE company_news (
-                        id SERIAL PRIMARY KEY,
-                        company_id INTEGER NOT NULL,
-                        title VARCHAR(1000) NOT NULL,
-                        original_link TEXT,
-                        news_date DATE NOT NULL,
-                        FOREIGN KEY (company_id) REFERENCES company(id) ON DELETE CASCADE
-                    );
-                """
-                )
-                logger.info("company_news 테이블이 성공적으로 생성되었습니다.")
-            else:
-                logger.info(
-                    "company_news 테이블이 이미 존재합니다. 테이블 생성을 건너뜁니다."
-                )
+            logger.info("company_news 테이블이 성공적으로 생성되었습니다.")
+        else:
+            logger.info(
+                "company_news 테이블이 이미 존재합니다. 테이블 생성을 건너뜁니다."
+            )
     except psycopg2.Error as e:
         logger.error(f"테이블 생성 오류: {e}")
         raise
@@ -117,14 +92,13 @@ def load_news_data(file_path):
         return []
 
 
-def get_company_map(conn):
+def get_company_map(cursor):
     """회사 이름을 ID로 매핑하는 딕셔너리 생성"""
     try:
         company_map = {}
-        with conn.cursor() as cursor:
-            cursor.execute("SELECT id, name FROM company")
-            for company_id, company_name in cursor.fetchall():
-                company_map[company_name] = company_id
+        cursor.execute("SELECT id, name FROM company")
+        for company_id, company_name in cursor.fetchall():
+            company_map[company_name] = company_id
 
         logger.info(f"{len(company_map)}개의 회사 매핑을 로드했습니다.")
         return company_map
@@ -133,84 +107,83 @@ def get_company_map(conn):
         return {}
 
 
-def insert_news_data(conn, news_data, company_map):
-    """뉴스 데이터를 데이터베이스에 삽입"""
-    try:
-        inserted_count = 0
-        skipped_count = 0
-        missing_company_count = 0
-
-        with conn.cursor() as cursor:
-            for news in news_data:
-                company_name = news["company_name"]
-
-                # 회사 ID 찾기
-                if company_name not in company_map:
-                    missing_company_count += 1
-                    logger.warning(
-                        f"회사 '{company_name}'가 데이터베이스에 존재하지 않습니다. 해당 뉴스를 건너뜁니다."
-                    )
-                    continue
+def group_news_by_company(news_data, company_map):
+    """뉴스 데이터를 회사 ID 단위로 묶고, 존재하지 않는 회사의 뉴스는 제외"""
+    groups = {}
+    missing_company_count = 0
 
-                company_id = company_map[company_name]
+    for news in news_data:
+        company_name = news["company_name"]
 
-                # 중복 확인
-                cursor.execute(
-                    """
-                    SELECT COUNT(*) FROM company_news 
-                    WHERE company_id = %s AND title = %s AND news_date = %s
-                    """,
-                    (company_id, news["title"], news["news_date"]),
-                )
-                count = cursor.fetchone()[0]
+        # 회사 ID 찾기
+        if company_name not in company_map:
+            missing_company_count += 1
+            logger.warning(
+                f"회사 '{company_name}'가 데이터베이스에 존재하지 않습니다. 해당 뉴스를 건너뜁니다."
+            )
+            continue
 
-                if count > 0:
-                    skipped_count += 1
-                    continue
+        groups.setdefault(company_name, (company_map[company_name], []))[1].append(news)
 
-                # 데이터 삽입
-                cursor.execute(
-                    """
-                    INSERT INTO company_news (company_id, title, original_link, news_date) 
-                    VALUES (%s, %s, %s, %s)
-                    """,
-                    (
-                        company_id,
-                        news["title"],
-                        news["original_link"],
-                        news["news_date"],
-                    ),
-                )
-                inserted_count += 1
-
-                # 로깅 (100개마다)
-                if inserted_count % 100 == 0:
-                    logger.info(f"{inserted_count}개의 뉴스 데이터가 삽입되었습니다.")
-
-        logger.info(f"총 {inserted_count}개의 뉴스 데이터가 삽입되었습니다.")
-        logger.info(f"중복으로 {skipped_count}개의 데이터가 건너뛰어졌습니다.")
+    if missing_company_count:
         logger.info(
             f"존재하지 않는 회사로 인해 {missing_company_count}개의 데이터가 건너뛰어졌습니다."
         )
+    return groups
 
-        return inserted_count
-    except psycopg2.Error as e:
-        logger.error(f"데이터 삽입 오류: {e}")
-        conn.rollback()
-        return 0
+
+def insert_company_news_batch(cursor, company_name, group):
+    """
+    회사 하나의 뉴스를 배치로 삽입
+    run_parallel_by_company의 worker로 사용되며, 회사 하나가 하나의 트랜잭션입니다.
+    """
+    company_id, news_items = group
+
+    rows = [
+        (company_id, news["title"], news["original_link"], news["news_date"])
+        for news in news_items
+    ]
+
+    # 데이터 삽입 (중복은 company_news_dedup_key 유니크 인덱스로 건너뜀)
+    inserted = batch_insert(
+        cursor,
+        f"""
+        INSERT INTO company_news (company_id, title, original_link, news_date) VALUES %s
+        ON CONFLICT {COMPANY_NEWS_DEDUP_COLUMNS} DO NOTHING
+        RETURNING id
+        """,
+        rows,
+    )
+
+    skipped_count = len(news_items) - len(inserted)
+    logger.info(
+        f"회사 '{company_name}': {len(inserted)}개 삽입, 중복으로 {skipped_count}개 건너뜀"
+    )
+    return len(inserted)
+
+
+def insert_news_data(news_data, company_map):
+    """뉴스 데이터를 회사 단위로 나눠 병렬로 삽입"""
+    groups = group_news_by_company(news_data, company_map)
+    results = run_parallel_by_company(groups, insert_company_news_batch)
+    inserted_count = sum(results.values())
+
+    logger.info(f"총 {inserted_count}개의 뉴스 데이터가 삽입되었습니다.")
+    return inserted_count
 
 
 def main():
     """메인 함수"""
     try:
-        # 데이터베이스 연결
-        conn = connect_to_db()
+        with pooled_connection() as conn:
+            with transaction(conn) as cursor:
+                # company_news 테이블 생성
+                create_company_news_table(cursor)
+                apply_migrations(cursor)
 
-        # company_news 테이블 생성
-        create_company_news_table(conn)
+                # 회사 매핑 가져오기
+                company_map = get_company_map(cursor)
 
-        # 회사 매핑 가져오기
-        company_map = get_company_map(conn)
         if not company_map:
             logger.error("회사 정보를 가져오지 못했습니다. 프로세스를 중단합니다.")
             return
@@ -222,14 +195,12 @@ def main():
             return
 
         # 데이터 삽입
-        insert_news_data(conn, news_data, company_map)
+        insert_news_data(news_data, company_map)
 
     except Exception as e:
         logger.error(f"예상치 못한 오류가 발생했습니다: {e}")
     finally:
-        if "conn" in locals() and conn:
-            conn.close()
-            logger.info("데이터베이스 연결이 닫혔습니다.")
+        close_connection_pool()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+"""
+멀티 워커 실행 설정 (gunicorn + uvicorn 워커)
+
+    gunicorn -c gunicorn.conf.py app.main:app
+    WEB_CONCURRENCY=4 PROMETHEUS_MULTIPROC_DIR=/tmp/searchright-metrics gunicorn -c gunicorn.conf.py app.main:app
+
+- 워커는 각자 DB 커넥션 풀, LLM 클라이언트, 스레드를 만들어야 하므로 preload_app 을 사용하지 않습니다.
+- 워커 간 캐시 공유는 CACHE_BACKEND=postgres (app/core/shared_cache.py), 요청 한도 공유는 RATE_LIMIT_BACKEND=postgres 로 설정합니다.
+- PROMETHEUS_MULTIPROC_DIR 를 지정하면 /metrics 가 모든 워커의 지표를 합산합니다 (지정하지 않으면 요청을 받은 워커의 지표만 반환).
+"""
+
+import multiprocessing
+import os
+import shutil
+
+# 추론 요청은 대부분 LLM/DB 대기 시간이라 워커 당 이벤트 루프가 많은 요청을 동시에 처리하고,
+# 워커 수는 CPU 작업(파싱, 전처리, 후처리)이 포화되지 않도록 코어 수 기준으로 정합니다.
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# nginx upstream keepalive 연결보다 오래 유지해 nginx 가 먼저 연결을 닫도록 함 (nginx/conf.d/searchright.conf)
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 75))
+
+# LLM 응답 지연(재시도 포함)보다 길게 설정해 처리 중인 워커가 재시작되지 않도록 함
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 180))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+
+preload_app = False
+accesslog = None
+forwarded_allow_ips = os.environ.get("FORWARDED_ALLOW_IPS", "127.0.0.1")
+
+
+def on_starting(server):
+	# 이전 실행의 워커 지표 파일 정리
+	multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+	if multiproc_dir:
+		shutil.rmtree(multiproc_dir, ignore_errors=True)
+		os.makedirs(multiproc_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+	if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+		from prometheus_client import multiprocess
+		multiprocess.mark_process_dead(worker.pid)